@@ -19,16 +19,93 @@
 #
 """Module for handling the yaml config and DB config and combine them"""
 
+import copy
+import hashlib
+import json
 import logging
+import os
+import threading
 from urllib.parse import quote_plus
 import yaml
-from pymongo import MongoClient
 from commons.utils import config_utils
 from commons import pswdmanager
 from commons.params import SETUPS_FPATH, DB_HOSTNAME, DB_NAME, SYS_INFO_COLLECTION, SETUP_DEFAULTS
+from commons.params import CONFIG_CACHE_DIR
 
 LOG = logging.getLogger(__name__)
 
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+#: Parsed files of this process keyed by path, value is ((mtime, size), data).
+_PARSED = {}
+_PARSED_LOCK = threading.Lock()
+
+
+def _file_stamp(fpath: str) -> tuple:
+    """Modification time and size of a file."""
+    stat = os.stat(fpath)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load_yaml(fpath: str, cache_dir: str = None) -> dict:
+    """
+    Parse a yaml file once per process and once per content on disk.
+    The disk cache keeps the parsed data as JSON, passwords are still encrypted.
+    Files whose data does not survive a JSON round trip, e.g. with dates or
+    non string keys, are not cached.
+    """
+    cache_dir = CONFIG_CACHE_DIR if cache_dir is None else cache_dir
+    stamp = _file_stamp(fpath)
+    with _PARSED_LOCK:
+        entry = _PARSED.get(os.path.abspath(fpath))
+    if entry and entry[0] == stamp:
+        return entry[1]
+    with open(fpath, "rb") as fin:
+        content = fin.read()
+    data = None
+    cache_path = None
+    if cache_dir:
+        cache_path = os.path.join(cache_dir, hashlib.sha256(content).hexdigest() + ".json")
+        try:
+            with open(cache_path) as cache_file:
+                data = json.load(cache_file)
+            LOG.debug("Read parsed %s from cache %s", fpath, cache_path)
+        except (OSError, ValueError):
+            data = None
+    if data is None:
+        LOG.debug("Reading details from file : %s", fpath)
+        data = yaml.load(content, Loader=YAML_LOADER)  # nosec, safe loader
+        if cache_path:
+            _write_cache(cache_path, data)
+    with _PARSED_LOCK:
+        _PARSED[os.path.abspath(fpath)] = (stamp, data)
+    return data
+
+
+def _write_cache(cache_path: str, data) -> None:
+    """Store parsed data as JSON when it round trips unchanged."""
+    try:
+        dumped = json.dumps(data)
+        if json.loads(dumped) != data:
+            LOG.debug("Parsed data of %s is not plain JSON, not cached", cache_path)
+            return
+    except (TypeError, ValueError):
+        LOG.debug("Parsed data of %s is not plain JSON, not cached", cache_path)
+        return
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = "{}.{}.tmp".format(cache_path, os.getpid())
+        with open(tmp_path, "w") as cache_file:
+            cache_file.write(dumped)
+        os.replace(tmp_path, cache_path)
+    except OSError as error:
+        LOG.debug("Could not cache parsed data to %s: %s", cache_path, error)
+
+
+def clear_cache() -> None:
+    """Forget files parsed by this process."""
+    with _PARSED_LOCK:
+        _PARSED.clear()
+
 
 def get_config_yaml(fpath: str) -> dict:
     """Reads the config and decrypts the passwords
@@ -36,24 +113,37 @@ def get_config_yaml(fpath: str) -> dict:
     :param fpath: configuration file path
     :return [type]: dictionary containing config data
     """
-    with open(fpath) as fin:
-        LOG.debug("Reading details from file : %s", fpath)
-        data = yaml.safe_load(fin)
-        data['end'] = 'end'
-        LOG.debug("Decrypting password from file : %s", fpath)
-        pswdmanager.decrypt_all_passwd(data)
+    data = copy.deepcopy(_load_yaml(fpath))
+    data['end'] = 'end'
+    LOG.debug("Decrypting password from file : %s", fpath)
+    pswdmanager.decrypt_all_passwd(data)
     return data
 
 
+def _read_setups(target: str) -> dict:
+    """Setup details of target from setups.json, the file is parsed once per change."""
+    stamp = _file_stamp(SETUPS_FPATH)
+    key = os.path.abspath(SETUPS_FPATH)
+    with _PARSED_LOCK:
+        entry = _PARSED.get(key)
+    if not entry or entry[0] != stamp:
+        entry = (stamp, config_utils.read_content_json(SETUPS_FPATH, mode='rb'))
+        with _PARSED_LOCK:
+            _PARSED[key] = entry
+    return copy.deepcopy(entry[1][target])
+
+
 def get_config_db(setup_query: dict, drop_id: bool = True):
     """Reads the configuration from the database
 
     :param setup_query:collection which will be read eg: {"setupname":"automation"}
     :param drop_id: IDs field from MongoDB will be dropped
     """
-    sys_coll = _get_collection_obj()
+    from commons.utils import db_utils  # pymongo is only needed with a target setup
+    uri = _get_db_uri()
     LOG.debug("Finding the setup details: %s", setup_query)
-    cursor = sys_coll.find(setup_query)
+    cursor = db_utils.cached_query("find", uri, DB_NAME, SYS_INFO_COLLECTION, (setup_query,),
+                                   lambda coll: list(coll.find(setup_query)))
     docs = {}
     for doc in cursor:
         if drop_id:
@@ -67,16 +157,19 @@ def get_config_db(setup_query: dict, drop_id: bool = True):
     return docs
 
 
-def _get_collection_obj():
+def _get_db_uri():
     LOG.debug("Database hostname: %s", DB_HOSTNAME)
-    LOG.debug("Database name: %s", DB_NAME)
-    LOG.debug("Collection name: %s", SYS_INFO_COLLECTION)
     db_creds = pswdmanager.get_secrets(secret_ids=['DB_USER', 'DB_PASSWORD'])
     mongodburi = "mongodb://{0}:{1}@{2}"
-    uri = mongodburi.format(
+    return mongodburi.format(
         quote_plus(db_creds['DB_USER']), quote_plus(db_creds['DB_PASSWORD']), DB_HOSTNAME)
-    LOG.debug("URI : %s", uri)
-    client = MongoClient(uri)
+
+
+def _get_collection_obj():
+    LOG.debug("Database name: %s", DB_NAME)
+    LOG.debug("Collection name: %s", SYS_INFO_COLLECTION)
+    from commons.utils import db_utils
+    client = db_utils.get_client(_get_db_uri())
     setup_db = client[DB_NAME]
     collection_obj = setup_db[SYS_INFO_COLLECTION]
     LOG.debug("Collection obj for DB interaction %s", collection_obj)
@@ -90,10 +183,12 @@ def update_config_db(setup_query: dict, data: dict) -> dict:
     :param data: Data to be updated in db
     :return [type]: dict data
     """
+    from commons.utils import db_utils
     sys_coll = _get_collection_obj()
     LOG.debug("Setup query : %s", setup_query)
     LOG.debug("Data to be updated : %s", data)
     rdata = sys_coll.update_many(setup_query, data)
+    db_utils.QUERY_CACHE.invalidate(DB_NAME, SYS_INFO_COLLECTION)
     LOG.debug("Data is updated successfully")
     return rdata
 
@@ -121,7 +216,7 @@ def get_config_wrapper(**kwargs):
         flag = True
         try:
             LOG.debug("Reading config from setups.json for setup: %s", target)
-            setup_details = config_utils.read_content_json(SETUPS_FPATH, mode='rb')[target]
+            setup_details = _read_setups(target)
         except (KeyError, FileNotFoundError):
             setup_query = {"setupname": kwargs['target']}
             LOG.debug("Reading config from DB for setup: %s", target)
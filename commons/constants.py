@@ -30,6 +30,74 @@ NWORKERS = 32
 # run in parallel.
 NGREENLETS = 32
 
+#: SSH connection pool, connections per (host, user), concurrent channels per
+# connection, idle seconds before a connection is closed and keepalive interval.
+SSH_POOL_MAX_CONNECTIONS = 4
+SSH_POOL_MAX_CHANNELS = 8
+SSH_POOL_IDLE_TIMEOUT = 300
+SSH_KEEPALIVE_INTERVAL = 30
+
+#: Max nodes on which ClusterExecutor runs a command or callable concurrently.
+CLUSTER_EXEC_MAX_WORKERS = 16
+
+#: Background reporting of test results to the report DB and Jira, queued
+# updates, updates sent per request, seconds a partial batch waits, send
+# attempts and first retry delay (doubled per attempt).
+REPORT_QUEUE_SIZE = 1000
+REPORT_BATCH_SIZE = 50
+REPORT_FLUSH_INTERVAL = 5
+REPORT_RETRIES = 4
+REPORT_RETRY_DELAY = 2
+
+#: Background upload of test logs to the NFS share, upload threads, uploads
+# handled together, files from this size on are gzipped, copy attempts and
+# first retry delay (doubled per attempt).
+LOG_SHIP_WORKERS = 4
+LOG_SHIP_BATCH_SIZE = 8
+LOG_SHIP_COMPRESS_MIN = 1024 * 1024
+LOG_SHIP_RETRIES = 3
+LOG_SHIP_RETRY_DELAY = 1
+
+#: Seconds a healthy cluster verdict is reused before the next test, and words
+# of markers of tests which may leave the cluster degraded (ha, data_durability,
+# prov_sanity ..), the verdict is dropped after such a test.
+HEALTH_GATE_TTL = 300
+HEALTH_GATE_DESTRUCTIVE_MARKS = ('ha', 'durability', 'prov')
+
+#: Scheduling by expected test duration, past passed runs kept per test, and
+# seconds assumed for a test without history by marker word (ha, longevity,
+# three_node_deployment ..) or otherwise.
+TEST_DURATION_SAMPLES = 5
+TEST_DURATION_PRIORS = {'ha': 3600, 'durability': 3600, 'longevity': 7200,
+                        'scalability': 3600, 'stress': 3600, 'load': 1800,
+                        'prov': 3600, 'deployment': 3600}
+TEST_DURATION_DEFAULT = 300
+
+#: Bulk bucket teardown, concurrent DeleteObjects calls per S3 client, buckets
+# torn down concurrently and keys per DeleteObjects call (S3 maximum 1000).
+S3_BULK_DELETE_WORKERS = 16
+S3_BULK_DELETE_BUCKETS = 4
+S3_DELETE_BATCH_SIZE = 1000
+
+#: Bucket statistics, concurrent key range listers of a bucket with more than
+# one page of keys, and upper bounds in bytes of the object size classes.
+S3_STATS_PARTITIONS = 8
+S3_SIZE_HISTOGRAM_BOUNDS = (0, 4 * 1024, 64 * 1024, 1024 ** 2, 16 * 1024 ** 2,
+                            128 * 1024 ** 2, 1024 ** 3)
+
+#: Threads computing MD5 digests of multipart upload parts.
+MULTIPART_MD5_WORKERS = 4
+
+#: File checksums, bytes read at once and files hashed concurrently.
+CHECKSUM_BLOCK_SIZE = 8 * 1024 ** 2
+CHECKSUM_WORKERS = 4
+
+#: Waits, first and longest delay in seconds between condition checks and
+# number of wait timing records kept per process.
+WAIT_INITIAL_DELAY = 1
+WAIT_MAX_DELAY = 30
+WAIT_TIMINGS_KEPT = 1000
+
 # SB contansts
 MIN = 800000
 MAX = 1300000
@@ -212,6 +280,9 @@ class Rest:
     BUCKET = "buckets"
     NAME = "name"
     LOGIN_PAYLOAD = "{\"username\":\"$username\",\"password\":\"$password\"}"
+    # Seconds a login token is reused and pooled HTTP connections per host
+    TOKEN_TTL = 600
+    SESSION_POOL_SIZE = 16
     BUCKET_PAYLOAD = "{\"bucket_name\":\"buk$value\"}"
     BUCKET_POLICY_PAYLOAD = "{\"Statement\": [{\"Action\": [\"s3:$s3operation\"]," \
                             "\"Effect\": \"$effect\",\"Resource\": \"arn:aws:s3:::$value/*\"," \
@@ -0,0 +1,182 @@
+#!/usr/bin/python
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Run a command or callable on a set of cluster nodes concurrently.
+
+Usage:
+    executor = ClusterExecutor(worker_node_list)
+    result = executor.run_cmd(commands.CMD_LIST_DEVICES, read_lines=True)
+    result = executor.run(self.prereq_vm, timeout=600)
+    if not result.ok:
+        return False, result.failed
+
+Targets are usually Host/LogicalNode objects but any object works with run(),
+results are keyed by the hostname attribute of a target or by str(target).
+Pass key for other targets, e.g. key=lambda node: node["host"] for node dicts
+which must not end up in logs with their passwords.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+
+from commons import constants
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class NodeResult:
+    """Outcome of a call on one node."""
+    node: Any
+    status: bool
+    output: Any = None
+    error: BaseException = None
+    duration: float = 0.0
+    timed_out: bool = False
+
+
+class ClusterResult(dict):
+    """Ordered map of node key to NodeResult."""
+
+    @property
+    def ok(self) -> bool:
+        """True when the call succeeded on every node."""
+        return all(res.status for res in self.values())
+
+    @property
+    def failed(self) -> Dict[str, NodeResult]:
+        """Results of nodes on which the call raised or timed out."""
+        return {key: res for key, res in self.items() if not res.status}
+
+    def outputs(self) -> Dict[str, Any]:
+        """Return value of the call per node."""
+        return {key: res.output for key, res in self.items()}
+
+    def slowest(self, count: int = 1) -> List[tuple]:
+        """(key, seconds) of the count slowest nodes."""
+        return sorted(((key, res.duration) for key, res in self.items()),
+                      key=lambda item: item[1], reverse=True)[:count]
+
+    def raise_on_failure(self, msg: str = "Cluster operation failed") -> None:
+        """Raise the error of the first failed node."""
+        for key, res in self.failed.items():
+            if res.timed_out:
+                raise TimeoutError(f"{msg} on {key}: timed out after {res.duration:.1f}s")
+            raise RuntimeError(f"{msg} on {key}: {res.error}") from res.error
+
+
+class ClusterExecutor:
+    """Run calls on several nodes with a bounded number of threads."""
+
+    def __init__(self, nodes: Iterable,
+                 max_workers: int = constants.CLUSTER_EXEC_MAX_WORKERS,
+                 timeout: float = None, key: Callable[[Any], str] = None) -> None:
+        """
+        :param nodes: Host/LogicalNode objects or any other targets.
+        :param max_workers: concurrent calls.
+        :param timeout: default per node timeout in seconds, None waits forever.
+        :param key: result and log key of a node, hostname attribute or str(node) if None.
+        """
+        self.nodes = list(nodes)
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._key = key
+
+    def key(self, node) -> str:
+        """Result key of a node."""
+        if self._key is not None:
+            return self._key(node)
+        return getattr(node, "hostname", None) or str(node)
+
+    def _call(self, node, func: Callable, args: tuple, kwargs: dict,
+              timeout: float) -> NodeResult:
+        """Call func on node, a call exceeding timeout is left running in background."""
+        outcome = dict()
+
+        def target():
+            try:
+                outcome['output'] = func(node, *args, **kwargs)
+            except BaseException as error:  # pylint: disable=broad-except
+                outcome['error'] = error
+
+        start = time.time()
+        if timeout is None:
+            target()
+        else:
+            thread = threading.Thread(target=target, daemon=True,
+                                      name=f"cluster-{self.key(node)}")
+            thread.start()
+            thread.join(timeout)
+            if thread.is_alive():
+                return NodeResult(node, False, duration=time.time() - start, timed_out=True,
+                                  error=TimeoutError(f"Timed out after {timeout}s"))
+        duration = time.time() - start
+        if 'error' in outcome:
+            return NodeResult(node, False, error=outcome['error'], duration=duration)
+        return NodeResult(node, True, outcome.get('output'), duration=duration)
+
+    def run(self, func: Callable, *args, timeout: float = None, **kwargs) -> ClusterResult:
+        """
+        Call func(node, *args, **kwargs) for every node concurrently.
+        Failures of a node do not stop the others, check the returned ClusterResult.
+        :param timeout: per node timeout in seconds, defaults to executor timeout.
+        :return: ClusterResult in the order of nodes.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        result = ClusterResult()
+        if not self.nodes:
+            return result
+        workers = min(self.max_workers, len(self.nodes))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self._call, node, func, args, kwargs, timeout)
+                       for node in self.nodes]
+            for node, future in zip(self.nodes, futures):
+                res = future.result()
+                result[self.key(node)] = res
+                if res.timed_out:
+                    LOGGER.error("%s timed out on %s after %.1fs",
+                                 getattr(func, "__name__", func), self.key(node), res.duration)
+                elif not res.status:
+                    LOGGER.error("%s failed on %s: %s",
+                                 getattr(func, "__name__", func), self.key(node), res.error)
+        LOGGER.debug("%s per node seconds: %s", getattr(func, "__name__", func),
+                     {key: round(res.duration, 2) for key, res in result.items()})
+        return result
+
+    def run_cmd(self, cmd: str, timeout: float = None, **kwargs) -> ClusterResult:
+        """
+        Execute cmd on every node with execute_cmd, kwargs are passed to it.
+        :param timeout: per node timeout, also used as command timeout.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        if timeout is not None:
+            kwargs['timeout'] = timeout
+
+        def execute(node):
+            return node.execute_cmd(cmd, **kwargs)
+
+        execute.__name__ = cmd
+        return self.run(execute, timeout=timeout)
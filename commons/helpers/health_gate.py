@@ -0,0 +1,130 @@
+#!/usr/bin/python
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Cluster health verdict shared by the tests of a session.
+
+Usage:
+    gate = HealthGate(probe_cluster_health, ttl=300)
+    gate.start_poller(interval=120)
+    gate.check()            # raises what the probe raised
+    gate.invalidate()       # after a test which may have degraded the cluster
+    gate.stop_poller()
+
+check() runs the probe only when the last healthy verdict is older than ttl
+or was invalidated, so tests on a stable cluster do not wait for it. A failed
+verdict is never reused, check() probes again and raises if it still fails.
+The optional poller refreshes the verdict in background.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable
+from typing import Iterable
+
+from commons import constants
+
+LOGGER = logging.getLogger(__name__)
+
+
+def is_destructive(mark_names: Iterable[str]) -> bool:
+    """True if one of the marker names is a HEALTH_GATE_DESTRUCTIVE_MARKS word,
+    e.g. ha, data_durability or prov_sanity but not dataprovider."""
+    return any(set(name.split('_')) & set(constants.HEALTH_GATE_DESTRUCTIVE_MARKS)
+               for name in mark_names)
+
+
+class HealthGate:
+    """TTL cached verdict of a cluster health probe."""
+
+    def __init__(self, probe: Callable[[], None],
+                 ttl: float = constants.HEALTH_GATE_TTL) -> None:
+        """
+        :param probe: raises AssertionError on an unhealthy cluster, returns otherwise.
+        :param ttl: seconds a healthy verdict is reused, 0 probes on every check.
+        """
+        self.probe = probe
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.checked = None
+        self.generation = 0
+        self.poller = None
+        self.stop_event = threading.Event()
+        self.stats = dict(probes=0, hits=0, failures=0, invalidations=0)
+
+    def _fresh(self) -> bool:
+        """True while the last healthy verdict can be reused."""
+        return self.checked is not None and time.monotonic() - self.checked < self.ttl
+
+    def check(self) -> None:
+        """Reuse a fresh healthy verdict or run the probe, concurrent callers share one probe."""
+        if self._fresh():
+            self.stats['hits'] += 1
+            return
+        with self.lock:
+            if self._fresh():
+                self.stats['hits'] += 1
+                return
+            self._probe()
+
+    def _probe(self) -> None:
+        """Run the probe and record its verdict, lock held."""
+        generation = self.generation
+        self.stats['probes'] += 1
+        start = time.monotonic()
+        try:
+            self.probe()
+        except BaseException:
+            self.checked = None
+            self.stats['failures'] += 1
+            raise
+        # An invalidation during the probe wins over its verdict
+        if generation == self.generation:
+            self.checked = start
+        LOGGER.debug("Health probe took %.1fs", time.monotonic() - start)
+
+    def invalidate(self) -> None:
+        """Forget the verdict, the next check probes again."""
+        self.checked = None
+        self.generation += 1
+        self.stats['invalidations'] += 1
+
+    def start_poller(self, interval: float) -> None:
+        """Refresh the verdict every interval seconds in a daemon thread."""
+        if self.poller and self.poller.is_alive():
+            return
+        self.stop_event.clear()
+        self.poller = threading.Thread(target=self._poll, args=(interval,),
+                                       name='health-poller', daemon=True)
+        self.poller.start()
+
+    def stop_poller(self) -> None:
+        """Stop the background poller."""
+        self.stop_event.set()
+        if self.poller:
+            self.poller.join()
+            self.poller = None
+
+    def _poll(self, interval: float) -> None:
+        """Poller loop, failures are logged and left for check to confirm."""
+        while not self.stop_event.wait(interval):
+            with self.lock:
+                try:
+                    self._probe()
+                except BaseException as error:  # pylint: disable=broad-except
+                    LOGGER.error("Background health probe failed: %s", error)
@@ -26,6 +26,7 @@ import shutil
 import socket
 import stat
 import time
+from dataclasses import dataclass
 from typing import Any
 from typing import List
 from typing import Tuple
@@ -37,6 +38,8 @@ import pysftp
 from paramiko.ssh_exception import SSHException
 
 from commons import commands, const
+from commons.helpers.cluster_executor import ClusterExecutor
+from commons.helpers.ssh_pool import SSH_POOL
 
 LOGGER = logging.getLogger(__name__)
 
@@ -52,6 +55,7 @@ class AbsHost:
         self.host_obj = None
         self.shell_obj = None
         self.pysftp_obj = None
+        self.use_pool = True
 
     def connect(
             self,
@@ -132,7 +136,7 @@ class AbsHost:
 
     def disconnect(self) -> None:
         """
-        Disconnects the host obj.
+        Disconnects the host obj, pooled connections are left open in the pool.
         """
         if self.host_obj:
             self.host_obj.close()
@@ -166,9 +170,50 @@ class AbsHost:
         return False
 
 
+@dataclass
+class CommandResult:
+    """Result of a command run by Host.run_many."""
+    hostname: str
+    cmd: str
+    status: bool
+    output: Any = None
+    error: str = None
+    duration: float = 0.0
+
+
 class Host(AbsHost):
     """Class for performing system file operation on Host"""
 
+    @staticmethod
+    def run_many(targets: List[Union['Host', Tuple['Host', str]]],
+                 cmd: str = None,
+                 max_workers: int = None,
+                 **kwargs) -> List[CommandResult]:
+        """
+        Execute commands on several hosts concurrently over pooled connections.
+        :param targets: Host objects when cmd is given else (host, cmd) tuples.
+        :param cmd: command to run on every host.
+        :param max_workers: concurrent commands, defaults to number of targets.
+        :param kwargs: keyword arguments for execute_cmd e.g. read_lines, timeout.
+        :return: CommandResult per target in the order of targets.
+        """
+        pairs = [(target, cmd) for target in targets] if cmd else list(targets)
+        if not pairs:
+            return list()
+
+        def run_one(item):
+            host, command = item[1]
+            return host.execute_cmd(command, **kwargs)
+
+        # keyed by position as a host may be given several commands
+        executor = ClusterExecutor(enumerate(pairs), max_workers=max_workers or len(pairs),
+                                   key=lambda item: f"{item[1][0].hostname}#{item[0]}")
+        result = executor.run(run_one)
+        return [CommandResult(host.hostname, command, res.status, res.output,
+                              error=None if res.status else str(res.error),
+                              duration=res.duration)
+                for (host, command), res in zip(pairs, result.values())]
+
     def execute_cmd(self,
                     cmd: str,
                     inputs: str = None,
@@ -192,7 +237,6 @@ class Host(AbsHost):
         :param read_nbytes: maximum number of bytes to read.
         :return: stdout/strerr.
         """
-        timer = time.time()
         timeout = kwargs.get('timeout', 400)
         check_recv_ready = kwargs.get('recv_ready', False)
         if 'recv_ready' in kwargs.keys():
@@ -201,8 +245,44 @@ class Host(AbsHost):
         if 'exc' in kwargs.keys():
             kwargs.pop('exc')
         LOGGER.debug(f"Executing {cmd}")
-        self.connect(**kwargs)  # fn will raise an exception
-        stdin, stdout, stderr = self.host_obj.exec_command(cmd, timeout=timeout)  # nosec
+        if not self.use_pool or kwargs.get('shell'):
+            self.connect(**kwargs)  # fn will raise an exception
+            return self._exec_command(self.host_obj, cmd, inputs, read_lines, read_nbytes,
+                                      timeout, check_recv_ready, exc)
+        for key in ('shell', 'timeout', 'retry'):
+            kwargs.pop(key, None)
+        attempts = 2
+        for attempt in range(attempts):
+            try:
+                conn = SSH_POOL.acquire(self.hostname, self.username, self.password,
+                                        timeout=timeout, **kwargs)
+            except TimeoutError:
+                raise
+            except Exception as error:
+                LOGGER.error("Exception while connecting to server: Error: %s", str(error))
+                raise RuntimeError('Rethrowing the SSH exception') from error
+            try:
+                resp = self._exec_command(conn.client, cmd, inputs, read_lines, read_nbytes,
+                                          timeout, check_recv_ready, exc)
+            except (SSHException, EOFError, ConnectionError) as error:
+                SSH_POOL.release(conn, broken=True)
+                if conn.uses == 1 or attempt == attempts - 1:
+                    raise
+                # connection went stale while idle in the pool, retry on a new one
+                LOGGER.debug("Pooled connection to %s failed: %s, retrying", self.hostname, error)
+                continue
+            except BaseException:
+                SSH_POOL.release(conn)
+                raise
+            SSH_POOL.release(conn)
+            return resp
+
+    @staticmethod
+    def _exec_command(client, cmd, inputs, read_lines, read_nbytes, timeout,
+                      check_recv_ready, exc):
+        """Execute cmd on connected paramiko client, see execute_cmd."""
+        timer = time.time()
+        stdin, stdout, stderr = client.exec_command(cmd, timeout=timeout)  # nosec
         # above is non blocking call and timeout is set for SSL handshake and command
         if check_recv_ready:
             while time.time() - timer < timeout and not stdout.channel.exit_status_ready():
@@ -585,6 +665,7 @@ class Host(AbsHost):
                 cmd)
             resp = self.execute_cmd(cmd, shell=False)
             LOGGER.debug(resp)
+            SSH_POOL.close_host(self.hostname)
         except Exception as error:
             LOGGER.error("*ERROR* An exception occurred in %s: %s",
                          Host.shutdown_node.__name__, error)
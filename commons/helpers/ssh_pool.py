@@ -0,0 +1,240 @@
+#!/usr/bin/python
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Process wide pool of SSH connections shared by Host objects.
+
+A paramiko transport multiplexes many channels, so every pooled SSHClient is
+lent to up to max_channels borrowers at a time and a new connection to the
+same (host, user, port) is opened only when all existing ones are busy.
+Connections are health checked when borrowed, kept alive with SSH keepalive
+packets and closed after idle_timeout seconds without borrowers.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import paramiko
+from paramiko.ssh_exception import SSHException
+
+from commons import constants
+
+LOGGER = logging.getLogger(__name__)
+
+
+class PooledConnection:
+    """SSHClient owned by the pool with borrower bookkeeping."""
+
+    def __init__(self, key: Tuple, client: paramiko.SSHClient) -> None:
+        self.key = key
+        self.client = client
+        self.borrowers = 0
+        self.uses = 0
+        self.last_used = time.monotonic()
+        self.broken = False
+
+    def is_alive(self) -> bool:
+        """Check that the transport is still usable."""
+        if self.broken:
+            return False
+        transport = self.client.get_transport()
+        if transport is None or not transport.is_active():
+            return False
+        try:
+            transport.send_ignore()
+        except (SSHException, EOFError, OSError):
+            return False
+        return True
+
+    def close(self) -> None:
+        """Close the underlying client."""
+        try:
+            self.client.close()
+        except Exception as error:  # pylint: disable=broad-except
+            LOGGER.debug("Error while closing ssh connection to %s: %s", self.key[0], error)
+
+
+class SSHConnectionPool:
+    """Pool of SSH connections keyed by (hostname, username, port)."""
+
+    def __init__(self,
+                 max_connections: int = constants.SSH_POOL_MAX_CONNECTIONS,
+                 max_channels: int = constants.SSH_POOL_MAX_CHANNELS,
+                 idle_timeout: float = constants.SSH_POOL_IDLE_TIMEOUT,
+                 keepalive: int = constants.SSH_KEEPALIVE_INTERVAL) -> None:
+        """
+        :param max_connections: connections per key, borrowers wait when all are busy.
+        :param max_channels: concurrent borrowers of one connection.
+        :param idle_timeout: seconds after which an unused connection is closed.
+        :param keepalive: seconds between keepalive packets, 0 to disable.
+        """
+        self.max_connections = max_connections
+        self.max_channels = max_channels
+        self.idle_timeout = idle_timeout
+        self.keepalive = keepalive
+        self.cond = threading.Condition()
+        self.connections: Dict[Tuple, List[PooledConnection]] = dict()
+        self.opening: Dict[Tuple, int] = dict()
+        self.stats = dict(created=0, reused=0, evicted=0, discarded=0)
+
+    @staticmethod
+    def _open(hostname: str, username: str, password: str, timeout: int,
+              **kwargs) -> paramiko.SSHClient:
+        """Open a new SSHClient, retrying SSH handshake failures."""
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        retry_count = 3
+        for count in range(1, retry_count + 1):
+            try:
+                client.connect(hostname=hostname, username=username, password=password,
+                               timeout=timeout, allow_agent=False, look_for_keys=False,
+                               **kwargs)
+                return client
+            except SSHException as error:
+                LOGGER.exception("Exception in connecting %s", error)
+                if count == retry_count:
+                    client.close()
+                    raise error
+                LOGGER.debug("Retrying to connect the host")
+        return client
+
+    def _pick(self, key: Tuple):
+        """Return a healthy connection with a free channel slot or None, lock held."""
+        for conn in list(self.connections.get(key, ())):
+            if conn.borrowers >= self.max_channels:
+                continue
+            if conn.borrowers == 0 and not conn.is_alive():
+                self.connections[key].remove(conn)
+                self.stats['discarded'] += 1
+                conn.close()
+                continue
+            return conn
+        return None
+
+    def acquire(self, hostname: str, username: str, password: str,
+                timeout: int = 400, **kwargs) -> PooledConnection:
+        """
+        Borrow a connection to hostname, opening one if none has a free channel.
+        :param timeout: connect timeout and max seconds to wait for a free connection.
+        :param kwargs: Optional keyword arguments for SSHClient.connect func call.
+        """
+        key = (hostname, username, kwargs.get('port', 22))
+        deadline = time.monotonic() + timeout
+        with self.cond:
+            self._evict_idle()
+            while True:
+                conn = self._pick(key)
+                if conn:
+                    conn.borrowers += 1
+                    conn.uses += 1
+                    self.stats['reused'] += 1
+                    return conn
+                opened = len(self.connections.get(key, ())) + self.opening.get(key, 0)
+                if opened < self.max_connections:
+                    self.opening[key] = self.opening.get(key, 0) + 1
+                    break
+                if not self.cond.wait(deadline - time.monotonic()):
+                    raise TimeoutError(f'No free ssh connection to {hostname} in {timeout}s')
+        conn = None
+        try:
+            LOGGER.debug("Connecting to host: %s", hostname)
+            client = self._open(hostname, username, password, timeout, **kwargs)
+            conn = PooledConnection(key, client)
+            conn.borrowers = 1
+            conn.uses = 1
+            if self.keepalive:
+                client.get_transport().set_keepalive(self.keepalive)
+        finally:
+            with self.cond:
+                self.opening[key] -= 1
+                if conn:
+                    self.connections.setdefault(key, list()).append(conn)
+                    self.stats['created'] += 1
+                self.cond.notify_all()
+        return conn
+
+    def release(self, conn: PooledConnection, broken: bool = False) -> None:
+        """Return a borrowed connection, broken connections are closed."""
+        with self.cond:
+            conn.borrowers -= 1
+            conn.last_used = time.monotonic()
+            if broken:
+                conn.broken = True
+            if conn.broken and conn.borrowers == 0:
+                if conn in self.connections.get(conn.key, ()):
+                    self.connections[conn.key].remove(conn)
+                    self.stats['discarded'] += 1
+                conn.close()
+            self.cond.notify_all()
+
+    @contextmanager
+    def client(self, hostname: str, username: str, password: str,
+               timeout: int = 400, **kwargs):
+        """Context manager yielding a pooled paramiko.SSHClient."""
+        conn = self.acquire(hostname, username, password, timeout, **kwargs)
+        broken = False
+        try:
+            yield conn.client
+        except (SSHException, EOFError, ConnectionError):
+            broken = True
+            raise
+        finally:
+            self.release(conn, broken)
+
+    def _evict_idle(self) -> None:
+        """Close connections idle for more than idle_timeout, lock held."""
+        now = time.monotonic()
+        for key, conns in self.connections.items():
+            for conn in list(conns):
+                if conn.borrowers == 0 and now - conn.last_used > self.idle_timeout:
+                    conns.remove(conn)
+                    self.stats['evicted'] += 1
+                    conn.close()
+
+    def close_host(self, hostname: str) -> None:
+        """Close idle connections of hostname, busy ones are closed on release.
+        Use when a node is rebooted or shut down."""
+        with self.cond:
+            for key, conns in self.connections.items():
+                if key[0] != hostname:
+                    continue
+                for conn in list(conns):
+                    conn.broken = True
+                    if conn.borrowers == 0:
+                        conns.remove(conn)
+                        conn.close()
+
+    def close_all(self) -> None:
+        """Close every pooled connection."""
+        with self.cond:
+            for conns in self.connections.values():
+                for conn in conns:
+                    conn.broken = True
+                    if conn.borrowers == 0:
+                        conn.close()
+            self.connections = dict()
+
+
+#: Pool shared by all Host objects of the process.
+SSH_POOL = SSHConnectionPool()
+atexit.register(SSH_POOL.close_all)
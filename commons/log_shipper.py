@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/python
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Background upload of test logs to the NFS share.
+
+Usage:
+    shipper = LogShipper()
+    shipper.start()
+    upload = shipper.ship(test_log, remote_path, on_done=comment_log_path)
+    print(upload.wait(timeout=60))
+    shipper.close(timeout=600)
+
+The NFS share is mounted once by start() and stays mounted for the session.
+Uploads are copied by worker threads, a worker takes up to batch_size queued
+uploads and creates every remote directory once. Files of compress_min bytes
+or more are gzipped while copied. A failing copy is retried with backoff and
+finally copied below local_dir like mount_upload_to_server does. on_done is
+called with the finished Upload, its path is where the log really landed.
+"""
+import gzip
+import logging
+import os
+import queue
+import shutil
+import threading
+import time
+from typing import Callable
+from typing import List
+
+from commons import constants
+from commons import params
+from commons.utils import system_utils
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Upload:
+    """A queued log upload, path is set once it finished."""
+    __slots__ = ('local_path', 'remote_path', 'remove', 'on_done', 'path', 'uploaded',
+                 'event')
+
+    def __init__(self, local_path: str, remote_path: str, remove: bool = False,
+                 on_done: Callable = None) -> None:
+        self.local_path = local_path
+        self.remote_path = remote_path
+        self.remove = remove
+        self.on_done = on_done
+        self.path = None
+        self.uploaded = False
+        self.event = threading.Event()
+
+    def wait(self, timeout: float = None) -> str:
+        """Path of the uploaded log, None if it did not finish in timeout."""
+        self.event.wait(timeout)
+        return self.path
+
+
+class LogShipper:
+    """Uploads logs to a NFS share mounted for the whole session."""
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, host_dir: str = params.NFS_SERVER_DIR,
+                 mnt_dir: str = params.MOUNT_DIR,
+                 local_dir: str = params.LOCAL_LOG_PATH,
+                 workers: int = constants.LOG_SHIP_WORKERS,
+                 batch_size: int = constants.LOG_SHIP_BATCH_SIZE,
+                 compress_min: int = constants.LOG_SHIP_COMPRESS_MIN,
+                 retries: int = constants.LOG_SHIP_RETRIES,
+                 retry_delay: float = constants.LOG_SHIP_RETRY_DELAY) -> None:
+        """
+        :param host_dir: NFS server directory.
+        :param mnt_dir: local mount point of host_dir.
+        :param local_dir: fallback directory of logs which could not be uploaded.
+        :param workers: upload threads.
+        :param batch_size: queued uploads a worker takes at once.
+        :param compress_min: files of this size or larger are gzipped, 0 disables.
+        :param retries: copy attempts per log.
+        :param retry_delay: seconds before the first retry, doubled per attempt.
+        """
+        self.host_dir = host_dir
+        self.mnt_dir = mnt_dir
+        self.local_dir = local_dir
+        self.workers = workers
+        self.batch_size = batch_size
+        self.compress_min = compress_min
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.queue = queue.Queue()
+        self.threads = list()
+        self.mounted = False
+        self.lock = threading.Lock()
+        self.created_dirs = set()
+        self.counters = dict(queued=0, uploaded=0, compressed=0, retried=0, fallback=0,
+                             failed=0, bytes=0)
+
+    def start(self) -> bool:
+        """Mount the NFS share and start workers, returns False if the mount failed."""
+        try:
+            resp = system_utils.mount_nfs_dir(self.host_dir, self.mnt_dir)
+            self.mounted = resp[0]
+            if not self.mounted:
+                LOGGER.error("Failed to mount %s, logs are copied to %s: %s",
+                             self.host_dir, self.local_dir, resp[1])
+        except Exception as error:  # pylint: disable=broad-except
+            LOGGER.error("Failed to mount %s, logs are copied to %s: %s",
+                         self.host_dir, self.local_dir, error)
+        for idx in range(self.workers - len(self.threads)):
+            thread = threading.Thread(target=self._run, name=f'log-shipper-{idx}', daemon=True)
+            thread.start()
+            self.threads.append(thread)
+        return self.mounted
+
+    def ship(self, local_path: str, remote_path: str, remove: bool = False,
+             on_done: Callable = None) -> Upload:
+        """
+        Queue upload of a file or directory into remote_path of the share.
+        :param remove: remove local file after upload.
+        :param on_done: called with the Upload once it finished.
+        """
+        upload = Upload(local_path, remote_path, remove, on_done)
+        if not self.threads:
+            self._upload_batch([upload])
+            return upload
+        with self.lock:
+            self.counters['queued'] += 1
+        self.queue.put(upload)
+        return upload
+
+    def drain(self, timeout: float = None) -> bool:
+        """Wait until all queued uploads finished, False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.queue.all_tasks_done:
+            while self.queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self.queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: float = None) -> bool:
+        """Finish queued uploads and stop workers, False if they did not finish in time."""
+        drained = self.drain(timeout)
+        for _ in self.threads:
+            self.queue.put(None)
+        for thread in self.threads:
+            thread.join(0 if not drained else timeout)
+        self.threads = list()
+        LOGGER.info("Log shipper stats %s", self.stats())
+        return drained
+
+    def stats(self) -> dict:
+        """Snapshot of upload counters."""
+        with self.lock:
+            return dict(self.counters)
+
+    def _run(self) -> None:
+        """Worker loop, uploads are taken in batches of queued ones."""
+        while True:
+            upload = self.queue.get()
+            if upload is None:
+                self.queue.task_done()
+                break
+            batch = [upload]
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    upload = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if upload is None:
+                    stop = True
+                    break
+                batch.append(upload)
+            try:
+                self._upload_batch(batch)
+            finally:
+                for _ in range(len(batch) + stop):
+                    self.queue.task_done()
+            if stop:
+                break
+
+    def _upload_batch(self, batch: List[Upload]) -> None:
+        """Upload logs, every remote directory is created once."""
+        batch = sorted(batch, key=lambda item: item.remote_path)
+        for upload in batch:
+            try:
+                self._upload(upload)
+            except Exception as error:  # pylint: disable=broad-except
+                LOGGER.error("Failed to upload %s: %s", upload.local_path, error)
+                with self.lock:
+                    self.counters['failed'] += 1
+            finally:
+                upload.event.set()
+            if upload.on_done:
+                try:
+                    upload.on_done(upload)
+                except Exception as error:  # pylint: disable=broad-except
+                    LOGGER.exception("Upload callback of %s failed: %s", upload.local_path, error)
+
+    def _upload(self, upload: Upload) -> None:
+        """Copy a log to the share, to local_dir when all attempts failed."""
+        if self.mounted:
+            for attempt in range(self.retries):
+                try:
+                    name = self._copy(upload.local_path, os.path.join(self.mnt_dir,
+                                                                      upload.remote_path))
+                    upload.path = os.path.join(self.host_dir, upload.remote_path, name)
+                    upload.uploaded = True
+                    break
+                except OSError as error:
+                    LOGGER.warning("Upload of %s failed: %s", upload.local_path, error)
+                    if attempt + 1 < self.retries:
+                        with self.lock:
+                            self.counters['retried'] += 1
+                        time.sleep(self.retry_delay * 2 ** attempt)
+        if not upload.uploaded:
+            name = self._copy(upload.local_path, os.path.join(self.local_dir, upload.remote_path))
+            upload.path = os.path.join(self.local_dir, upload.remote_path, name)
+            with self.lock:
+                self.counters['fallback'] += 1
+        with self.lock:
+            self.counters['uploaded'] += 1
+        if upload.remove and os.path.isfile(upload.local_path):
+            os.remove(upload.local_path)
+
+    def _copy(self, local_path: str, dest_dir: str) -> str:
+        """Copy a log into dest_dir, returns its name there."""
+        with self.lock:
+            created = dest_dir in self.created_dirs
+        if not created:
+            os.makedirs(dest_dir, exist_ok=True)
+            with self.lock:
+                self.created_dirs.add(dest_dir)
+        try:
+            return self._copy_into(local_path, dest_dir)
+        except OSError:
+            with self.lock:
+                self.created_dirs.discard(dest_dir)
+            raise
+
+    def _copy_into(self, local_path: str, dest_dir: str) -> str:
+        """Gzip a large log into existing dest_dir, others are copied with copy_to_dir."""
+        if not os.path.isfile(local_path):
+            return os.path.basename(system_utils.copy_to_dir(local_path, dest_dir))
+        size = os.path.getsize(local_path)
+        if self.compress_min and size >= self.compress_min:
+            name = os.path.basename(local_path) + '.gz'
+            with open(local_path, 'rb') as src, gzip.open(os.path.join(dest_dir, name),
+                                                          'wb', compresslevel=6) as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+            with self.lock:
+                self.counters['compressed'] += 1
+        else:
+            name = os.path.basename(system_utils.copy_to_dir(local_path, dest_dir))
+        with self.lock:
+            self.counters['bytes'] += size
+        return name
@@ -31,6 +31,12 @@ LATEST_LOG_FOLDER = 'latest'
 LOG_DIR = os.path.join(SCRIPT_HOME, LOG_DIR_NAME)
 TEST_DATA_FOLDER = os.path.join(LOG_DIR, 'TestData')
 VAR_LOG_SYS = '/var/log/'
+# Parsed yaml configs (passwords still encrypted), empty string disables the cache
+CONFIG_CACHE_DIR = os.environ.get(
+    "CONFIG_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "cortx-test", "config"))
+
+# Test results which could not be reported, replayed by the next session
+REPORT_SPILL_DIR = os.path.join(LOG_DIR, 'report_spill')
 
 COMMON_CONFIG = os.path.join(CONFIG_DIR, 'common_config.yaml')
 S3_CONFIG = os.path.join(CONFIG_DIR, 's3', 's3_config.yaml')
@@ -62,6 +68,10 @@ JIRA_TEST_META_JSON = 'test_meta_data.json'
 JIRA_TEST_COLLECTION = 'test_collection.csv'
 JIRA_SELECTED_TESTS = 'selected_test_lists.csv'
 JIRA_DIST_TEST_LIST = 'dist_test_lists.csv'
+# Collected test items per test file content, see core.collection_index
+COLLECTION_INDEX = os.path.join(LOG_DIR_NAME, 'collection_index.json')
+# Durations of passed test runs, see core.scheduler
+TEST_DURATION_HISTORY = os.path.join(LOG_DIR_NAME, 'test_durations.json')
 
 # Kafka Config Params
 # Schema Registry (http(s)://host[:port]
@@ -107,6 +117,9 @@ S3_ENDPOINT = "https://s3.seagate.com"
 DATASET_FILES = "/var/log/datagen/createdfile.txt"
 USER_JSON = '_usersdata'
 USER_META_JSON = '_user_metadata'
+USER_META_LOG = '_user_metadata.log'
+META_LOG_FLUSH_RECORDS = 64
+META_LOG_COMPACT_RECORDS = 100000
 UPLOADED_FILES = "uploadInfo.csv"
 DELETE_OP_FILE_NAME = "deleteInfo.csv"
 COM_DELETE_OP_FILENAME = "combinedDeleteInfo.csv"
@@ -117,6 +130,12 @@ FAILED_FILES_SERVER_ERROR = "FailedFilesServerError.csv"
 DESTRUCTIVE_TEST_RESULT = "/root/result_summary.csv"
 DELETE_PERCENTAGE = 10
 DOWNLOAD_HOME = '/var/log/'
+DI_READ_SIZE = 1024 * 1024
+DI_ENGINE = 'process'  # process or asyncio
+DI_VERIFY_MODE = 'download'  # download or seed
+DI_ASYNC_CONCURRENCY = 256
+DI_ASYNC_CONNECTIONS = 64
+DI_ASYNC_REGION = 'us-east-1'
 
 S3_INSTANCES_PER_NODE = 1
 LOCAL_S3_CONFIG = os.path.join(tempfile.gettempdir(), 's3config.yaml')
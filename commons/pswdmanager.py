@@ -23,6 +23,7 @@ Performing the encryption and decryption
 import os
 import json
 import base64
+from functools import lru_cache
 from Crypto.Cipher import AES
 from Crypto.Hash import SHA256
 from Crypto import Random as CryptoRandom
@@ -49,6 +50,12 @@ def decrypt(enc_secret: str) -> str:
     Decrypt encrypted word using AES-CBC mode decryption
     """
     key = get_secrets(secret_ids=['KEY'])['KEY']
+    return _decrypt(enc_secret, key)
+
+
+@lru_cache(maxsize=4096)
+def _decrypt(enc_secret: str, key: str) -> str:
+    """Decrypt with key, the same secret appears in many configs so results are memoized."""
     key = key.encode("utf8")
     digest_key = SHA256.new(key).digest()
     enc_secret = enc_secret.encode("utf8")
@@ -19,6 +19,8 @@
 #
 """ Report Server client to update test results to Mongo DB"""
 import threading
+from http import HTTPStatus
+
 import requests
 from commons import errorcodes
 from commons.exceptions import CTException
@@ -26,7 +28,9 @@ from commons.utils import web_utils
 
 REPORT_SRV = "http://cftic2.pun.seagate.com:5000/"  # todo discover report server
 REPORT_SRV_CREATE = REPORT_SRV + "reportsdb/create"
+REPORT_SRV_CREATE_MANY = REPORT_SRV + "reportsdb/create_many"
 REPORT_SRV_UPDATE = REPORT_SRV + "reportsdb/update"
+REPORT_SRV_AGGREGATE = REPORT_SRV + "reportsdb/aggregate"
 
 
 class SingletonMixin:
@@ -129,6 +133,42 @@ class ReportClient(SingletonMixin):
             "db_password": ""
         }
        """
+        payload = self.build_payload(**data_kwargs)
+        headers = {
+            'Content-Type': 'application/json'
+        }
+        response = web_utils.http_post_request(REPORT_SRV_CREATE, payload, headers, verify=False)
+        print(response.text.encode('utf8'))
+        return response.status_code
+
+    def create_db_entries(self, entries: list, db_user: str = None,
+                          db_pass: str = None) -> int:
+        """
+        Create DB entries of several test results with one request.
+        Nothing is created when the request fails, an old report server without bulk
+        create answers 404/405, use create_db_entry per entry then.
+        :param entries: data_kwargs of create_db_entry per test result.
+        :param db_user: DB user, defaults to the one of the first entry.
+        :param db_pass: DB password, defaults to the one of the first entry.
+        :return: Response status.
+        """
+        payloads = [self.build_payload(**data_kwargs) for data_kwargs in entries]
+        db_user = db_user or payloads[0]["db_username"]
+        db_pass = db_pass or payloads[0]["db_password"]
+        for payload in payloads:
+            payload.pop("db_username")
+            payload.pop("db_password")
+        headers = {
+            'Content-Type': 'application/json'
+        }
+        data = {"entries": payloads, "db_username": db_user, "db_password": db_pass}
+        response = web_utils.http_post_request(REPORT_SRV_CREATE_MANY, data, headers,
+                                               verify=False)
+        return response.status_code
+
+    @staticmethod
+    def build_payload(**data_kwargs) -> dict:
+        """Report DB document of a test result, see create_db_entry for data_kwargs."""
         payload = {"OSVersion": data_kwargs.get('os', "CentOS"),
                    "buildNo": data_kwargs.get('build'),
                    "buildType": data_kwargs.get('build_type', "stable"),
@@ -164,13 +204,25 @@ class ReportClient(SingletonMixin):
                    "enclosureType": data_kwargs['enclosure_type'],
                    "failureString": data_kwargs.get('failure_string'),
                    }
+        return payload
 
-        headers = {
-            'Content-Type': 'application/json'
-        }
-        response = web_utils.http_post_request(REPORT_SRV_CREATE, payload, headers, verify=False)
-        print(response.text.encode('utf8'))
-        return response.status_code
+    def get_test_durations(self, test_ids: list, timeout: int = 30) -> dict:
+        """
+        Mean execution time of passed runs per test id.
+        :param test_ids: tests to look up.
+        :return: {test_id: seconds}, tests without passed runs are missing.
+        """
+        payload = {"aggregate": [
+            {"$match": {"testID": {"$in": list(test_ids)}, "testResult": "PASS",
+                        "testExecutionTime": {"$gt": 0}}},
+            {"$group": {"_id": "$testID", "duration": {"$avg": "$testExecutionTime"}}}],
+            "db_username": self.db_user,
+            "db_password": self.db_pass}
+        response = self.session.get(REPORT_SRV_AGGREGATE, json=payload, verify=False,
+                                    timeout=timeout)
+        if response.status_code != HTTPStatus.OK:
+            return dict()
+        return {doc['_id']: doc['duration'] for doc in response.json().get('result', [])}
 
     def update_db_entry(self, **data_kwargs):
         """
@@ -0,0 +1,395 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/python
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Background reporting of test results to the report DB and Jira.
+
+Usage:
+    reporter = ReportingService(report_client, jira_task, db_user, db_pass)
+    reporter.start()
+    reporter.create_db_entry(**payload)
+    reporter.update_jira_status(te_tkt, test_id, 'PASS')
+    reporter.close(timeout=300)
+
+Pytest hooks only queue updates, a worker thread sends them in batches: DB
+entries with one bulk create request per batch and Jira statuses of a test
+execution with one Xray import, coalesced to the last status of every test.
+Failed sends are retried with exponential backoff, updates which still fail
+are appended to a spill file and replayed by the next started service. A bulk
+create rejected with a 4xx status is not retried, its entries are created one
+by one and only the ones rejected again are dropped.
+"""
+import glob
+import json
+import logging
+import os
+import queue
+import socket
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from http import HTTPStatus
+from typing import List
+from typing import Tuple
+
+from filelock import FileLock
+
+from commons import constants
+from commons import params
+from commons.utils import jira_utils
+
+LOGGER = logging.getLogger(__name__)
+
+DB, JIRA_STATUS, JIRA_COMMENT = 'db', 'jira_status', 'jira_comment'
+SPILL_SUFFIX = '.jsonl'
+
+
+class RejectedError(Exception):
+    """Update rejected by the server with a 4xx status, sending it again cannot succeed."""
+
+
+def _is_client_error(status: int) -> bool:
+    """True for a 4xx status."""
+    return HTTPStatus.BAD_REQUEST <= status < HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+class _Marker:
+    """Queue marker, set once all updates queued before it were handled."""
+
+    def __init__(self, stop: bool = False) -> None:
+        self.stop = stop
+        self.event = threading.Event()
+
+
+class ReportingService:
+    """Queue of report DB and Jira updates sent by a worker thread."""
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, report_client=None, jira_task: jira_utils.JiraTask = None,
+                 db_user: str = None, db_pass: str = None,
+                 spill_dir: str = params.REPORT_SPILL_DIR,
+                 queue_size: int = constants.REPORT_QUEUE_SIZE,
+                 batch_size: int = constants.REPORT_BATCH_SIZE,
+                 flush_interval: float = constants.REPORT_FLUSH_INTERVAL,
+                 retries: int = constants.REPORT_RETRIES,
+                 retry_delay: float = constants.REPORT_RETRY_DELAY) -> None:
+        """
+        :param report_client: ReportClient, None if DB updates are disabled.
+        :param jira_task: JiraTask, None if Jira updates are disabled.
+        :param db_user: DB credentials added to DB entries when sent, they are never spilled.
+        :param spill_dir: directory of updates which could not be sent.
+        :param queue_size: queued updates after which callers wait flush_interval and spill.
+        :param batch_size: updates sent per request.
+        :param flush_interval: seconds a partial batch waits for more updates.
+        :param retries: send attempts of a batch.
+        :param retry_delay: seconds before the first retry, doubled per attempt.
+        """
+        self.report_client = report_client
+        self.jira_task = jira_task
+        self.db_user = db_user
+        self.db_pass = db_pass
+        self.spill_dir = spill_dir
+        self.spill_path = os.path.join(
+            spill_dir, f'{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}'
+                       f'{SPILL_SUFFIX}')
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.queue = queue.Queue(queue_size)
+        self.thread = None
+        self.lock = threading.Lock()
+        self.counters = dict(queued=0, sent=0, requests=0, retried=0, spilled=0, replayed=0,
+                             dropped=0)
+
+    def start(self) -> None:
+        """Start the worker thread, it first replays spilled updates."""
+        if self.thread and self.thread.is_alive():
+            return
+        self.thread = threading.Thread(target=self._run, name='reporting-service', daemon=True)
+        self.thread.start()
+
+    def create_db_entry(self, **payload) -> bool:
+        """Queue a report DB entry, payload as for ReportClient.create_db_entry."""
+        payload.pop('db_username', None)
+        payload.pop('db_password', None)
+        return self._put(dict(kind=DB, data=payload))
+
+    def update_jira_status(self, test_exe_id: str, test_id: str, test_status: str,
+                           log_path: str = '') -> bool:
+        """Queue a test status update of a test execution, stamped with the current time."""
+        record = jira_utils.JiraTask.test_status_record(test_id, test_status, log_path)
+        return self._put(dict(kind=JIRA_STATUS, te=test_exe_id, data=record))
+
+    def update_execution_details(self, test_run_id: str, test_id: str, comment: str) -> bool:
+        """Queue a comment on a test run."""
+        return self._put(dict(kind=JIRA_COMMENT, data=dict(
+            test_run_id=test_run_id, test_id=test_id, comment=comment)))
+
+    def _put(self, item: dict) -> bool:
+        """Queue an update, spill it when the worker is not running or cannot keep up."""
+        if self.thread is None or not self.thread.is_alive():
+            LOGGER.error("Reporting service is not running, spilling %s update", item['kind'])
+            self._spill([item])
+            return False
+        try:
+            self.queue.put(item, timeout=self.flush_interval)
+        except queue.Full:
+            LOGGER.error("Reporting queue is full, spilling %s update", item['kind'])
+            self._spill([item])
+            return False
+        with self.lock:
+            self.counters['queued'] += 1
+        return True
+
+    def flush(self, timeout: float = None) -> bool:
+        """Wait until updates queued so far were sent or spilled, False on timeout."""
+        if self.thread is None or not self.thread.is_alive():
+            return True
+        marker = _Marker()
+        self.queue.put(marker)
+        return marker.event.wait(timeout)
+
+    def close(self, timeout: float = None) -> bool:
+        """
+        Send all queued updates and stop the worker thread.
+        :param timeout: seconds to wait, updates still queued afterwards are spilled.
+        :return: False if the worker did not finish in time.
+        """
+        if self.thread is None:
+            return True
+        marker = _Marker(stop=True)
+        self.queue.put(marker)
+        finished = marker.event.wait(timeout)
+        if not finished:
+            leftover = list()
+            while True:
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if isinstance(item, dict):
+                    leftover.append(item)
+            LOGGER.error("Reporting did not finish in %ss, spilling %s queued updates",
+                         timeout, len(leftover))
+            self._spill(leftover)
+        self.thread = None
+        LOGGER.info("Reporting service stats %s", self.stats())
+        return finished
+
+    def stats(self) -> dict:
+        """Snapshot of update counters."""
+        with self.lock:
+            return dict(self.counters)
+
+    def _run(self) -> None:
+        """Worker loop, sends a batch when it is full or flush_interval expired."""
+        try:
+            self._replay()
+        except Exception as error:  # pylint: disable=broad-except
+            LOGGER.exception("Failed to replay spilled updates: %s", error)
+        pending, deadline = list(), None
+        while True:
+            timeout = None if not pending else max(0.0, deadline - time.monotonic())
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if isinstance(item, _Marker):
+                self._send(pending)
+                pending = list()
+                item.event.set()
+                if item.stop:
+                    break
+                continue
+            if item is not None:
+                if not pending:
+                    deadline = time.monotonic() + self.flush_interval
+                pending.append(item)
+                if len(pending) < self.batch_size and time.monotonic() < deadline:
+                    continue
+            self._send(pending)
+            pending = list()
+
+    def _send(self, items: List[dict]) -> None:
+        """Send updates grouped per request, spill the ones which failed."""
+        if not items:
+            return
+        db_entries = [item for item in items if item['kind'] == DB]
+        statuses = OrderedDict()
+        for item in items:
+            if item['kind'] != JIRA_STATUS:
+                continue
+            key = (item['te'], item['data']['testKey'])
+            previous = statuses.pop(key, None)
+            record = dict(item['data'])
+            if previous and 'start' in previous['data'] and 'start' not in record:
+                record['start'] = previous['data']['start']
+            statuses[key] = dict(item, data=record)
+        comments = [item for item in items if item['kind'] == JIRA_COMMENT]
+
+        # Once an endpoint failed all retries the rest of its updates is spilled directly
+        failed, dropped, db_down = list(), list(), False
+        for start in range(0, len(db_entries), self.batch_size):
+            chunk = db_entries[start:start + self.batch_size]
+            if db_down:
+                failed.extend(chunk)
+                continue
+            try:
+                if not self._retry(self._send_db, chunk):
+                    db_down = True
+                    failed.extend(chunk)
+            except RejectedError as error:
+                LOGGER.warning("%s, creating %s DB entries one by one", error, len(chunk))
+                rejected, unsent = self._send_db_each(chunk)
+                dropped.extend(rejected)
+                failed.extend(unsent)
+        per_te = OrderedDict()
+        for item in statuses.values():
+            per_te.setdefault(item['te'], list()).append(item)
+        jira_down = False
+        for te_tkt, te_items in per_te.items():
+            for start in range(0, len(te_items), self.batch_size):
+                chunk = te_items[start:start + self.batch_size]
+                if jira_down or not self._retry(self._send_jira_statuses, te_tkt, chunk):
+                    jira_down = True
+                    failed.extend(chunk)
+        for item in comments:
+            if jira_down or not self._retry(self._send_jira_comment, item):
+                jira_down = True
+                failed.append(item)
+        with self.lock:
+            self.counters['sent'] += len(items) - len(failed) - len(dropped)
+            self.counters['dropped'] += len(dropped)
+        if failed:
+            self._spill(failed)
+
+    def _retry(self, func, *args) -> bool:
+        """
+        Call func until it returns True, sleeping retry_delay doubled per attempt.
+        RejectedError of func is raised, a rejected request is not retried.
+        """
+        for attempt in range(self.retries):
+            with self.lock:
+                self.counters['requests'] += 1
+                if attempt:
+                    self.counters['retried'] += 1
+            try:
+                if func(*args):
+                    return True
+            except RejectedError:
+                raise
+            except Exception as error:  # pylint: disable=broad-except
+                LOGGER.warning("%s failed: %s", func.__name__, error)
+            if attempt + 1 < self.retries:
+                time.sleep(self.retry_delay * 2 ** attempt)
+        LOGGER.error("%s failed after %s attempts", func.__name__, self.retries)
+        return False
+
+    def _send_db(self, items: List[dict]) -> bool:
+        """Create report DB entries with one request."""
+        if self.report_client is None:
+            LOGGER.error("No report client, dropping %s DB entries", len(items))
+            return True
+        status = self.report_client.create_db_entries(
+            [item['data'] for item in items], self.db_user, self.db_pass)
+        if _is_client_error(status):
+            raise RejectedError(f"Bulk create rejected with {status}")
+        return status == HTTPStatus.OK
+
+    def _send_db_each(self, items: List[dict]) -> Tuple[List[dict], List[dict]]:
+        """
+        Create report DB entries with one request each, after the bulk create was rejected.
+        :return: entries rejected by the report server and entries which failed otherwise.
+        """
+        rejected, unsent = list(), list()
+        for item in items:
+            with self.lock:
+                self.counters['requests'] += 1
+            try:
+                status = self.report_client.create_db_entry(
+                    **item['data'], db_username=self.db_user, db_password=self.db_pass)
+            except Exception as error:  # pylint: disable=broad-except
+                LOGGER.warning("create_db_entry failed: %s", error)
+                unsent.append(item)
+                continue
+            if _is_client_error(status):
+                LOGGER.error("Report server rejected DB entry of %s with %s, dropping it",
+                             item['data'].get('test_id'), status)
+                rejected.append(item)
+            elif status != HTTPStatus.OK:
+                unsent.append(item)
+        return rejected, unsent
+
+    def _send_jira_statuses(self, test_exe_id: str, items: List[dict]) -> bool:
+        """Update statuses of tests of a test execution with one request."""
+        if self.jira_task is None:
+            LOGGER.error("No Jira task, dropping %s status updates", len(items))
+            return True
+        response = self.jira_task.update_test_jira_statuses(
+            test_exe_id, [item['data'] for item in items])
+        return response is not None and response.status_code < HTTPStatus.BAD_REQUEST
+
+    def _send_jira_comment(self, item: dict) -> bool:
+        """Add a comment to a test run."""
+        if self.jira_task is None:
+            LOGGER.error("No Jira task, dropping comment of %s", item['data']['test_id'])
+            return True
+        return self.jira_task.update_execution_details(**item['data'])
+
+    def _spill(self, items: List[dict]) -> None:
+        """Append updates to the spill file of this service."""
+        if not items:
+            return
+        try:
+            os.makedirs(self.spill_dir, exist_ok=True)
+            with FileLock(os.path.join(self.spill_dir, '.lock')):
+                with open(self.spill_path, 'a') as spill:
+                    for item in items:
+                        spill.write(json.dumps(item, default=str) + '\n')
+                    spill.flush()
+                    os.fsync(spill.fileno())
+        except OSError as error:
+            LOGGER.error("Failed to spill %s updates to %s: %s", len(items), self.spill_path,
+                         error)
+            return
+        with self.lock:
+            self.counters['spilled'] += len(items)
+
+    def _replay(self) -> None:
+        """Send updates spilled by earlier services, each spill file is claimed by one."""
+        if not os.path.isdir(self.spill_dir):
+            return
+        claimed = list()
+        with FileLock(os.path.join(self.spill_dir, '.lock')):
+            for path in glob.glob(os.path.join(self.spill_dir, '*' + SPILL_SUFFIX)):
+                if path == self.spill_path:
+                    continue
+                claim = f'{path}.{os.getpid()}.replay'
+                os.rename(path, claim)
+                claimed.append(claim)
+        for claim in claimed:
+            with open(claim) as spill:
+                items = [json.loads(line) for line in spill if line.strip()]
+            LOGGER.info("Replaying %s spilled updates of %s", len(items), claim)
+            for start in range(0, len(items), self.batch_size):
+                self._send(items[start:start + self.batch_size])
+            with self.lock:
+                self.counters['replayed'] += len(items)
+            os.remove(claim)
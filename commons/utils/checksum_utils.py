@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/python
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""File checksums computed in process.
+
+Usage:
+    checksum = file_checksum("/tmp/obj")  # md5 hex digest
+    digests = file_digests("/tmp/obj", ("md5", "sha256", "crc32c", "etag"),
+                           part_size=5 * 1024 ** 2)
+    per_file = files_digests(["/tmp/obj1", "/tmp/obj2"], ("md5",))
+
+A file is read once with large buffered reads into a reused buffer and every
+block is fed to all requested hashes, so several digests cost one pass over
+the data. hashlib releases the GIL while hashing large blocks, files are
+hashed concurrently on a thread pool. Algorithm names are case insensitive,
+"SHA-256" and "sha256" are the same. "etag" is the S3 multipart ETag,
+md5 of the part md5 digests with the part count appended.
+crc32c uses the crc32c package when installed, else a slow pure python
+implementation.
+"""
+
+import base64
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+from typing import Iterable
+from typing import List
+
+from commons import constants
+
+try:
+    import crc32c as _crc32c
+except ImportError:
+    _crc32c = None
+
+CRC32C_POLY = 0x82F63B78
+
+
+def _crc32c_table() -> List[int]:
+    """Lookup table of the reflected Castagnoli polynomial."""
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ CRC32C_POLY if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+
+_CRC32C_TABLE = None if _crc32c else _crc32c_table()
+
+
+class Crc32c:
+    """crc32c with the hashlib update/digest interface, digest is big endian."""
+
+    name = "crc32c"
+
+    def __init__(self) -> None:
+        self.value = 0
+
+    def update(self, data) -> None:
+        """Add data to the checksum."""
+        if _crc32c:
+            self.value = _crc32c.crc32c(data, self.value)
+            return
+        crc, table = self.value ^ 0xFFFFFFFF, _CRC32C_TABLE
+        for byte in bytes(data):
+            crc = table[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+        self.value = crc ^ 0xFFFFFFFF
+
+    def digest(self) -> bytes:
+        """Checksum as 4 bytes, as sent base64 encoded in x-amz-checksum-crc32c."""
+        return self.value.to_bytes(4, "big")
+
+    def hexdigest(self) -> str:
+        """Checksum as hex string."""
+        return self.digest().hex()
+
+
+class EtagHash:
+    """S3 multipart ETag of data uploaded in parts of part_size, one part if 0."""
+
+    name = "etag"
+
+    def __init__(self, part_size: int = 0) -> None:
+        self.part_size = part_size
+        self._digests = []
+        self._part = hashlib.md5()  # nosec
+        self._filled = 0
+
+    def update(self, data) -> None:
+        """Add data, a part is closed when it reaches part_size."""
+        data = memoryview(data)
+        while self.part_size and self._filled + len(data) > self.part_size:
+            take = self.part_size - self._filled
+            self._part.update(data[:take])
+            data = data[take:]
+            self._digests.append(self._part.digest())
+            self._part = hashlib.md5()  # nosec
+            self._filled = 0
+        self._part.update(data)
+        self._filled += len(data)
+
+    def hexdigest(self) -> str:
+        """ETag without quotes, e.g. "9b2cf535f27731c974343645a3985328-3"."""
+        digests = list(self._digests)
+        if self._filled or not digests:
+            digests.append(self._part.digest())
+        return f"{hashlib.md5(b''.join(digests)).hexdigest()}-{len(digests)}"  # nosec
+
+
+def algo_name(algo: str) -> str:
+    """Normalized algorithm name, "SHA-256" gives "sha256"."""
+    return algo.lower().replace("-", "").replace("_", "")
+
+
+def new(algo: str, part_size: int = 0):
+    """
+    Hash object of algo with update and hexdigest.
+    :param algo: md5, sha1, sha224, sha256, sha384, sha512, crc32c or etag.
+    :param part_size: multipart part size of etag.
+    """
+    name = algo_name(algo)
+    if name == "crc32c":
+        return Crc32c()
+    if name == "etag":
+        return EtagHash(part_size)
+    try:
+        return hashlib.new(name)
+    except ValueError as error:
+        raise ValueError(f"Unsupported checksum algorithm {algo}") from error
+
+
+def to_base64(hexdigest: str) -> str:
+    """Base64 of a hex digest, e.g. the Content-MD5 header value of an md5."""
+    return base64.b64encode(bytes.fromhex(hexdigest)).decode()
+
+
+def file_digests(file_path: str, algos: Iterable[str] = ("md5",), part_size: int = 0,
+                 block_size: int = constants.CHECKSUM_BLOCK_SIZE) -> Dict[str, str]:
+    """
+    Hex digests of a file for all algos in one read of the file.
+    :param part_size: multipart part size of the etag algo.
+    :param block_size: bytes read at once, a multiple of the page size.
+    :return: dict of algo as given to hex digest.
+    """
+    hashes = {algo: new(algo, part_size) for algo in algos}
+    with open(file_path, "rb", buffering=0) as fin:
+        # small files need no large buffer, one spare byte sees the end in one read
+        buf = bytearray(min(block_size, os.fstat(fin.fileno()).st_size + 1))
+        view = memoryview(buf)
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fin.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        while True:
+            count = fin.readinto(buf)
+            if not count:
+                break
+            block = view[:count]
+            for hash_obj in hashes.values():
+                hash_obj.update(block)
+    return {algo: hash_obj.hexdigest() for algo, hash_obj in hashes.items()}
+
+
+def file_checksum(file_path: str, algo: str = "md5", part_size: int = 0) -> str:
+    """Hex digest of a file."""
+    return file_digests(file_path, (algo,), part_size)[algo]
+
+
+def files_digests(file_paths: Iterable[str], algos: Iterable[str] = ("md5",),
+                  part_size: int = 0,
+                  workers: int = constants.CHECKSUM_WORKERS) -> Dict[str, Dict[str, str]]:
+    """
+    Hex digests of several files hashed concurrently.
+    :return: dict of file path to file_digests result, in the given file order.
+    """
+    file_paths, algos = list(file_paths), tuple(algos)
+    if len(file_paths) < 2 or workers < 2:
+        return {path: file_digests(path, algos, part_size) for path in file_paths}
+    with ThreadPoolExecutor(max_workers=min(workers, len(file_paths)),
+                            thread_name_prefix="checksum") as executor:
+        results = executor.map(lambda path: file_digests(path, algos, part_size), file_paths)
+        return dict(zip(file_paths, results))
@@ -0,0 +1,141 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""
+MongoDB client registry and query result cache.
+
+MongoClient is thread safe and pools connections, get_client() keeps a single
+client per URI for the whole process. Read helpers cache results for CACHE_TTL
+seconds keyed by (uri, db, collection, operation, normalized query), writes
+must call QUERY_CACHE.invalidate() for the collection they modify.
+This module is shared by the framework and the report, dashboard and REST
+server tools, which put the repository root on sys.path to import it.
+"""
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+from typing import Callable
+
+from pymongo import MongoClient
+
+from commons.params import SYS_INFO_COLLECTION
+from commons.params import VM_COLLECTION
+
+#: Seconds a query result is served from cache and max number of cached results.
+CACHE_TTL = 60
+CACHE_MAX_ENTRIES = 1024
+#: Collections which are never cached, core/locking_server keeps setup locks and
+#: VM reservations in them which other processes change at any time.
+UNCACHED_COLLECTIONS = {SYS_INFO_COLLECTION, VM_COLLECTION}
+
+_CLIENTS = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def get_client(uri: str) -> MongoClient:
+    """
+    Return the process wide client for uri, MongoClient is thread safe and
+    keeps its own connection pool so it is created once and reused.
+    """
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(uri)
+        if client is None:
+            client = MongoClient(uri)
+            _CLIENTS[uri] = client
+        return client
+
+
+def close_clients():
+    """Close all registered clients."""
+    with _CLIENTS_LOCK:
+        for client in _CLIENTS.values():
+            client.close()
+        _CLIENTS.clear()
+
+
+class QueryCache:
+    """TTL and LRU bounded cache of query results."""
+
+    def __init__(self, ttl: float = CACHE_TTL, max_entries: int = CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> (bool, Any):
+        """Return (True, value) for a fresh entry else (False, None)."""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self.entries[key]
+                self.misses += 1
+                return False, None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+
+    def put(self, key: tuple, value: Any) -> None:
+        """Add value, evicting least recently used entries above max_entries."""
+        if self.ttl <= 0 or self.max_entries <= 0:
+            return
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, db_name: str = None, collection: str = None) -> None:
+        """Drop cached results of a collection, of a database or everything."""
+        with self.lock:
+            for key in list(self.entries):
+                if db_name in (None, key[1]) and collection in (None, key[2]):
+                    del self.entries[key]
+
+
+QUERY_CACHE = QueryCache()
+
+
+def normalize(query: Any) -> str:
+    """
+    Cache key of a query. Top level fields of a filter are ANDed so their
+    order is irrelevant, nested documents and pipelines keep their order.
+    """
+    if isinstance(query, dict):
+        query = sorted(query.items(), key=lambda item: item[0])
+    return json.dumps(query, default=str)
+
+
+def cached_query(operation: str, uri: str, db_name: str, collection: str,
+                 params: tuple, loader: Callable) -> Any:
+    """
+    Return result of loader(collection) from cache or run it and cache it.
+    A copy is returned so callers may modify the documents.
+    """
+    if collection in UNCACHED_COLLECTIONS:
+        return loader(get_client(uri)[db_name][collection])
+    key = (uri, db_name, collection, operation) + tuple(normalize(item) for item in params)
+    found, result = QUERY_CACHE.get(key)
+    if not found:
+        result = loader(get_client(uri)[db_name][collection])
+        QUERY_CACHE.put(key, result)
+    return copy.deepcopy(result)
@@ -26,12 +26,12 @@ import logging
 import json
 from typing import List
 from urllib.parse import quote_plus
-from pymongo import MongoClient
 from commons import commands as common_cmd
 from commons.helpers.node_helper import Node
 from commons.params import DB_HOSTNAME
 from commons.params import DB_NAME
 from commons.params import SYS_INFO_COLLECTION
+from commons.utils import db_utils
 
 LOGGER = logging.getLogger(__name__)
 
@@ -211,7 +211,7 @@ def register_setup_entry(hosts: List, setupname, csm_user, csm_pass, node_pass):
     setup_query = {"setupname": setup_json['setupname']}
     uri = "mongodb://{0}:{1}@{2}".format(quote_plus(os.environ.get('DB_USER')),
                                          quote_plus(os.environ.get('DB_PASSWORD')), DB_HOSTNAME)
-    client = MongoClient(uri)
+    client = db_utils.get_client(uri)
     collection_obj = client[DB_NAME][SYS_INFO_COLLECTION]
     LOGGER.debug("Collection obj for DB interaction %s", collection_obj)
     LOGGER.debug("Setup query : %s", setup_query)
@@ -222,5 +222,6 @@ def register_setup_entry(hosts: List, setupname, csm_user, csm_pass, node_pass):
     else:
         collection_obj.update_one(setup_query, {'$set': setup_json})
         LOGGER.debug("Setup Data is updated successfully")
+    db_utils.QUERY_CACHE.invalidate(DB_NAME, SYS_INFO_COLLECTION)
     setup_details = collection_obj.find_one(setup_query)
     return setup_details
@@ -258,18 +258,31 @@ class JiraTask:
         """
         Update test jira status in xray jira.
         """
-        state = {}
-        status = {}
-        state["testExecutionKey"] = test_exe_id
-        status["testKey"] = test_id
+        return self.update_test_jira_statuses(
+            test_exe_id, [self.test_status_record(test_id, test_status, log_path)])
+
+    @staticmethod
+    def test_status_record(test_id, test_status, log_path='', timestamp=None) -> dict:
+        """
+        Xray import record of a test status.
+        :param timestamp: time of the status change, now if None.
+        """
+        timestamp = datetime.datetime.now().astimezone() if timestamp is None else timestamp
+        status = {"testKey": test_id}
         if test_status == 'Executing':
-            status["start"] = datetime.datetime.now().astimezone().isoformat(timespec='seconds')
+            status["start"] = timestamp.isoformat(timespec='seconds')
         else:
-            status["finish"] = datetime.datetime.now().astimezone().isoformat(timespec='seconds')
+            status["finish"] = timestamp.isoformat(timespec='seconds')
             status["comment"] = log_path
         status["status"] = test_status
-        state["tests"] = []
-        state['tests'].append(status)
+        return status
+
+    def update_test_jira_statuses(self, test_exe_id, statuses: list):
+        """
+        Update status of several tests of a test execution with one request.
+        :param statuses: records created by test_status_record.
+        """
+        state = {"testExecutionKey": test_exe_id, "tests": statuses}
         data = json.dumps(state)
         jira_url = self.jira_url + "/rest/raven/1.0/import/execution"
         response = requests.request("POST", jira_url, data=data,
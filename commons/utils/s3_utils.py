@@ -18,8 +18,9 @@
 
 """S3 utility Library."""
 import base64
+import io
+import mmap
 import os
-import time
 import urllib
 import hmac
 import datetime
@@ -28,11 +29,17 @@ import logging
 import json
 import xmltodict
 from hashlib import md5
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from random import shuffle
 from typing import Any
+from typing import Iterable
+from typing import List
 from config import S3_CFG, CMN_CFG
 
 from commons.utils import assert_utils
+from commons.utils import checksum_utils
+from commons.utils import wait_utils
 from commons import constants as const
 
 
@@ -197,39 +204,34 @@ def convert_xml_to_dict(xml_response) -> dict:
 
 
 def poll(target, *args, condition=None, **kwargs) -> Any:
-    """Method to wait for a function/target to return a certain expected condition."""
+    """
+    Method to wait for a function/target to return a certain expected condition.
+    :param condition: callable taking the response, true when it is as expected.
+    :keyword timeout: seconds to wait, sync_delay of the S3 config by default.
+    :keyword step: longest delay between calls, sync_step of the S3 config by default.
+    :keyword expected: response type accepted without condition.
+    :return: first accepted response, else the response of one last call.
+    """
+    if condition is not None and not callable(condition):
+        raise TypeError(f"poll condition must be callable, got {condition!r}")
     timeout = kwargs.pop("timeout", S3_CFG["sync_delay"])
     step = kwargs.pop("step", S3_CFG["sync_step"])
     expected = kwargs.pop("expected", dict)
-    end_time = time.time() + timeout
-    while time.time() <= end_time:
-        try:
-            response = target(*args, **kwargs)
-            if condition:
-                if eval(condition.format(response)):
-                    return response
-            elif isinstance(response, expected) or response:
-                return response
-        except Exception as response:
-            LOGGER.error(response)
-        LOGGER.info("SYNC: retrying for %s", str(target.__name__))
-        time.sleep(step)
+    backoff = wait_utils.Backoff(initial=min(step, const.WAIT_INITIAL_DELAY), maximum=step)
+    result = wait_utils.wait_until(
+        target, *args,
+        condition=condition or (lambda response: isinstance(response, expected) or response),
+        timeout=timeout, name=f"SYNC {target.__name__}", backoff=backoff, **kwargs)
+    if result:
+        return result.value
 
     return target(*args, **kwargs)
 
 
 def calc_checksum(file_path, part_size=0):
-    """Calculating an checksum using encryption algorithm."""
+    """Multipart ETag of a file uploaded in parts of part_size, one part if 0."""
     try:
-        hash_digests = list()
-        with open(file_path, 'rb') as f_obj:
-            if part_size and os.stat(file_path).st_size > part_size:
-                for chunk in iter(lambda: f_obj.read(part_size), b''):
-                    hash_digests.append(md5(chunk).digest())
-            else:
-                hash_digests.append(md5(f_obj.read()).digest())
-
-        return md5(b''.join(hash_digests)).hexdigest() + '-' + str(len(hash_digests))
+        return checksum_utils.file_checksum(file_path, "etag", part_size=part_size)
     except OSError as error:
         LOGGER.error(str(error))
         raise error from OSError
@@ -251,16 +253,164 @@ def get_multipart_etag(parts):
 
     :param parts: List of dict with the format {part_number: (data_bytes, content_md5), ...}
     """
-    md5_digests = []
-    for part_number in sorted(parts.keys()):
-        md5_digests.append(md5(parts[part_number][0]).digest())
-    multipart_etag = md5(b''.join(md5_digests)).hexdigest() + '-' + str(len(md5_digests))
-    return '"%s"' % multipart_etag
+    etag = MultipartEtag()
+    for part_number, part in parts.items():
+        if isinstance(part, MultipartPart):
+            etag.add(part_number, part.digest())
+        else:
+            etag.add(part_number, md5(part[0]).digest())
+    return etag.value
+
+
+class MultipartEtag:
+    """Expected multipart ETag built from part MD5 digests as parts are uploaded."""
+
+    def __init__(self):
+        self.digests = dict()
+
+    def add(self, part_number: int, digest: bytes) -> None:
+        """Record the MD5 digest of a part, in any order."""
+        self.digests[part_number] = digest
+
+    @property
+    def value(self) -> str:
+        """Quoted ETag of the parts added so far, in part number order."""
+        digests = [self.digests[part_number] for part_number in sorted(self.digests)]
+        return '"%s-%s"' % (md5(b''.join(digests)).hexdigest(), len(digests))
+
+
+class MultipartPart(Sequence):
+    """
+    One part of a file, part[0] is a zero copy memoryview of the data and part[1]
+    its Content-MD5, computed on first use, so part data is never held in memory.
+    A part is pickled as (file path, offset, length) and maps the file again when
+    unpickled, e.g. in a multiprocessing.Pool worker.
+    """
+
+    __slots__ = ('data', 'path', 'offset', '_digest')
+
+    def __init__(self, data: memoryview, path: str = None, offset: int = 0) -> None:
+        self.data = data
+        self.path = path
+        self.offset = offset
+        self._digest = None
+
+    def __reduce__(self):
+        if self.path is None:
+            return MultipartPart, (memoryview(bytes(self.data)),)
+        return _load_part, (self.path, self.offset, len(self.data), self._digest)
+
+    def __getitem__(self, idx):
+        if idx in (0, -2):
+            return self.data
+        if idx in (1, -1):
+            return self.content_md5
+        raise IndexError(idx)
+
+    def __len__(self) -> int:
+        return 2
+
+    def digest(self) -> bytes:
+        """MD5 digest of the part data."""
+        if self._digest is None:
+            self._digest = md5(self.data).digest()
+        return self._digest
+
+    @property
+    def content_md5(self) -> str:
+        """Content-MD5 header value of the part."""
+        return base64.b64encode(self.digest()).decode('utf-8')
+
+    def reader(self) -> "PartReader":
+        """File object over the part data, e.g. as upload_part Body."""
+        return PartReader(self.data)
+
+
+class PartReader(io.RawIOBase):
+    """Seekable read only file object over a memoryview, the data is read in place."""
+
+    def __init__(self, view: memoryview) -> None:
+        super().__init__()
+        self.view = view.cast('B') if view.format != 'B' else view
+        self.pos = 0
+
+    def __len__(self) -> int:
+        return len(self.view)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        end = len(self.view) if size is None or size < 0 else min(len(self.view),
+                                                                   self.pos + size)
+        data = bytes(self.view[self.pos:end])
+        self.pos = max(self.pos, end)
+        return data
+
+    def readinto(self, buffer) -> int:
+        count = max(0, min(len(buffer), len(self.view) - self.pos))
+        buffer[:count] = self.view[self.pos:self.pos + count]
+        self.pos += count
+        return count
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self.pos, io.SEEK_END: len(self.view)}[whence]
+        self.pos = max(0, base + offset)
+        return self.pos
+
+    def tell(self) -> int:
+        return self.pos
+
+
+def split_file(file_path: str, sizes: Iterable[int], stop_at_eof: bool = True
+               ) -> List[MultipartPart]:
+    """
+    Parts of consecutive sizes of a file, backed by one read only mmap of it.
+
+    :param file_path: Path of object file.
+    :param sizes: part sizes in bytes, the part at end of file may be shorter.
+    :param stop_at_eof: stop at end of file, else parts past it are empty.
+    """
+    size, view = _map_file(file_path)
+    parts = list()
+    offset = 0
+    for part_size in sizes:
+        if stop_at_eof and (offset >= size or part_size <= 0):
+            break
+        parts.append(MultipartPart(view[offset:offset + int(part_size)], file_path, offset))
+        offset += int(part_size)
+    return parts
+
+
+def _map_file(file_path: str) -> tuple:
+    """Size and read only memoryview of a whole file."""
+    with open(file_path, "rb") as file_pointer:
+        size = os.fstat(file_pointer.fileno()).st_size
+        view = memoryview(mmap.mmap(file_pointer.fileno(), 0, access=mmap.ACCESS_READ)
+                          if size else b'')
+    return size, view
+
+
+def _load_part(file_path: str, offset: int, length: int, digest: bytes) -> MultipartPart:
+    """Unpickle a MultipartPart by mapping its file again."""
+    part = MultipartPart(_map_file(file_path)[1][offset:offset + length], file_path, offset)
+    part._digest = digest  # pylint: disable=protected-access
+    return part
+
+
+def calc_parts_md5(parts: Iterable[MultipartPart],
+                   workers: int = const.MULTIPART_MD5_WORKERS) -> None:
+    """Compute part MD5 digests in parallel, hashlib releases the GIL while hashing."""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(MultipartPart.digest, parts))
 
 
 def get_aligned_parts(file_path, total_parts=1, chunk_size=5242880, random=False) -> dict:
     """
-    Create the upload parts dict with aligned part size(limitation: not supported more than 10G).
+    Create the upload parts dict with aligned part size.
 
     https://www.gbmb.org/mb-to-bytes
     Megabytes (MB)	Bytes (B) decimal	Bytes (B) binary
@@ -270,21 +420,15 @@ def get_aligned_parts(file_path, total_parts=1, chunk_size=5242880, random=False
     :param file_path: Path of object file.
     :param chunk_size: chunk size used to read each check default is 5MB.
     :param random: Generate random else sequential part order.
-    :return: Parts details with data, checksum.
+    :return: Parts details with data (memoryview of the file), checksum.
     """
     try:
         obj_size = os.stat(file_path).st_size
-        parts = dict()
         part_size = int(int(obj_size) / int(chunk_size)) // int(total_parts)
-        with open(file_path, "rb") as file_pointer:
-            i = 1
-            while True:
-                data = file_pointer.read(chunk_size * part_size)
-                if not data:
-                    break
-                LOGGER.info("data_len %s", str(len(data)))
-                parts[i] = [data, calc_contentmd5(data)]
-                i += 1
+        sizes = [chunk_size * part_size] * (-(-obj_size // (chunk_size * part_size))
+                                            if part_size else 0)
+        parts = dict(enumerate(split_file(file_path, sizes), 1))
+        LOGGER.info("data_len %s", [len(part[0]) for part in parts.values()])
         if random:
             keys = list(parts.keys())
             shuffle(keys)
@@ -298,7 +442,7 @@ def get_aligned_parts(file_path, total_parts=1, chunk_size=5242880, random=False
 
 def get_unaligned_parts(file_path, total_parts=1, chunk_size=5242880, random=False) -> dict:
     """
-    Create the upload parts dict with unaligned part size(limitation: not supported more than 10G).
+    Create the upload parts dict with unaligned part size.
 
     https://www.gbmb.org/mb-to-bytes
     Megabytes (MB)	Bytes (B) decimal	Bytes (B) binary
@@ -311,24 +455,21 @@ def get_unaligned_parts(file_path, total_parts=1, chunk_size=5242880, random=Fal
     :param file_path: Path of object file.
     :param chunk_size: chunk size used to read each check default is 5MB.
     :param random: Generate random else sequential part order.
-    :return: Parts details with data, checksum.
+    :return: Parts details with data (memoryview of the file), checksum.
     """
     try:
         obj_size = os.stat(file_path).st_size
-        parts = dict()
         part_size = int(int(obj_size) / int(chunk_size)) // int(total_parts)
         unaligned = [104857, 209715, 314572, 419430, 524288,
                      629145, 734003, 838860, 943718, 1048576]
-        with open(file_path, "rb") as file_pointer:
-            i = 1
-            while True:
-                shuffle(unaligned)
-                data = file_pointer.read((chunk_size + unaligned[0]) * part_size)
-                if not data:
-                    break
-                LOGGER.info("data_len %s", str(len(data)))
-                parts[i] = [data, calc_contentmd5(data)]
-                i += 1
+        sizes = list()
+        total = 0
+        while part_size and total < obj_size:
+            shuffle(unaligned)
+            sizes.append((chunk_size + unaligned[0]) * part_size)
+            total += sizes[-1]
+        parts = dict(enumerate(split_file(file_path, sizes), 1))
+        LOGGER.info("data_len %s", [len(part[0]) for part in parts.values()])
         if random:
             keys = list(parts.keys())
             shuffle(keys)
@@ -347,19 +488,16 @@ def get_precalculated_parts(file_path, part_list, chunk_size=1048576) -> dict:
     :param file_path: Path of object file.
     :param part_list: List of dict with keys 'part_size' (in bytes) and 'count'
     :param chunk_size: chunk size used to read each check default is 1MB.
-    :return: Parts details with data, checksum.
+    :return: Parts details with data (memoryview of the file), checksum.
     """
     total_part_list = []
     for part in part_list:
         total_part_list.extend([part['part_size']] * part['count'])
     shuffle(total_part_list)
-    parts = dict()
     try:
-        with open(file_path, "rb") as file_pointer:
-            for i, part_size in enumerate(total_part_list, 1):
-                data = file_pointer.read(int(part_size * chunk_size))
-                parts[i] = [data, calc_contentmd5(data)]
-        return parts
+        return dict(enumerate(split_file(
+            file_path, [part_size * chunk_size for part_size in total_part_list],
+            stop_at_eof=False), 1))
     except OSError as error:
         LOGGER.error(str(error))
         raise error from OSError
@@ -33,13 +33,13 @@ import string
 import glob
 from typing import Tuple
 from subprocess import Popen, PIPE
-from hashlib import md5
-from pathlib import Path
 from botocore.response import StreamingBody
 from paramiko import SSHClient, AutoAddPolicy
 from commons import commands
 from commons import params
 from commons.constants import AWS_CLI_ERROR
+from commons.constants import CHECKSUM_BLOCK_SIZE
+from commons.utils import checksum_utils
 
 if sys.platform == 'win32':
     try:
@@ -296,70 +296,40 @@ def calculate_checksum(
     :param file_path: Name of the file with path
     :param binary_bz64: Calculate binary base64 checksum for file,
     if False it will return MD5 checksum digest
-    :param options: option for md5sum tool
-    :keyword filter_resp: filter md5 checksum cmd response True/False
+    :param options: option of the former md5sum tool, not used
+    :keyword filter_resp: kept for compatibility, the checksum is always filtered
     # :param hash_algo: calculate checksum for given hash algo
-    :return: string or MD5 object
+    :return: bool, base64 md5 or hex digest
     """
     hash_algo = kwargs.get("hash_algo", "md5")
     if not os.path.exists(file_path):
         return False, "Please pass proper file path"
-    if hash_algo == "md5":
-        if binary_bz64:
-            cmd = "openssl md5 -binary {} | base64".format(file_path)
-        else:
-            cmd = "md5sum {} {}".format(options, file_path)
-    if hash_algo == "SHA-1":
-        cmd = "sha1sum {}".format(file_path)
-    if hash_algo == "SHA-224":
-        cmd = "sha224sum {}".format(file_path)
-    if hash_algo == "SHA-256":
-        cmd = "sha256sum {}".format(file_path)
-    if hash_algo == "SHA-384":
-        cmd = "sha384sum {}".format(file_path)
-    if hash_algo == "SHA-512":
-        cmd = "sha512sum {}".format(file_path)
-
-    LOGGER.debug("Executing cmd: %s", cmd)
-    result = run_local_cmd(cmd)
-    LOGGER.debug("Output: %s", str(result))
-    if kwargs.get("filter_resp", None) and binary_bz64:
-        result = (result[0], filter_bin_md5(result[1]))
-    return result
+    try:
+        result = checksum_utils.file_checksum(file_path, hash_algo)
+    except (OSError, ValueError) as error:
+        LOGGER.error("Checksum of %s not calculated: %s", file_path, error)
+        return False, str(error)
+    if binary_bz64 and checksum_utils.algo_name(hash_algo) == "md5":
+        result = checksum_utils.to_base64(result)
+    LOGGER.debug("%s of %s: %s", hash_algo, file_path, result)
+    return True, result
 
 
 def calc_checksum(object_ref: object, hash_algo: str = 'md5'):
     """
     Calculate checksum of file or stream.
     :param object_ref: Object/File Path or byte/buffer stream
-    :param hash_algo: md5 or sha1
-    :return:
+    :param hash_algo: algorithm supported by checksum_utils.new, e.g. md5 or sha1
+    :return: hex digest
     """
-    read_sz = 8192
-    csum = None
-    file_hash = md5()  # nosec
-    if hash_algo != 'md5':
-        raise NotImplementedError('Only md5 supported')
     if isinstance(object_ref, StreamingBody):
-        chunk = object_ref.read(amt=read_sz)
-        while chunk:
+        file_hash = checksum_utils.new(hash_algo)
+        for chunk in object_ref.iter_chunks(chunk_size=CHECKSUM_BLOCK_SIZE):
             file_hash.update(chunk)
-            chunk = object_ref.read(amt=read_sz)
         return file_hash.hexdigest()
     if os.path.exists(object_ref):
-        size = Path(object_ref).stat().st_size
-
-        with open(object_ref, 'rb') as file_ptr:
-            if size < read_sz:
-                buf = file_ptr.read(size)
-            else:
-                buf = file_ptr.read(read_sz)
-            while buf:
-                file_hash.update(buf)
-                buf = file_ptr.read(read_sz)
-            csum = file_hash.hexdigest()
-
-    return csum
+        return checksum_utils.file_checksum(object_ref, hash_algo)
+    return None
 
 
 def cal_percent(num1: float, num2: float) -> float:
@@ -581,7 +551,7 @@ def get_file_checksum(filename: str):
     """
     LOGGER.debug("Calculating checksum of file content")
     try:
-        result = md5(open(filename, "rb").read()).hexdigest()
+        result = checksum_utils.file_checksum(filename)
 
         return True, result
     except BaseException as error:
@@ -1029,6 +999,35 @@ def insert_into_builtins(name, obj):
         builtins.obj = obj
 
 
+def mount_nfs_dir(host_dir: str, mnt_dir: str) -> tuple:
+    """Mount NFS directory unless it is already mounted
+    :param host_dir: Link of NFS server directory
+    :param mnt_dir: Path of directory to be mounted
+    :return: Bool, response"""
+    if os.path.ismount(mnt_dir):
+        return True, mnt_dir
+    if not os.path.exists(mnt_dir):
+        LOGGER.info("Creating a mount directory to share")
+        make_dirs(dpath=mnt_dir)
+    resp = run_local_cmd(cmd=commands.CMD_MOUNT.format(host_dir, mnt_dir))
+    if not resp[0]:
+        return resp
+    return True, mnt_dir
+
+
+def copy_to_dir(local_path: str, dest_dir: str) -> str:
+    """Copy a file or directory tree into dest_dir, created if missing
+    A tree is merged into an existing copy, so a retried copy can complete it.
+    :return: Path of the copy"""
+    if not os.path.exists(dest_dir):
+        make_dirs(dpath=dest_dir)
+    if os.path.isfile(local_path):
+        LOGGER.debug("Copy from %s to %s", local_path, dest_dir)
+        return shutil.copy(local_path, dest_dir)
+    return shutil.copytree(local_path, os.path.join(dest_dir, os.path.basename(local_path)),
+                           dirs_exist_ok=True)
+
+
 def mount_upload_to_server(host_dir: str = None, mnt_dir: str = None,
                            remote_path: str = None, local_path: str = None) \
         -> tuple:
@@ -1039,43 +1038,20 @@ def mount_upload_to_server(host_dir: str = None, mnt_dir: str = None,
     :param local_path: Local path of the file to be uploaded
     :return: Bool, response"""
     try:
-        if not os.path.ismount(mnt_dir):
-            if not os.path.exists(mnt_dir):
-                LOGGER.info("Creating a mount directory to share")
-                resp = make_dirs(dpath=mnt_dir)
-
-            cmd = commands.CMD_MOUNT.format(host_dir, mnt_dir)
-            resp = run_local_cmd(cmd=cmd)
-            if not resp[0]:
-                return resp
-
+        resp = mount_nfs_dir(host_dir, mnt_dir)
+        if not resp[0]:
+            return resp
         new_path = os.path.join(mnt_dir, remote_path)
-        LOGGER.info("Creating directory on server")
-        if not os.path.exists(new_path):
-            resp = make_dirs(dpath=new_path)
-
         LOGGER.info("Copying file to mounted directory")
         LOGGER.info("local path and new path are %s\n%s", local_path, new_path)
-        if os.path.isfile(local_path):
-            LOGGER.debug("Copy from %s to %s", local_path, new_path)
-            shutil.copy(local_path, new_path)
-        else:
-            LOGGER.debug("Copy in else")
-            shutil.copytree(local_path, os.path.join(new_path, os.path.basename(local_path)))
+        copy_to_dir(local_path, new_path)
         log_path = os.path.join(host_dir, remote_path)
 
     except Exception as error:
         LOGGER.error(error)
         LOGGER.info("Copying file to local path")
         log_path = os.path.join(params.LOCAL_LOG_PATH, remote_path)
-        if not os.path.exists(log_path):
-            LOGGER.info("Creating local log directory")
-            resp = make_dirs(dpath=log_path)
-
-        if os.path.isfile(local_path):
-            shutil.copy(local_path, log_path)
-        else:
-            shutil.copytree(local_path, os.path.join(log_path, os.path.basename(local_path)))
+        copy_to_dir(local_path, log_path)
 
     return True, log_path
 
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/python
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Wait for a condition with exponential, jittered backoff and a deadline.
+
+Usage:
+    result = wait_for(lambda: node.is_string_in_remote_file(alert, path)[0],
+                      timeout=120, name="sspl alert")
+    if not result:
+        LOGGER.error("No alert after %.1fs, %s checks", result.elapsed, result.attempts)
+    response = wait_until(health.check_cluster_status, pod_obj,
+                          condition=lambda resp: resp[0], timeout=1200).value
+
+The predicate is called right away and again after delays growing from
+initial by factor up to maximum, each randomized by +-jitter so parallel
+workers do not poll in lock step. The wait returns as soon as the predicate
+is true and never sleeps past the deadline. Every wait, including fixed
+pauses, is logged with its actual duration and kept in a bounded in process
+record, see wait_timings().
+"""
+
+import collections
+import logging
+import random
+import threading
+import time
+from dataclasses import asdict
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+from typing import Iterator
+from typing import List
+from typing import Tuple
+from typing import Type
+
+from commons import constants
+
+LOGGER = logging.getLogger(__name__)
+
+_TIMINGS = collections.deque(maxlen=constants.WAIT_TIMINGS_KEPT)
+_TIMINGS_LOCK = threading.Lock()
+
+
+@dataclass
+class Backoff:
+    """Delays between attempts, initial * factor ** n capped at maximum, +-jitter."""
+    initial: float = constants.WAIT_INITIAL_DELAY
+    factor: float = 2.0
+    maximum: float = constants.WAIT_MAX_DELAY
+    jitter: float = 0.1
+
+    def delays(self) -> Iterator[float]:
+        """Endless delays in seconds."""
+        delay = self.initial
+        while True:
+            spread = delay * self.jitter
+            yield max(0.0, delay + random.uniform(-spread, spread))  # nosec
+            delay = min(delay * self.factor, self.maximum)
+
+
+@dataclass
+class WaitResult:
+    """Outcome and timing of a wait, true if the condition was met."""
+    name: str
+    success: bool
+    value: Any = None
+    attempts: int = 0
+    elapsed: float = 0.0
+    timeout: float = 0.0
+    error: BaseException = None
+
+    def __bool__(self) -> bool:
+        return self.success
+
+    def as_dict(self) -> dict:
+        """Timing record without value and error objects."""
+        record = asdict(self)
+        record.pop("value")
+        record["error"] = repr(self.error) if self.error else None
+        return record
+
+
+def _record(result: WaitResult) -> WaitResult:
+    """Log and keep the timing of a finished wait."""
+    with _TIMINGS_LOCK:
+        _TIMINGS.append(result.as_dict())
+    LOGGER.info("WAIT %s: %s after %.2fs of %ss, %s attempts%s", result.name,
+                "done" if result.success else "timed out", result.elapsed, result.timeout,
+                result.attempts, f", last error {result.error!r}" if result.error else "")
+    return result
+
+
+def wait_timings() -> List[dict]:
+    """Timing records of the latest waits of this process, oldest first."""
+    with _TIMINGS_LOCK:
+        return list(_TIMINGS)
+
+
+def wait_for(predicate: Callable[[], Any], timeout: float, name: str = None,
+             backoff: Backoff = None,
+             exceptions: Tuple[Type[BaseException], ...] = (Exception,),
+             raise_on_timeout: bool = False) -> WaitResult:
+    """
+    Call predicate until it returns a true value or timeout seconds passed.
+    :param predicate: no argument callable, its last return value is the result value.
+    :param name: label of the wait in logs and timings, the predicate name by default.
+    :param exceptions: exceptions of predicate treated as not yet true.
+    :param raise_on_timeout: raise TimeoutError instead of returning a failed result.
+    """
+    backoff = backoff or Backoff()
+    name = name or getattr(predicate, "__name__", "condition")
+    result = WaitResult(name, False, timeout=timeout)
+    start = time.monotonic()
+    deadline = start + timeout
+    delays = backoff.delays()
+    while True:
+        result.attempts += 1
+        try:
+            result.value = predicate()
+            result.error = None
+        except exceptions as error:  # pylint: disable=broad-except
+            result.value, result.error = None, error
+            LOGGER.debug("WAIT %s: attempt %s failed: %s", name, result.attempts, error)
+        if result.value:
+            result.success = True
+            break
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(next(delays), remaining))
+    result.elapsed = time.monotonic() - start
+    _record(result)
+    if raise_on_timeout and not result.success:
+        raise TimeoutError(f"{name} not true after {result.elapsed:.1f}s") from result.error
+    return result
+
+
+def wait_until(target: Callable, *args, condition: Callable[[Any], bool] = bool,
+               timeout: float, name: str = None, backoff: Backoff = None,
+               exceptions: Tuple[Type[BaseException], ...] = (Exception,),
+               **kwargs) -> WaitResult:
+    """
+    Call target(*args, **kwargs) until condition(response) is true.
+    :return: result with the last response of target as value.
+    """
+    state = dict()
+
+    def predicate():
+        state["response"] = target(*args, **kwargs)
+        return condition(state["response"])
+
+    result = wait_for(predicate, timeout, name or getattr(target, "__name__", None),
+                      backoff, exceptions)
+    result.value = state.get("response") if result.error is None else None
+    return result
+
+
+def pause(seconds: float, name: str) -> WaitResult:
+    """Fixed sleep without a condition to check, recorded like a wait."""
+    start = time.monotonic()
+    time.sleep(seconds)
+    return _record(WaitResult(name, True, attempts=1, elapsed=time.monotonic() - start,
+                              timeout=seconds))
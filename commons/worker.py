@@ -17,33 +17,85 @@
 # For any questions about this software or licensing,
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 #
-"""Worker pool to perform similar tasks"""
+"""Worker pool to perform similar tasks
+
+Usage:
+    workers = Workers()
+    workers.start_workers(nworkers=16)
+    task = workers.submit(func, arg1, key=value)
+    count = workers.submit_many(func, items, batch_size=64)
+    results = list(workers.map(func, items))
+    workers.drain(timeout=600)
+    print(workers.stats())
+    workers.end_workers()
+
+Work items are queued in batches on a bounded queue, submitters block while
+max_pending batches are waiting (backpressure). Every Task captures the result
+or the exception of its call, failures are logged and counted.
+"""
+import time
 import logging
-import queue
 import threading
+import collections
 from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import List
 from threading import Thread
 from commons.constants import NWORKERS
 
 logger = logging.getLogger(__name__)
 
+DEF_BATCH_SIZE = 64
+#: Upper bounds (ms) of latency histogram buckets, last bucket is unbounded.
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 60000)
+
+PENDING, RUNNING, DONE, FAILED = 'pending', 'running', 'done', 'failed'
+
 
-class WorkQ(queue.Queue):
-    def __init__(self, func: Any, maxsize: int) -> None:
-        self.lock_req = maxsize != 0
+class Task:
+    """A unit of work submitted to Workers, holds its result or exception."""
+    __slots__ = ('func', 'args', 'kwargs', 'state', 'result', 'exception',
+                 'started', 'finished', 'pool')
+
+    def __init__(self, func: Callable, args: tuple = (), kwargs: dict = None,
+                 pool: 'Workers' = None) -> None:
         self.func = func
-        self.semaphore = threading.Semaphore(maxsize)
-        queue.Queue.__init__(self, maxsize)
+        self.args = args
+        self.kwargs = kwargs if kwargs else dict()
+        self.state = PENDING
+        self.result = None
+        self.exception = None
+        self.started = None
+        self.finished = None
+        self.pool = pool
+
+    def done(self) -> bool:
+        """True once the task has run, successfully or not."""
+        return self.state in (DONE, FAILED)
 
-    def put(self, item):
-        if self.lock_req:
-            self.semaphore.acquire()
-        queue.Queue.put(self, item)
+    def wait(self, timeout: float = None) -> bool:
+        """Wait for task completion, returns False on timeout."""
+        if self.done():
+            return True
+        with self.pool.cond:
+            return self.pool.cond.wait_for(self.done, timeout)
 
-    def task_done(self):
-        if self.lock_req:
-            self.semaphore.release()
-        queue.Queue.task_done(self)
+    def get(self, timeout: float = None) -> Any:
+        """Return task result, re-raising the exception of a failed task."""
+        if not self.wait(timeout):
+            raise TimeoutError(f'task {self.func} did not finish in {timeout}s')
+        if self.exception is not None:
+            raise self.exception
+        return self.result
+
+    @property
+    def latency(self) -> float:
+        """Execution time in seconds."""
+        if self.finished is None or self.started is None:
+            return None
+        return self.finished - self.started
 
 
 class Workers(object):
@@ -51,36 +103,167 @@ class Workers(object):
 
     def __init__(self):
         self.w_workers = []
-        self.w_workq = None
+        self.cond = threading.Condition()
+        self.batches = collections.deque()
+        self.max_pending = 0
+        self.closed = False
+        self.counters = dict(queued=0, running=0, done=0, failed=0)
+        self.histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
 
     def start_workers(self,
                       nworkers: int = NWORKERS,
-                      func: Any = None) -> None:
-        self.w_workq = WorkQ(func, nworkers)
+                      func: Any = None,
+                      max_pending: int = None) -> None:
+        """
+        Start worker threads.
+        :param nworkers: number of threads.
+        :param func: unused, kept for compatibility.
+        :param max_pending: queued batches after which submitters block, 2 * nworkers if None.
+        """
+        self.max_pending = max_pending if max_pending else 2 * nworkers
+        self.closed = False
         for i in range(nworkers):
-            w = Thread(target=self.worker)
+            w = Thread(target=self.worker, name=f'worker-{i}', daemon=True)
             w.start()
             self.w_workers.append(w)
 
     def worker(self):
         while True:
-            wq = self.w_workq.get()
-            if wq is None:
-                self.w_workq.task_done()
+            with self.cond:
+                while not self.batches and not self.closed:
+                    self.cond.wait()
+                if not self.batches:
+                    break
+                batch = self.batches.popleft()
+                self.cond.notify_all()  # wake up submitters blocked on backpressure
+            for task in batch:
+                self._run(task)
+
+    def _run(self, task: Task) -> None:
+        """Execute a task and update counters."""
+        with self.cond:
+            self.counters['queued'] -= 1
+            self.counters['running'] += 1
+        task.state = RUNNING
+        task.started = time.perf_counter()
+        try:
+            task.result = task.func(*task.args, **task.kwargs)
+            state = DONE
+        except Exception as fault:
+            task.exception = fault
+            state = FAILED
+            logger.exception('Task %s failed with %s', task.func, fault)
+        task.finished = time.perf_counter()
+        latency_ms = (task.finished - task.started) * 1000
+        bucket = len(LATENCY_BUCKETS_MS)
+        for idx, bound in enumerate(LATENCY_BUCKETS_MS):
+            if latency_ms <= bound:
+                bucket = idx
                 break
-            wi = wq.get()
-            wq.func(wi)
-            wq.task_done()
-            self.w_workq.task_done()
+        with self.cond:
+            task.state = state
+            self.counters['running'] -= 1
+            self.counters[state] += 1
+            self.histogram[bucket] += 1
+            self.cond.notify_all()
+
+    def _enqueue(self, batch: List[Task]) -> None:
+        """Queue a batch of tasks, blocks while max_pending batches are queued."""
+        with self.cond:
+            if self.closed or not self.w_workers:
+                raise RuntimeError('Workers are not started or already shut down')
+            while len(self.batches) >= self.max_pending:
+                self.cond.wait()
+            self.batches.append(batch)
+            self.counters['queued'] += len(batch)
+            self.cond.notify_all()
+
+    def submit(self, func: Callable, *args, **kwargs) -> Task:
+        """Queue func(*args, **kwargs) and return its Task."""
+        task = Task(func, args, kwargs, self)
+        self._enqueue([task])
+        return task
+
+    def _batches(self, func: Callable, items: Iterable,
+                 batch_size: int) -> Iterator[List[Task]]:
+        """Tasks of func(item) for every item grouped in batches of batch_size."""
+        batch = list()
+        for item in items:
+            batch.append(Task(func, (item,), None, self))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = list()
+        if batch:
+            yield batch
+
+    def submit_many(self, func: Callable, items: Iterable,
+                    batch_size: int = DEF_BATCH_SIZE) -> int:
+        """Queue func(item) for every item in batches of batch_size.
+        Items are consumed lazily and Tasks are not kept, so a generator of millions
+        of items only holds max_pending batches in memory at any time. Results are
+        dropped, failures are logged and counted in stats(), use map for results.
+        :return: number of queued tasks.
+        """
+        count = 0
+        for batch in self._batches(func, items, batch_size):
+            self._enqueue(batch)
+            count += len(batch)
+        return count
+
+    def map(self, func: Callable, items: Iterable, batch_size: int = DEF_BATCH_SIZE,
+            timeout: float = None) -> Iterator:
+        """Like builtin map run on the pool, exceptions are raised on iteration.
+        Results are yielded in order as soon as they are ready, at most max_pending
+        batches beyond the ones being consumed are submitted ahead.
+        """
+        in_flight = collections.deque()
+        limit = self.max_pending * batch_size
+        for batch in self._batches(func, items, batch_size):
+            self._enqueue(batch)
+            in_flight.extend(batch)
+            while in_flight and (len(in_flight) > limit or in_flight[0].done()):
+                yield in_flight.popleft().get(timeout)
+        while in_flight:
+            yield in_flight.popleft().get(timeout)
 
     def wenque(self, item):
-        self.w_workq.put(item)
+        """Queue a legacy work item, a queue.Queue with a func attribute holding
+        one argument for func."""
+        return self.submit(item.func, item.get())
+
+    def drain(self, timeout: float = None) -> bool:
+        """Wait until all queued and running tasks finished, False on timeout."""
+        with self.cond:
+            return self.cond.wait_for(
+                lambda: not self.counters['queued'] and not self.counters['running'], timeout)
 
-    def end_workers(self):
-        for i in range(len(self.w_workers)):
-            self.w_workq.put(None)
-        self.w_workq.join()
+    def stats(self) -> dict:
+        """Snapshot of task counters and latency histogram (bucket upper bound ms: count)."""
+        with self.cond:
+            stats = dict(self.counters)
+            stats['latency_ms'] = {str(bound): count for bound, count in
+                                   zip(LATENCY_BUCKETS_MS + ('inf',), self.histogram)}
+        return stats
+
+    def end_workers(self, timeout: float = None) -> bool:
+        """
+        Drain queued work and stop the threads.
+        :param timeout: seconds to wait for the drain, None waits forever.
+        :return: False if work was still pending when timeout expired, it is dropped.
+        """
+        drained = self.drain(timeout)
+        with self.cond:
+            if not drained:
+                dropped = sum(len(batch) for batch in self.batches)
+                logger.error('Dropping %s queued tasks after drain timeout', dropped)
+                self.batches.clear()
+                self.counters['queued'] -= dropped
+            self.closed = True
+            self.cond.notify_all()
         logger.info('shutdown all workers')
         logger.info('Joining all threads to main thread')
-        for i in range(len(self.w_workers)):
-            self.w_workers[i].join()
+        for w in self.w_workers:
+            w.join(timeout)
+        self.w_workers = []
+        logger.info('Workers stats %s', self.stats())
+        return drained
@@ -22,6 +22,7 @@ import os
 import sys
 import ast
 import re
+import threading
 import munch
 from typing import List
 from commons import configmanager
@@ -113,37 +114,69 @@ def build_s3_endpoints() -> dict:
     return s3_conf
 
 
-if target:
-    S3_CFG = build_s3_endpoints()  # Importing S3cfg from config init can be dangerous.Use s3 init.
-else:
-    S3_CFG = configmanager.get_config_wrapper(fpath=S3_CONFIG)
-
-CMN_CFG = configmanager.get_config_wrapper(fpath=COMMON_CONFIG, target=target)
-if S3_ENGINE_RGW == CMN_CFG["s3_engine"]:
-    S3_CFG["region"] = "default"
-CMN_CFG.update(S3_CFG)
-JMETER_CFG = configmanager.get_config_wrapper(
-    fpath=CSM_CONFIG, config_key="JMeterConfig", target=target, target_key="csm")
-
-if PROD_FAMILY_LC == CMN_CFG["product_family"]:
-    CSM_REST_CFG = configmanager.get_config_wrapper(
-        fpath=CSM_CONFIG, config_key="Restcall_LC", target=target, target_key="csm")
-else:
-    CSM_REST_CFG = configmanager.get_config_wrapper(
+def _common_configs() -> dict:
+    """S3 and common configs, the common config includes the S3 config."""
+    if target:
+        s3_cfg = build_s3_endpoints()  # Importing S3cfg from config init can be dangerous.Use s3 init.
+    else:
+        s3_cfg = configmanager.get_config_wrapper(fpath=S3_CONFIG)
+    cmn_cfg = configmanager.get_config_wrapper(fpath=COMMON_CONFIG, target=target)
+    if S3_ENGINE_RGW == cmn_cfg["s3_engine"]:
+        s3_cfg["region"] = "default"
+    cmn_cfg.update(s3_cfg)
+    return {"S3_CFG": s3_cfg, "CMN_CFG": cmn_cfg}
+
+
+def _csm_rest_config() -> dict:
+    """Rest call config of the product family."""
+    if PROD_FAMILY_LC == __getattr__("CMN_CFG")["product_family"]:
+        return configmanager.get_config_wrapper(
+            fpath=CSM_CONFIG, config_key="Restcall_LC", target=target, target_key="csm")
+    return configmanager.get_config_wrapper(
         fpath=CSM_CONFIG, config_key="Restcall", target=target, target_key="csm")
-CSM_CFG = configmanager.get_config_wrapper(fpath=CSM_CONFIG)
-RAS_VAL = configmanager.get_config_wrapper(
-    fpath=RAS_CONFIG_PATH, target=target, target_key="csm")
-CMN_DESTRUCTIVE_CFG = configmanager.get_config_wrapper(fpath=COMMON_DESTRUCTIVE_CONFIG_PATH)
-RAS_TEST_CFG = configmanager.get_config_wrapper(fpath=SSPL_TEST_CONFIG_PATH)
-PROV_CFG = configmanager.get_config_wrapper(fpath=PROV_TEST_CONFIG_PATH)
-HA_CFG = configmanager.get_config_wrapper(fpath=HA_TEST_CONFIG_PATH)
-PROV_TEST_CFG = configmanager.get_config_wrapper(fpath=PROV_CONFIG_PATH)
-
-DI_CFG = configmanager.get_config_wrapper(fpath=DI_CONFIG_PATH)
-DATA_PATH_CFG = configmanager.get_config_wrapper(fpath=DATA_PATH_CONFIG_PATH, target=target)
-
-# Munched configs. These can be used by dot "." operator.
-
-di_cfg = munch.munchify(DI_CFG)
-cmn_cfg = munch.munchify(CMN_CFG)
+
+
+# Configs are loaded on first access of their name, e.g. "from config import CMN_CFG",
+# so a process only parses the yaml files and setup details it uses.
+_LAZY_CONFIGS = {
+    "S3_CFG": _common_configs,
+    "CMN_CFG": _common_configs,
+    "JMETER_CFG": lambda: configmanager.get_config_wrapper(
+        fpath=CSM_CONFIG, config_key="JMeterConfig", target=target, target_key="csm"),
+    "CSM_REST_CFG": _csm_rest_config,
+    "CSM_CFG": lambda: configmanager.get_config_wrapper(fpath=CSM_CONFIG),
+    "RAS_VAL": lambda: configmanager.get_config_wrapper(
+        fpath=RAS_CONFIG_PATH, target=target, target_key="csm"),
+    "CMN_DESTRUCTIVE_CFG": lambda: configmanager.get_config_wrapper(
+        fpath=COMMON_DESTRUCTIVE_CONFIG_PATH),
+    "RAS_TEST_CFG": lambda: configmanager.get_config_wrapper(fpath=SSPL_TEST_CONFIG_PATH),
+    "PROV_CFG": lambda: configmanager.get_config_wrapper(fpath=PROV_TEST_CONFIG_PATH),
+    "HA_CFG": lambda: configmanager.get_config_wrapper(fpath=HA_TEST_CONFIG_PATH),
+    "PROV_TEST_CFG": lambda: configmanager.get_config_wrapper(fpath=PROV_CONFIG_PATH),
+    "DI_CFG": lambda: configmanager.get_config_wrapper(fpath=DI_CONFIG_PATH),
+    "DATA_PATH_CFG": lambda: configmanager.get_config_wrapper(
+        fpath=DATA_PATH_CONFIG_PATH, target=target),
+    # Munched configs. These can be used by dot "." operator.
+    "di_cfg": lambda: munch.munchify(__getattr__("DI_CFG")),
+    "cmn_cfg": lambda: munch.munchify(__getattr__("CMN_CFG")),
+}
+_LAZY_LOCK = threading.RLock()
+
+
+def __getattr__(name: str):
+    """Load a config on first access and keep it as module attribute."""
+    loader = _LAZY_CONFIGS.get(name)
+    if loader is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with _LAZY_LOCK:
+        if name not in globals():
+            if loader is _common_configs:
+                globals().update(loader())
+            else:
+                globals()[name] = loader()
+    return globals()[name]
+
+
+def __dir__():
+    """Names of loaded and not yet loaded configs."""
+    return sorted(set(globals()) | set(_LAZY_CONFIGS))
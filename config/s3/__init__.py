@@ -19,7 +19,9 @@
 #
 
 """S3 configs are initialized here."""
+import threading
 
+import config
 from commons import configmanager
 from commons.params import S3_OBJ_TEST_CONFIG
 from commons.params import S3_BKT_TEST_CONFIG
@@ -32,17 +34,38 @@ from commons.params import DEL_CFG_PATH
 from commons.params import IAM_POLICY_CFG_PATH
 from commons.params import S3_LDAP_TEST_CONFIG
 from commons.params import S3_VER_CFG_PATH
-from config import S3_CFG as s3_config
 
-S3_CFG = s3_config
-DEL_CFG = configmanager.get_config_wrapper(fpath=DEL_CFG_PATH)
-S3_OBJ_TST = configmanager.get_config_wrapper(fpath=S3_OBJ_TEST_CONFIG)
-S3_BKT_TST = configmanager.get_config_wrapper(fpath=S3_BKT_TEST_CONFIG)
-S3CMD_CNF = configmanager.get_config_wrapper(fpath=S3CMD_TEST_CONFIG)
-S3_USER_ACC_MGMT_CONFIG = configmanager.get_config_wrapper(fpath=S3_USER_ACC_MGMT_CONFIG_PATH)
-S3_BLKBOX_CFG = configmanager.get_config_wrapper(fpath=S3_BLACK_BOX_CONFIG_PATH)
-S3_TMP_CRED_CFG = configmanager.get_config_wrapper(fpath=S3_TEMP_CRED_CONFIG_PATH)
-MPART_CFG = configmanager.get_config_wrapper(fpath=S3_MPART_CFG_PATH)
-S3_LDAP_TST_CFG = configmanager.get_config_wrapper(fpath=S3_LDAP_TEST_CONFIG)
-IAM_POLICY_CFG = configmanager.get_config_wrapper(fpath=IAM_POLICY_CFG_PATH)
-S3_VER_CFG = configmanager.get_config_wrapper(fpath=S3_VER_CFG_PATH)
+# Configs are loaded on first access of their name like the configs of the config package.
+_LAZY_CONFIGS = {
+    "S3_CFG": None,
+    "DEL_CFG": DEL_CFG_PATH,
+    "S3_OBJ_TST": S3_OBJ_TEST_CONFIG,
+    "S3_BKT_TST": S3_BKT_TEST_CONFIG,
+    "S3CMD_CNF": S3CMD_TEST_CONFIG,
+    "S3_USER_ACC_MGMT_CONFIG": S3_USER_ACC_MGMT_CONFIG_PATH,
+    "S3_BLKBOX_CFG": S3_BLACK_BOX_CONFIG_PATH,
+    "S3_TMP_CRED_CFG": S3_TEMP_CRED_CONFIG_PATH,
+    "MPART_CFG": S3_MPART_CFG_PATH,
+    "S3_LDAP_TST_CFG": S3_LDAP_TEST_CONFIG,
+    "IAM_POLICY_CFG": IAM_POLICY_CFG_PATH,
+    "S3_VER_CFG": S3_VER_CFG_PATH,
+}
+_LAZY_LOCK = threading.RLock()
+
+
+def __getattr__(name: str):
+    """Load a config on first access and keep it as module attribute."""
+    if name not in _LAZY_CONFIGS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with _LAZY_LOCK:
+        if name not in globals():
+            if _LAZY_CONFIGS[name] is None:
+                globals()[name] = getattr(config, name)
+            else:
+                globals()[name] = configmanager.get_config_wrapper(fpath=_LAZY_CONFIGS[name])
+    return globals()[name]
+
+
+def __dir__():
+    """Names of loaded and not yet loaded configs."""
+    return sorted(set(globals()) | set(_LAZY_CONFIGS))
@@ -44,16 +44,23 @@ from strip_ansi import strip_ansi
 
 from commons import Globals
 from commons import cortxlogging
+from commons import log_shipper
 from commons import params
 from commons import report_client
+from commons import reporting_service
 from commons import constants as const
+from commons.helpers.cluster_executor import ClusterExecutor
+from commons.helpers.health_gate import HealthGate
+from commons.helpers.health_gate import is_destructive
 from commons.helpers.health_helper import Health
 from commons.utils import assert_utils
 from commons.utils import config_utils
 from commons.utils import jira_utils
 from commons.utils import system_utils
 from config import CMN_CFG
+from core.collection_index import CollectionIndex
 from core.runner import LRUCache
+from core.scheduler import DurationHistory
 from core.runner import get_db_credential
 from core.runner import get_jira_credential
 from libs.di.di_mgmt_ops import ManagementOPs
@@ -65,6 +72,13 @@ LOG_DIR = 'log'
 CACHE = LRUCache(1024 * 10)
 CACHE_JSON = 'nodes-cache.yaml'
 REPORT_CLIENT = None
+REPORTER = None
+LOG_SHIPPER = None
+HEALTH_GATE = None
+REPORTER_CLOSE_TIMEOUT = 600
+COLLECTED_ITEMS = list()
+COLLECT_ERRORS = set()
+DURATIONS = DurationHistory()
 DT_PATTERN = '%Y-%m-%d_%H:%M:%S'
 
 LOGGER = logging.getLogger(__name__)
@@ -81,7 +95,7 @@ Globals.CSM_LOGS = None
 
 def _get_items_from_cache():
     """Intended for internal use after modifying collected items."""
-    return CACHE.table
+    return CACHE.to_dict()
 
 
 @pytest.fixture(autouse=True, scope='session')
@@ -231,6 +245,14 @@ def pytest_addoption(parser):
         "--health_check", action="store", default=True,
         help="Decide whether to do health check in local mode."
     )
+    parser.addoption(
+        "--health_check_ttl", action="store", default=const.HEALTH_GATE_TTL,
+        help="Seconds a healthy cluster verdict is reused by the next tests, 0 checks always."
+    )
+    parser.addoption(
+        "--health_poll_interval", action="store", default=0,
+        help="Seconds between background cluster health checks, 0 disables them."
+    )
     parser.addoption(
         "--product_family", action="store", default='LC',
         help="Product Type LR or LC."
@@ -281,8 +303,21 @@ def read_dist_test_list_csv() -> List:
 
 @pytest.hookimpl(trylast=True)
 def pytest_sessionfinish(session, exitstatus):
-    """Remove handlers from all loggers."""
+    """Send queued reports and remove handlers from all loggers."""
     # todo add html hook file = session.config._htmlfile
+    if HEALTH_GATE:
+        HEALTH_GATE.stop_poller()
+        LOGGER.info("Health gate stats %s", HEALTH_GATE.stats)
+    if LOG_SHIPPER and not LOG_SHIPPER.close(REPORTER_CLOSE_TIMEOUT):
+        LOGGER.error("Log uploads did not finish in %ss", REPORTER_CLOSE_TIMEOUT)
+    if REPORTER:
+        if not REPORTER.close(REPORTER_CLOSE_TIMEOUT):
+            LOGGER.error("Queued reports are spilled to %s", REPORTER.spill_dir)
+    if DURATIONS.durations and not hasattr(session.config, 'workerinput'):
+        try:
+            DURATIONS.save()
+        except OSError as error:
+            LOGGER.warning("Test durations not saved: %s", error)
     loggers = [logging.getLogger()] + list(logging.Logger.manager.loggerDict.values())
     for _logger in loggers:
         handlers = getattr(_logger, 'handlers', [])
@@ -438,6 +473,7 @@ def pytest_configure_node(node):
         else:
             Globals.JIRA_UPDATE = False
     node.workerinput['shared_dir'] = node.config.shared_directory
+    node.workerinput['collection_plan'] = collection_plan(node.config)
     pytest.dns_rr_counter = 0
 
 
@@ -449,9 +485,25 @@ def pytest_sessionstart(session: Session) -> None:
     """
     # db_user, db_passwd = CMN_CFG.db_user, CMN_CFG.db_passwd
     # init_instance db_user=None, db_passwd=None
-    global REPORT_CLIENT
+    global REPORT_CLIENT, REPORTER, LOG_SHIPPER, HEALTH_GATE
     report_client.ReportClient.init_instance()
     REPORT_CLIENT = report_client.ReportClient.get_instance()
+    option = session.config.option
+    HEALTH_GATE = HealthGate(probe_cluster_health, ttl=float(option.health_check_ttl))
+    if ast.literal_eval(str(option.health_check)) and float(option.health_poll_interval):
+        HEALTH_GATE.start_poller(float(option.health_poll_interval))
+    DURATIONS.load()
+    if not ast.literal_eval(str(option.local)):
+        # Credentials are read once here, the hooks only queue reports.
+        jira_task, db_user, db_pass = None, None, None
+        if ast.literal_eval(str(option.jira_update)):
+            jira_task = jira_utils.JiraTask(*get_jira_credential())
+        if ast.literal_eval(str(option.db_update)):
+            db_user, db_pass = get_db_credential()
+        REPORTER = reporting_service.ReportingService(REPORT_CLIENT, jira_task, db_user, db_pass)
+        REPORTER.start()
+        LOG_SHIPPER = log_shipper.LogShipper(params.NFS_SERVER_DIR, params.MOUNT_DIR)
+        LOG_SHIPPER.start()
     reset_imported_module_log_level(session)
 
 
@@ -476,16 +528,141 @@ def reset_imported_module_log_level(session):
         logging.getLogger(pkg).setLevel(logging.WARNING)
 
 
+def _index_entry(item) -> dict:
+    """Collection index entry of a test item."""
+    test_id = ''
+    _marks = list()
+    for mark in item.iter_markers():
+        if mark.name == 'tags':
+            test_id = mark.args[0]
+        else:
+            _marks.append(mark.name)
+    return dict(nodeid=item.nodeid, test_id=test_id, marks=_marks,
+                parallel='parallel' in _marks)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(items):
+    """Keep all collected items for the collection index, before -m/-k deselection."""
+    COLLECTED_ITEMS[:] = items
+
+
+def pytest_collectreport(report):
+    """Remember test files which failed to collect, they are not indexed."""
+    if report.failed:
+        COLLECT_ERRORS.add(report.nodeid.split('::')[0])
+
+
+def required_test_ids(config) -> List:
+    """Test ids of the TE ticket, e.g. ['TEST-17413', 'TEST-17414'], none for local runs."""
+    if ast.literal_eval(str(config.option.distributed)):
+        return read_dist_test_list_csv()
+    if not ast.literal_eval(str(config.option.local)):
+        return read_test_list_csv()
+    return list()
+
+
+def index_meta_run(config) -> bool:
+    """Collected meta of unchanged files is read from the index unless -m/-k filter it."""
+    return bool(ast.literal_eval(str(config.option.local)) and config.option.collectonly
+                and not config.option.markexpr and not config.option.keyword)
+
+
+def collection_plan(config) -> dict:
+    """
+    Test files to collect, decided once by the xdist controller or the only process
+    and passed to xdist workers, so every process collects the same tests.
+    Only test files which hold required tests or are new or changed since they were
+    indexed are collected, other files are not imported.
+    :return: dict(files=test files of args or None if not indexed,
+        collect=relative paths to collect or None for a full collection).
+    """
+    plan = getattr(config, 'collection_plan', None)
+    if plan is not None:
+        return plan
+    index = CollectionIndex(os.path.join(os.getcwd(), params.COLLECTION_INDEX),
+                            str(config.rootpath)).load()
+    args = [os.path.join(str(config.invocation_params.dir), arg)
+            for arg in config.args or ['.']]
+    files = index.test_files(args, ignore=config.getoption('ignore') or [],
+                             norecursedirs=config.getini('norecursedirs'))
+    required_tests, all_files = required_test_ids(config), index_meta_run(config)
+    to_collect = set()
+    if files is not None and (required_tests or all_files):
+        to_collect = index.stale(files)
+        if required_tests:
+            to_collect |= index.files_for(required_tests, files)
+    if to_collect or (all_files and files is not None and index.files):
+        LOGGER.info("Collecting %s of %s test files using collection index",
+                    len(to_collect), len(files))
+        plan = dict(files=files, collect=sorted(to_collect))
+    else:
+        plan = dict(files=files, collect=None)
+    config.collection_plan = plan
+    config.collection_index = index
+    return plan
+
+
+def collect_with_index(session):
+    """
+    Collect the test files of the collection plan. Only the controller or the only
+    process records them in the index, xdist workers use the controller's plan and
+    never write the shared index file.
+    :return: collected items, index, test files of args or None if not indexed.
+    """
+    config = session.config
+    workerinput = getattr(config, 'workerinput', None)
+    if workerinput is not None:
+        plan = workerinput.get('collection_plan') or dict(files=None, collect=None)
+    else:
+        plan = collection_plan(config)
+    files = plan['files']
+    if plan['collect'] is None:
+        to_collect = files or []
+        items = session.perform_collect()
+    else:
+        to_collect = plan['collect']
+        items = session.perform_collect([os.path.join(str(config.rootpath), relpath)
+                                         for relpath in to_collect])
+    index = getattr(config, 'collection_index', None)
+    if files is not None and index is not None:
+        collected = {relpath: [] for relpath in to_collect if relpath not in COLLECT_ERRORS}
+        for item in COLLECTED_ITEMS:
+            relpath = item.nodeid.split('::')[0]
+            if relpath in collected:
+                collected[relpath].append(_index_entry(item))
+        index.forget(COLLECT_ERRORS)
+        index.update(collected)
+        index.prune(files)
+        try:
+            index.save()
+        except OSError as error:
+            LOGGER.warning("Collection index not saved: %s", error)
+    return items, index, files
+
+
+def order_by_duration(items: List) -> None:
+    """Order items longest expected duration first, xdist then packs workers LPT first."""
+    estimates = dict()
+    for item in items:
+        entry = _index_entry(item)
+        estimates[item] = DURATIONS.estimate(entry['test_id'], entry['marks'])
+    items[:] = sorted(items, key=lambda item: -estimates[item])
+    LOGGER.debug("Expected test durations %s",
+                 {item.nodeid: estimates[item] for item in items})
+
+
 @pytest.hookimpl(tryfirst=True)
 def pytest_collection(session):
     """Collect tests in master and filter out test from TE ticket."""
-    items = session.perform_collect()
     config = session.config
     _local = ast.literal_eval(str(config.option.local))
     _distributed = ast.literal_eval(str(config.option.distributed))
     is_parallel = ast.literal_eval(str(config.option.is_parallel))
     health_check = ast.literal_eval(str(config.option.health_check))
-    required_tests = list()
+    required_tests = required_test_ids(config)
+    index_meta = index_meta_run(config)
+    items, index, test_files = collect_with_index(session)
     global CACHE
     CACHE = LRUCache(1024 * 10)
     Globals.LOCAL_RUN = _local
@@ -494,7 +671,6 @@ def pytest_collection(session):
     Globals.BUILD = config.option.build
     Globals.TARGET = config.option.target
     if _distributed:
-        required_tests = read_dist_test_list_csv()
         Globals.TE_TKT = config.option.te_tkt
         selected_items = []
         for item in items:
@@ -506,20 +682,19 @@ def pytest_collection(session):
                         selected_items.append(item)
             CACHE.store(item.nodeid, test_found)
         items[:] = selected_items
+        if is_parallel:
+            order_by_duration(items)
     elif _local:
         meta = list()
         for item in items:
-            test_id = ''
-            _marks = list()
-            for mark in item.iter_markers():
-                if mark.name == 'tags':
-                    test_id = mark.args[0]
-                else:
-                    _marks.append(mark.name)
-            CACHE.store(item.nodeid, test_id)
-            meta.append(dict(nodeid=item.nodeid, test_id=test_id, marks=_marks))
+            entry = _index_entry(item)
+            CACHE.store(item.nodeid, entry['test_id'])
+            meta.append(dict(nodeid=item.nodeid, test_id=entry['test_id'], marks=entry['marks']))
+        if index_meta and test_files is not None and index is not None:
+            # files not collected again are taken from the index
+            meta = [dict(nodeid=entry['nodeid'], test_id=entry['test_id'], marks=entry['marks'])
+                    for entry in index.entries(test_files)]
     else:
-        required_tests = read_test_list_csv()  # e.g. required_tests = ['TEST-17413', 'TEST-17414']
         Globals.TE_TKT = config.option.te_tkt
         selected_items = []
         selected_tests = []
@@ -553,6 +728,8 @@ def pytest_collection(session):
             for test in selected_tests:
                 write.writerow([test])
         items[:] = selected_items
+        if is_parallel:
+            order_by_duration(items)
     cache_home = os.path.join(os.getcwd(), LOG_DIR)
     cache_path = os.path.join(cache_home, CACHE_JSON)
     if not os.path.exists(cache_home):
@@ -581,19 +758,19 @@ def pytest_collection(session):
     return items
 
 
-# pylint: disable=too-many-arguments
-def db_and_jira_update(task, test_id, item, call, status, db_user, db_pass):
+def db_and_jira_update(test_id, item, call, status):
+    """Queue Jira status and report DB entry of a test, credentials are added when sent."""
     try:
         jira_update = ast.literal_eval(str(item.config.option.jira_update))
         db_update = ast.literal_eval(str(item.config.option.db_update))
-        if jira_update:
-            task.update_test_jira_status(item.config.option.te_tkt, test_id, status)
-        if db_update:
-            payload = create_report_payload(item, call, status, db_user, db_pass)
-            REPORT_CLIENT.create_db_entry(**payload)
-    except (requests.exceptions.RequestException, Exception) as fault:
+        if jira_update and REPORTER:
+            REPORTER.update_jira_status(item.config.option.te_tkt, test_id, status)
+        if db_update and REPORTER:
+            payload = create_report_payload(item, call, status, None, None)
+            REPORTER.create_db_entry(**payload)
+    except Exception as fault:
         LOGGER.exception(str(fault))
-        LOGGER.error("Failed to execute DB update for %s", test_id)
+        LOGGER.error("Failed to queue DB update for %s", test_id)
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -613,6 +790,9 @@ def pytest_runtest_makereport(item, call):
     report = outcome.get_result()
     Globals.ALL_RESULT = report
     setattr(item, "rep_" + report.when, report)
+    if report.when == 'teardown' and HEALTH_GATE and \
+            is_destructive(mark.name for mark in item.iter_markers()):
+        HEALTH_GATE.invalidate()
     try:
         attr = getattr(item, 'call_duration')
         LOGGER.info('Setting attribute call_duration')
@@ -628,7 +808,6 @@ def pytest_runtest_makereport(item, call):
     pass_file = 'passed_tests.log'
     current_file = 'other_test_calls.log'
     jira_update = ast.literal_eval(str(item.config.option.jira_update))
-    db_update = ast.literal_eval(str(item.config.option.db_update))
     test_id = CACHE.lookup(report.nodeid)
     if report.when == 'setup':
         Globals.CSM_LOGS = f"{LOG_DIR}/latest/{test_id}_Gui_Logs/"
@@ -639,14 +818,8 @@ def pytest_runtest_makereport(item, call):
         if report.when == 'setup' and item.rep_setup.failed:
             # Fail eagerly in Jira, when you know setup failed.
             # The status is again anyhow updated in teardown as it was earlier.
-            try:
-                if jira_update:
-                    jira_id, jira_pwd = get_jira_credential()
-                    task = jira_utils.JiraTask(jira_id, jira_pwd)
-                    task.update_test_jira_status(item.config.option.te_tkt, test_id, 'FAIL')
-            except (requests.exceptions.RequestException, Exception) as fault:
-                LOGGER.exception(str(fault))
-                LOGGER.error("Failed to execute Jira update for %s", test_id)
+            if jira_update and REPORTER:
+                REPORTER.update_jira_status(item.config.option.te_tkt, test_id, 'FAIL')
         elif report.when == 'teardown':
             try:
                 remote_path = os.path.join(params.NFS_BASE_DIR,
@@ -657,56 +830,17 @@ def pytest_runtest_makereport(item, call):
                                            )
                 setattr(report, "logpath", remote_path)
                 setattr(item, "logpath", remote_path)
-                if jira_update:
-                    db_user, db_pass = get_db_credential()
-                    jira_id, jira_pwd = get_jira_credential()
-                    task = jira_utils.JiraTask(jira_id, jira_pwd)
-
                 if item.rep_setup.failed or item.rep_teardown.failed:
-                    try:
-                        if jira_update:
-                            task.update_test_jira_status(item.config.option.te_tkt, test_id, 'FAIL')
-                        if db_update:
-                            # capture exec info
-                            payload = create_report_payload(item, call, 'FAIL', db_user, db_pass)
-                            REPORT_CLIENT.create_db_entry(**payload)
-                    except (requests.exceptions.RequestException, Exception) as fault:
-                        LOGGER.exception(str(fault))
-                        LOGGER.error("Failed to execute DB update for %s", test_id)
+                    db_and_jira_update(test_id, item, call, 'FAIL')
                 elif item.rep_setup.passed and (item.rep_call.failed or item.rep_teardown.failed):
-                    try:
-                        if jira_update:
-                            task.update_test_jira_status(item.config.option.te_tkt, test_id, 'FAIL')
-                        if db_update:
-                            payload = create_report_payload(item, call, 'FAIL', db_user, db_pass)
-                            REPORT_CLIENT.create_db_entry(**payload)
-                    except (requests.exceptions.RequestException, Exception) as fault:
-                        LOGGER.exception(str(fault))
-                        LOGGER.error("Failed to execute DB update for %s", test_id)
+                    db_and_jira_update(test_id, item, call, 'FAIL')
                 elif item.rep_setup.passed and item.rep_call.passed and item.rep_teardown.passed:
-                    try:
-                        if jira_update:
-                            task.update_test_jira_status(item.config.option.te_tkt, test_id, 'PASS')
-                        if db_update:
-                            payload = create_report_payload(item, call, 'PASS', db_user, db_pass)
-                            REPORT_CLIENT.create_db_entry(**payload)
-                    except (requests.exceptions.RequestException, Exception) as fault:
-                        LOGGER.exception(str(fault))
-                        LOGGER.error("Failed to execute DB update for %s", test_id)
+                    db_and_jira_update(test_id, item, call, 'PASS')
                 elif item.rep_setup.skipped and \
                         (item.rep_teardown.skipped or item.rep_teardown.passed):
                     # Jira reporting of skipped cases does not contain skipped option
                     # Reporting it blocked and updating db.
-                    try:
-                        if jira_update:
-                            task.update_test_jira_status(item.config.option.te_tkt, test_id, 'BLOCKED')
-                        if db_update:
-                            payload = create_report_payload(item, call, 'BLOCKED', db_user, db_pass)
-                            REPORT_CLIENT.create_db_entry(**payload)
-                    except (requests.exceptions.RequestException, Exception) as fault:
-                        LOGGER.exception(str(fault))
-                        LOGGER.error("Failed to execute DB update for %s", test_id)
-
+                    db_and_jira_update(test_id, item, call, 'BLOCKED')
             except Exception as exception:
                 LOGGER.error("Exception %s occurred in reporting for test %s.",
                              str(exception), test_id)
@@ -741,7 +875,8 @@ def pytest_runtest_makereport(item, call):
 
 def upload_supporting_logs(test_id: str, remote_path: str, log: str):
     """
-    Upload all supporting (s3bench) log files to nfs share
+    Queue upload of all supporting (s3bench) log files to nfs share, local files are
+    removed once uploaded.
     :param test_id: test number in file name
     :param remote_path: path on NFS share
     :param log: log file string e.g. s3bench
@@ -754,54 +889,42 @@ def upload_supporting_logs(test_id: str, remote_path: str, log: str):
         support_logs = glob.glob(f"{LOG_DIR}/latest/logs-cortx-cloud-*")
     LOGGER.debug("support logs is %s", support_logs)
     for support_log in support_logs:
-        resp = system_utils.mount_upload_to_server(host_dir=params.NFS_SERVER_DIR,
-                                                   mnt_dir=params.MOUNT_DIR,
-                                                   remote_path=remote_path,
-                                                   local_path=support_log)
-        if resp[0]:
-            LOGGER.info("Supporting log files are uploaded at location : %s", resp[1])
-            if os.path.isfile(support_log):
-                os.remove(support_log)
-                LOGGER.info("Removed the files from local path after uploading to NFS share")
-        else:
-            LOGGER.error("Failed to supporting log file at location %s", resp[1])
+        LOG_SHIPPER.ship(support_log, remote_path, remove=True)
 
 
-def check_cortx_cluster_health():
-    """Check the cluster health before each test is picked up for run."""
-    LOGGER.info("Check cluster status for all nodes.")
-    nodes = CMN_CFG["nodes"]
-    for node in nodes:
+def get_health_nodes() -> List[Health]:
+    """Health objects of nodes to be checked, only master node for LC."""
+    health_nodes = list()
+    for node in CMN_CFG["nodes"]:
         if CMN_CFG.get("product_family") == const.PROD_FAMILY_LC:
             if node["node_type"].lower() != "master":
                 continue
-        hostname = node['hostname']
-        health = Health(hostname=hostname,
-                        username=node['username'],
-                        password=node['password'])
-        result = health.check_node_health()
-        assert_utils.assert_true(result[0],
-                                 f'Cluster Node {hostname} failed in health check. Reason: {result}')
-        health.disconnect()
+        health_nodes.append(Health(hostname=node['hostname'],
+                                   username=node['username'],
+                                   password=node['password']))
+    return health_nodes
+
+
+def check_cortx_cluster_health():
+    """Check the cluster health before each test is picked up for run."""
+    LOGGER.info("Check cluster status for all nodes.")
+    result = ClusterExecutor(get_health_nodes()).run(Health.check_node_health)
+    for hostname, res in result.items():
+        assert_utils.assert_true(res.status and res.output[0],
+                                 f'Cluster Node {hostname} failed in health check. '
+                                 f'Reason: {res.output or res.error}')
     LOGGER.info("Cluster status is healthy.")
 
 
 def check_cluster_storage():
     """Checks nodes storage and accepts till 98 % occupancy."""
     LOGGER.info("Check cluster storage for all nodes.")
-    nodes = CMN_CFG["nodes"]
-    for node in nodes:
-        if CMN_CFG.get("product_family") == const.PROD_FAMILY_LC:
-            if node["node_type"].lower() != "master":
-                continue
-        hostname = node['hostname']
-        health = Health(hostname=hostname,
-                        username=node['username'],
-                        password=node['password'])
-        ha_total, ha_avail, ha_used = health.get_sys_capacity()
+    result = ClusterExecutor(get_health_nodes()).run(Health.get_sys_capacity)
+    result.raise_on_failure("Cluster storage check failed")
+    for hostname, res in result.items():
+        ha_total, _, ha_used = res.output
         ha_used_percent = round((ha_used / ha_total) * 100, 1)
         assert ha_used_percent < 98.0, f'Cluster Node {hostname} failed space check.'
-        health.disconnect()
 
 
 def pytest_runtest_logstart(nodeid, location):
@@ -846,15 +969,23 @@ def pytest_runtest_logstart(nodeid, location):
     h_chk = Globals.HEALTH_CHK
     if h_chk and not skip_health_check:
         check_health(target)
+    elif skip_health_check and HEALTH_GATE:
+        HEALTH_GATE.invalidate()  # provisioner tests redeploy the cluster
+
+
+def probe_cluster_health():
+    """Cluster health and storage check, storage failures are only logged."""
+    check_cortx_cluster_health()
+    try:
+        check_cluster_storage()
+    except (AssertionError, Exception) as fault:
+        LOGGER.error(f"Cluster Storage {fault}")
 
 
 def check_health(target):
+    """Stop the session when the cluster is unhealthy, a fresh healthy verdict is reused."""
     try:
-        check_cortx_cluster_health()
-        try:
-            check_cluster_storage()
-        except (AssertionError, Exception) as fault:
-            LOGGER.error(f"Cluster Storage {fault}")
+        HEALTH_GATE.check()
     except AssertionError as fault:
         LOGGER.error(f"Health check failed for setup with exception {fault}")
         pytest.exit(f'Health check failed for cluster {target}', 3)
@@ -872,6 +1003,8 @@ def pytest_runtest_logreport(report: "TestReport") -> None:
     :param report:
     :return:
     """
+    if report.when == 'call' and report.passed:
+        DURATIONS.record(CACHE.get(report.nodeid), report.duration)
     if Globals.LOCAL_RUN:
         if report.when == 'teardown':
             log = report.caplog
@@ -889,10 +1022,8 @@ def pytest_runtest_logreport(report: "TestReport") -> None:
     test_id = CACHE.lookup(report.nodeid)
     if report.when == 'setup' and report.outcome == 'passed':
         # If you reach here and when you know setup passed.
-        if Globals.JIRA_UPDATE:
-            jira_id, jira_pwd = get_jira_credential()
-            task = jira_utils.JiraTask(jira_id, jira_pwd)
-            task.update_test_jira_status(Globals.TE_TKT, test_id, 'Executing')
+        if Globals.JIRA_UPDATE and REPORTER:
+            REPORTER.update_jira_status(Globals.TE_TKT, test_id, 'Executing')
     elif report.when == 'call':
         pass
     elif report.when == 'teardown':
@@ -907,44 +1038,42 @@ def pytest_runtest_logreport(report: "TestReport") -> None:
         with open(test_log, 'w') as fp:
             for rec in logs:
                 fp.write(rec + '\n')
-        LOGGER.info("Uploading test log file to NFS server")
+        LOGGER.info("Queueing test log file upload to NFS server")
         remote_path = getattr(report, 'logpath').replace(":", "_")
-        resp = system_utils.mount_upload_to_server(host_dir=params.NFS_SERVER_DIR,
-                                                   mnt_dir=params.MOUNT_DIR,
-                                                   remote_path=remote_path,
-                                                   local_path=test_log)
-        if resp[0]:
-            LOGGER.info("Log file is uploaded at location : %s", resp[1])
-        else:
-            LOGGER.error("Failed to upload log file at location %s", resp[1])
+        # Jira comment is queued once the upload finished and its location is known
+        LOG_SHIPPER.ship(test_log, remote_path,
+                         on_done=lambda upload: comment_log_path(test_id, upload))
         upload_supporting_logs(test_id, remote_path, "s3bench")
         upload_supporting_logs(test_id, remote_path, "")
         upload_supporting_logs(test_id, remote_path, "csm_gui")
-        LOGGER.info("Adding log file path to %s", test_id)
-        comment = "Log file path: {}".format(os.path.join(resp[1], name))
-        if Globals.JIRA_UPDATE:
-            jira_id, jira_pwd = get_jira_credential()
-            task = jira_utils.JiraTask(jira_id, jira_pwd)
-            try:
-                if Globals.tp_meta['te_meta']['te_id'] == Globals.TE_TKT:
-                    test_run_id = next(d['test_run_id'] for i, d in enumerate(
-                        Globals.tp_meta['test_meta']) if d['test_id'] ==
-                                       test_id)
-                    resp = task.update_execution_details(
-                        test_run_id=test_run_id, test_id=test_id,
-                        comment=comment)
-                    if resp:
-                        LOGGER.info("Added execution details comment in: %s",
-                                    test_id)
-                    else:
-                        LOGGER.error("Failed to comment to %s", test_id)
+
+
+def comment_log_path(test_id: str, upload: log_shipper.Upload) -> None:
+    """Add log file path of an uploaded test log to the test run in Jira."""
+    if upload.path is None:
+        LOGGER.error("Failed to upload log file %s", upload.local_path)
+        return
+    LOGGER.info("Log file is uploaded at location : %s", upload.path)
+    LOGGER.info("Adding log file path to %s", test_id)
+    comment = "Log file path: {}".format(upload.path)
+    if Globals.JIRA_UPDATE and REPORTER:
+        try:
+            if Globals.tp_meta['te_meta']['te_id'] == Globals.TE_TKT:
+                test_run_id = next(d['test_run_id'] for i, d in enumerate(
+                    Globals.tp_meta['test_meta']) if d['test_id'] ==
+                                   test_id)
+                if REPORTER.update_execution_details(
+                        test_run_id=test_run_id, test_id=test_id, comment=comment):
+                    LOGGER.info("Queued execution details comment of: %s", test_id)
                 else:
-                    LOGGER.error("Failed to get correct TE id. \nExpected: "
-                                 "%s\nActual: %s", Globals.TE_TKT,
-                                 Globals.tp_meta['te_meta']['te_id'])
-            except KeyError:
-                LOGGER.error("KeyError: Failed to add log file path to %s",
-                             test_id)
+                    LOGGER.error("Failed to queue comment to %s", test_id)
+            else:
+                LOGGER.error("Failed to get correct TE id. \nExpected: "
+                             "%s\nActual: %s", Globals.TE_TKT,
+                             Globals.tp_meta['te_meta']['te_id'])
+        except KeyError:
+            LOGGER.error("KeyError: Failed to add log file path to %s",
+                         test_id)
 
 
 @pytest.fixture(scope='function')
@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/python
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Thread safe in memory caches.
+
+LRUCache evicts the least recently stored or looked up entry once maxsize
+entries are held and optionally expires entries ttl seconds after they were
+stored. InMemoryDB adds O(1) removal of a random entry, it keeps the keys in
+an array and the array position of every key, a removed key is replaced by
+the last one. All operations are O(1). Both can be saved to and loaded from a
+pickle file, e.g. to keep the object checksums of a load run.
+"""
+import os
+import pickle
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+from typing import Hashable
+from typing import Tuple
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    In memory cache for storing test id and test node information
+    """
+
+    def __init__(self, size: int, ttl: float = None) -> None:
+        """
+        :param size: max entries, the least recently used one is evicted.
+        :param ttl: seconds after which a stored entry expires, None never.
+        """
+        self.maxsize = size
+        self.ttl = ttl
+        self.table = OrderedDict()  # key: (value, expiry or None), oldest first
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING, touch=False) is not _MISSING
+
+    def _added(self, key: Hashable) -> None:
+        """Called with lock held after a new key was inserted."""
+
+    def _removed(self, key: Hashable) -> None:
+        """Called with lock held after a key was removed."""
+
+    def _pop(self, key: Hashable) -> Any:
+        """Remove key, lock held. Returns the stored (value, expiry)."""
+        entry = self.table.pop(key)
+        self._removed(key)
+        return entry
+
+    def store(self, key: Hashable, value: Any, ttl: float = None) -> None:
+        """
+        Stores the key and value and evicts the least recently used entry.
+        :param ttl: seconds until the entry expires, defaults to cache ttl.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expiry = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            if key in self.table:
+                self.table.move_to_end(key)
+            else:
+                self._added(key)
+            self.table[key] = (value, expiry)
+            while len(self.table) > self.maxsize:
+                oldest = next(iter(self.table))
+                self._pop(oldest)
+                self.evictions += 1
+
+    def get(self, key: Hashable, default: Any = None, touch: bool = True) -> Any:
+        """
+        Value of key or default if it is missing or expired.
+        :param touch: mark the entry as most recently used.
+        """
+        with self._lock:
+            entry = self.table.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            value, expiry = entry
+            if expiry is not None and expiry <= time.monotonic():
+                self._pop(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+            if touch:
+                self.table.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def lookup(self, key: Hashable) -> Any:
+        """
+        Lookup cache for key.
+        :param key:
+        :return: val of entry
+        :raises KeyError: if key is missing or expired.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def delete(self, key: Hashable) -> None:
+        """Removes the table entry if present."""
+        with self._lock:
+            if key in self.table:
+                self._pop(key)
+
+    def clear(self) -> None:
+        """Remove all entries, stats are kept."""
+        with self._lock:
+            for key in list(self.table):
+                self._pop(key)
+
+    def to_dict(self) -> dict:
+        """Live entries as {key: value} in LRU order."""
+        now = time.monotonic()
+        with self._lock:
+            return {key: value for key, (value, expiry) in self.table.items()
+                    if expiry is None or expiry > now}
+
+    def purge_expired(self) -> int:
+        """Remove expired entries, returns how many. O(n), expired entries are
+        otherwise removed when looked up or evicted."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [key for key, (_, expiry) in self.table.items()
+                       if expiry is not None and expiry <= now]
+            for key in expired:
+                self._pop(key)
+            self.expirations += len(expired)
+        return len(expired)
+
+    def stats(self) -> dict:
+        """Snapshot of size and hit/miss/eviction counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return dict(size=len(self.table), maxsize=self.maxsize, hits=self.hits,
+                        misses=self.misses, evictions=self.evictions,
+                        expirations=self.expirations,
+                        hit_ratio=round(self.hits / lookups, 4) if lookups else None)
+
+    def save(self, path: str) -> int:
+        """
+        Write entries to path in LRU order, replacing the file atomically.
+        Expiry times are saved as wall clock times.
+        :return: number of saved entries.
+        """
+        offset = time.time() - time.monotonic()
+        with self._lock:
+            entries = [(key, value, None if expiry is None else expiry + offset)
+                       for key, (value, expiry) in self.table.items()]
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as fout:
+            pickle.dump(entries, fout, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        return len(entries)
+
+    def load(self, path: str) -> int:
+        """
+        Store entries saved by save, expired ones are skipped.
+        :return: number of loaded entries, 0 if path does not exist.
+        """
+        if not os.path.exists(path):
+            return 0
+        with open(path, 'rb') as fin:
+            entries = pickle.load(fin)
+        now = time.time()
+        loaded = 0
+        for key, value, expiry in entries:
+            if expiry is not None and expiry <= now:
+                continue
+            self.store(key, value, None if expiry is None else expiry - now)
+            loaded += 1
+        return loaded
+
+
+class InMemoryDB(LRUCache):
+    """In memory storage with O(1) removal of a random entry."""
+
+    def __init__(self, size: int, ttl: float = None) -> None:
+        super().__init__(size, ttl)
+        self.keys = list()
+        self.index = dict()
+        self.random = random.SystemRandom()
+
+    def _added(self, key: Hashable) -> None:
+        self.index[key] = len(self.keys)
+        self.keys.append(key)
+
+    def _removed(self, key: Hashable) -> None:
+        pos = self.index.pop(key)
+        last = self.keys.pop()
+        if pos < len(self.keys):
+            self.keys[pos] = last
+            self.index[last] = pos
+
+    def pop_one(self) -> Tuple[Any, Any]:
+        """
+        Pop one table entry randomly, (False, False) when empty.
+        Expired entries are dropped while searching for a live one.
+        """
+        with self._lock:
+            now = time.monotonic()
+            while self.keys:
+                key = self.keys[self.random.randrange(len(self.keys))]
+                value, expiry = self._pop(key)
+                if expiry is not None and expiry <= now:
+                    self.expirations += 1
+                    continue
+                self.hits += 1
+                return key, value
+            self.misses += 1
+            return False, False
+
+    def sample(self) -> Tuple[Any, Any]:
+        """One random live (key, value) without removing it, (False, False) when empty."""
+        with self._lock:
+            now = time.monotonic()
+            while self.keys:
+                key = self.keys[self.random.randrange(len(self.keys))]
+                value, expiry = self.table[key]
+                if expiry is not None and expiry <= now:
+                    self._pop(key)
+                    self.expirations += 1
+                    continue
+                self.hits += 1
+                return key, value
+            self.misses += 1
+            return False, False
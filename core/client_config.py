@@ -25,8 +25,8 @@ import logging
 import subprocess
 import json
 from urllib.parse import quote_plus
-from pymongo import MongoClient
 from commons.params import DB_HOSTNAME
+from commons.utils.db_utils import get_client
 from commons.params import DB_NAME
 from commons.params import SYS_INFO_COLLECTION
 
@@ -49,7 +49,7 @@ class ClientConfig:
         """
         mongodburi = "mongodb://{0}:{1}@{2}"
         uri = mongodburi.format(quote_plus(self.db_user), quote_plus(self.db_password), DB_HOSTNAME)
-        client = MongoClient(uri)
+        client = get_client(uri)
         setup_db = client[DB_NAME]
         collection_obj = setup_db[SYS_INFO_COLLECTION]
         setup_query = {"setupname": target}
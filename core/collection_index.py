@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/python
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Persistent index of collected tests keyed by test file content.
+
+Every test file is recorded with the sha256 of its content and the test
+items pytest collected from it: nodeid, tag (test id), marker names and
+parallel flag. A run selecting tests of a TE ticket collects only the files
+holding its test ids plus files which are new or changed since they were
+indexed, instead of importing every test module. The whole index is dropped
+when pytest.ini, a conftest.py or any other non test module or data file
+(config yaml, json, csv ..) changes, as helpers and config feed imports and
+parametrization of every test file.
+
+    index = CollectionIndex(params.COLLECTION_INDEX).load()
+    files = index.test_files(['tests'])
+    to_collect = index.stale(files) | index.files_for(['TEST-17413'])
+    ... collect to_collect with pytest, then
+    index.update({path: [entry, ..]}); index.save()
+"""
+import configparser
+import fnmatch
+import hashlib
+import json
+import os
+import shlex
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+
+from commons import params
+
+VERSION = 2
+TEST_FILE_PATTERNS = ('test_*.py', '*_test.py')
+SKIP_DIRS = ('__pycache__', '.*', 'venv', 'node_modules')
+# non test files whose content affects collection of any test file
+CONFIG_PATTERNS = ('*.py', '*.ini', '*.cfg', '*.yaml', '*.yml', '*.json', '*.csv')
+
+
+def file_digest(path: str) -> str:
+    """sha256 hex digest of file content."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as fin:
+        for chunk in iter(lambda: fin.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class CollectionIndex:
+    """Test items per test file, valid while the file content is unchanged."""
+
+    def __init__(self, path: str = params.COLLECTION_INDEX, root: str = None) -> None:
+        """
+        :param path: index json file.
+        :param root: directory test file paths are relative to, cwd if None.
+        """
+        self.path = path
+        self.root = os.path.abspath(root or os.getcwd())
+        self.files = dict()  # relpath: {sha256, mtime_ns, size, items: [entry]}
+        self.config_digest = None
+
+    def load(self) -> 'CollectionIndex':
+        """Read the index file, a missing, corrupt or outdated one gives an empty index."""
+        try:
+            with open(self.path) as fin:
+                data = json.load(fin)
+        except (OSError, ValueError):
+            return self
+        if data.get('version') != VERSION or data.get('config') != self.collection_config():
+            return self
+        self.files = data.get('files', dict())
+        self.config_digest = data['config']
+        return self
+
+    def save(self) -> None:
+        """Write the index atomically."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = dict(version=VERSION, config=self.collection_config(), files=self.files)
+        tmp_path = f'{self.path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as fout:
+            json.dump(data, fout)
+        os.replace(tmp_path, self.path)
+
+    def collection_config(self) -> str:
+        """
+        Digest of all files below root which are not test files but may affect
+        collection: pytest.ini, conftest.py, helper modules and config data.
+        The directory of the index file itself (log) is not included.
+        """
+        if self.config_digest is not None:
+            return self.config_digest
+        digest = hashlib.sha256()
+        index_path = os.path.abspath(self.path)
+        index_dir = os.path.dirname(index_path)
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = sorted(name for name in dirnames if not self._skip_dir(name)
+                                 and os.path.join(dirpath, name) != index_dir)
+            for name in sorted(filenames):
+                if any(fnmatch.fnmatch(name, pattern) for pattern in TEST_FILE_PATTERNS):
+                    continue
+                if not any(fnmatch.fnmatch(name, pattern) for pattern in CONFIG_PATTERNS):
+                    continue
+                path = os.path.join(dirpath, name)
+                if path.startswith(index_path):
+                    continue  # the index and its temp files
+                digest.update(os.path.relpath(path, self.root).encode())
+                digest.update(file_digest(path).encode())
+        self.config_digest = digest.hexdigest()
+        return self.config_digest
+
+    @staticmethod
+    def _skip_dir(name: str, extra: Iterable[str] = ()) -> bool:
+        """True for directories pytest does not recurse into."""
+        return any(fnmatch.fnmatch(name, pattern) for pattern in SKIP_DIRS + tuple(extra))
+
+    def relpath(self, path: str) -> str:
+        """Path relative to root as used in nodeids."""
+        return os.path.relpath(os.path.abspath(path), self.root)
+
+    def test_files(self, args: Iterable[str], ignore: Iterable[str] = (),
+                   norecursedirs: Iterable[str] = (),
+                   patterns: Iterable[str] = TEST_FILE_PATTERNS) -> Optional[List[str]]:
+        """
+        Relative paths of test files pytest collects for args.
+        :param ignore: paths given with --ignore.
+        :return: None when an arg selects less than whole files, e.g. a nodeid.
+        """
+        ignored = {os.path.abspath(path) for path in ignore}
+        files = set()
+        for arg in args:
+            path = os.path.abspath(os.path.join(self.root, arg))
+            if '::' in arg or not os.path.exists(path):
+                return None
+            if os.path.isfile(path):
+                files.add(self.relpath(path))
+                continue
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames[:] = [name for name in dirnames
+                               if not self._skip_dir(name, norecursedirs)
+                               and os.path.join(dirpath, name) not in ignored]
+                for name in filenames:
+                    full = os.path.join(dirpath, name)
+                    if full not in ignored and any(fnmatch.fnmatch(name, pattern)
+                                                   for pattern in patterns):
+                        files.add(self.relpath(full))
+        return sorted(files)
+
+    def ini_options(self) -> dict:
+        """--ignore paths and norecursedirs configured in pytest.ini."""
+        parser = configparser.ConfigParser(interpolation=None)
+        parser.read(os.path.join(self.root, 'pytest.ini'))
+        addopts = shlex.split(parser.get('pytest', 'addopts', fallback=''))
+        ignore = [os.path.join(self.root, opt.split('=', 1)[1]) for opt in addopts
+                  if opt.startswith('--ignore=')]
+        norecursedirs = parser.get('pytest', 'norecursedirs', fallback='').split()
+        return dict(ignore=ignore, norecursedirs=norecursedirs)
+
+    def default_test_files(self) -> List[str]:
+        """Test files of a plain pytest run from root."""
+        return self.test_files([self.root], **self.ini_options())
+
+    def is_current(self, relpath: str) -> bool:
+        """True if relpath is indexed with its current content."""
+        record = self.files.get(relpath)
+        if record is None:
+            return False
+        try:
+            stat = os.stat(os.path.join(self.root, relpath))
+        except OSError:
+            return False
+        if stat.st_mtime_ns == record['mtime_ns'] and stat.st_size == record['size']:
+            return True
+        if file_digest(os.path.join(self.root, relpath)) != record['sha256']:
+            return False
+        record.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+        return True
+
+    def stale(self, files: Iterable[str]) -> Set[str]:
+        """Files which are new or changed since they were indexed."""
+        return {relpath for relpath in files if not self.is_current(relpath)}
+
+    def files_for(self, test_ids: Iterable[str], files: Iterable[str] = None) -> Set[str]:
+        """Indexed files holding one of test_ids, restricted to files if given."""
+        test_ids = set(test_ids)
+        candidates = self.files if files is None else [f for f in files if f in self.files]
+        return {relpath for relpath in candidates
+                if any(entry['test_id'] in test_ids for entry in self.files[relpath]['items'])}
+
+    def update(self, items: Dict[str, List[dict]]) -> None:
+        """Record collected entries of files with their current content."""
+        for relpath, entries in items.items():
+            full = os.path.join(self.root, relpath)
+            try:
+                stat = os.stat(full)
+            except OSError:
+                self.files.pop(relpath, None)
+                continue
+            self.files[relpath] = dict(sha256=file_digest(full), mtime_ns=stat.st_mtime_ns,
+                                       size=stat.st_size, items=entries)
+
+    def forget(self, relpaths: Iterable[str]) -> None:
+        """Drop files, e.g. ones which failed to collect."""
+        for relpath in relpaths:
+            self.files.pop(relpath, None)
+
+    def prune(self, files: Iterable[str]) -> None:
+        """Drop indexed files below the walked args which no longer exist."""
+        existing = set(files)
+        for relpath in list(self.files):
+            if relpath not in existing and not os.path.exists(os.path.join(self.root, relpath)):
+                del self.files[relpath]
+
+    def entries(self, files: Iterable[str] = None) -> List[dict]:
+        """Indexed entries in file order, of files if given."""
+        files = sorted(self.files) if files is None else files
+        return [entry for relpath in files if relpath in self.files
+                for entry in self.files[relpath]['items']]
@@ -23,9 +23,10 @@ Utility Class for health status check and update to database
 
 import logging
 from urllib.parse import quote_plus
-from pymongo import MongoClient
+from commons.helpers.cluster_executor import ClusterExecutor
 from commons.helpers.health_helper import Health
 from commons.params import DB_HOSTNAME
+from commons.utils.db_utils import get_client
 from commons.params import DB_NAME
 from commons.params import SYS_INFO_COLLECTION
 
@@ -50,7 +51,7 @@ class HealthCheck:
         target_dict = {}
         mongodburi = "mongodb://{0}:{1}@{2}"
         uri = mongodburi.format(quote_plus(self.db_user), quote_plus(self.db_password), DB_HOSTNAME)
-        client = MongoClient(uri)
+        client = get_client(uri)
         setup_db = client[DB_NAME]
         collection_obj = setup_db[SYS_INFO_COLLECTION]
         for target in targets:
@@ -70,7 +71,7 @@ class HealthCheck:
         """
         mongodburi = "mongodb://{0}:{1}@{2}"
         uri = mongodburi.format(quote_plus(self.db_user), quote_plus(self.db_password), DB_HOSTNAME)
-        client = MongoClient(uri)
+        client = get_client(uri)
         setup_db = client[DB_NAME]
         collection_obj = setup_db[SYS_INFO_COLLECTION]
         for setupname in target_status_dict:
@@ -99,12 +100,13 @@ class HealthCheck:
                 if not setup["setup_in_useby"] == "":
                     continue
             nodes = setup["nodes"]
-            for node in nodes:
-                result = Health.check_cortx_cluster_health(node)
-                if result:
-                    target_status_dict[setupname] = True
-                else:
+            if not nodes:
+                continue
+            result = ClusterExecutor(nodes, key=lambda node: node['hostname']).run(
+                Health.check_cortx_cluster_health)
+            target_status_dict[setupname] = True
+            for host, res in result.items():
+                if not res.status or not res.output:
                     target_status_dict[setupname] = False
-                    LOGGER.info("Health check failed for %s of %s", node['host'], setupname)
-                    break
+                    LOGGER.info("Health check failed for %s of %s", host, setupname)
         self.update_health_status(target_status_dict)
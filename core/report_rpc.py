@@ -22,6 +22,11 @@
 Report RPC module handle initiating a report client and update Jira and MongoDB.
 These are async rpc calls and intended to be called from pytest reporting hooks.
 """
+from commons import report_client
+from commons import reporting_service
+from commons.utils import jira_utils
+from core.runner import get_db_credential
+from core.runner import get_jira_credential
 
 
 class ReportClientImpl:
@@ -29,9 +34,25 @@ class ReportClientImpl:
 
     def __init__(self):
         """Init Jira and MongoDB Clients."""
+        db_user, db_pass = get_db_credential()
+        jira_id, jira_pwd = get_jira_credential()
+        report_client.ReportClient.init_instance()
+        self.service = reporting_service.ReportingService(
+            report_client.ReportClient.get_instance(), jira_utils.JiraTask(jira_id, jira_pwd),
+            db_user, db_pass)
+        self.service.start()
 
-    def async_update_db(self):
-        """Async update db with test result."""
+    def async_update_db(self, payload: dict) -> bool:
+        """Async update db with test result, payload as for ReportClient.create_db_entry."""
+        return self.service.create_db_entry(**payload)
+
+    def async_update_jira(self, test_exe_id: str, test_id: str, test_status: str) -> bool:
+        """Async update of a test status in a test execution."""
+        return self.service.update_jira_status(test_exe_id, test_id, test_status)
+
+    def flush(self, timeout: float = 300) -> bool:
+        """Wait until queued updates were sent or spilled."""
+        return self.service.flush(timeout)
 
 
 def register(srv):
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/python
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Test scheduling by expected duration.
+
+Expected durations come from past passed runs, kept in a local history file
+and refreshed from the testExecutionTime of report DB entries. Tests without
+history get a prior by marker (ha, longevity ..). Work is scheduled longest
+processing time first: xdist workers and targets which pull the next test or
+work item when idle then finish within 4/3 of the optimal makespan, instead of
+a multi hour HA test starting last.
+
+    history = DurationHistory().load()
+    history.refresh(test_ids)  # report DB, optional
+    bins = lpt_pack({tid: history.estimate(tid, marks) for ..}, workers)
+"""
+import heapq
+import json
+import logging
+import os
+import statistics
+from typing import Dict
+from typing import Hashable
+from typing import Iterable
+from typing import List
+
+import requests
+
+from commons import constants as const
+from commons import params
+
+LOGGER = logging.getLogger(__name__)
+
+
+def prior(marks: Iterable[str] = ()) -> float:
+    """Assumed seconds of a test without history, the longest prior of its marker words."""
+    words = {word for mark in marks for word in mark.split('_')}
+    return max((secs for word, secs in const.TEST_DURATION_PRIORS.items() if word in words),
+               default=const.TEST_DURATION_DEFAULT)
+
+
+def lpt_order(durations: Dict[Hashable, float]) -> List[Hashable]:
+    """Keys longest duration first, ties in key order."""
+    return sorted(durations, key=lambda key: (-durations[key], str(key)))
+
+
+def lpt_pack(durations: Dict[Hashable, float], bins: int) -> List[List[Hashable]]:
+    """
+    Longest processing time first bin packing, each key goes to the least loaded bin.
+    :return: bins non empty key lists, most loaded first.
+    """
+    bins = max(1, min(bins, len(durations)))
+    heap = [(0.0, idx, []) for idx in range(bins)]
+    for key in lpt_order(durations):
+        load, idx, keys = heapq.heappop(heap)
+        keys.append(key)
+        heapq.heappush(heap, (load + durations[key], idx, keys))
+    return [keys for _, _, keys in sorted(heap, key=lambda entry: -entry[0]) if keys]
+
+
+def makespan(durations: Dict[Hashable, float], workers: int) -> float:
+    """Expected seconds to run tests on workers, at least the longest test."""
+    if not durations:
+        return 0.0
+    return max(max(durations.values()), sum(durations.values()) / max(1, workers))
+
+
+class DurationHistory:
+    """Durations of the last passed runs per test id, saved as json."""
+
+    def __init__(self, path: str = params.TEST_DURATION_HISTORY,
+                 samples: int = const.TEST_DURATION_SAMPLES) -> None:
+        self.path = path
+        self.samples = samples
+        self.durations = dict()  # test_id: [seconds, ..] oldest first
+
+    def load(self) -> 'DurationHistory':
+        """Read the history file, a missing or corrupt one gives an empty history."""
+        try:
+            with open(self.path) as fin:
+                self.durations = json.load(fin)
+        except (OSError, ValueError) as error:
+            LOGGER.debug("No test duration history %s: %s", self.path, error)
+        return self
+
+    def save(self) -> None:
+        """Write the history atomically."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f'{self.path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as fout:
+            json.dump(self.durations, fout)
+        os.replace(tmp_path, self.path)
+
+    def record(self, test_id: str, seconds: float) -> None:
+        """Add a passed run, only the last samples runs are kept."""
+        if not test_id or seconds <= 0:
+            return
+        runs = self.durations.setdefault(test_id, [])
+        runs.append(round(seconds, 3))
+        del runs[:-self.samples]
+
+    def estimate(self, test_id: str, marks: Iterable[str] = ()) -> float:
+        """Median of recorded runs or the prior of marks."""
+        runs = self.durations.get(test_id)
+        return statistics.median(runs) if runs else prior(marks)
+
+    def refresh(self, test_ids: Iterable[str], db_user: str = None,
+                db_pass: str = None) -> int:
+        """
+        Add report DB durations of tests without local history.
+        :return: number of tests added, 0 if the report server is unreachable.
+        """
+        # imported here, report_client is not needed for history only use
+        from commons.report_client import ReportClient
+        missing = [tid for tid in set(test_ids) if tid and tid not in self.durations]
+        if not missing:
+            return 0
+        try:
+            found = ReportClient(db_user, db_pass).get_test_durations(missing)
+        except (requests.RequestException, ValueError) as error:
+            LOGGER.warning("Test durations not read from report DB: %s", error)
+            return 0
+        for test_id, seconds in found.items():
+            self.record(test_id, seconds)
+        return len(found)
@@ -36,6 +36,7 @@ import threading
 import csv
 import subprocess
 import logging
+import math
 from typing import List
 from typing import Tuple
 from typing import Any
@@ -45,13 +46,14 @@ from threading import Thread
 from confluent_kafka.admin import AdminClient
 from confluent_kafka.admin import NewTopic
 from core import rpcserver
+from core.collection_index import CollectionIndex
+from core import scheduler
 from core import report_rpc
 from core import runner
 from core import producer
 from commons.utils import system_utils
 from commons.utils import jira_utils
 from commons.utils import config_utils
-from commons import worker
 from commons import params
 from commons import cortxlogging
 
@@ -86,6 +88,8 @@ def parse_args(argv):
                         help="Enable async reporting to Jira and MongoDB")
     parser.add_argument("-c", "--cancel_run", type=bool, default=False,
                         help="Enable Cancel run")
+    parser.add_argument("-p", "--prc_cnt", type=int, default=2,
+                        help="Parallel pytest workers per target, used for scheduling")
     return parser.parse_args(args=argv)
 
 
@@ -196,7 +200,7 @@ def run(opts: dict) -> None:
     # Ensure that only 1 execution is run with multiple targets. This will be enhanced
     # when we start running multiple distributed executions for multiple targets.
     create_topic(kafka_client)
-    work_queue = worker.WorkQ(producer.produce, 1024)
+    work_queue = Queue(1024)
     finish = False  # Use finish to exit loop
     # start kafka producer
     _producer = Thread(target=producer.server,
@@ -205,35 +209,61 @@ def run(opts: dict) -> None:
 
     # for parallel group create a kafka entry
     # for each non parallel group item create a kafka entry
-    for tg in selected_tag_map:
-        parallel_set, sequential_set = selected_tag_map[tg]
+    # items are produced longest expected duration first, targets pull them in order
+    history = scheduler.DurationHistory().load()
+    history.refresh({test for sets in selected_tag_map.values() for test_set in sets
+                     for test in test_set},
+                    os.environ.get('DB_USER'), os.environ.get('DB_PASSWORD'))
+    for tg, parallel, test_set, duration in plan_work_items(
+            selected_tag_map, test_map, history, len(targets), opts.prc_cnt):
+        LOGGER.info("Scheduling %s tests of %s, expected %ss", len(test_set), tg, int(duration))
         witem = Queue()
-        witem.put(parallel_set)
+        witem.put(test_set)
         witem.tag = tg
-        witem.parallel = True
+        witem.parallel = parallel
         witem.targets = targets
-        set_t = parallel_set if len(parallel_set) else sequential_set
-        witem.tickets = test_map[next(iter(set_t))][-1]
+        witem.tickets = test_map[next(iter(test_set))][-1]
         witem.build = opts.build
         witem.build_type = opts.build_type
         witem.test_plan = test_plan
         work_queue.put(witem)
-        for set_item in sequential_set:
-            w_item = Queue()
-            w_item.put([set_item])
-            w_item.tag = tg
-            w_item.parallel = False
-            w_item.targets = targets
-            w_item.tickets = test_map[set_item][-1]
-            w_item.build = opts.build
-            w_item.build_type = opts.build_type
-            w_item.test_plan = test_plan
-            work_queue.put(w_item)
     work_queue.put(None)  # poison
     work_queue.join()
     _producer.join()
 
 
+def plan_work_items(selected_tag_map: Dict, test_map: Dict,
+                    history: scheduler.DurationHistory, targets: int,
+                    workers: int) -> List[Tuple[str, bool, Any, float]]:
+    """
+    Work items longest expected duration first. A parallel group expected to run
+    longer than the mean target load is split LPT first across up to targets items.
+    :return: [(tag, parallel, test set, expected seconds)]
+    """
+    def estimate(test):
+        return history.estimate(test, test_map[test][2] or ())
+
+    groups = list()
+    for tag, (parallel_set, sequential_set) in selected_tag_map.items():
+        if parallel_set:
+            groups.append((tag, {test: estimate(test) for test in parallel_set}))
+        for test in sequential_set:
+            groups.append((tag, [test]))
+    spans = [scheduler.makespan(group, workers) if isinstance(group, dict)
+             else estimate(group[0]) for _, group in groups]
+    mean_load = sum(spans) / max(1, targets)
+    items = list()
+    for (tag, group), span in zip(groups, spans):
+        if not isinstance(group, dict):
+            items.append((tag, False, group, span))
+            continue
+        chunks = min(targets, max(1, math.ceil(span / mean_load))) if mean_load else 1
+        for chunk in scheduler.lpt_pack(group, chunks):
+            durations = {test: group[test] for test in chunk}
+            items.append((tag, True, set(chunk), scheduler.makespan(durations, workers)))
+    return sorted(items, key=lambda item: -item[3])
+
+
 def develop_execution_plan(rev_tag_map, selected_tag_map, skip_test, test_map, tickets):
     """Develop Test execution plan to be followed by test runners."""
     for ticket in tickets:
@@ -349,7 +379,19 @@ def create_log_dir_if_not_exists():
 def run_pytest_collect_only_cmd(opts, te_tag=None):
     """Form a pytest command to collect tests in TE ticket.
     Target default to automation as a nominal value for collection.
+    te_meta.json is written from the collection index when no test file changed.
     """
+    index = CollectionIndex(params.COLLECTION_INDEX).load()
+    test_files = index.default_test_files()
+    if index.files and not index.stale(test_files) and (not te_tag or te_tag.isidentifier()):
+        # test universe is unchanged since last collected, skip importing test modules
+        meta = [dict(nodeid=entry['nodeid'], test_id=entry['test_id'], marks=entry['marks'])
+                for entry in index.entries(test_files)
+                if not te_tag or te_tag in entry['marks']]
+        config_utils.create_content_json(
+            os.path.join(create_log_dir_if_not_exists(), 'te_meta.json'), meta,
+            ensure_ascii=False)
+        return
     env = os.environ.copy()
     env['TARGET'] = opts.targets[0] #needs dummy target
     tag = '-m ' + te_tag if te_tag else None
@@ -19,16 +19,109 @@
 #
 """ This is the core module for REST API. """
 
+import base64
 import json
 import logging
+import threading
+import time
+from http.cookiejar import DefaultCookiePolicy
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.exceptions import InsecureRequestWarning
 
 from commons import constants
 from commons.constants import Rest as const
 from config import CMN_CFG
 
+LOGGER = logging.getLogger(__name__)
+
+
+class TokenCache:
+    """
+    Login tokens keyed by login identity (host, port, username, password).
+    A token is reused until ttl expires, or the exp claim of a JWT token
+    if that comes earlier, or until it is invalidated.
+    """
+
+    def __init__(self, ttl: float = const.TOKEN_TTL):
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.tokens = dict()
+        self.stats = dict(hits=0, misses=0, invalidated=0)
+
+    @staticmethod
+    def expiry(token: str, ttl: float) -> float:
+        """time.time() after which token is not reused."""
+        expires = time.time() + ttl
+        parts = token.split()[-1].split(".")
+        if len(parts) == 3:
+            try:
+                payload = parts[1] + "=" * (-len(parts[1]) % 4)
+                claims = json.loads(base64.urlsafe_b64decode(payload))
+                expires = min(expires, float(claims["exp"]) - 30)
+            except (ValueError, KeyError, TypeError):
+                pass
+        return expires
+
+    def get(self, key: tuple):
+        """Cached token of key or None."""
+        with self.lock:
+            entry = self.tokens.get(key)
+            if entry and entry[1] > time.time():
+                self.stats["hits"] += 1
+                return entry[0]
+            self.tokens.pop(key, None)
+            self.stats["misses"] += 1
+            return None
+
+    def put(self, key: tuple, token: str) -> None:
+        """Cache token of key."""
+        if self.ttl > 0:
+            with self.lock:
+                self.tokens[key] = (token, self.expiry(token, self.ttl))
+
+    def invalidate(self, key: tuple = None, token: str = None) -> None:
+        """Drop the token of key, a given token or every token."""
+        with self.lock:
+            for cached_key, entry in list(self.tokens.items()):
+                if key is None and token is None or cached_key == key or entry[0] == token:
+                    del self.tokens[cached_key]
+                    self.stats["invalidated"] += 1
+
+
+#: Tokens shared by all RestTestLib objects of the process.
+TOKEN_CACHE = TokenCache()
+
+_SESSIONS = dict()
+_SESSIONS_LOCK = threading.Lock()
+
+
+def get_session(base_url: str, pool_size: int = const.SESSION_POOL_SIZE) -> requests.Session:
+    """
+    Return the process wide keep-alive session of base_url.
+    Cookies are not kept, every request is authorized by its own headers as
+    with the module level requests functions.
+    """
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(base_url)
+        if session is None:
+            session = requests.Session()
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _SESSIONS[base_url] = session
+        return session
+
+
+def close_sessions() -> None:
+    """Close all pooled sessions."""
+    with _SESSIONS_LOCK:
+        for session in _SESSIONS.values():
+            session.close()
+        _SESSIONS.clear()
+
 
 class RestClient:
     """
@@ -43,11 +136,13 @@ class RestClient:
         requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
         self.log = logging.getLogger(__name__)
         self._config = config
-        self._request = {"get": requests.get, "post": requests.post,
-                         "patch": requests.patch, "delete": requests.delete,
-                         "put": requests.put}
         self._base_url = "{}:{}".format(
             self._config["mgmt_vip"], str(self._config["port"]))
+        self.session = get_session(
+            self._base_url, self._config.get("session_pool_size", const.SESSION_POOL_SIZE))
+        self._request = {"get": self.session.get, "post": self.session.post,
+                         "patch": self.session.patch, "delete": self.session.delete,
+                         "put": self.session.put}
         self._json_file_path = self._config[
             "jsonfile"] if 'jsonfile' in self._config else const.JOSN_FILE
         self.secure_connection = self._config["secure"]
@@ -89,6 +184,9 @@ class RestClient:
             request_url, headers=headers,
             data=data, params=params, verify=False, json=json_dict)
         self.log.debug("Response Object: %s", response_object)
+        if endpoint == self._config.get("rest_logout_endpoint") and headers and \
+                "Authorization" in headers:
+            TOKEN_CACHE.invalidate(token=headers["Authorization"])
         try:
             self.log.debug("Response JSON: %s", response_object.json())
         except BaseException:
@@ -21,10 +21,13 @@
 import logging
 from string import Template
 
+import requests
+
 import commons.errorcodes as err
 from commons.constants import Rest as const
 from commons.exceptions import CTException
 from libs.csm.rest.csm_rest_core_lib import RestClient
+from libs.csm.rest.csm_rest_core_lib import TOKEN_CACHE
 from config import CSM_REST_CFG
 
 
@@ -151,6 +154,49 @@ class RestTestLib:
                 err.CSM_REST_AUTHENTICATION_ERROR, error) from error
         return response
 
+    def login_identity(self, login_as) -> tuple:
+        """Token cache key of login_as, a config user type or a credentials dict."""
+        user = login_as if isinstance(login_as, dict) else self.config[login_as]
+        return (self.config["mgmt_vip"], self.config["port"], user.get("username"),
+                user.get("password"))
+
+    def log_login_failure(self, response):
+        """Log details of a failed login response."""
+        self.log.error(f"Authentication request failed in"
+                       f" {RestTestLib.authenticate_and_login.__name__}.\n"
+                       f"Response code : {response.status_code}")
+        self.log.error(f"Response content: {response.content}")
+        self.log.error(f"Request headers : {response.request.headers}\n"
+                       f"Request body : {response.request.body}")
+
+    def get_login_token(self, login_as) -> tuple:
+        """
+        Return (token, cached), logging in only when the cache has no valid
+        token for the login identity of login_as.
+        """
+        key = self.login_identity(login_as)
+        token = TOKEN_CACHE.get(key)
+        if token:
+            return token, True
+        self.log.debug("user will be logged in as %s", login_as)
+        response = self.rest_login(login_as=login_as)
+        if response.status_code != const.SUCCESS_STATUS:
+            self.log_login_failure(response)
+            raise CTException(err.CSM_REST_AUTHENTICATION_ERROR)
+        token = response.headers['Authorization']
+        TOKEN_CACHE.put(key, token)
+        return token, False
+
+    def invalidate_token(self, login_as=None):
+        """
+        Drop cached login token of login_as or of every user, the next
+        authenticated call logs in again.
+        """
+        if login_as is None:
+            TOKEN_CACHE.invalidate()
+        elif isinstance(login_as, dict) or login_as in self.config:
+            TOKEN_CACHE.invalidate(key=self.login_identity(login_as))
+
     def authenticate_and_login(func):
         """
         :type: Decorator
@@ -179,22 +225,24 @@ class RestTestLib:
             authorized = kwargs.pop(
                 "authorized") if "authorized" in kwargs else True
 
-            # Fetching the login response
-            self.log.debug("user will be logged in as %s", login_type)
-            response = self.rest_login(login_as=login_type)
-
-            if authorized and response.status_code == const.SUCCESS_STATUS:
-                self.headers = {
-                    'Authorization': response.headers['Authorization']}
-            else:
-                self.log.error(f"Authentication request failed in"
-                               f" {RestTestLib.authenticate_and_login.__name__}.\n"
-                               f"Response code : {response.status_code}")
-                self.log.error(f"Response content: {response.content}")
-                self.log.error(f"Request headers : {response.request.headers}\n"
-                               f"Request body : {response.request.body}")
+            if not authorized:
+                # Fetching the login response
+                self.log.debug("user will be logged in as %s", login_type)
+                response = self.rest_login(login_as=login_type)
+                self.log_login_failure(response)
                 raise CTException(err.CSM_REST_AUTHENTICATION_ERROR)
-            return func(self, *args, **kwargs)
+
+            token, cached = self.get_login_token(login_type)
+            self.headers = {'Authorization': token}
+            response = func(self, *args, **kwargs)
+            if cached and isinstance(response, requests.Response) and \
+                    response.status_code == const.UNAUTHORIZED:
+                self.log.debug("Cached token of %s is rejected, logging in again", login_type)
+                self.invalidate_token(login_type)
+                token, _ = self.get_login_token(login_type)
+                self.headers = {'Authorization': token}
+                response = func(self, *args, **kwargs)
+            return response
 
         return create_authenticate_header
 
@@ -232,6 +280,7 @@ class RestTestLib:
         :return: Boolean value for successful creation
         """
         try:
+            self.invalidate_token(user_type)
             # Updating configurations
             self.config.update({
                 user_type: {"username": username, "password": password}
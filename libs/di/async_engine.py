@@ -0,0 +1,406 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/python
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Asyncio based DI upload and verify engine.
+
+Uploader forks a process per user and every process builds NWORKERS + 1 boto3
+resources and a thread pool. AsyncDIEngine drives all users from one event loop
+with a keep-alive connection pool per user, requests are signed with botocore
+SigV4 and sent over asyncio streams, so thousands of PUT/GET operations can be
+in flight from a single process.
+
+       RunDataCheckManager(users, engine='asyncio')
+                 |
+            AsyncDIEngine ---- ObjectStateStore / uploadInfo.csv
+                 |
+          AsyncS3Client (per user)
+                 |
+          ConnectionPool (per user, bounded keep-alive connections)
+"""
+import ssl
+import time
+import base64
+import random
+import asyncio
+import hashlib
+import logging
+import collections
+from urllib.parse import quote
+from urllib.parse import urlparse
+from botocore.auth import S3SigV4Auth
+from botocore.awsrequest import AWSRequest
+from botocore.credentials import Credentials
+from commons import params
+from commons.params import S3_ENDPOINT
+from libs.di import state_store
+from libs.di import data_generator
+from libs.di.downloader import DataIntegrityValidator
+from libs.di.uploader import save_upload_records
+from libs.di.uploader import save_users
+
+LOGGER = logging.getLogger(__name__)
+
+
+class S3RequestError(Exception):
+    """Raised for non 2xx responses of the async S3 client."""
+
+    def __init__(self, status, reason, body=b''):
+        super().__init__(f'{status} {reason} {body[:512]!r}')
+        self.status = status
+
+
+class ConnectionPool:
+    """Bounded pool of keep-alive HTTP connections to one endpoint."""
+
+    def __init__(self, endpoint: str = S3_ENDPOINT,
+                 max_connections: int = params.DI_ASYNC_CONNECTIONS,
+                 verify=True) -> None:
+        url = urlparse(endpoint)
+        self.host = url.hostname
+        self.secure = url.scheme == 'https'
+        self.port = url.port if url.port else (443 if self.secure else 80)
+        self.netloc = url.netloc
+        self.endpoint = f'{url.scheme}://{url.netloc}'
+        self.max_connections = max_connections
+        self.ssl_context = None
+        if self.secure:
+            self.ssl_context = ssl.create_default_context(
+                cafile=verify if isinstance(verify, str) else None)
+            if verify is False:
+                self.ssl_context.check_hostname = False
+                self.ssl_context.verify_mode = ssl.CERT_NONE
+        self.idle = collections.deque()
+        self.slots = None
+        self.opened = 0
+
+    async def acquire(self):
+        """Return an idle connection or open a new one, waits when pool is exhausted."""
+        if self.slots is None:
+            self.slots = asyncio.Semaphore(self.max_connections)
+        await self.slots.acquire()
+        while self.idle:
+            reader, writer = self.idle.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return reader, writer, True
+            writer.close()
+        try:
+            reader, writer = await asyncio.open_connection(
+                self.host, self.port, ssl=self.ssl_context, limit=2 ** 20)
+        except Exception:
+            self.slots.release()
+            raise
+        self.opened += 1
+        return reader, writer, False
+
+    def release(self, conn, reuse=True):
+        """Return connection to the pool, closed connections are dropped."""
+        reader, writer = conn[0], conn[1]
+        if reuse and not reader.at_eof():
+            self.idle.append((reader, writer))
+        else:
+            writer.close()
+        self.slots.release()
+
+    def close(self):
+        """Close all idle connections."""
+        while self.idle:
+            self.idle.pop()[1].close()
+
+
+class AsyncS3Client:
+    """Minimal S3 object client on top of ConnectionPool."""
+
+    def __init__(self, pool: ConnectionPool, access_key: str, secret_key: str,
+                 region: str = params.DI_ASYNC_REGION) -> None:
+        self.pool = pool
+        self.signer = S3SigV4Auth(Credentials(access_key, secret_key), 's3', region)
+
+    def _sign(self, method, path, body, headers):
+        """Return signed request headers."""
+        request = AWSRequest(method=method, url=self.pool.endpoint + path,
+                             data=body, headers=headers)
+        request.context['payload_signing_enabled'] = False
+        self.signer.add_auth(request)
+        request.headers['Host'] = self.pool.netloc
+        return request.headers.items()
+
+    @staticmethod
+    async def _read_head(reader):
+        """Read status line and headers of a response."""
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError('connection closed by server')
+        # reason phrase is optional, e.g. "HTTP/1.1 200"
+        _, _, rest = status_line.decode('latin-1').rstrip('\r\n').partition(' ')
+        status, _, reason = rest.partition(' ')
+        headers = dict()
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, value = line.decode('latin-1').split(':', 1)
+            headers[name.strip().lower()] = value.strip()
+        return int(status), reason, headers
+
+    @staticmethod
+    async def _read_body(reader, headers, sink, read_size):
+        """Read response body and pass every chunk to sink."""
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            while True:
+                size = int((await reader.readline()).split(b';')[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                sink(await reader.readexactly(size))
+                await reader.readline()
+            return
+        remaining = int(headers.get('content-length', 0))
+        while remaining:
+            chunk = await reader.read(min(read_size, remaining))
+            if not chunk:
+                raise asyncio.IncompleteReadError(b'', remaining)
+            sink(chunk)
+            remaining -= len(chunk)
+
+    async def request(self, method, bucket, key, body=b'', headers=None, sink=None,
+                      read_size=params.DI_READ_SIZE):
+        """Send a signed request, retrying once on a stale keep-alive connection.
+
+        :param sink: Callable receiving response body chunks, body is collected if None.
+        :return: tuple of response headers and collected body
+        """
+        path = '/{}/{}'.format(bucket, quote(key, safe='/~'))
+        signed = self._sign(method, path, body, dict(headers or dict()))
+        head = ''.join(f'{name}: {value}\r\n' for name, value in signed)
+        payload = f'{method} {path} HTTP/1.1\r\n{head}Content-Length: {len(body)}\r\n\r\n'
+        for attempt in range(2):
+            conn = await self.pool.acquire()
+            reader, writer, reused = conn
+            chunks = list()
+            try:
+                writer.write(payload.encode('latin-1'))
+                if body:
+                    writer.write(body)
+                await writer.drain()
+                status, reason, rheaders = await self._read_head(reader)
+                if status >= 300 or sink is None:
+                    await self._read_body(reader, rheaders, chunks.append, read_size)
+                else:
+                    await self._read_body(reader, rheaders, sink, read_size)
+            except (ConnectionError, asyncio.IncompleteReadError) as fault:
+                self.pool.release(conn, reuse=False)
+                if reused and attempt == 0:
+                    continue
+                raise fault
+            except Exception:
+                self.pool.release(conn, reuse=False)
+                raise
+            self.pool.release(conn, reuse=rheaders.get('connection', '').lower() != 'close')
+            if status >= 300:
+                raise S3RequestError(status, reason, b''.join(chunks))
+            return rheaders, b''.join(chunks)
+
+    async def put_object(self, bucket, key, body: bytes, md5sum: str = None):
+        """PUT object, Content-MD5 is sent when md5sum (hex) is given."""
+        headers = dict()
+        if md5sum:
+            headers['Content-MD5'] = base64.b64encode(bytes.fromhex(md5sum)).decode()
+        rheaders, _ = await self.request('PUT', bucket, key, body, headers)
+        return rheaders.get('etag', '').strip('"')
+
+    async def get_object_checksum(self, bucket, key, algo='md5',
+                                  read_size=params.DI_READ_SIZE):
+        """GET object and hash the body while it is received.
+        :return: tuple of hex digest and number of bytes received
+        """
+        hasher = hashlib.new(algo)
+        received = [0]
+
+        def sink(chunk):
+            hasher.update(chunk)
+            received[0] += len(chunk)
+        await self.request('GET', bucket, key, sink=sink, read_size=read_size)
+        return hasher.hexdigest(), received[0]
+
+
+class AsyncDIEngine:
+    """Upload and verify DI objects for all users from one event loop.
+    start() and verify_data_integrity() mirror Uploader.start() and
+    DataIntegrityValidator.verify_data_integrity().
+    """
+
+    def __init__(self,
+                 concurrency: int = params.DI_ASYNC_CONCURRENCY,
+                 max_connections: int = params.DI_ASYNC_CONNECTIONS,
+                 endpoint: str = S3_ENDPOINT,
+                 verify=True) -> None:
+        self.concurrency = concurrency
+        self.max_connections = max_connections
+        self.endpoint = endpoint
+        self.verify = verify
+        self.change_manager = state_store.ObjectStateStore()
+        self.latencies = collections.defaultdict(list)
+        self.errors = collections.Counter()
+        self.elapsed = dict()
+
+    def _clients(self, users):
+        """Create a client with its own connection pool per user."""
+        return {user: AsyncS3Client(ConnectionPool(self.endpoint, self.max_connections,
+                                                   self.verify),
+                                    udict['accesskey'], udict['secretkey'])
+                for user, udict in users.items()}
+
+    async def _run_workers(self, items, func):
+        """Run func over items with at most concurrency operations in flight."""
+        queue = asyncio.Queue(maxsize=self.concurrency * 2)
+
+        async def worker():
+            while True:
+                item = await queue.get()
+                try:
+                    if item is None:
+                        break
+                    await func(item)
+                except Exception as fault:
+                    LOGGER.error('Async DI operation failed for %s: %s', item, fault)
+                finally:
+                    queue.task_done()
+        tasks = [asyncio.ensure_future(worker()) for _ in range(self.concurrency)]
+        for item in items:
+            await queue.put(item)
+        for _ in tasks:
+            await queue.put(None)
+        await asyncio.gather(*tasks)
+
+    async def _upload_one(self, item, clients, records):
+        """Generate and upload one object."""
+        user, bucket = item
+        seed = data_generator.DataGenerator.get_random_seed(lower=1)
+        size = random.sample(data_generator.SMALL_BLOCK_SIZES, 1)[0]
+        gen = data_generator.DataGenerator(c_ratio=2)
+        stream = gen.stream(size, seed=seed)
+        body = stream.read()
+        md5sum = stream.hexdigest('md5')
+        obj_name = gen.get_object_name()
+        start = time.perf_counter()
+        try:
+            await clients[user].put_object(bucket, obj_name, body, md5sum)
+        except Exception as fault:
+            self.errors['put'] += 1
+            LOGGER.info(f'{obj_name} in bucket {bucket} Upload caught exception: {fault}')
+            return
+        self.latencies['put'].append(time.perf_counter() - start)
+        records.append([user, bucket, obj_name, md5sum])
+        self.change_manager.add_file_to_bucket(
+            user, bucket, dict(name=obj_name, checksum=md5sum, seed=seed, size=size,
+                               mtime=time.time(), c_ratio=gen.compression_ratio))
+
+    async def _upload_all(self, users, files_count, stop_event, future_obj):
+        """Upload files_count objects to every bucket of every user."""
+        clients = self._clients(users)
+        records = list()
+
+        def items():
+            for user, udict in users.items():
+                for bucket in udict['buckets']:
+                    for _ in range(files_count):
+                        if stop_event is not None and stop_event.is_set():
+                            LOGGER.debug("Stop event has been set, remaining objects "
+                                         "will be skipped.")
+                            return
+                        yield user, bucket
+        if future_obj:
+            future_obj.value = True
+        start = time.perf_counter()
+        try:
+            await self._run_workers(items(), lambda item: self._upload_one(item, clients, records))
+        finally:
+            for client in clients.values():
+                client.pool.close()
+        self.elapsed['put'] = time.perf_counter() - start
+        return records
+
+    def start(self, users, buckets, files_count, prefs, stop_event, future_obj=None):
+        """Upload objects for all users, same signature as Uploader.start."""
+        LOGGER.info(f'Starting async uploads for users {users}')
+        save_users(users)
+        records = asyncio.run(self._upload_all(users, files_count, stop_event, future_obj))
+        self.change_manager.flush()
+        save_upload_records(records)
+        LOGGER.info(f'Async upload completed for users {users}: {self.get_stats("put")}')
+
+    async def _verify_one(self, item, clients, failed, failed_server):
+        """Download one object and compare its md5 with the recorded one."""
+        start = time.perf_counter()
+        try:
+            csum, _ = await clients[item['user']].get_object_checksum(
+                item['bucket'], item['objectpath'])
+        except Exception as fault:
+            self.errors['get'] += 1
+            LOGGER.error(f'Final object download failed for {item} with exception {fault}')
+            failed_server.append(item)
+            return
+        self.latencies['get'].append(time.perf_counter() - start)
+        if csum != item['objcsum']:
+            LOGGER.error(f"download object checksum {csum} does not matches provided "
+                         f"checksum {item['objcsum']} for file {item['objectpath']}")
+            failed.append(item)
+
+    async def _verify_all(self, users, entries, failed, failed_server):
+        """Verify all entries of uploadInfo.csv."""
+        clients = self._clients(users)
+        items = (dict(user=ent[0], bucket=ent[1], objectpath=ent[2], objcsum=ent[3])
+                 for ent in entries)
+        start = time.perf_counter()
+        try:
+            await self._run_workers(
+                items, lambda item: self._verify_one(item, clients, failed, failed_server))
+        finally:
+            for client in clients.values():
+                client.pool.close()
+        self.elapsed['get'] = time.perf_counter() - start
+
+    def verify_data_integrity(self, users):
+        """Download and compare checksum of uploaded objects, returns summary dict."""
+        uploaded, deleted, deleted_count = DataIntegrityValidator.read_upload_records(users)
+        if not uploaded:
+            return None
+        entries = [ent for ent in uploaded if (ent[0], ent[1], ent[2]) not in deleted]
+        failed, failed_server = list(), list()
+        asyncio.run(self._verify_all(users, entries, failed, failed_server))
+        DataIntegrityValidator.failed_files = failed
+        DataIntegrityValidator.failed_files_server_error = failed_server
+        summary = dict(uploaded_files=len(uploaded), deleted_files=deleted_count,
+                       failed_files=len(failed) + len(failed_server),
+                       checksum_verified=len(uploaded) - deleted_count)
+        LOGGER.info(f'Async verification summary {summary}: {self.get_stats("get")}')
+        return summary
+
+    def get_stats(self, operation):
+        """Return throughput and latency percentiles (ms) of an operation."""
+        lat = sorted(self.latencies[operation])
+        elapsed = self.elapsed.get(operation, 0)
+        if not lat:
+            return dict(ops=0, errors=self.errors[operation])
+
+        def pct(value):
+            return round(lat[min(len(lat) - 1, int(len(lat) * value))] * 1000, 3)
+        return dict(ops=len(lat), errors=self.errors[operation],
+                    ops_per_sec=round(len(lat) / elapsed, 2) if elapsed else None,
+                    p50=pct(0.50), p95=pct(0.95), p99=pct(0.99), max=pct(1))
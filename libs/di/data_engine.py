@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/python
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Block based, seed reproducible data engine for DI object data.
+
+Object data is a sequence of fixed size blocks. Every block starts with
+uncompressible bytes taken from an AES-CTR keystream and is padded with
+filler bytes, so the compression ratio holds for any part of the object.
+
+    block k = keystream[k * U, (k + 1) * U) + FILLER * (BLOCK_SIZE - U)
+    U = BLOCK_SIZE * (1 - compressibility / 100)
+
+The keystream nonce is derived from the seed and the counter from the keystream
+offset, so any byte range of an object can be regenerated from (seed, offset)
+without producing the bytes before it. Memory use is bounded by the chunk size
+passed to iter_range(), independent of the object size.
+Usage:
+    engine = DataEngine(c_ratio=2)
+    data = engine.get_range(seed=10, offset=4096, nbytes=8192)
+    for chunk in engine.iter_range(seed=10, offset=0, nbytes=1024 ** 3):
+        md5.update(chunk)
+"""
+import struct
+from Crypto.Cipher import AES
+
+KB = 1024
+MB = KB * KB
+BLOCK_SIZE = 64 * KB
+CHUNK_SIZE = 8 * MB
+AES_BLOCK = 16
+FILLER_BYTE = b'i'
+DEF_SECRET = b'0123456789abcdef' * 2
+
+
+def get_compressibility(c_ratio: int) -> int:
+    """compressibility (in %) = 100 - (1.0/compression_ratio * 100)"""
+    return int(100 - (1.0 / c_ratio * 100)) if c_ratio >= 1 else 0
+
+
+class DataEngine:
+    """Generate byte ranges of seeded objects with a given compression ratio."""
+
+    def __init__(self,
+                 c_ratio: int = 1,
+                 block_size: int = BLOCK_SIZE,
+                 secret: bytes = DEF_SECRET) -> None:
+        self.c_ratio = c_ratio
+        self.block_size = block_size
+        self.secret = secret
+        self.compressibility = get_compressibility(c_ratio)
+        self.unc_size = max(1, int(block_size * (1.0 - self.compressibility / 100.0)))
+        self.filler = FILLER_BYTE * (block_size - self.unc_size)
+
+    def _keystream(self, seed, offset, nbytes):
+        """AES-CTR keystream bytes [offset, offset + nbytes) for seed."""
+        skip = offset % AES_BLOCK
+        cipher = AES.new(self.secret, AES.MODE_CTR,
+                         nonce=struct.pack('>Q', seed & 0xFFFFFFFFFFFFFFFF),
+                         initial_value=offset // AES_BLOCK)
+        return cipher.encrypt(bytes(skip + nbytes))[skip:]
+
+    def get_range(self, seed: int, offset: int, nbytes: int) -> bytes:
+        """Return object bytes [offset, offset + nbytes) for seed."""
+        if nbytes <= 0:
+            return b''
+        bsz, unc = self.block_size, self.unc_size
+        first, last = offset // bsz, (offset + nbytes - 1) // bsz
+        # Keystream used by all blocks in range is contiguous.
+        ks_start = first * unc + min(offset - first * bsz, unc)
+        ks_end = last * unc + min(offset + nbytes - last * bsz, unc)
+        kstream = memoryview(self._keystream(seed, ks_start, ks_end - ks_start))
+        out = bytearray(nbytes)
+        pos = 0
+        kpos = 0
+        for block in range(first, last + 1):
+            bstart = max(offset, block * bsz) - block * bsz
+            bend = min(offset + nbytes, (block + 1) * bsz) - block * bsz
+            if bstart < unc:
+                klen = min(bend, unc) - bstart
+                out[pos:pos + klen] = kstream[kpos:kpos + klen]
+                kpos += klen
+                pos += klen
+                bstart += klen
+            if bend > bstart:
+                flen = bend - bstart
+                out[pos:pos + flen] = self.filler[:flen]
+                pos += flen
+        return bytes(out)
+
+    def iter_range(self, seed: int, offset: int, nbytes: int, chunk_size: int = CHUNK_SIZE):
+        """Yield object bytes [offset, offset + nbytes) in chunks of chunk_size."""
+        end = offset + nbytes
+        while offset < end:
+            size = min(chunk_size, end - offset)
+            yield self.get_range(seed, offset, size)
+            offset += size
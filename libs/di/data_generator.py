@@ -18,11 +18,11 @@
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 #
 """Generate test data for S3 I/O with desired compression, duplication and formats.
-Size could be as small as 1 byte to 1 GB.
+Size could be as small as 1 byte to several GB, data is produced by DataEngine
+in fixed size blocks and is reproducible from the seed.
 """
 import os
 import logging
-import array
 import random
 import zlib
 import hashlib
@@ -34,16 +34,18 @@ from Crypto.Cipher import AES
 from pathlib import Path
 from commons import params
 from libs.di.file_formats import *
+from libs.di.data_stream import DataStream
+from libs.di.data_engine import DataEngine
 
 KB = 1024
 MB = KB * KB
-CMN_BUF = 'i' * MB
 DEF_COMPRESS_LEVEL = 4
 DEFAULT_DATA_TYPE = 1
 ZEROED_DATA_TYPE = 2
 U_LIMIT = 10 ** 6
 CMPR_RATIOS = (1, 2, 3, 4, 5, 6, 7, 8)
 SMALL_BLOCK_SIZES = [4 * KB, 8 * KB, 16 * KB, 32 * KB, 64 * KB, 128 * KB]
+OBJECT_EXTENSIONS = sorted(all_extensions)
 MEDIUM_BLOCK_SIZES = [4 * MB, 8 * MB, 16 * MB, 21 * MB, 32 * MB, 64 * MB, 128 * MB]
 
 LOGGER = logging.getLogger(__name__)
@@ -77,32 +79,33 @@ class DataGenerator:
         self.compressibility = int(100 - (1.0 / self.compression_ratio * 100))
         self.secret = '0123456789abcdef' * 2
         self.iv = '0123456789abcdef'
+        self.engine = DataEngine(c_ratio=c_ratio, secret=self.secret.encode('utf-8'))
 
     def generate(self,
                  size: int,
                  datatype: int = DEFAULT_DATA_TYPE,
                  seed: int = None) -> Union[Tuple[str, Any], Tuple[Union[int, bytes], Any]]:
 
-        """Assume size is less than 5GB.
+        """Generate size bytes for seed, a random seed is used if not given.
         Keeping de-dupe and compression ratio separate for avoiding complexity in buffer
         stream.
 
             compressibility (in %) = 100 - (1.0/compression_ratio * 100)
 
+        Returns the buffer and its sha1 checksum. Use stream() for objects which
+        should not be materialized in memory.
         """
         csum = hashlib.sha1()
         if size == 0:
-            buf = ''
+            buf = b''
             csum.update(buf)
             chksum = csum.hexdigest()
             return buf, chksum
 
         if datatype == DEFAULT_DATA_TYPE:
             # Ignoring de-dupe ratio for blobs.
-            if self.compression_ratio >= 1:
-                compressibility = int(100 - (1 / self.compression_ratio * 100))
-                buf = self.__get_data(size, compressibility, seed)
-        buf = buf.encode('utf-8')[:size]  # hack until better solution is found.
+            seed = seed if seed else self.get_random_seed(lower=1)
+            buf = self.engine.get_range(seed, 0, size)
         csum.update(buf)
         chksum = csum.hexdigest()
         return buf, chksum
@@ -112,28 +115,12 @@ class DataGenerator:
                         upper: int = U_LIMIT) -> int:
         return random.randint(lower, upper)
 
-    def __get_data(self, size, compressibility, seed=None):
-        buf = self.__get_uncompressible_buffer(compressibility, size, seed)
-        return str(buf) + self.__get_buf(size - len(buf))  # todo can be improved
-
-    def __get_buf(self, size):
-        if size <= 0:
-            return ''
-
-        if size > len(CMN_BUF):
-            return CMN_BUF + self.__get_buf(size - MB)
-        else:
-            return CMN_BUF[:size]
-
-    def __get_uncompressible_buffer(self, compressibility, size, seed=None):
-        if not seed:
-            unc_buf = os.urandom(size)
-            return unc_buf[0: int((size * (1.0 - compressibility / 100.0)))]
-        else:
-            buf = array.array('l', [seed] * size).tobytes()
-            buf = self.encrypt_buf(buf)
-            buf = buf[0: int((size * (1.0 - compressibility / 100.0)))]
-            return buf
+    def stream(self, size: int, seed: int = None) -> DataStream:
+        """Return a seekable file like object producing size bytes on demand.
+        Checksums are available from the stream once it has been read.
+        """
+        seed = seed if seed else self.get_random_seed(lower=1)
+        return DataStream(size, seed, self.engine)
 
     def encrypt_buf(self, buf):
         blksz = 16
@@ -156,13 +143,7 @@ class DataGenerator:
                          data_folder_prefix: str,
                          min_sz: int = 5,
                          max_sz: int = 10) -> str:
-        name = ''
-        ext = random.sample(all_extensions, 1)[0]
-        for i in range(random.randrange(min_sz, max_sz)):
-            name += random.choice(string.ascii_letters + string.digits + '_-')
-        if self.append_csum_file_name:
-            name += '_' + csum
-        name += '_' + 'cx' + ext
+        name = self.get_object_name(csum, min_sz, max_sz)
         if size < 1024:
             iosize = 1024
         elif (size >= 1024) & (size < 1024 * 1024):
@@ -179,6 +160,20 @@ class DataGenerator:
         name = os.path.join(params.DATAGEN_HOME, data_folder_prefix, name)
         return self.__save_data_to_file(fbuf, iosize, name, off, size)
 
+    def get_object_name(self,
+                        csum: str = None,
+                        min_sz: int = 5,
+                        max_sz: int = 10) -> str:
+        """Random object name, checksum is embedded when enabled and known."""
+        name = ''
+        ext = random.choice(OBJECT_EXTENSIONS)
+        for i in range(random.randrange(min_sz, max_sz)):
+            name += random.choice(string.ascii_letters + string.digits + '_-')
+        if self.append_csum_file_name and csum:
+            name += '_' + csum
+        name += '_' + 'cx' + ext
+        return name
+
     # pylint: disable=max-args, R0201
     def __save_data_to_file(self, fbuf, iosize, name, off, size):
         with open(name, 'wb', 512 * 1024) as fd:  # buffer size
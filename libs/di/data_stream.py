@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/python
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""File like, seekable in-memory data source for DI uploads.
+
+DataStream produces object data on demand from a DataEngine while boto3 reads
+it, so uploads do not need a temp file. The data is reproducible from
+(seed, size, c_ratio) and any offset can be read without producing the bytes
+before it. MD5 and SHA1 are updated while bytes are produced for the first
+time, re-reads after a seek are not hashed again.
+Usage:
+    stream = DataGenerator(c_ratio=2).stream(1024 * 1024, seed=10)
+    s3.meta.client.upload_fileobj(stream, bucket, key)
+    md5sum = stream.hexdigest('md5')
+"""
+import io
+import hashlib
+from libs.di.data_engine import DataEngine
+
+HASH_ALGOS = ('md5', 'sha1')
+
+
+class DataStream(io.RawIOBase):
+    """Seekable read only stream of generated object data."""
+
+    def __init__(self, size: int, seed: int, engine: DataEngine) -> None:
+        super().__init__()
+        self.size = size
+        self.seed = seed
+        self.engine = engine
+        self.pos = 0
+        self.hashers = {algo: hashlib.new(algo) for algo in HASH_ALGOS}
+        self.hashed = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.pos
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self.pos + offset
+        elif whence == io.SEEK_END:
+            pos = self.size + offset
+        else:
+            raise ValueError('invalid whence ({}, should be 0, 1 or 2)'.format(whence))
+        if pos < 0:
+            raise ValueError('negative seek position {}'.format(pos))
+        self.pos = pos
+        return self.pos
+
+    def readinto(self, buf):
+        view = memoryview(buf).cast('B')
+        nbytes = min(len(view), self.size - self.pos)
+        if nbytes <= 0:
+            return 0
+        chunk = self.engine.get_range(self.seed, self.pos, nbytes)
+        view[:nbytes] = chunk
+        if self.pos == self.hashed:
+            for hasher in self.hashers.values():
+                hasher.update(chunk)
+            self.hashed += nbytes
+        self.pos += nbytes
+        return nbytes
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = max(0, self.size - self.pos)
+        buf = bytearray(min(size, max(0, self.size - self.pos)))
+        nbytes = self.readinto(buf)
+        return bytes(buf[:nbytes])
+
+    def readall(self):
+        return self.read(-1)
+
+    def hexdigest(self, algo: str = 'md5') -> str:
+        """Return checksum of the whole stream, producing unread tail if required."""
+        if self.hashed < self.size:
+            for chunk in self.engine.iter_range(self.seed, self.hashed,
+                                                self.size - self.hashed):
+                for hasher in self.hashers.values():
+                    hasher.update(chunk)
+            self.hashed = self.size
+        return self.hashers[algo].hexdigest()
@@ -24,11 +24,9 @@ import datetime
 import time
 import sys
 import logging
-import hashlib
 import random
 from time import perf_counter_ns
 from hashlib import md5
-from pathlib import Path
 from fabric import Connection
 from fabric import Config
 from fabric import ThreadingGroup, SerialGroup
@@ -39,6 +37,7 @@ from commons.constants import POD_NAME_PREFIX, PROD_FAMILY_LC, PROD_TYPE_K8S
 from commons import params
 from commons.helpers.pods_helper import LogicalNode
 from commons.utils import assert_utils
+from commons.utils import checksum_utils
 from commons import constants as const
 from commons.helpers.node_helper import Node
 from config import cmn_cfg
@@ -148,27 +147,8 @@ def sigint_handler(signum, frame):
 
 
 def read_file(filepath, size=0, algo=CKSUM_ALGO_1):
-    """Find checksum of file as per algo."""
-    if not size:
-        sz = Path(filepath).stat().st_size
-
-    read_sz = 8192  # blk sz
-    c_sum = ''
-    if algo == CKSUM_ALGO_1:
-        file_hash = hashlib.md5()
-    elif algo == CKSUM_ALGO_2:
-        file_hash = hashlib.sha1()
-
-    with open(filepath, 'rb') as fp:
-        if sz < read_sz:
-            buf = fp.read(sz)
-        else:
-            buf = fp.read(read_sz)
-        while buf:
-            file_hash.update(buf)
-            buf = fp.read(read_sz)
-        c_sum = file_hash.hexdigest()
-    return c_sum.strip()  # not required. Recheck.
+    """Find checksum of file as per algo, size is not used."""
+    return checksum_utils.file_checksum(filepath, algo)
 
 
 def copy_local_to_s3_config(self, **kwargs) -> tuple:
@@ -24,6 +24,7 @@ import threading
 from multiprocessing import Value
 from commons import params
 from libs.di import uploader
+from libs.di import async_engine
 from libs.di.downloader import DataIntegrityValidator
 
 LOGGER = logging.getLogger(__name__)
@@ -60,14 +61,34 @@ class ASyncIO:
 
 class RunDataCheckManager(ASyncIO):
 
-    def __init__(self, users):
-        self.uploader = uploader.Uploader()
+    def __init__(self, users, engine=params.DI_ENGINE, verify=params.DI_VERIFY_MODE):
+        """
+        :param users: User dict with user and bucket information
+        :param engine: process for the process/thread pool Uploader or asyncio
+         for AsyncDIEngine which drives all users from a single event loop
+        :param verify: download to download objects and compare checksums or
+         seed to compare objects against data regenerated from the state store
+        """
+        self.engine = engine
+        self.verify = verify
+        if engine == 'asyncio':
+            self.uploader = async_engine.AsyncDIEngine()
+        else:
+            self.uploader = uploader.Uploader()
         self.users = users
         self.future_value = Value('b', False)
         self.future_thread_value = threading.Event()
         super(RunDataCheckManager, self).__init__(
             upload_cls=self.uploader, users=users)
 
+    def verify_data_integrity(self, users):
+        """Verify uploaded objects from seeds or by downloading them with the upload engine."""
+        if self.verify == 'seed':
+            return DataIntegrityValidator.verify_data_integrity_from_seed(users)
+        if self.engine == 'asyncio':
+            return self.uploader.verify_data_integrity(users)
+        return DataIntegrityValidator.verify_data_integrity(users)
+
     def __check_upload(self):
         """
         read upload file uploadInfo.csv
@@ -164,11 +185,11 @@ class RunDataCheckManager(ASyncIO):
         :param files_count: objects to be uploaded per buckets
         :param prefs: dir prefix where objects will be created for uploading
         :param di_check: checks for data integrity
-        :return: None
+        :return: tuple response of stop_io contains boolean and dict
         """
         prefs_dict = prefs if isinstance(prefs, dict) else {
             "prefix_dir": prefs}
         self.start_io(
             users=users, buckets=buckets, files_count=files_count,
             prefs=prefs_dict)
-        self.stop_io(users, di_check=di_check)
+        return self.stop_io(users, di_check=di_check)
@@ -23,43 +23,73 @@ Simulates parallel downloads.
 import os
 import logging
 import csv
-import queue
 import hashlib
-from pathlib import Path
+import threading
 from commons import params
 from commons import worker
-from commons.utils import system_utils
+from commons.exceptions import CortxTestException
 from libs.di import di_base
 from libs.di.di_mgmt_ops import ManagementOPs
 from libs.di import uploader
+from libs.di import state_store
+from libs.di.range_verifier import SeedVerifier
+from libs.di.range_verifier import DEF_C_RATIO
 
 LOGGER = logging.getLogger(__name__)
+_local = threading.local()
+
+
+def get_read_buffer(size):
+    """Return a per thread reusable buffer of at least size bytes."""
+    buf = getattr(_local, 'buf', None)
+    if buf is None or len(buf) < size:
+        buf = _local.buf = bytearray(size)
+    return memoryview(buf)[:size]
+
+
+def stream_checksum(body, read_size=params.DI_READ_SIZE, algo='md5'):
+    """Hash a streaming body with readinto() into a reusable buffer.
+    botocore StreamingBody has no readinto, the underlying urllib3 response is
+    read directly when available.
+    :return: tuple of hex digest and number of bytes read
+    """
+    raw = getattr(body, '_raw_stream', body)
+    hasher = hashlib.new(algo)
+    nbytes = 0
+    if hasattr(raw, 'readinto'):
+        view = get_read_buffer(read_size)
+        size = raw.readinto(view)
+        while size:
+            hasher.update(view[:size])
+            nbytes += size
+            size = raw.readinto(view)
+    else:
+        chunk = body.read(read_size)
+        while chunk:
+            hasher.update(chunk)
+            nbytes += len(chunk)
+            chunk = body.read(read_size)
+    return hasher.hexdigest(), nbytes
 
 
 class DataIntegrityValidator:
     s3_objects = dict()
     failed_files = list()
     failed_files_server_error = list()
+    seed_verifier = SeedVerifier()
 
     @staticmethod
     def download_and_compare_chksum(kwargs):
-        """ Download file with s3cmd "s3://bucket/ObjectPath" test_output_file
-            compare downloaded file's md5sum with prior stored
+        """ Stream object "s3://bucket/ObjectPath" with get_object and
+            compare md5sum of the received data with prior stored.
+            Nothing is written to disk, body is hashed while it is received.
         """
         try:
             user = kwargs.get('user')
             objectpath = kwargs.get('objectpath')
             bucket = kwargs.get('bucket')
             objcsum = kwargs.get('objcsum')
-            cwd = params.DOWNLOAD_HOME
-            basepath = os.path.join(cwd, user)
-            objpth = os.path.join(cwd, user, objectpath)
-            try:
-                if not os.path.exists(basepath):
-                    system_utils.mkdirs(basepath)
-            except (OSError, Exception) as fault:
-                LOGGER.error(f"Error {fault} while creating directory for user {user}")
-
+            read_size = kwargs.get('read_size', params.DI_READ_SIZE)
             try:
                 s3 = DataIntegrityValidator.s3_objects[user]
             except Exception as fault:
@@ -68,36 +98,18 @@ class DataIntegrityValidator:
                 LOGGER.error(f"Won't be able to download object {kwargs} without connection")
                 return
             try:
-                s3.meta.client.download_file(bucket, objectpath, objpth)
+                resp = s3.meta.client.get_object(Bucket=bucket, Key=objectpath)
+                csum, nbytes = stream_checksum(resp['Body'], read_size)
+                if nbytes != resp['ContentLength']:
+                    raise IOError(f'received {nbytes} of {resp["ContentLength"]} bytes')
                 LOGGER.info(f'downloaded object : {kwargs}')
             except Exception as e:
                 print(e)
                 LOGGER.error(f'Final object download failed for {kwargs} with exception {e}')
                 DataIntegrityValidator.failed_files_server_error.append(kwargs)
             else:
-                print("Downloaded file '{}' from '{}'".format(objectpath, bucket))
-                filepath = objpth
-                sz = Path(filepath).stat().st_size
-                read_sz = 8192
-                csum = None
-                with open(filepath, 'rb') as fp:
-                    file_hash = hashlib.md5()
-                    if sz < read_sz:
-                        buf = fp.read(sz)
-                    else:
-                        buf = fp.read(read_sz)
-                    while buf:
-                        file_hash.update(buf)
-                        buf = fp.read(read_sz)
-                    csum = file_hash.hexdigest()
-                    try:
-                        os.unlink(filepath)
-                    except (OSError, Exception) as fault:
-                        LOGGER.error('Fault %s occurred duing unlink. Trying rm command', fault)
-                        rmLocalObject = "rm -rf " + str(filepath)
-                        os.system(rmLocalObject)
-
-                if objcsum == csum.strip():
+                print("Downloaded object '{}' from '{}'".format(objectpath, bucket))
+                if objcsum == csum:
                     LOGGER.info(
                         "download object checksum {} matches provided checksum {} for file {}".format(csum, objcsum,
                                                                                                       objectpath))
@@ -107,78 +119,146 @@ class DataIntegrityValidator:
                                                                                                                objcsum,
                                                                                                                objectpath))
                     DataIntegrityValidator.failed_files.append(kwargs)
-                    if os.path.exists(filepath):
-                        os.remove(filepath)
         except Exception as fault:
             LOGGER.exception(fault)
             LOGGER.error(f'Exception occurred for item {kwargs} with exception {fault}')
 
+    @staticmethod
+    def verify_object_from_seed(kwargs):
+        """ Compare object data with data regenerated from the seed recorded at upload.
+            Full object is stream compared unless samples is set, in which case
+            random ranges of range_size are fetched with ranged GETs.
+        """
+        user = kwargs.get('user')
+        try:
+            s3 = DataIntegrityValidator.s3_objects[user]
+        except KeyError as fault:
+            LOGGER.error(f'No S3 Connection for user {user} in S3 sessions list {fault}')
+            DataIntegrityValidator.failed_files_server_error.append(kwargs)
+            return
+        verifier = DataIntegrityValidator.seed_verifier
+        fdict = kwargs['file']
+        c_ratio = fdict.get('c_ratio', DEF_C_RATIO)
+        if kwargs.get('samples'):
+            results = verifier.verify_sampled(s3.meta.client, kwargs['bucket'], fdict['name'],
+                                              fdict['seed'], fdict['sz'], kwargs['samples'],
+                                              kwargs['range_size'], c_ratio)
+        else:
+            results = [verifier.verify_object(s3.meta.client, kwargs['bucket'], fdict['name'],
+                                              fdict['seed'], fdict['sz'], c_ratio)]
+        for result in results:
+            if result['error']:
+                DataIntegrityValidator.failed_files_server_error.append(dict(kwargs, **result))
+                return
+            if not result['status']:
+                LOGGER.error(f"Object {fdict['name']} differs from expected data at offset "
+                             f"{result['mismatch_offset']}")
+                DataIntegrityValidator.failed_files.append(dict(kwargs, **result))
+                return
+        LOGGER.info(f"Verified object {fdict['name']} of bucket {kwargs['bucket']} from seed")
+
     @classmethod
-    def verify_data_integrity(cls, users):
+    def verify_data_integrity_from_seed(cls, users, samples=0, range_size=1024 * 1024):
         """
-        UploadInfo File format supported is
-        #user7,user7-8844buckets0,naPcn6qP47SkUPkxbP_PtJUVF1iv.json,7e2db9e2f7621db0ddfde4d294e92eca
-        Downloads the file and compare checksum.
-        :return:
+        Verify objects recorded in the object state store by regenerating the
+        expected data from their seeds, nothing is downloaded to disk.
+        :param users: Users dict with user and bucket data
+        :param samples: Ranged GETs per object, 0 to stream compare whole objects
+        :param range_size: Size of each sampled range
+        :return: summary dict
+        :raises CortxTestException: when the state store has no objects for users
         """
+        store = state_store.ObjectStateStore()
+        items = [dict(user=user, bucket=bkt_container['name'], file=fdict,
+                      samples=samples, range_size=range_size)
+                 for user in users
+                 for bkt_container in store.get_all_buckets_data_for_user(user) or list()
+                 for fdict in bkt_container['files']]
+        if not items:
+            LOGGER.error("No objects recorded in state store for users %s", list(users))
+            raise CortxTestException('No objects recorded in state store to verify')
         workers = worker.Workers()
         workers.start_workers()
         cls.s3_objects = di_base.init_s3_connections(users=users)
+        cls.failed_files = list()
+        cls.failed_files_server_error = list()
+        submitted = workers.submit_many(cls.verify_object_from_seed, items, batch_size=1)
+        workers.end_workers()
+        for item in cls.failed_files:
+            LOGGER.error(f'data mismatch for {item}')
+        for item in cls.failed_files_server_error:
+            LOGGER.error(f'Server Error for {item}')
+        failed = len(cls.failed_files) + len(cls.failed_files_server_error)
+        summary = dict(uploaded_files=submitted, deleted_files=0,
+                       failed_files=failed, checksum_verified=submitted - failed)
+        LOGGER.info("Seed verification summary %s", summary)
+        return summary
+
+    @staticmethod
+    def read_upload_records(users):
+        """
+        Read uploaded files of users and the deleted files csv.
+        :return: tuple of uploaded entries, dict of deleted entries keyed by
+         (user, bucket, object) and number of deleted entries
+        """
         deletedFiles = list()
-        uploadedFiles = list()
         deletedDict = dict()
-        summary = dict()
         with open(params.UPLOADED_FILES, newline='') as f:
             reader = csv.reader(f)
-            # uploadedFiles = list(reader)
             uploadedFiles = [el for el in list(reader) if el[0] in users.keys()]
 
         if len(uploadedFiles) == 0:
             print("uploaded data not found, exiting script")
             LOGGER.info("uploaded data not found, exiting script")
-            workers.end_workers()
-            return
+            return uploadedFiles, deletedDict, 0
 
         if os.path.exists(params.DELETE_OP_FILE_NAME):
             with open(params.DELETE_OP_FILE_NAME, newline='') as f:
                 reader = csv.reader(f)
                 deletedFiles = list(reader)
-        summary['deleted_files'] = len(deletedFiles)
 
         for f in deletedFiles:
             if len(f) == 4:
                 deletedDict[(f[0], f[1], f[2])] = f[3]
             else:
                 LOGGER.error("Skipped considering deleted file {}".format(f))
+        return uploadedFiles, deletedDict, len(deletedFiles)
 
-        for i in range(1, params.NUSERS + 1):
-            try:
-                if not os.path.exists(os.path.join(params.DOWNLOAD_HOME,
-                                                   ManagementOPs.user_prefix + str(i))):
-                    system_utils.mkdirs(os.path.join(params.DOWNLOAD_HOME,
-                                                     ManagementOPs.user_prefix + str(i)))
-            except (OSError, Exception) as exe:
-                LOGGER.error(f"Error {exe} while creating directory for user {i}")
-
-        for ix, ent in enumerate(uploadedFiles, 1):
-            if (ent[0], ent[1], ent[2]) in deletedDict:
-                continue
-            workQ = queue.Queue()
-            workQ.func = cls.download_and_compare_chksum
-            kwargs = dict()
-            kwargs['user'] = ent[0]
-            kwargs['objectpath'] = ent[2]
-            kwargs['bucket'] = ent[1]
-            kwargs['objcsum'] = ent[3]
-            kwargs['accesskey'] = users.get(ent[0])['accesskey']
-            kwargs['secret'] = users.get(ent[0])['secretkey']
-            workQ.put(kwargs)
-            workers.wenque(workQ)
-            LOGGER.info(f"Enqueued item {ix} for download and checksum compare")
-            # if workQ is not None:
-            #    workQ.join()
-            # workQ = None
-        LOGGER.info(f"processed items {ix} for data integrity check")
+    @classmethod
+    def verify_data_integrity(cls, users):
+        """
+        UploadInfo File format supported is
+        #user7,user7-8844buckets0,naPcn6qP47SkUPkxbP_PtJUVF1iv.json,7e2db9e2f7621db0ddfde4d294e92eca
+        Downloads the file and compare checksum.
+        :return:
+        """
+        workers = worker.Workers()
+        workers.start_workers()
+        cls.s3_objects = di_base.init_s3_connections(users=users)
+        summary = dict()
+        uploadedFiles, deletedDict, deleted_count = cls.read_upload_records(users)
+        if not uploadedFiles:
+            workers.end_workers()
+            return
+        summary['deleted_files'] = deleted_count
+
+        def work_items():
+            for ent in uploadedFiles:
+                if (ent[0], ent[1], ent[2]) in deletedDict:
+                    continue
+                kwargs = dict()
+                kwargs['user'] = ent[0]
+                kwargs['objectpath'] = ent[2]
+                kwargs['bucket'] = ent[1]
+                kwargs['objcsum'] = ent[3]
+                kwargs['accesskey'] = users.get(ent[0])['accesskey']
+                kwargs['secret'] = users.get(ent[0])['secretkey']
+                yield kwargs
+
+        queued = workers.submit_many(cls.download_and_compare_chksum, work_items(), batch_size=1)
+        ix = len(uploadedFiles)
+        LOGGER.info(f"Enqueued {queued} of {ix} items for data integrity check")
+        workers.drain()
 
         summary['failed_files'] = len(cls.failed_files) + len(cls.failed_files_server_error)
         summary['uploaded_files'] = ix
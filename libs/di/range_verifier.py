@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/python
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Verify downloaded object data against data regenerated from the seed.
+
+Objects uploaded through DataGenerator.stream() are fully described by
+(seed, size, c_ratio), which DataManager/ObjectStateStore record per object.
+Instead of comparing an MD5 of the whole downloaded file, the expected bytes of
+any range are regenerated with DataEngine and compared chunk by chunk while the
+GET body is read. Nothing is written to disk and the first mismatching offset
+is reported, so sampled ranged GETs can be used on multi-GB objects.
+"""
+import random
+import logging
+from libs.di.data_engine import DataEngine
+from libs.di.data_engine import MB
+
+LOGGER = logging.getLogger(__name__)
+
+VERIFY_CHUNK_SIZE = 4 * MB
+DEF_C_RATIO = 1
+
+
+def first_mismatch(expected, actual) -> int:
+    """Return index of first differing byte of two buffers or -1 when equal."""
+    if expected == actual:
+        return -1
+    for idx, (exp, act) in enumerate(zip(expected, actual)):
+        if exp != act:
+            return idx
+    return min(len(expected), len(actual))
+
+
+def read_exact(body, size):
+    """Read size bytes from body unless it ends before."""
+    data = body.read(size)
+    if len(data) in (0, size):
+        return data
+    parts = [data]
+    received = len(data)
+    while received < size:
+        data = body.read(size - received)
+        if not data:
+            break
+        parts.append(data)
+        received += len(data)
+    return b''.join(parts)
+
+
+class SeedVerifier:
+    """Compare S3 object data with data regenerated from its seed."""
+
+    def __init__(self, chunk_size: int = VERIFY_CHUNK_SIZE) -> None:
+        self.chunk_size = chunk_size
+        self.engines = dict()
+
+    def get_engine(self, c_ratio):
+        """Return cached DataEngine for compression ratio."""
+        if c_ratio not in self.engines:
+            self.engines[c_ratio] = DataEngine(c_ratio=c_ratio)
+        return self.engines[c_ratio]
+
+    def compare_stream(self, body, seed, offset, nbytes, c_ratio=DEF_C_RATIO):
+        """Compare nbytes read from body with object bytes starting at offset.
+
+        :param body: File like object with read(), e.g. botocore StreamingBody.
+        :return: Offset of first mismatching byte in the object or -1 on match.
+        """
+        engine = self.get_engine(c_ratio)
+        pos = offset
+        end = offset + nbytes
+        while pos < end:
+            size = min(self.chunk_size, end - pos)
+            actual = read_exact(body, size)
+            expected = engine.get_range(seed, pos, size)
+            idx = first_mismatch(expected, actual)
+            if idx != -1:
+                return pos + idx
+            pos += size
+        if body.read(1):
+            return end  # more data than expected
+        return -1
+
+    @staticmethod
+    def _result(bucket, key, offset, nbytes, mismatch, error=None):
+        """Verification result dict."""
+        return dict(bucket=bucket, key=key, offset=offset, nbytes=nbytes,
+                    status=mismatch == -1 and error is None,
+                    mismatch_offset=mismatch, error=error)
+
+    def verify_range(self, s3_client, bucket, key, seed, offset, nbytes, c_ratio=DEF_C_RATIO):
+        """Ranged GET of [offset, offset + nbytes) and compare with regenerated data."""
+        try:
+            resp = s3_client.get_object(Bucket=bucket, Key=key,
+                                        Range='bytes={}-{}'.format(offset, offset + nbytes - 1))
+            mismatch = self.compare_stream(resp['Body'], seed, offset, nbytes, c_ratio)
+        except Exception as fault:
+            LOGGER.error('Ranged GET of %s/%s [%s, +%s) failed: %s', bucket, key,
+                         offset, nbytes, fault)
+            return self._result(bucket, key, offset, nbytes, -1, str(fault))
+        if mismatch != -1:
+            LOGGER.error('Data mismatch for %s/%s at offset %s', bucket, key, mismatch)
+        return self._result(bucket, key, offset, nbytes, mismatch)
+
+    def verify_object(self, s3_client, bucket, key, seed, size, c_ratio=DEF_C_RATIO):
+        """Full GET of object and chunk by chunk compare with regenerated data."""
+        try:
+            resp = s3_client.get_object(Bucket=bucket, Key=key)
+            mismatch = self.compare_stream(resp['Body'], seed, 0, size, c_ratio)
+        except Exception as fault:
+            LOGGER.error('GET of %s/%s failed: %s', bucket, key, fault)
+            return self._result(bucket, key, 0, size, -1, str(fault))
+        if mismatch != -1:
+            LOGGER.error('Data mismatch for %s/%s at offset %s', bucket, key, mismatch)
+        return self._result(bucket, key, 0, size, mismatch)
+
+    def verify_sampled(self, s3_client, bucket, key, seed, size, samples, range_size,
+                       c_ratio=DEF_C_RATIO):
+        """Verify random ranges of an object, stops at the first failed range.
+
+        :return: List of verification results of the checked ranges.
+        """
+        results = list()
+        for offset, nbytes in self.sample_ranges(size, samples, range_size):
+            result = self.verify_range(s3_client, bucket, key, seed, offset, nbytes, c_ratio)
+            results.append(result)
+            if not result['status']:
+                break
+        return results
+
+    @staticmethod
+    def sample_ranges(size, samples, range_size):
+        """Return sorted (offset, nbytes) ranges, first and last range always included."""
+        if size <= 0:
+            return list()
+        range_size = min(range_size, size)
+        last = size - range_size
+        offsets = {0, last}
+        while len(offsets) < min(samples, last + 1):
+            offsets.add(random.randint(0, last))
+        return [(offset, range_size) for offset in sorted(offsets)]
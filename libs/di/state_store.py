@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/python
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Append-only object state store for the DI framework.
+
+DataManager rewrites the complete <user>_user_metadata json for every uploaded
+object. ObjectStateStore keeps the same client side state as an append-only
+log of json records per user and an in-memory index keyed by
+(user, bucket, object), so recording an upload costs a single buffered append.
+
+ Log record format (one json document per line)
+ {"bucket": "test-1", "file": {"name": "a.txt", "checksum": "abcd", "sz": 1024,
+                              "seed": 1, "mtime": 1, "c_ratio": 2}}
+
+The log is compacted (rewritten with only the live entries) once the number of
+superseded records crosses the compaction threshold. Readers in other processes
+tail the log from the last offset they have seen and reload it if the log was
+compacted underneath them.
+"""
+import os
+import json
+import logging
+import threading
+from commons import params
+from commons.utils import system_utils
+from libs.di.data_man import DataManager
+from libs.di.data_man import C_LEVEL_BUCKET
+
+LOGGER = logging.getLogger(__name__)
+
+
+class _UserLog:
+    """Index and log bookkeeping for a single user."""
+
+    def __init__(self, fpath):
+        self.fpath = fpath
+        self.buckets = dict()  # bucket -> {object name -> file dict}
+        self.pending = list()  # serialized records not yet written
+        self.offset = 0  # bytes of the log already replayed
+        self.inode = None
+        self.records = 0  # records present in the log file
+
+
+class ObjectStateStore(DataManager):
+    """Append-only log plus in-memory index with the DataManager query API."""
+
+    def __init__(self,
+                 home: str = None,
+                 flush_every: int = params.META_LOG_FLUSH_RECORDS,
+                 compact_threshold: int = params.META_LOG_COMPACT_RECORDS) -> None:
+        """
+        :param home: Directory holding per user logs, default is META_DATA_HOME.
+        :param flush_every: Number of buffered records which triggers an append.
+        :param compact_threshold: Superseded records after which log is compacted.
+        """
+        super().__init__()
+        self.home = home if home else params.META_DATA_HOME
+        self.flush_every = max(1, flush_every)
+        self.compact_threshold = compact_threshold
+        self.users = dict()
+        self.bucket_owner = dict()
+        self.lock = threading.RLock()
+
+    def _log_path(self, user):
+        """Return log path for user."""
+        return os.path.join(self.home, user + params.USER_META_LOG)
+
+    def _get_user_log(self, user):
+        """Return user log bookkeeping, replaying any new records from disk."""
+        ulog = self.users.get(user)
+        if ulog is None:
+            if not os.path.exists(self.home):
+                try:
+                    system_utils.mkdirs(self.home)
+                except (OSError, Exception) as fault:
+                    LOGGER.exception(str(fault), exc_info=fault.__traceback__)
+                    raise
+            ulog = _UserLog(self._log_path(user))
+            self.users[user] = ulog
+        self._replay(user, ulog)
+        return ulog
+
+    def _replay(self, user, ulog):
+        """Apply records appended to the log since last replay."""
+        try:
+            stat_info = os.stat(ulog.fpath)
+        except FileNotFoundError:
+            return
+        if ulog.inode is not None and ulog.inode != stat_info.st_ino:
+            # Log compacted by another process, rebuild index from scratch.
+            ulog.buckets.clear()
+            ulog.offset = 0
+            ulog.records = 0
+        ulog.inode = stat_info.st_ino
+        if stat_info.st_size <= ulog.offset:
+            return
+        with open(ulog.fpath, 'rb') as fp:
+            fp.seek(ulog.offset)
+            for line in fp:
+                if not line.endswith(b'\n'):
+                    break  # partially written record, pick it up next time
+                ulog.offset += len(line)
+                try:
+                    record = json.loads(line)
+                except ValueError as fault:
+                    LOGGER.error('Skipped corrupt record in %s: %s', ulog.fpath, fault)
+                    continue
+                self._apply(user, ulog, record['bucket'], record['file'])
+                ulog.records += 1
+
+    def _apply(self, user, ulog, bucket, fdict):
+        """Update in-memory index with a file entry."""
+        ulog.buckets.setdefault(bucket, dict())[fdict['name']] = fdict
+        self.bucket_owner[bucket] = user
+
+    def _flush_user(self, ulog):
+        """Append buffered records of a user to its log."""
+        if not ulog.pending:
+            return
+        with open(ulog.fpath, 'a') as fp:
+            fp.write(''.join(ulog.pending))
+        if ulog.inode is None:
+            ulog.inode = os.stat(ulog.fpath).st_ino
+        ulog.offset = os.stat(ulog.fpath).st_size
+        ulog.records += len(ulog.pending)
+        ulog.pending = list()
+        if ulog.records - self._live_entries(ulog) >= self.compact_threshold:
+            self._compact(ulog)
+
+    @staticmethod
+    def _live_entries(ulog):
+        """Number of objects currently indexed for a user."""
+        return sum(len(files) for files in ulog.buckets.values())
+
+    def _compact(self, ulog):
+        """Rewrite the log with one record per live object."""
+        tmp_path = ulog.fpath + '.compact'
+        with open(tmp_path, 'w') as fp:
+            for bucket, files in ulog.buckets.items():
+                for fdict in files.values():
+                    fp.write(json.dumps(dict(bucket=bucket, file=fdict)) + '\n')
+        os.replace(tmp_path, ulog.fpath)
+        stat_info = os.stat(ulog.fpath)
+        ulog.inode = stat_info.st_ino
+        ulog.offset = stat_info.st_size
+        ulog.records = self._live_entries(ulog)
+        LOGGER.debug('Compacted %s to %s records', ulog.fpath, ulog.records)
+
+    def add_file_to_bucket(self, user, bucket, file_dict):
+        """Record an uploaded object, the log append is buffered."""
+        if bucket is None:
+            return
+        fdict = dict(name=file_dict['name'], checksum=file_dict['checksum'],
+                     sz=file_dict['size'], seed=file_dict['seed'],
+                     mtime=file_dict['mtime'])
+        if 'c_ratio' in file_dict:
+            fdict['c_ratio'] = file_dict['c_ratio']
+        with self.lock:
+            ulog = self._get_user_log(user)
+            self._apply(user, ulog, bucket, fdict)
+            ulog.pending.append(json.dumps(dict(bucket=bucket, file=fdict)) + '\n')
+            if len(ulog.pending) >= self.flush_every:
+                self._flush_user(ulog)
+
+    def flush(self, user=None):
+        """Persist buffered records for a user or for all users."""
+        with self.lock:
+            users = [user] if user else list(self.users)
+            for name in users:
+                if name in self.users:
+                    self._flush_user(self.users[name])
+
+    def compact(self, user=None):
+        """Compact logs for a user or for all users."""
+        with self.lock:
+            users = [user] if user else list(self.users)
+            for name in users:
+                ulog = self._get_user_log(name)
+                self._flush_user(ulog)
+                if os.path.exists(ulog.fpath):
+                    self._compact(ulog)
+
+    def get_all_buckets_data_for_user(self, user):
+        """Return bucket containers for user in the DataManager json layout."""
+        if user is None:
+            raise ValueError('user is mandatory')
+        with self.lock:
+            ulog = self._get_user_log(user)
+            self._flush_user(ulog)
+            if not ulog.buckets:
+                return None
+            buckets = list()
+            for bucket, files in ulog.buckets.items():
+                container = self.get_container(level=C_LEVEL_BUCKET)
+                container['name'] = bucket
+                container['files'] = list(files.values())
+                buckets.append(container)
+            return buckets
+
+    def get_file_within_bucket(self, name, bkt_container, bucket):
+        """Find file within a bucket using the index and return None if not."""
+        if bucket is None or not bkt_container:
+            return None
+        with self.lock:
+            user = self.bucket_owner.get(bucket)
+            if user is not None:
+                return self.users[user].buckets.get(bucket, dict()).get(name)
+        return super().get_file_within_bucket(name, bkt_container, bucket)
+
+    def get_object(self, user, bucket, name):
+        """Return stored entry for (user, bucket, object) or None."""
+        with self.lock:
+            ulog = self._get_user_log(user)
+            return ulog.buckets.get(bucket, dict()).get(name)
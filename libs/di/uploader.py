@@ -22,11 +22,9 @@
 
 import os
 import sys
-import queue
 import random
 import logging
 import csv
-import hashlib
 import time
 import multiprocessing as mp
 from multiprocessing import Manager, Event
@@ -35,7 +33,7 @@ from commons.utils import config_utils
 from commons.worker import Workers
 from commons import params
 from libs.di import di_base
-from libs.di import data_man
+from libs.di import state_store
 from libs.di import data_generator
 from commons.params import USER_JSON
 
@@ -49,6 +47,24 @@ uploadObjects = []
 LOGGER = logging.getLogger(__name__)
 
 
+def save_upload_records(rows):
+    """Append [user, bucket, object, md5] rows to the uploaded files csv."""
+    if len(rows) > 0:
+        with open(params.UPLOADED_FILES, 'a', newline='') as fp:
+            wr = csv.writer(
+                fp, quoting=csv.QUOTE_NONE, delimiter=',', quotechar='',
+                escapechar='\\')
+            fcntl.flock(fp, fcntl.LOCK_EX)
+            wr.writerows(rows)
+            fcntl.flock(fp, fcntl.LOCK_UN)
+
+
+def save_users(users):
+    """Write users with their keys and buckets to USER_JSON in the log dir."""
+    users_path = os.path.join(params.LOG_DIR, USER_JSON)
+    config_utils.create_content_json(users_path, users, ensure_ascii=False)  # need test name prefix
+
+
 class Uploader:
     """Simulates Uploads client upto 10k."""
     tsfrConfig = TransferConfig(multipart_threshold=1024 * 1024 * 16,
@@ -57,7 +73,7 @@ class Uploader:
                                 use_threads=True)
 
     def __init__(self):
-        self.change_manager = data_man.DataManager()
+        self.change_manager = state_store.ObjectStateStore()
 
     def upload(self, user, keys, buckets, files_count, prefs, stop_event, future_obj):
         user_name = user.replace('_', '-')
@@ -68,44 +84,33 @@ class Uploader:
         pool_len = len(s3connections)
 
         workers = Workers()
-        workers.start_workers(func=self._upload)
+        workers.start_workers()
         if future_obj:
             future_obj.value = True
-        for bucket in buckets:
-            for ix in range(files_count):
-                if not stop_event.is_set():
-                    workQ = queue.Queue()
-                    workQ.func = self._upload
-                    kwargs = dict()
-                    kwargs['user'] = user
-                    kwargs['bucket'] = bucket
-                    kwargs['s3connections'] = s3connections
-                    kwargs['pool_len'] = pool_len
-                    kwargs['file_number'] = ix
-                    kwargs['prefs'] = prefs
-                    workQ.put(kwargs)
-                    workers.wenque(workQ)
-                else:
-                    LOGGER.debug(
-                        "Stop event has been set, remaining objects will be "
-                        "skipped.")
-                    print("Stop event has been set, remaining objects will be"
-                          " skipped.")
-                    break
+
+        def work_items():
+            for bucket in buckets:
+                for ix in range(files_count):
+                    if stop_event.is_set():
+                        LOGGER.debug(
+                            "Stop event has been set, remaining objects will be "
+                            "skipped.")
+                        print("Stop event has been set, remaining objects will be"
+                              " skipped.")
+                        return
+                    yield dict(user=user, bucket=bucket, s3connections=s3connections,
+                               pool_len=pool_len, file_number=ix, prefs=prefs)
                 LOGGER.info(
-                    f"Enqueued item {ix} for download and checksum compare")
-            LOGGER.info(
-                f"processed items {ix} to upload for user {user}")
+                    f"processed items {files_count} to upload for user {user} bucket {bucket}")
+        # Uploads are long running, one item per batch keeps all threads busy.
+        workers.submit_many(self._upload, work_items(), batch_size=1)
         workers.end_workers()
         LOGGER.info('Upload Workers shutdown completed successfully')
-        if len(uploadObjects) > 0:
-            with open(params.UPLOADED_FILES, 'a', newline='') as fp:
-                wr = csv.writer(
-                    fp, quoting=csv.QUOTE_NONE, delimiter=',', quotechar='',
-                    escapechar='\\')
-                fcntl.flock(fp, fcntl.LOCK_EX)
-                wr.writerows(uploadObjects)
-                fcntl.flock(fp, fcntl.LOCK_UN)
+        failed = workers.stats()['failed']
+        if failed:
+            LOGGER.error(f'{failed} upload tasks failed for user {user}')
+        self.change_manager.flush(user)
+        save_upload_records(uploadObjects)
         LOGGER.info(f'Upload completed for user {user}')
 
     def _upload(self, kwargs):
@@ -115,46 +120,38 @@ class Uploader:
         pool_len = kwargs['pool_len']
         user_name = kwargs['user']
         prefs = kwargs['prefs']
-        prefix = prefs.get('prefix_dir', 'test-1')  # todo revisit
-
         # todo get random compression ratio and process prefs
         # get random size
-        seed = data_generator.DataGenerator.get_random_seed()
+        seed = data_generator.DataGenerator.get_random_seed(lower=1)
         size = random.sample(data_generator.SMALL_BLOCK_SIZES, 1)[0]
         gen = data_generator.DataGenerator(c_ratio=2)
-        buf, csum = gen.generate(size, seed=seed)
-        file_path = gen.save_buf_to_file(buf, csum, 1024 * 1024, prefix)
+        stream = gen.stream(size, seed=seed)
+        obj_name = gen.get_object_name()
         s3 = s3connections[random.randint(0, pool_len - 1)]
         try:
-            s3.meta.client.upload_file(str(file_path),
-                                       bucket,
-                                       os.path.basename(file_path),
-                                       Config=Uploader.tsfrConfig)
-            print(f'uploaded file {file_path} for user {user_name}')
+            s3.meta.client.upload_fileobj(stream,
+                                          bucket,
+                                          obj_name,
+                                          Config=Uploader.tsfrConfig)
+            print(f'uploaded object {obj_name} for user {user_name}')
         except Exception as e:
             LOGGER.info(
-                f'{file_path} in bucket {bucket} Upload caught exception: {e}')
+                f'{obj_name} in bucket {bucket} Upload caught exception: {e}')
         else:
-            LOGGER.info(f'{file_path} in bucket {bucket} Upload Done')
-            with open(file_path, 'rb') as fp:
-                md5sum = hashlib.md5(fp.read()).hexdigest()
-            obj_name = os.path.basename(file_path)
-            stat_info = os.stat(file_path)
+            LOGGER.info(f'{obj_name} in bucket {bucket} Upload Done')
+            md5sum = stream.hexdigest('md5')
             row_data = [user_name, bucket, obj_name, md5sum]
             uploadObjects.append(row_data)
             file_object = dict(name=obj_name, checksum=md5sum, seed=seed,
-                               size=size, mtime=stat_info.st_mtime)
+                               size=size, mtime=time.time(),
+                               c_ratio=gen.compression_ratio)
             self.change_manager.add_file_to_bucket(
                 user_name, bucket, file_object)
-            if os.path.exists(file_path):
-                os.remove(file_path)
 
     def start(self, users, buckets, files_count, prefs, stop_event, future_obj=None):
         LOGGER.info(f'Starting uploads for users {users}')
         # check if users comply to specific schema
-        users_home = params.LOG_DIR
-        users_path = os.path.join(users_home, USER_JSON)
-        config_utils.create_content_json(users_path, users, ensure_ascii=False)  # need test name prefix
+        save_users(users)
         jobs = []
         for user, udict in users.items():
             keys = [udict['accesskey'], udict['secretkey']]
@@ -35,9 +35,11 @@ from commons import constants as common_const
 from commons import pswdmanager
 from commons.constants import Rest as Const
 from commons.exceptions import CTException
+from commons.helpers.cluster_executor import ClusterExecutor
 from commons.helpers.pods_helper import LogicalNode
+from commons.utils import checksum_utils
 from commons.utils import system_utils
-from commons.utils.system_utils import run_local_cmd
+from commons.utils import wait_utils
 from config import CMN_CFG, HA_CFG
 from config.s3 import S3_CFG
 from libs.csm.rest.csm_rest_system_health import SystemHealth
@@ -752,11 +754,15 @@ class HAK8s:
                 return False, "K8S cluster status has Failures"
         if pod_list is None:
             pod_list = pod_obj.get_all_pods(pod_prefix=common_const.POD_NAME_PREFIX)
-        for pod_name in pod_list:
-            res = pod_obj.send_k8s_cmd(
+        result = ClusterExecutor(pod_list).run(
+            lambda pod_name: pod_obj.send_k8s_cmd(
                 operation="exec", pod=pod_name, namespace=common_const.NAMESPACE,
                 command_suffix=f"-c {common_const.HAX_CONTAINER_NAME} -- "
-                               f"{common_cmd.MOTR_STATUS_CMD}", decode=True)
+                               f"{common_cmd.MOTR_STATUS_CMD}", decode=True))
+        for pod_name, pod_res in result.items():
+            if not pod_res.status:
+                return False, pod_res.error
+            res = pod_res.output
             for line in res.split("\n"):
                 if "failed" in line or "offline" in line or "unknown" in line:
                     LOGGER.error("Response for data pod %s's hctl status: %s", pod_name, res)
@@ -771,12 +777,8 @@ class HAK8s:
         :param compare: Flag to compare checksums of files
         :return: List of md5 content or bool for md5 comparison
         """
-        md5_list = []
-        for file in file_list:
-            cmd = common_cmd.MD5SUM.format("-t", file)
-            resp = run_local_cmd(cmd=cmd)
-            md5 = (resp[1].split())[0]
-            md5_list.append(md5.replace("b'", ""))
+        digests = checksum_utils.files_digests(file_list)
+        md5_list = [digests[file]["md5"] for file in file_list]
 
         if not compare:
             return md5_list
@@ -791,16 +793,15 @@ class HAK8s:
         :return: bool, response
         """
         LOGGER.info("Polling cluster status")
-        start_time = int(time.time())
-        while timeout > int(time.time()) - start_time:
-            time.sleep(60)
-            resp = self.check_cluster_status(pod_obj)
-            if resp[0]:
-                LOGGER.info("Cortx cluster is up")
-                break
-
-        LOGGER.debug("Time taken by cluster restart is %s seconds", int(time.time()) - start_time)
-        return resp
+        result = wait_utils.wait_until(
+            self.check_cluster_status, pod_obj, condition=lambda resp: resp[0],
+            timeout=timeout, name="cluster status",
+            backoff=wait_utils.Backoff(initial=HA_CFG["common_params"]["10sec_delay"],
+                                       maximum=60))
+        if result:
+            LOGGER.info("Cortx cluster is up")
+        LOGGER.debug("Time taken by cluster restart is %s seconds", int(result.elapsed))
+        return result.value if result.value is not None else (False, result.error)
 
     @staticmethod
     def restore_pod(pod_obj, restore_method, restore_params: dict = None):
@@ -36,6 +36,7 @@ import yaml
 from commons import commands as common_cmd
 from commons import constants as common_const
 from commons import pswdmanager
+from commons.helpers.cluster_executor import ClusterExecutor
 from commons.helpers.pods_helper import LogicalNode
 from commons.params import TEST_DATA_FOLDER
 from commons.utils import system_utils, assert_utils, ext_lbconfig_utils
@@ -299,12 +300,29 @@ class ProvDeployK8sCortxLib:
         return : Boolean
         """
         LOGGER.info("Pull Cortx image on all worker nodes.")
-        for obj in worker_obj_list:
-            obj.execute_cmd(common_cmd.CMD_DOCKER_PULL.format(self.cortx_image))
-            if self.cortx_server_image:
-                obj.execute_cmd(common_cmd.CMD_DOCKER_PULL.format(self.cortx_server_image))
+        executor = ClusterExecutor(worker_obj_list)
+        executor.run_cmd(common_cmd.CMD_DOCKER_PULL.format(self.cortx_image)).raise_on_failure(
+            "Image pull failed")
+        if self.cortx_server_image:
+            executor.run_cmd(common_cmd.CMD_DOCKER_PULL.format(
+                self.cortx_server_image)).raise_on_failure("Image pull failed")
         return True
 
+    def prepare_worker_node(self, node: LogicalNode, sol_file_path: str,
+                            system_disk: str, git_tag):
+        """
+        Run VM, git and cortx prerequisites on a worker node.
+        param: node: Worker node object
+        param: sol_file_path: Local Solution file path
+        param: system_disk: disk used to mount /mnt/fs-local-volume on worker node
+        param: git tag: tag of service repo
+        """
+        resp = self.prereq_vm(node)
+        assert_utils.assert_true(resp[0], resp[1])
+        self.prereq_git(node, git_tag)
+        self.copy_sol_file(node, sol_file_path, self.deploy_cfg["k8s_dir"])
+        self.execute_prereq_cortx(node, self.deploy_cfg["k8s_dir"], system_disk)
+
     def deploy_cortx_cluster(self, sol_file_path: str, master_node_list: list,
                              worker_node_list: list, system_disk_dict: dict,
                              git_tag) -> tuple:
@@ -323,14 +341,11 @@ class ProvDeployK8sCortxLib:
         if len(worker_node_list) == 0:
             return False, "Minimum one worker node needed for deployment"
 
-        for node in worker_node_list:
-            resp = self.prereq_vm(node)
-            assert_utils.assert_true(resp[0], resp[1])
-            system_disk = system_disk_dict[node.hostname]
-            self.prereq_git(node, git_tag)
-            self.copy_sol_file(node, sol_file_path, self.deploy_cfg["k8s_dir"])
-            # system disk will be used mount /mnt/fs-local-volume on worker node
-            self.execute_prereq_cortx(node, self.deploy_cfg["k8s_dir"], system_disk)
+        result = ClusterExecutor(worker_node_list).run(
+            lambda node: self.prepare_worker_node(node, sol_file_path,
+                                                  system_disk_dict[node.hostname], git_tag))
+        LOGGER.info("Worker prerequisites done, slowest node %s", result.slowest())
+        result.raise_on_failure("Worker prerequisites failed")
 
         self.pull_cortx_image(worker_node_list)
 
@@ -793,11 +808,14 @@ class ProvDeployK8sCortxLib:
             resp = master_node_obj.execute_cmd(cmd=destroy_cmd, recv_ready=True,
                                                timeout=self.deploy_cfg['timeout']['destroy'])
             LOGGER.debug("resp : %s", resp)
-            for worker in worker_node_obj:
-                resp = worker.execute_cmd(cmd=list_etc_3rd_party, read_lines=True)
-                LOGGER.debug("resp : %s", resp)
-                resp = worker.execute_cmd(cmd=list_data_3rd_party, read_lines=True)
-                LOGGER.debug("resp : %s", resp)
+            executor = ClusterExecutor(worker_node_obj)
+            for cmd in (list_etc_3rd_party, list_data_3rd_party):
+                result = executor.run_cmd(cmd, read_lines=True)
+                result.raise_on_failure(cmd)
+                LOGGER.debug("resp : %s", result.outputs())
+                if result:
+                    # listing of the last worker, as returned before the listing was concurrent
+                    resp = list(result.values())[-1].output
             return True, resp
         # pylint: disable=broad-except
         except BaseException as error:
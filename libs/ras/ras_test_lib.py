@@ -33,6 +33,7 @@ from commons.helpers.node_helper import Node
 from libs.ras.ras_core_lib import RASCoreLib
 from commons.utils.config_utils import get_config, update_cfg_based_on_separator
 from commons.utils import system_utils as sys_utils
+from commons.utils import wait_utils
 from commons import constants as cmn_cons
 from commons import commands as common_commands
 from commons import errorcodes as err
@@ -943,13 +944,11 @@ class RASTestLib(RASCoreLib):
         """
         common_cfg = RAS_VAL["ras_sspl_alert"]
 
-        LOGGER.info("Fetching sspl log file")
-        time.sleep(common_cfg["sleep_val"])
-        LOGGER.debug("Reading the sspl log file")
-        read_resp = self.node_utils.read_file(filepath, "/tmp/local_sspl.log")
-        LOGGER.debug(read_resp)
-        LOGGER.info("Checking expected strings are in sspl log file")
-        resp = self.validate_alert_log(filepath, exp_string)
+        LOGGER.info("Waiting for %s in sspl log file", exp_string)
+        result = wait_utils.wait_until(self.validate_alert_log, filepath, exp_string,
+                                       condition=lambda resp: resp[0],
+                                       timeout=common_cfg["sleep_val"], name="sspl log alert")
+        resp = result.value or (False, result.error)
         LOGGER.debug("%s : %s", resp[1], exp_string)
         LOGGER.info("Fetched sspl disk space alert")
         LOGGER.info("Removing sspl log file from the Node")
@@ -1031,19 +1030,20 @@ class RASTestLib(RASCoreLib):
             common_cfg["file"],
             common_cfg["sspl_config"],
             common_cfg["disk_usage_val"])
-        time.sleep(common_cfg["max_wait_time"])
+        wait_utils.pause(common_cfg["max_wait_time"] + 10, "sspl disk usage alert")
         file_name = file_path.split("/")[-1]
         local_file_path = os.path.join(os.getcwd(),
                                        file_name)
-        time.sleep(10)
         self.health_obj.restart_pcs_resource(common_cfg["sspl_resource_id"])
-        LOGGER.info("Sleeping for 120 seconds after restarting sspl services")
-        time.sleep(common_cfg["sleep_val"])
-        self.node_utils.copy_file_to_local(file_path, local_file_path)
-        LOGGER.info("Downloaded remote file %s", local_file_path)
-        if not os.path.exists(local_file_path):
+        LOGGER.info("Waiting up to %s seconds for the log after restarting sspl services",
+                    common_cfg["sleep_val"])
+        logged = wait_utils.wait_for(
+            lambda: self._log_has_patterns(file_path, local_file_path, pattern_lst),
+            timeout=common_cfg["sleep_val"], name="sspl log levels")
+        if not logged and not os.path.exists(local_file_path):
             resp_lst.append(False)
             return resp_lst
+        LOGGER.info("Downloaded remote file %s", local_file_path)
         # Read the remote file contents
         with open(local_file_path, "r") as f_pointer:
             for line in f_pointer:
@@ -1058,6 +1058,16 @@ class RASTestLib(RASCoreLib):
 
         return resp_lst
 
+    def _log_has_patterns(self, file_path: str, local_file_path: str,
+                          pattern_lst: list) -> bool:
+        """Download file_path, True if it has lines and every line has a pattern."""
+        self.node_utils.copy_file_to_local(file_path, local_file_path)
+        if not os.path.exists(local_file_path):
+            return False
+        with open(local_file_path, "r") as f_pointer:
+            lines = f_pointer.readlines()
+        return bool(lines) and all(any(x in line for x in pattern_lst) for line in lines)
+
     def sspl_log_collect(self) -> Tuple[bool, str]:
         """
         Function starts the collection of SSPl logs.
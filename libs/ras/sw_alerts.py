@@ -39,6 +39,12 @@ class SoftwareAlert(RASCoreLib):
         super().__init__(host, username, password)
         self.svc_path = None
 
+    def _start_cmd(self, cmd: str):
+        """Start cmd on the node without waiting for it, on a dedicated connection."""
+        if self.node_utils.host_obj is None:
+            self.node_utils.connect()
+        return self.node_utils.host_obj.exec_command(cmd)
+
     def run_verify_svc_state(self, svc: str, action: str, monitor_svcs: list,
                              ignore_param: list = ['timestamp', 'comment'], timeout: int = 5):
         """Perform the given action on the given service and verify systemctl response.
@@ -270,7 +276,7 @@ class SoftwareAlert(RASCoreLib):
                 "Service": {
                     "ExecStop": "/bin/sleep 200", "TimeoutStopSec": "500"}})
         self.apply_svc_setting()
-        self.node_utils.host_obj.exec_command(commands.SYSTEM_CTL_STOP_CMD.format(svc))
+        self._start_cmd(commands.SYSTEM_CTL_STOP_CMD.format(svc))
 
     def put_svc_reloading(self, svc):
         """Function to generate reloading alert
@@ -282,20 +288,20 @@ class SoftwareAlert(RASCoreLib):
                 "Service": {
                     "ExecReload": "/bin/sleep 50"}})
         self.apply_svc_setting()
-        self.node_utils.host_obj.exec_command(commands.SYSTEM_CTL_RELOAD_CMD.format(svc))
+        self._start_cmd(commands.SYSTEM_CTL_RELOAD_CMD.format(svc))
 
     def put_svc_activating(self, svc):
         """Function to generate activating alert
 
         :param svc: Service Name
         """
-        self.node_utils.host_obj.exec_command(commands.SYSTEM_CTL_STOP_CMD.format(svc))
+        self._start_cmd(commands.SYSTEM_CTL_STOP_CMD.format(svc))
         self.write_svc_file(
             svc, {
                 "Service": {
                     "ExecStartPre": "/bin/sleep 500", "TimeoutStartSec": "600"}})
         self.apply_svc_setting()
-        self.node_utils.host_obj.exec_command(commands.SYSTEM_CTL_START_CMD.format(svc))
+        self._start_cmd(commands.SYSTEM_CTL_START_CMD.format(svc))
 
     def put_svc_restarting(self, svc):
         """Function to generate restarting alert
@@ -307,7 +313,7 @@ class SoftwareAlert(RASCoreLib):
                 "Service": {
                     "ExecStartPre": "/bin/sleep 200", "TimeoutStartSec": "500"}})
         self.apply_svc_setting()
-        self.node_utils.host_obj.exec_command(commands.SYSTEM_CTL_RESTART_CMD.format(svc))
+        self._start_cmd(commands.SYSTEM_CTL_RESTART_CMD.format(svc))
 
     def recover_svc(self, svc: str, attempt_start: bool = True, timeout=200):
         """
@@ -725,7 +731,7 @@ class SoftwareAlert(RASCoreLib):
         :return [str]: Response from stress command
         """
         cmd = commands.CMD_INCREASE_MEMORY.format(vm_count, memory_size, timespan)
-        resp = self.node_utils.host_obj.exec_command(cmd)
+        resp = self._start_cmd(cmd)
         LOGGER.debug("%s response : %s",cmd, resp)
         return resp
 
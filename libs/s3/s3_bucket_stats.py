@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/python
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Object count, bytes and size histogram of a bucket.
+
+Usage:
+    stats = bucket_stats(s3_test_obj.s3_client, "bkt-1")
+    LOGGER.info("%s objects, %s bytes, histogram %s", stats.objects, stats.bytes,
+                stats.histogram_dict())
+    status, msg = verify_capacity([stats], SystemCapacity())
+
+The first ListObjectsV2 page tells whether the bucket is small. A larger one
+is split into key ranges at first characters after the prefix, every range is
+listed by its own thread starting after the range's lower bound and stopping
+past its upper bound, so ranges are disjoint and cover all keys. Only counters
+and compact arrays are kept, nothing is logged per object.
+"""
+
+import bisect
+import logging
+import string
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Tuple
+
+from commons import constants
+
+LOGGER = logging.getLogger(__name__)
+
+# first characters keys are split at, in S3 (UTF-8 binary) key order
+PARTITION_CHARS = string.digits + string.ascii_uppercase + string.ascii_lowercase
+CAPACITY_UNITS = {"BYTES": 1, "KB": 1024, "MB": 1024 ** 2, "GB": 1024 ** 3, "TB": 1024 ** 4}
+
+
+@dataclass
+class BucketStats:
+    """Aggregated object sizes of a bucket (prefix)."""
+    bucket: str
+    prefix: str = ""
+    objects: int = 0
+    bytes: int = 0
+    largest: int = 0
+    bounds: Tuple[int, ...] = constants.S3_SIZE_HISTOGRAM_BOUNDS
+    # objects and bytes per size class, class i holds sizes <= bounds[i], the last above all
+    histogram: array = field(default=None)
+    histogram_bytes: array = field(default=None)
+    partitions: int = 1
+    duration: float = 0.0
+
+    def __post_init__(self):
+        if self.histogram is None:
+            self.histogram = array("Q", bytes(8 * (len(self.bounds) + 1)))
+        if self.histogram_bytes is None:
+            self.histogram_bytes = array("Q", bytes(8 * (len(self.bounds) + 1)))
+
+    def add(self, sizes: Iterable[int]) -> None:
+        """Count objects of sizes."""
+        bounds, histogram, histogram_bytes = self.bounds, self.histogram, self.histogram_bytes
+        for size in sizes:
+            idx = bisect.bisect_left(bounds, size)
+            histogram[idx] += 1
+            histogram_bytes[idx] += size
+            self.objects += 1
+            self.bytes += size
+            if size > self.largest:
+                self.largest = size
+
+    def merge(self, other: "BucketStats") -> None:
+        """Add the counts of another partition."""
+        self.objects += other.objects
+        self.bytes += other.bytes
+        self.largest = max(self.largest, other.largest)
+        for idx, count in enumerate(other.histogram):
+            self.histogram[idx] += count
+            self.histogram_bytes[idx] += other.histogram_bytes[idx]
+
+    def histogram_dict(self) -> Dict[str, int]:
+        """Objects per size class labelled by upper bound, e.g. {"<=4096": 10, ">1073741824": 1}."""
+        labels = [f"<={bound}" for bound in self.bounds] + [f">{self.bounds[-1]}"]
+        return dict(zip(labels, self.histogram))
+
+
+def _list_range(s3_client, bucket: str, prefix: str, start_after: str, end: str,
+                page_size: int) -> BucketStats:
+    """Stats of keys below prefix with start_after < key <= end, end None for no upper bound."""
+    stats = BucketStats(bucket, prefix)
+    kwargs = dict(Bucket=bucket, Prefix=prefix, MaxKeys=page_size)
+    if start_after:
+        kwargs["StartAfter"] = start_after
+    while True:
+        page = s3_client.list_objects_v2(**kwargs)
+        contents = page.get("Contents", [])
+        if end is not None and contents and contents[-1]["Key"] > end:
+            stats.add(obj["Size"] for obj in contents if obj["Key"] <= end)
+            return stats
+        stats.add(obj["Size"] for obj in contents)
+        if not page.get("IsTruncated"):
+            return stats
+        kwargs.pop("StartAfter", None)
+        kwargs["ContinuationToken"] = page["NextContinuationToken"]
+
+
+def bucket_stats(s3_client, bucket: str, prefix: str = "",
+                 partitions: int = constants.S3_STATS_PARTITIONS,
+                 page_size: int = 1000) -> BucketStats:
+    """
+    Count objects and bytes of a bucket, large buckets are listed in key ranges concurrently.
+    :param s3_client: boto3 s3 client.
+    :param prefix: only keys below prefix.
+    :param partitions: concurrent listers of a bucket with more than one page of keys.
+    """
+    start = time.perf_counter()
+    first = s3_client.list_objects_v2(Bucket=bucket, Prefix=prefix, MaxKeys=page_size)
+    if not first.get("IsTruncated") or partitions < 2:
+        stats = BucketStats(bucket, prefix)
+        stats.add(obj["Size"] for obj in first.get("Contents", []))
+        if first.get("IsTruncated"):
+            stats.merge(_list_range(s3_client, bucket, prefix, first["Contents"][-1]["Key"],
+                                    None, page_size))
+    else:
+        step = max(1, len(PARTITION_CHARS) // partitions)
+        bounds = [prefix + char for char in PARTITION_CHARS[step::step]][:partitions - 1]
+        ranges = list(zip([""] + bounds, bounds + [None]))
+        with ThreadPoolExecutor(max_workers=len(ranges),
+                                thread_name_prefix="bucket-stats") as executor:
+            results = list(executor.map(
+                lambda rng: _list_range(s3_client, bucket, prefix, rng[0], rng[1], page_size),
+                ranges))
+        stats = BucketStats(bucket, prefix, partitions=len(ranges))
+        for result in results:
+            stats.merge(result)
+    stats.duration = time.perf_counter() - start
+    LOGGER.info("Bucket %s%s: %s objects, %s bytes, listed in %.2fs with %s listers",
+                bucket, f"/{prefix}" if prefix else "", stats.objects, stats.bytes,
+                stats.duration, stats.partitions)
+    return stats
+
+
+def verify_capacity(stats: List[BucketStats], capacity) -> Tuple[bool, str]:
+    """
+    Cross check bucket bytes against the used capacity reported by CSM.
+    :param capacity: libs.csm.rest.csm_rest_capacity.SystemCapacity object.
+    :return: False if the buckets hold more bytes than the cluster reports used.
+    """
+    response = capacity.parse_capacity_usage()
+    if not response:
+        return False, "CSM capacity usage could not be read"
+    _, _, used, _, unit = response
+    used_bytes = used * CAPACITY_UNITS.get(str(unit).upper(), 1)
+    total = sum(stat.bytes for stat in stats)
+    if total > used_bytes:
+        return False, f"Buckets hold {total} bytes, CSM reports {used_bytes} bytes used"
+    return True, f"Buckets hold {total} of {used_bytes} used bytes"
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/python
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Bulk teardown of buckets with many objects.
+
+Usage:
+    with BulkDeleter(s3_test_obj.s3_client) as deleter:
+        results = deleter.delete_buckets(["bkt-1", "bkt-2"])
+    for res in results.values():
+        LOGGER.info("%s: %s objects in %.1fs", res.bucket, res.objects, res.duration)
+
+Keys are listed page by page with ListObjectsV2 (ListObjectVersions for
+versioned buckets) and every page of up to 1000 keys is deleted with one
+DeleteObjects call on a bounded worker pool while the next page is listed.
+Incomplete multipart uploads are aborted before the bucket is deleted.
+Several buckets are torn down concurrently, sharing the delete worker pool.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+
+from botocore.exceptions import ClientError
+
+from commons import constants
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class TeardownResult:
+    """Outcome of emptying and deleting one bucket."""
+    bucket: str
+    objects: int = 0
+    uploads_aborted: int = 0
+    errors: List[dict] = field(default_factory=list)
+    deleted: bool = False
+    duration: float = 0.0
+    error: BaseException = None
+
+    @property
+    def objects_per_sec(self) -> float:
+        """Delete throughput of the bucket."""
+        return self.objects / self.duration if self.duration else 0.0
+
+
+class BulkDeleter:
+    """Empty and delete buckets with batched DeleteObjects on a bounded worker pool."""
+
+    def __init__(self, s3_client,
+                 workers: int = constants.S3_BULK_DELETE_WORKERS,
+                 buckets: int = constants.S3_BULK_DELETE_BUCKETS,
+                 batch_size: int = constants.S3_DELETE_BATCH_SIZE) -> None:
+        """
+        :param s3_client: boto3 s3 client.
+        :param workers: concurrent DeleteObjects/AbortMultipartUpload calls.
+        :param buckets: buckets torn down concurrently.
+        :param batch_size: keys per DeleteObjects call, 1000 at most.
+        """
+        self.s3_client = s3_client
+        self.workers = workers
+        self.buckets = buckets
+        self.batch_size = min(batch_size, 1000)
+        # bounds listed but not yet deleted batches, listing stays ahead of workers
+        self._inflight = threading.BoundedSemaphore(workers * 2)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="s3-delete")
+
+    def _versioned(self, bucket: str) -> bool:
+        """True if the bucket has or had versioning enabled."""
+        try:
+            status = self.s3_client.get_bucket_versioning(Bucket=bucket).get("Status")
+        except ClientError as error:
+            LOGGER.debug("Versioning of %s not read: %s", bucket, error)
+            return False
+        return status in ("Enabled", "Suspended")
+
+    def _batches(self, bucket: str, prefix: str = "") -> Iterator[List[dict]]:
+        """Pages of keys (with version ids for versioned buckets) to delete."""
+        if self._versioned(bucket):
+            pages = self.s3_client.get_paginator("list_object_versions").paginate(
+                Bucket=bucket, Prefix=prefix, PaginationConfig={"PageSize": self.batch_size})
+            for page in pages:
+                keys = [{"Key": obj["Key"], "VersionId": obj["VersionId"]}
+                        for obj in page.get("Versions", []) + page.get("DeleteMarkers", [])]
+                for start in range(0, len(keys), self.batch_size):
+                    yield keys[start:start + self.batch_size]
+        else:
+            pages = self.s3_client.get_paginator("list_objects_v2").paginate(
+                Bucket=bucket, Prefix=prefix, PaginationConfig={"PageSize": self.batch_size})
+            for page in pages:
+                keys = [{"Key": obj["Key"]} for obj in page.get("Contents", [])]
+                if keys:
+                    yield keys
+
+    def _delete_batch(self, bucket: str, keys: List[dict]) -> tuple:
+        """Delete one batch, returns (deleted count, per key errors)."""
+        try:
+            response = self.s3_client.delete_objects(
+                Bucket=bucket, Delete={"Objects": keys, "Quiet": True})
+        finally:
+            self._inflight.release()
+        errors = response.get("Errors", [])
+        return len(keys) - len(errors), errors
+
+    def _abort_upload(self, bucket: str, upload: dict) -> bool:
+        """Abort one multipart upload, False if it completed or was aborted meanwhile."""
+        try:
+            self.s3_client.abort_multipart_upload(
+                Bucket=bucket, Key=upload["Key"], UploadId=upload["UploadId"])
+        except ClientError as error:
+            LOGGER.debug("Upload %s of %s not aborted: %s", upload["UploadId"], bucket, error)
+            return False
+        finally:
+            self._inflight.release()
+        return True
+
+    def _uploads(self, bucket: str, prefix: str = "") -> Iterator[dict]:
+        """Incomplete multipart uploads of the bucket."""
+        pages = self.s3_client.get_paginator("list_multipart_uploads").paginate(
+            Bucket=bucket, Prefix=prefix)
+        for page in pages:
+            yield from page.get("Uploads", [])
+
+    def _submit(self, func, *args):
+        """Run func on the worker pool, blocks while too many calls are queued."""
+        self._inflight.acquire()
+        try:
+            return self._pool.submit(func, *args)
+        except BaseException:
+            self._inflight.release()
+            raise
+
+    def empty_bucket(self, bucket: str, prefix: str = "") -> TeardownResult:
+        """Delete all objects (below prefix) and abort incomplete multipart uploads."""
+        result = TeardownResult(bucket)
+        start = time.perf_counter()
+        batches = [self._submit(self._delete_batch, bucket, keys)
+                   for keys in self._batches(bucket, prefix)]
+        aborts = [self._submit(self._abort_upload, bucket, upload)
+                  for upload in self._uploads(bucket, prefix)]
+        for future in batches:
+            deleted, errors = future.result()
+            result.objects += deleted
+            result.errors.extend(errors)
+        result.uploads_aborted = sum(future.result() for future in aborts)
+        result.duration = time.perf_counter() - start
+        return result
+
+    def delete_bucket(self, bucket: str) -> TeardownResult:
+        """Empty and delete bucket, a failure is recorded in the result."""
+        start = time.perf_counter()
+        result = TeardownResult(bucket)
+        try:
+            result = self.empty_bucket(bucket)
+            if result.errors:
+                raise RuntimeError(f"{len(result.errors)} objects not deleted, e.g. "
+                                   f"{result.errors[:3]}")
+            self.s3_client.delete_bucket(Bucket=bucket)
+            result.deleted = True
+        except Exception as error:  # pylint: disable=broad-except
+            result.error = error
+        result.duration = time.perf_counter() - start
+        LOGGER.info("Bucket %s: %s objects, %s uploads aborted in %.2fs (%.0f objects/s)%s",
+                    bucket, result.objects, result.uploads_aborted, result.duration,
+                    result.objects_per_sec,
+                    f", failed: {result.error}" if result.error else "")
+        return result
+
+    def delete_buckets(self, buckets: Iterable[str]) -> Dict[str, TeardownResult]:
+        """Tear down buckets concurrently, results in the given bucket order."""
+        buckets = list(buckets)
+        if not buckets:
+            return dict()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=min(self.buckets, len(buckets)),
+                                thread_name_prefix="bucket-teardown") as executor:
+            results = dict(zip(buckets, executor.map(self.delete_bucket, buckets)))
+        duration = time.perf_counter() - start
+        objects = sum(res.objects for res in results.values())
+        LOGGER.info("Deleted %s of %s buckets with %s objects in %.2fs (%.0f objects/s)",
+                    sum(res.deleted for res in results.values()), len(buckets), objects,
+                    duration, objects / duration if duration else 0.0)
+        return results
+
+    def close(self) -> None:
+        """Stop the delete workers."""
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self) -> "BulkDeleter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
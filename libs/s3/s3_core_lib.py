@@ -28,7 +28,9 @@ from botocore.config import Config
 
 import boto3
 from config import S3_CFG, CMN_CFG
+from commons.constants import S3_BULK_DELETE_WORKERS
 from commons.constants import S3_ENGINE_RGW
+from libs.s3.s3_bulk_delete import BulkDeleter
 
 LOGGER = logging.getLogger(__name__)
 
@@ -63,7 +65,9 @@ class S3Rest:
             region = kwargs.get("region", None)
         aws_session_token = kwargs.get("aws_session_token", None)
         debug = kwargs.get("debug", S3_CFG["debug"])
-        config = Config(retries={'max_attempts': 6})
+        # connection pool large enough for the concurrent bulk delete calls
+        config = Config(retries={'max_attempts': 6},
+                        max_pool_connections=max(10, S3_BULK_DELETE_WORKERS))
         self.use_ssl = kwargs.get("use_ssl", S3_CFG["use_ssl"])
         val_cert = kwargs.get("validate_certs", S3_CFG["validate_certs"])
         self.s3_cert_path = s3_cert_path if val_cert else False
@@ -343,14 +347,16 @@ class S3Lib(S3Rest):
         """
         bucket = self.s3_resource.Bucket(bucket_name)
         if force:
-            self.object_list(bucket_name)
             LOGGER.info(
                 "This might cause data loss as you have opted for bucket deletion with "
                 "objects in it")
-            response = bucket.objects.all().delete()
-            LOGGER.debug(
-                "Objects deleted successfully from bucket %s, response: %s", bucket_name, response)
-            self.object_list(bucket_name)
+            with BulkDeleter(self.s3_client) as deleter:
+                result = deleter.empty_bucket(bucket_name)
+            if result.errors:
+                raise IOError(f"{len(result.errors)} objects of {bucket_name} not deleted, "
+                              f"e.g. {result.errors[:3]}")
+            LOGGER.debug("%s objects deleted from bucket %s in %.2fs, %s uploads aborted",
+                         result.objects, bucket_name, result.duration, result.uploads_aborted)
         response = bucket.delete()
         LOGGER.debug("Bucket '%s' deleted successfully. Response: %s", bucket_name, response)
 
@@ -25,6 +25,7 @@ import sys
 import logging
 import threading
 from boto3.s3.transfer import TransferConfig
+from commons.utils.s3_utils import PartReader
 from libs.s3.s3_core_lib import S3Lib
 
 LOGGER = logging.getLogger(__name__)
@@ -65,7 +66,7 @@ class Multipart(S3Lib):
         """
         Upload parts of a specific multipart upload.
 
-        :param body: content of the object.
+        :param body: content of the object, bytes, memoryview or file object.
         :param bucket_name: Name of the bucket.
         :param object_name: Name of the object.
         :keyword content_md5: base64-encoded MD5 digest of message
@@ -74,6 +75,9 @@ class Multipart(S3Lib):
         upload_id = kwargs.get("upload_id", None)
         part_number = kwargs.get("part_number", None)
         content_md5 = kwargs.get("content_md5", None)
+        if isinstance(body, memoryview):
+            # mmap backed part, streamed from the mapping without a copy of the part
+            body = PartReader(body)
         if content_md5:
             response = self.s3_client.upload_part(
                 Body=body, Bucket=bucket_name, Key=object_name,
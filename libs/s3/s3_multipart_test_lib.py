@@ -22,7 +22,6 @@
 
 import os
 import logging
-from hashlib import md5
 from numpy.random import permutation
 
 from botocore.exceptions import ClientError
@@ -162,28 +161,26 @@ class S3MultipartTestLib(Multipart):
                 if os.path.exists(multipart_obj_path):
                     os.remove(multipart_obj_path)
                 create_file(multipart_obj_path, multipart_obj_size)
-            with open(multipart_obj_path, "rb") as file_pointer:
-                i = 1
-                while True:
-                    data = file_pointer.read(1048576 * single_part_size)
-                    LOGGER.info("data_len %s", str(len(data)))
-                    if not data:
-                        break
-                    part = super().upload_part(
-                        data, bucket_name, object_name, upload_id=mpu_id, part_number=i)
-                    LOGGER.debug("Part : %s", str(part))
-                    parts.append({"PartNumber": i, "ETag": part["ETag"]})
-                    uploaded_bytes += len(data)
-                    LOGGER.debug(
-                        "{0} of {1} uploaded ({2:.2f}%)".format(
+            part_bytes = 1048576 * single_part_size
+            obj_bytes = os.stat(multipart_obj_path).st_size
+            sizes = [part_bytes] * (-(-obj_bytes // part_bytes) if part_bytes else 0)
+            for i, file_part in enumerate(s3_utils.split_file(multipart_obj_path, sizes), 1):
+                data = file_part[0]
+                LOGGER.info("data_len %s", str(len(data)))
+                part = super().upload_part(
+                    data, bucket_name, object_name, upload_id=mpu_id, part_number=i)
+                LOGGER.debug("Part : %s", str(part))
+                parts.append({"PartNumber": i, "ETag": part["ETag"]})
+                uploaded_bytes += len(data)
+                LOGGER.debug(
+                    "{0} of {1} uploaded ({2:.2f}%)".format(
+                        uploaded_bytes,
+                        multipart_obj_size *
+                        1048576,
+                        cal_percent(
                             uploaded_bytes,
                             multipart_obj_size *
-                            1048576,
-                            cal_percent(
-                                uploaded_bytes,
-                                multipart_obj_size *
-                                1048576)))
-                    i += 1
+                            1048576)))
             LOGGER.info(parts)
 
             return True, parts
@@ -215,20 +212,20 @@ class S3MultipartTestLib(Multipart):
             total_part_list = list()
             for part in part_sizes:
                 total_part_list.extend([part['part_size']] * part['count'])
-            md5_digests = [None] * len(total_part_list)
-            with open(multipart_obj_path, "rb") as file_pointer:
-                for i, partnum in enumerate(permutation(len(total_part_list))):
-                    data = file_pointer.read(int(chunk_size * total_part_list[i]))
-                    LOGGER.info("data_len %s", str(len(data)))
-                    part = super().upload_part(
-                        data, bucket_name, object_name, upload_id=upload_id,
-                        part_number=int(partnum) + 1)
-                    LOGGER.debug("Part : %s", str(part))
-                    uploaded_parts.append({"PartNumber": int(partnum) + 1, "ETag": part["ETag"]})
-                    md5_digests[int(partnum)] = md5(data).digest()
-            multipart_etag = '"%s"' % \
-                             (md5(b''.join(md5_digests)).hexdigest() + '-' + str(len(md5_digests)))
-            return True, {'uploaded_parts': uploaded_parts, 'expected_etag': multipart_etag}
+            multipart_etag = s3_utils.MultipartEtag()
+            file_parts = s3_utils.split_file(
+                multipart_obj_path, [chunk_size * size for size in total_part_list],
+                stop_at_eof=False)
+            for file_part, partnum in zip(file_parts, permutation(len(total_part_list))):
+                LOGGER.info("data_len %s", str(len(file_part[0])))
+                part = super().upload_part(
+                    file_part[0], bucket_name, object_name, upload_id=upload_id,
+                    part_number=int(partnum) + 1)
+                LOGGER.debug("Part : %s", str(part))
+                uploaded_parts.append({"PartNumber": int(partnum) + 1, "ETag": part["ETag"]})
+                multipart_etag.add(int(partnum) + 1, file_part.digest())
+            return True, {'uploaded_parts': uploaded_parts,
+                          'expected_etag': multipart_etag.value}
         except BaseException as error:
             LOGGER.error("Error in %s: %s",
                          S3MultipartTestLib.upload_parts.__name__,
@@ -253,6 +250,8 @@ class S3MultipartTestLib(Multipart):
             parallel_thread = kwargs.get("parallel_thread", 5)
             gevent_pool = GeventPool(parallel_thread)
             part_number_list = list(parts.keys())
+            s3_utils.calc_parts_md5(part for part in parts.values()
+                                    if isinstance(part, s3_utils.MultipartPart))
 
             for part_number in part_number_list:
                 part = parts.get(part_number, None)
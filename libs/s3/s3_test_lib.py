@@ -40,6 +40,8 @@ from config.s3 import S3_CFG
 from libs.s3 import ACCESS_KEY, SECRET_KEY
 from libs.s3.s3_acl_test_lib import S3AclTestLib
 from libs.s3.s3_bucket_policy_test_lib import S3BucketPolicyTestLib
+from libs.s3.s3_bucket_stats import bucket_stats
+from libs.s3.s3_bulk_delete import BulkDeleter
 from libs.s3.s3_core_lib import S3Lib
 
 LOGGER = logging.getLogger(__name__)
@@ -389,21 +391,30 @@ class S3TestLib(S3Lib):
         :param bucket_name: Name of the bucket.
         :return: (Boolean, size of bucket in int)
         """
-        total_size = 0
+        LOGGER.info("Getting bucket size")
+        _, stats = self.get_bucket_stats(bucket_name)
+        LOGGER.info("Total size: %s", stats.bytes)
+
+        return True, stats.bytes
+
+    def get_bucket_stats(self, bucket_name: str = None, prefix: str = "") -> tuple:
+        """
+        Object count, bytes and size histogram of a bucket.
+
+        :param bucket_name: Name of the bucket.
+        :param prefix: Only count objects having this prefix.
+        :return: (Boolean, BucketStats)
+        """
         try:
-            LOGGER.info("Getting bucket size")
-            bucket = super().get_bucket_size(bucket_name)
-            for each_object in bucket.objects.all():
-                total_size += each_object.size
-                LOGGER.info(each_object.size)
-            LOGGER.info("Total size: %s", total_size)
+            stats = bucket_stats(self.s3_client, bucket_name, prefix)
+            LOGGER.info("Object size histogram: %s", stats.histogram_dict())
         except (ClientError, Exception) as error:
             LOGGER.error("Error in %s: %s",
-                         S3TestLib.get_bucket_size.__name__,
+                         S3TestLib.get_bucket_stats.__name__,
                          error)
             raise CTException(err.S3_CLIENT_ERROR, error.args[0])
 
-        return True, total_size
+        return True, stats
 
     def delete_multiple_objects(
             self,
@@ -451,16 +462,22 @@ class S3TestLib(S3Lib):
         """
         LOGGER.info("Deleting multiple empty/non-empty buckets")
         response_dict = {"Deleted": [], "CouldNotDelete": []}
-        for bucket in bucket_list:
-            response = self.delete_bucket(bucket, True)
-            if response[0]:
-                response_dict["Deleted"].append(bucket)
-            else:
-                LOGGER.error(
-                    "Error in %s: %s",
-                    S3TestLib.delete_multiple_buckets.__name__,
-                    response[1])
-                response_dict["CouldNotDelete"].append(bucket)
+        with BulkDeleter(self.s3_client) as deleter:
+            results = deleter.delete_buckets(bucket_list or [])
+        for bucket, result in results.items():
+            if not result.deleted:
+                # retried with polling, e.g. a bucket still receiving objects
+                LOGGER.warning("Retrying deletion of bucket %s: %s", bucket, result.error)
+                try:
+                    self.delete_bucket(bucket, True)
+                except CTException as error:
+                    LOGGER.error(
+                        "Error in %s: %s",
+                        S3TestLib.delete_multiple_buckets.__name__,
+                        error)
+                    response_dict["CouldNotDelete"].append(bucket)
+                    continue
+            response_dict["Deleted"].append(bucket)
         if response_dict["CouldNotDelete"]:
             LOGGER.error("Failed to delete bucket")
             return False, response_dict
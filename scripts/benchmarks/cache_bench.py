@@ -0,0 +1,116 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Microbenchmark of core.cache against the former deque/list based cache.
+
+python -m scripts.benchmarks.cache_bench --sizes 10000 100000 1000000 10000000
+Every size is filled with "bucket/object" keys, then store, lookup, delete and
+random pop are timed per operation. The former random pop copied all keys to a
+list on every call, it is timed with --legacy-ops pops only.
+"""
+import argparse
+import secrets
+import threading
+import time
+from collections import deque
+
+from core.cache import InMemoryDB
+
+
+class LegacyInMemoryDB:
+    """The former FIFO cache with O(n) delete and random pop, for comparison."""
+
+    def __init__(self, size):
+        self.maxsize = size
+        self.fifo = deque()
+        self.table = dict()
+        self._lock = threading.Lock()
+
+    def store(self, key, value):
+        with self._lock:
+            if key not in self.table:
+                self.fifo.append(key)
+            self.table[key] = value
+            if len(self.fifo) > self.maxsize:
+                self.table.pop(self.fifo.popleft(), None)
+
+    def lookup(self, key):
+        with self._lock:
+            return self.table[key]
+
+    def delete(self, key):
+        with self._lock:
+            self.table.pop(key, None)
+            try:
+                self.fifo.remove(key)
+            except ValueError:
+                pass
+
+    def pop_one(self):
+        with self._lock:
+            keys = list(self.table.keys())
+            if not keys:
+                return False, False
+            key = secrets.choice(keys)
+            return key, self.table.pop(key)
+
+
+def per_op_us(func, keys):
+    """Mean microseconds of func(key) over keys."""
+    start = time.perf_counter()
+    for key in keys:
+        func(key)
+    return (time.perf_counter() - start) / max(len(keys), 1) * 1e6
+
+
+def bench(cls, size, ops, random_ops):
+    """Per operation microseconds of a cache class filled with size keys."""
+    cache = cls(size)
+    keys = [f'bucket-{idx % 100}/object-{idx}' for idx in range(size)]
+    result = dict(store=per_op_us(lambda key: cache.store(key, 'crc'), keys))
+    probe = keys[::max(1, size // ops)][:ops]
+    result['lookup'] = per_op_us(cache.lookup, probe)
+    result['pop_one'] = per_op_us(lambda _: cache.pop_one(), range(random_ops))
+    result['delete'] = per_op_us(cache.delete, probe[:random_ops])
+    return result
+
+
+def main():
+    """Benchmark entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', type=int, default=[10000, 100000, 1000000])
+    parser.add_argument('--ops', type=int, default=100000, help='timed lookups and pops')
+    parser.add_argument('--legacy-ops', type=int, default=100,
+                        help='timed pops and deletes of the former cache, 0 skips it')
+    args = parser.parse_args()
+    print('{:>10} {:>8} {:>10} {:>10} {:>10} {:>10}'.format(
+        'keys', 'cache', 'store us', 'lookup us', 'pop us', 'delete us'))
+    for size in args.sizes:
+        runs = [('lru', bench(InMemoryDB, size, args.ops, min(args.ops, size)))]
+        if args.legacy_ops:
+            runs.append(('legacy', bench(LegacyInMemoryDB, size, args.ops,
+                                         min(args.legacy_ops, size))))
+        for name, result in runs:
+            print('{:>10} {:>8} {:10.2f} {:10.2f} {:10.2f} {:10.2f}'.format(
+                size, name, result['store'], result['lookup'], result['pop_one'],
+                result['delete']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""In process checksums vs the former md5sum/openssl subprocess path.
+
+python -m scripts.benchmarks.checksum_bench --sizes 1K,1M,64M,1G,10G --dir /var/tmp
+For every size one random data file is written and hashed with
+  subprocess  openssl md5 -binary | base64, as calculate_checksum used to run
+  md5sum      md5sum, as HAK8s.cal_compare_checksum used to run
+  8k-reads    hashlib md5 with 8 KB reads, as di_lib.read_file used to do
+  md5         checksum_utils.file_checksum
+  md5+sha256+etag  checksum_utils.file_digests in one pass
+  crc32c      checksum_utils crc32c, slow without the crc32c package
+The parallel line hashes --files copies of the largest file sequentially and
+with checksum_utils.files_digests. Run it on a cold cache (drop_caches) to
+include disk reads.
+"""
+import argparse
+import hashlib
+import os
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+
+from commons.utils import checksum_utils
+
+UNITS = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+
+
+def parse_size(size: str) -> int:
+    """Bytes of 1K, 64M, 10G."""
+    size = size.strip().upper()
+    if size[-1] in UNITS:
+        return int(float(size[:-1]) * UNITS[size[-1]])
+    return int(size)
+
+
+def write_file(path: str, size: int) -> None:
+    """Random data file, a 16 MB random block repeated for large sizes."""
+    block = os.urandom(min(size, 16 * 1024 ** 2))
+    with open(path, "wb") as fout:
+        left = size
+        while left:
+            fout.write(block[:left])
+            left -= min(left, len(block))
+
+
+def read_8k(path: str) -> str:
+    """md5 with 8 KB reads."""
+    file_hash = hashlib.md5()  # nosec
+    with open(path, "rb") as fin:
+        for chunk in iter(lambda: fin.read(8192), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def timed(func, runs: int) -> float:
+    """Median seconds of runs calls."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def methods(path: str) -> dict:
+    """Checksum methods of one file by label."""
+    return {
+        "subprocess": lambda: subprocess.run(f"openssl md5 -binary {path} | base64",
+                                             shell=True, check=True,  # nosec
+                                             stdout=subprocess.PIPE),
+        "md5sum": lambda: subprocess.run(["md5sum", path], check=True,
+                                         stdout=subprocess.PIPE),
+        "8k-reads": lambda: read_8k(path),
+        "md5": lambda: checksum_utils.file_checksum(path),
+        "md5+sha256+etag": lambda: checksum_utils.file_digests(
+            path, ("md5", "sha256", "etag"), part_size=16 * 1024 ** 2),
+        "crc32c": lambda: checksum_utils.file_checksum(path, "crc32c"),
+    }
+
+
+def main():
+    """Benchmark entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1K,1M,64M,1G")
+    parser.add_argument("--dir", default=None, help="directory of the data files")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--files", type=int, default=8, help="files of the parallel run")
+    args = parser.parse_args()
+    workdir = tempfile.mkdtemp(prefix="checksum_bench", dir=args.dir)
+    try:
+        sizes = [parse_size(size) for size in args.sizes.split(",")]
+        print(f"{'size':>12} {'method':>16} {'seconds':>10} {'MB/s':>10}")
+        for size in sizes:
+            path = os.path.join(workdir, f"data_{size}")
+            write_file(path, size)
+            # big files once
+            runs = args.runs if size <= 64 * 1024 ** 2 else 1
+            for label, func in methods(path).items():
+                seconds = timed(func, runs)
+                print(f"{size:>12} {label:>16} {seconds:>10.4f} "
+                      f"{size / seconds / 1024 ** 2 if seconds else 0:>10.1f}")
+            if size != max(sizes):
+                os.remove(path)
+        paths = [os.path.join(workdir, f"data_{max(sizes)}")]
+        for idx in range(1, args.files):
+            paths.append(f"{paths[0]}.{idx}")
+            shutil.copyfile(paths[0], paths[-1])
+        sequential = timed(lambda: [checksum_utils.file_checksum(path) for path in paths], 1)
+        parallel = timed(lambda: checksum_utils.files_digests(paths), 1)
+        print(f"{len(paths)} files of {max(sizes)} bytes: sequential {sequential:.3f} s, "
+              f"parallel {parallel:.3f} s ({sequential / parallel:.1f}x)")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
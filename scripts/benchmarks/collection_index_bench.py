@@ -0,0 +1,76 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Cold vs warm test collection time with the collection index.
+
+python -m scripts.benchmarks.collection_index_bench --runs 3 --target automation
+A cold run removes the index and collects every test module, a warm run
+collects changed files only and takes the rest from the index, as drunner and
+local collect-only runs do. The in process index check, hashing only files
+whose mtime or size changed, is timed separately.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from commons import params
+from core.collection_index import CollectionIndex
+
+
+def collect(target, extra):
+    """Seconds of one pytest collect-only run."""
+    cmd = [sys.executable, '-m', 'pytest', '--collect-only', '-q', '--local=True',
+           f'--target={target}'] + extra
+    start = time.perf_counter()
+    subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+    return time.perf_counter() - start
+
+
+def index_check():
+    """Seconds to load the index and find stale files."""
+    start = time.perf_counter()
+    index = CollectionIndex(params.COLLECTION_INDEX).load()
+    stale = index.stale(index.default_test_files())
+    return time.perf_counter() - start, len(index.files), len(stale)
+
+
+def main():
+    """Benchmark entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--target', default='automation')
+    parser.add_argument('pytest_args', nargs='*', help='extra pytest args')
+    args = parser.parse_args()
+    cold, warm = [], []
+    for _ in range(args.runs):
+        if os.path.exists(params.COLLECTION_INDEX):
+            os.remove(params.COLLECTION_INDEX)
+        cold.append(collect(args.target, args.pytest_args))
+        warm.append(collect(args.target, args.pytest_args))
+    check, indexed, stale = index_check()
+    print(f'cold collection  {statistics.median(cold):8.2f} s')
+    print(f'warm collection  {statistics.median(warm):8.2f} s')
+    print(f'index check      {check:8.3f} s ({indexed} files indexed, {stale} stale)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Measure import time of the config package and of the entry points that use it.
+
+python -m scripts.benchmarks.config_import_bench --save before.json
+python -m scripts.benchmarks.config_import_bench --baseline before.json --target 0.5
+Every case runs in a fresh interpreter with python -X importtime, the total is
+the sum of the self times of all imported modules (median of --runs runs).
+With --baseline the run fails unless every case common to both runs is at
+least --target (fraction) faster than the baseline.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CASES = {
+    'config': ['-c', 'import config'],
+    'config+CMN_CFG': ['-c', 'from config import CMN_CFG'],
+    'testrunner': ['-c', 'import testrunner'],
+    'pytest collection': ['-m', 'pytest', '--collect-only', '-q',
+                          'tests/s3/test_bucket_tagging.py'],
+    'tools.cmi_calc': ['-c', 'import tools.cmi_calc'],
+    'tools.db_update': ['-c', 'import tools.db_update'],
+}
+
+
+def import_times(args):
+    """Run python -X importtime args, return ({module: cumulative us}, total self us, rc)."""
+    proc = subprocess.run([sys.executable, '-X', 'importtime'] + args, cwd=ROOT,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                          universal_newlines=True, check=False)
+    modules, total = dict(), 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        total += int(self_us)
+        modules[name.strip()] = int(cumulative_us)
+    return modules, total, proc.returncode
+
+
+def measure(args, runs):
+    """Median total ms and slowest modules of the last run."""
+    totals, modules, code = list(), dict(), 0
+    for _ in range(runs):
+        modules, total, code = import_times(args)
+        totals.append(total / 1000)
+    slowest = sorted(modules.items(), key=lambda item: item[1], reverse=True)[:5]
+    return dict(ms=round(statistics.median(totals), 1), rc=code,
+                slowest=[(name, round(us / 1000, 1)) for name, us in slowest])
+
+
+def main():
+    """Benchmark entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--cases', nargs='+', default=list(CASES), choices=list(CASES))
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--save', help='write results to this json file')
+    parser.add_argument('--baseline', help='json file of an earlier --save')
+    parser.add_argument('--target', type=float, default=0.5,
+                        help='required fractional reduction against --baseline')
+    args = parser.parse_args()
+    results = dict()
+    for case in args.cases:
+        results[case] = measure(CASES[case], args.runs)
+        print('{:>20}: {:9.1f} ms  rc {}  slowest {}'.format(
+            case, results[case]['ms'], results[case]['rc'], results[case]['slowest'][:3]))
+    if args.save:
+        with open(args.save, 'w') as fout:
+            json.dump(results, fout, indent=2)
+    if args.baseline:
+        with open(args.baseline) as fin:
+            baseline = json.load(fin)
+        missed = list()
+        for case in set(baseline) & set(results):
+            reduction = 1 - results[case]['ms'] / baseline[case]['ms']
+            print('{:>20}: {:+.0%} against baseline'.format(case, -reduction))
+            if reduction < args.target:
+                missed.append(case)
+        if missed:
+            print('Target reduction of {:.0%} missed by {}'.format(args.target, missed))
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
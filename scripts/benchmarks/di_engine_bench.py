@@ -0,0 +1,81 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Compare DI upload/verify throughput of the process and asyncio engines.
+
+python -m scripts.benchmarks.di_engine_bench --endpoint https://s3.seagate.com \
+    --access-key AK --secret-key SK --buckets di-bench-1 di-bench-2 --objects 1000
+Buckets must exist. Every engine uploads --objects objects per bucket and then
+verifies everything that was uploaded.
+"""
+import os
+import argparse
+import multiprocessing
+import tempfile
+import time
+from commons import params
+
+
+def run(engine, users, objects):
+    """Upload and verify with engine, return dict of timings."""
+    # S3_ENDPOINT is bound at import time by the DI modules.
+    from libs.di.di_run_man import RunDataCheckManager
+    params.UPLOADED_FILES = os.path.join(tempfile.mkdtemp(prefix='di-bench-'),
+                                         'uploadInfo.csv')
+    run_man = RunDataCheckManager(users=users, engine=engine)
+    start = time.perf_counter()
+    run_man.start_io(users=users, buckets=None, files_count=objects,
+                     prefs={'prefix_dir': 'di-bench'}, event=multiprocessing.Event())
+    put_time = time.perf_counter() - start
+    start = time.perf_counter()
+    status, summary = run_man.stop_io(users, di_check=True)
+    get_time = time.perf_counter() - start
+    result = dict(engine=engine, put_s=round(put_time, 2), get_s=round(get_time, 2),
+                  status=status, summary=summary)
+    if engine == 'asyncio':
+        result['put'] = run_man.uploader.get_stats('put')
+        result['get'] = run_man.uploader.get_stats('get')
+    return result
+
+
+def main():
+    """Benchmark entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--endpoint', default=params.S3_ENDPOINT)
+    parser.add_argument('--access-key', required=True)
+    parser.add_argument('--secret-key', required=True)
+    parser.add_argument('--buckets', nargs='+', required=True)
+    parser.add_argument('--objects', type=int, default=1000, help='objects per bucket')
+    parser.add_argument('--engines', nargs='+', default=['process', 'asyncio'])
+    args = parser.parse_args()
+    params.S3_ENDPOINT = args.endpoint
+    users = {'di-bench': dict(accesskey=args.access_key, secretkey=args.secret_key,
+                              buckets=args.buckets)}
+    total = args.objects * len(args.buckets)
+    for engine in args.engines:
+        result = run(engine, users, args.objects)
+        print('{engine:>8}: PUT {put_s}s ({put_rate:.1f} obj/s), verify {get_s}s '
+              '({get_rate:.1f} obj/s), status {status}'.format(
+                  put_rate=total / result['put_s'], get_rate=total / result['get_s'], **result))
+        if engine == 'asyncio':
+            print('          PUT latency ms {put}\n          GET latency ms {get}'.format(**result))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Compare DI object state bookkeeping of DataManager and ObjectStateStore.
+
+python -m scripts.benchmarks.di_state_store_bench --entries 10000 100000 1000000
+"""
+import argparse
+import shutil
+import tempfile
+import time
+from commons import params
+from libs.di.data_man import DataManager
+from libs.di.state_store import ObjectStateStore
+
+USER = 'bench-user'
+
+
+def _file_dicts(count, nbuckets):
+    """Yield (bucket, file dict) tuples for count objects."""
+    for idx in range(count):
+        yield 'bench-bucket-{}'.format(idx % nbuckets), dict(
+            name='obj-{}'.format(idx), checksum='{:032x}'.format(idx), seed=idx,
+            size=4096, mtime=idx)
+
+
+def run(manager, count, nbuckets):
+    """Add count entries, read them back and return (add sec, query sec)."""
+    start = time.perf_counter()
+    for bucket, fdict in _file_dicts(count, nbuckets):
+        manager.add_file_to_bucket(USER, bucket, fdict)
+    if isinstance(manager, ObjectStateStore):
+        manager.flush()
+    add_time = time.perf_counter() - start
+    start = time.perf_counter()
+    buckets = manager.get_all_buckets_data_for_user(USER)
+    for container in buckets:
+        manager.get_file_within_bucket('obj-0', container, container['name'])
+    return add_time, time.perf_counter() - start
+
+
+def main():
+    """Benchmark entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--entries', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--buckets', type=int, default=10)
+    parser.add_argument('--json-limit', type=int, default=10000,
+                        help='skip the json path above this many entries, it is O(n^2)')
+    args = parser.parse_args()
+    print('{:>10} {:>18} {:>14} {:>14}'.format('entries', 'backend', 'add (s)', 'query (s)'))
+    for count in args.entries:
+        backends = [('state_store', ObjectStateStore)]
+        if count <= args.json_limit:
+            backends.insert(0, ('json', DataManager))
+        for name, cls in backends:
+            home = tempfile.mkdtemp(prefix='di-state-bench-')
+            params.META_DATA_HOME = home
+            try:
+                add_time, query_time = run(cls(), count, args.buckets)
+            finally:
+                shutil.rmtree(home, ignore_errors=True)
+            print('{:>10} {:>18} {:>14.3f} {:>14.3f}'.format(count, name, add_time, query_time))
+        if count > args.json_limit:
+            print('{:>10} {:>18} {:>14} {:>14}'.format(count, 'json', 'skipped', '-'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Measure dashboard page render query latency with and without the client registry/cache.
+
+python -m scripts.benchmarks.mongo_query_cache_bench --uri mongodb://localhost:27017
+python -m scripts.benchmarks.mongo_query_cache_bench --mock
+A render issues a count and a find per object size like the performance
+statistics table. Compared are a new MongoClient per call, the shared client
+without cache and the shared client with the query cache. mongomock clients do
+not share data, so --mock skips the client per query case.
+"""
+import argparse
+import statistics
+import time
+from pymongo import MongoClient
+from commons.utils import db_utils
+
+DB_NAME = 'bench_perf'
+COLLECTION = 'results'
+OBJECT_SIZES = ['4Kb', '100Kb', '1Mb', '5Mb', '36Mb', '64Mb', '128Mb', '256Mb']
+
+
+def populate(client, docs):
+    """Create docs performance documents."""
+    coll = client[DB_NAME][COLLECTION]
+    coll.delete_many({})
+    coll.insert_many([dict(Build='build-{}'.format(idx % 20), Object_Size=OBJECT_SIZES[
+        idx % len(OBJECT_SIZES)], Name='S3bench', Throughput=idx % 997, Count_of_Servers=3)
+                      for idx in range(docs)])
+    coll.create_index([('Build', 1), ('Object_Size', 1)])
+
+
+def render_new_client(uri, build):
+    """Page render opening a client per query as before."""
+    for size in OBJECT_SIZES:
+        query = dict(Build=build, Object_Size=size, Name='S3bench')
+        with MongoClient(uri) as client:
+            client[DB_NAME][COLLECTION].count_documents(query)
+        with MongoClient(uri) as client:
+            list(client[DB_NAME][COLLECTION].find(query))
+
+
+def render_registry(uri, build):
+    """Page render through the registry and query cache."""
+    for size in OBJECT_SIZES:
+        query = dict(Build=build, Object_Size=size, Name='S3bench')
+        db_utils.cached_query('count', uri, DB_NAME, COLLECTION, (query,),
+                              lambda coll: coll.count_documents(query))
+        db_utils.cached_query('find', uri, DB_NAME, COLLECTION, (query,),
+                              lambda coll: list(coll.find(query)))
+
+
+def measure(render, uri, renders):
+    """Return per render latencies in ms."""
+    latencies = list()
+    for idx in range(renders):
+        start = time.perf_counter()
+        render(uri, 'build-{}'.format(idx % 5))
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def main():
+    """Benchmark entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--uri', default='mongodb://localhost:27017')
+    parser.add_argument('--mock', action='store_true', help='use mongomock, no server needed')
+    parser.add_argument('--docs', type=int, default=20000)
+    parser.add_argument('--renders', type=int, default=50)
+    args = parser.parse_args()
+    if args.mock:
+        import mongomock  # pylint: disable=import-outside-toplevel
+        db_utils.MongoClient = mongomock.MongoClient
+    populate(db_utils.get_client(args.uri), args.docs)
+    cache_ttl = db_utils.QUERY_CACHE.ttl
+    cases = [('new client per query', render_new_client, None),
+             ('shared client', render_registry, 0),
+             ('shared client + cache', render_registry, cache_ttl)]
+    if args.mock:
+        cases = cases[1:]
+    for name, render, ttl in cases:
+        if ttl is not None:
+            db_utils.QUERY_CACHE.ttl = ttl
+            db_utils.QUERY_CACHE.invalidate()
+        latencies = measure(render, args.uri, args.renders)
+        print('{:>24}: median {:8.2f} ms  p95 {:8.2f} ms'.format(
+            name, statistics.median(latencies),
+            sorted(latencies)[int(len(latencies) * 0.95) - 1]))
+    db_utils.get_client(args.uri).drop_database(DB_NAME)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Compare per object size statistics queries with the single pipeline of the dashboard.
+
+python -m scripts.benchmarks.perf_stats_query_bench --uri mongodb://localhost:27017
+python -m scripts.benchmarks.perf_stats_query_bench --mock --docs 5000
+The legacy statistics table runs distinct on Object_Size and then one
+aggregate per (size, operation). The pipeline table matches and groups the
+whole table in one aggregation. Queries bypass the query cache so every render
+reaches the database.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__)))), 'tools', 'dash_server'))
+
+# pylint: disable=wrong-import-position
+from Performance import aggregate_queries  # noqa: E402
+from Performance import mongodb_api  # noqa: E402
+from Performance.schemas import get_complete_schema, get_statistics_schema  # noqa: E402
+
+DB_NAME = 'bench_perf'
+COLLECTION = 'results'
+OBJECT_SIZES = ['4KB', '100KB', '1MB', '5MB', '36MB', '64MB', '128MB', '256MB']
+QUERY = {'release': 1, 'OS': 'centos', 'branch': 'main', 'nodes': 3, 'clients': 1, 'pfull': 0,
+         'itrns': 1, 'custom': 'none', 'buckets': 1, 'sessions': 100, 'name': 'S3bench'}
+
+
+def populate(coll, docs):
+    """Create docs performance documents spread over 20 builds."""
+    coll.delete_many({})
+    coll.insert_many([{
+        'OS': 'centos', 'Branch': 'main', 'Count_of_Servers': 3, 'Count_of_Clients': 1,
+        'Percentage_full': 0, 'Iteration': 1, 'Custom': 'none', 'Buckets': 1, 'Sessions': 100,
+        'Build': str(idx % 20), 'Object_Size': OBJECT_SIZES[idx % len(OBJECT_SIZES)],
+        'Operation': ('Read', 'Write')[idx // len(OBJECT_SIZES) % 2], 'Name': 'S3bench',
+        'Objects': 10, 'Throughput': idx % 997, 'IOPS': idx % 331,
+        'Latency': {'Avg': 0.01}, 'TTFB': {'Avg': 0.005}, 'Run_State': 'successful'}
+        for idx in range(docs)])
+    coll.create_index([('Build', 1), ('Object_Size', 1), ('Operation', 1)])
+
+
+def render_legacy(coll, data):
+    """Statistics table the way backend.get_data_for_stats queried it before."""
+    sizes = coll.distinct('Object_Size', get_statistics_schema(data))
+    rows = list()
+    for size in sizes:
+        for operation in ('Read', 'Write'):
+            query = get_complete_schema(dict(data, objsize=size, operation=operation))
+            rows.append(list(coll.aggregate([{'$match': query}, {'$group': dict(
+                aggregate_queries.BENCHMARK_ACCUMULATORS, _id='null')}])))
+    return rows
+
+
+def render_pipeline(coll, data):
+    """Statistics table with a single aggregation."""
+    docs = list(coll.aggregate(aggregate_queries.get_benchmark_pipeline(data, 'Object_Size')))
+    return aggregate_queries.build_benchmark_frame(docs, data['name'], 'Object_Size',
+                                                   'Object Sizes')
+
+
+def measure(render, coll, renders):
+    """Return per render latencies in ms."""
+    latencies = list()
+    for idx in range(renders):
+        start = time.perf_counter()
+        render(coll, dict(QUERY, build=str(idx % 20)))
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def main():
+    """Benchmark entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--uri', default='mongodb://localhost:27017')
+    parser.add_argument('--mock', action='store_true', help='use mongomock, no server needed')
+    parser.add_argument('--docs', type=int, default=100000)
+    parser.add_argument('--renders', type=int, default=20)
+    args = parser.parse_args()
+    if args.mock:
+        import mongomock  # pylint: disable=import-outside-toplevel
+        mongodb_api.db_utils.MongoClient = mongomock.MongoClient
+    coll = mongodb_api.db_utils.get_client(args.uri)[DB_NAME][COLLECTION]
+    populate(coll, args.docs)
+    for name, render in (('distinct + per size', render_legacy),
+                         ('single pipeline', render_pipeline)):
+        latencies = measure(render, coll, args.renders)
+        print('{:>20}: median {:8.2f} ms  p95 {:8.2f} ms'.format(
+            name, statistics.median(latencies),
+            sorted(latencies)[int(len(latencies) * 0.95) - 1]))
+    coll.database.client.drop_database(DB_NAME)
+
+
+if __name__ == '__main__':
+    main()
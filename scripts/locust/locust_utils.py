@@ -32,7 +32,7 @@ from botocore.exceptions import BotoCoreError, ClientError, ConnectionClosedErro
 from locust import events
 
 from commons.utils import system_utils
-from core.runner import InMemoryDB
+from core.cache import InMemoryDB
 from scripts.locust import LOCUST_CFG
 
 LOGGER = logging.getLogger(__name__)
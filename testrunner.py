@@ -36,6 +36,7 @@ from core import kafka_consumer
 from core.health_status_check_update import HealthCheck
 from core.client_config import ClientConfig
 from core.locking_server import LockingServer
+from core.scheduler import DurationHistory
 from commons.utils.jira_utils import JiraTask
 from commons import configmanager
 from commons.utils import config_utils
@@ -226,6 +227,18 @@ def run_pytest_cmd(args, te_tag=None, parallel_exe=False, env=None, re_execution
         sys.exit(2)
 
 
+def refresh_test_durations(args, test_list):
+    """
+    Add report DB durations of tests without local history, parallel runs are
+    ordered longest expected test first from it.
+    """
+    if not args.db_update or not test_list:
+        return
+    history = DurationHistory().load()
+    if history.refresh(test_list, *runner.get_db_credential()):
+        history.save()
+
+
 def delete_status_files():
     file_list = ['failed_tests.log', 'passed_tests.log', 'other_test_calls.log']
     for file in file_list:
@@ -415,6 +428,8 @@ def trigger_tests_from_kafka_msg(args, kafka_msg):
     create_test_meta_data_file(args, kafka_msg.test_list)  # why this data is needed in kafka exec
     _env = os.environ.copy()
     _env['pytest_run'] = 'distributed'
+    if kafka_msg.parallel:
+        refresh_test_durations(args, kafka_msg.test_list)
 
     # First execute all tests with parallel tag which are mentioned in given tag.
     run_pytest_cmd(args, te_tag=None, parallel_exe=kafka_msg.parallel, env=_env)
@@ -476,6 +491,7 @@ def trigger_tests_from_te(args):
             args.stop_on_first_error = True
 
         if not args.force_serial_run:
+            refresh_test_durations(args, test_list)
             # First execute all tests with parallel tag which are mentioned in given tag.
             run_pytest_cmd(args, te_tag, True, env=_env)
 
@@ -23,6 +23,7 @@ import pytest
 from libs.di.di_test_framework import Uploader
 from libs.di.di_test_framework import DIChecker
 from libs.di.di_mgmt_ops import ManagementOPs
+from libs.di.di_run_man import RunDataCheckManager
 from commons.ct_fail_on import CTFailOn
 from commons.errorcodes import error_handler
 from config import DATA_PATH_CFG
@@ -44,6 +45,20 @@ class TestDataIntegrity:
         DIChecker.init_s3_conn(users)
         DIChecker.verify_data_integrity(users)
 
+    @pytest.mark.di
+    @pytest.mark.tags("TEST-3")
+    def test_di_sanity_seed_verify(self):
+        """Upload objects and verify them against data regenerated from their seeds."""
+        ops = ManagementOPs()
+        users = ops.create_account_users(nusers=2)
+        io_data = ops.create_buckets(nbuckets=2, users=users)
+        run_data_chk_obj = RunDataCheckManager(users=io_data, verify='seed')
+        status, summary = run_data_chk_obj.run_io_sequentially(
+            users=io_data, files_count=10, prefs="test_di_sanity_seed_verify")
+        LOGGER.info("Seed verification summary %s", summary)
+        assert status, f"Seed verification failed {summary}"
+        assert summary["checksum_verified"] == summary["uploaded_files"], summary
+
     @pytest.mark.skip
     @pytest.mark.di
     @pytest.mark.tags("TEST-1")
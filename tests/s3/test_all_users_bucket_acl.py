@@ -119,7 +119,7 @@ class TestAllUsersBucketAcl:
         self.log.info("Step 2: Changed bucket permission to AllUsers READ")
         self.log.info("Step 3: Verifying bucket permission is changed")
         resp = s3_utils.poll(self.acl_obj.get_bucket_acl, self.bucket_name,
-                             condition='{}[1][1][0]["Permission"]=="READ"')
+                             condition=lambda resp: resp[1][1][0]["Permission"] == "READ")
         assert_utils.assert_true(resp[0], resp[1])
         assert_utils.assert_equal(resp[1][1][0]["Permission"], "READ", resp[1])
         self.log.info("Step 3: Verified bucket permission is changed")
@@ -213,7 +213,8 @@ class TestAllUsersBucketAcl:
         self.log.info("Step 2: Changed bucket permission to AllUsers READ")
         self.log.info("Step 3: Verifying bucket permission is changed")
         resp = s3_utils.poll(self.acl_obj.get_bucket_acl,
-                             self.bucket_name, condition='{}[1][1][0]["Permission"]=="READ"')
+                             self.bucket_name,
+                             condition=lambda resp: resp[1][1][0]["Permission"] == "READ")
         assert_utils.assert_true(resp[0], resp[1])
         assert_utils.assert_equal(resp[1][1][0]["Permission"], "READ", resp[1])
         self.log.info("Step 3: Verified bucket permission is changed")
@@ -310,7 +311,8 @@ class TestAllUsersBucketAcl:
         self.log.info("Step 2: Changed bucket permission to AllUsers READ")
         self.log.info("Step 3: Verifying bucket permission is changed")
         resp = s3_utils.poll(self.acl_obj.get_bucket_acl,
-                             self.bucket_name, condition='{}[1][1][0]["Permission"]=="READ"')
+                             self.bucket_name,
+                             condition=lambda resp: resp[1][1][0]["Permission"] == "READ")
         assert_utils.assert_true(resp[0], resp[1])
         assert_utils.assert_equal(resp[1][1][0]["Permission"], "READ", resp[1])
         self.log.info("Step 3: Verified bucket permission is changed")
@@ -344,7 +346,8 @@ class TestAllUsersBucketAcl:
         self.log.info("Step 2: Changed bucket permission to AllUsers WRITE")
         self.log.info("Step 3: Verifying bucket permission is changed")
         resp = s3_utils.poll(self.acl_obj.get_bucket_acl,
-                             self.bucket_name, condition='{}[1][1][0]["Permission"]=="WRITE"')
+                             self.bucket_name,
+                             condition=lambda resp: resp[1][1][0]["Permission"] == "WRITE")
         assert_utils.assert_true(resp[0], resp[1])
         assert_utils.assert_equal(resp[1][1][0]["Permission"], "WRITE", resp[1])
         self.log.info("Step 3: Verified bucket permission is changed")
@@ -378,7 +381,8 @@ class TestAllUsersBucketAcl:
         self.log.info("Step 2: Changed bucket permission to AllUsers WRITE")
         self.log.info("Step 3: Verifying bucket permission is changed")
         resp = s3_utils.poll(self.acl_obj.get_bucket_acl,
-                             self.bucket_name, condition='{}[1][1][0]["Permission"]=="WRITE"')
+                             self.bucket_name,
+                             condition=lambda resp: resp[1][1][0]["Permission"] == "WRITE")
         assert_utils.assert_true(resp[0], resp[1])
         assert_utils.assert_equal(resp[1][1][0]["Permission"], "WRITE", resp[1])
         self.log.info("Step 3: Verified bucket permission is changed")
@@ -419,7 +423,8 @@ class TestAllUsersBucketAcl:
         self.log.info("Step 2: Changed bucket permission to AllUsers WRITE")
         self.log.info("Step 3: Verifying bucket permission is changed")
         resp = s3_utils.poll(self.acl_obj.get_bucket_acl,
-                             self.bucket_name, condition='{}[1][1][0]["Permission"]=="WRITE"')
+                             self.bucket_name,
+                             condition=lambda resp: resp[1][1][0]["Permission"] == "WRITE")
         assert_utils.assert_true(resp[0], resp[1])
         assert_utils.assert_equal(resp[1][1][0]["Permission"], "WRITE", resp[1])
         self.log.info("Step 3: Verified bucket permission is changed")
@@ -996,7 +1001,8 @@ class TestAllUsersBucketAcl:
         self.log.info("Step 2: Changed bucket permission to AllUsers WRITE_ACP")
         self.log.info("Step 3: Verifying bucket permission is changed")
         resp = s3_utils.poll(self.acl_obj.get_bucket_acl,
-                             self.bucket_name, condition='{}[1][1][0]["Permission"]=="WRITE_ACP"')
+                             self.bucket_name,
+                             condition=lambda resp: resp[1][1][0]["Permission"] == "WRITE_ACP")
         assert_utils.assert_equal(resp[1][1][0]["Permission"], "WRITE_ACP", resp[1])
         self.log.info("Step 3: Verified bucket permission is changed")
         self.log.info("Step 4: Updating object ACL through other unsigned account")
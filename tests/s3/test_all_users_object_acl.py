@@ -806,7 +806,7 @@ class TestAllUsersObjectAcl:
         self.log.info(
             "Step 3: Get object acl from that bucket using unsigned account")
         resp = poll(self.acl_obj.get_object_acl, self.bucket_name, self.obj_name,
-                    condition="{}[1]['Grants'][0]['Permission']=='FULL_CONTROL'")
+                    condition=lambda resp: resp[1]['Grants'][0]['Permission'] == 'FULL_CONTROL')
         assert resp[0], resp[1]
         assert resp[1]["Grants"][0]["Permission"] == "FULL_CONTROL", resp[1]
         self.log.info(
@@ -841,7 +841,7 @@ class TestAllUsersObjectAcl:
             "Step 3: Changed object's acl to FULL_CONTROL for all users")
         self.log.info("Step 4: Verifying that object's acl is changed")
         resp = poll(self.acl_obj.get_object_acl, self.bucket_name, self.obj_name,
-                    condition="{}[1]['Grants'][0]['Permission']=='WRITE_ACP'")
+                    condition=lambda resp: resp[1]['Grants'][0]['Permission'] == 'WRITE_ACP')
         assert resp[0], resp[1]
         assert resp[1]["Grants"][0]["Permission"] == "WRITE_ACP", resp[1]
         self.log.info("Step 4: Verified that object's acl is changed")
@@ -161,7 +161,7 @@ class TestBucketACL:
         resp = self.s3_obj.create_bucket(self.bucket)
         assert_utils.assert_true(resp[0], resp[1])
         resp = s3_utils.poll(self.acl_obj.get_bucket_acl, self.bucket,
-                             condition="{}[1][1][0]['Permission']=='FULL_CONTROL'")
+                             condition=lambda resp: resp[1][1][0]['Permission'] == 'FULL_CONTROL')
         assert_utils.assert_true(resp[0], resp[1])
         assert_utils.assert_equals(resp[1][1][0]["Permission"], "FULL_CONTROL", resp[1])
         self.log.info("verify Get Bucket ACL of existing Bucket")
@@ -0,0 +1,286 @@
+"""Single pipeline queries building whole Performance statistics tables"""
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+# -*- coding: utf-8 -*-
+# !/usr/bin/python
+
+import numpy as np
+import pandas as pd
+
+from Performance.schemas import statistics_column_headings, multiple_buckets_headings, \
+    degraded_read_headings, get_benchmark_table_schema, get_degraded_table_schema
+from Performance.global_functions import sort_object_sizes_list, sort_builds_list, \
+    sort_sessions, get_db_details, round_off, makeconfig, config_path
+from Performance.mongodb_api import aggregate_documents
+
+OPERATIONS = ["Read", "Write"]
+CLUSTER_STATES = ['normal-read', 'degraded-read', 'recovered-read']
+DEGRADED_STATS = ["Throughput", "IOPS", "Latency", "TTFB"]
+# summaries maintained by tools/report/perf_rollup.py
+ROLLUP_SUFFIX = "_rollup"
+
+# group field: (row label of a db value, sort function of row labels)
+ROW_KEYS = {
+    'Object_Size': (lambda value: value.replace(' ', '').upper(), sort_object_sizes_list),
+    'Sessions': (int, sort_sessions),
+    'Build': (str, sort_builds_list),
+}
+
+BENCHMARK_ACCUMULATORS = {
+    "total_objs": {"$sum": "$Objects"},
+    "sum_throughput": {"$sum": "$Throughput"},
+    "sum_iops": {"$sum": "$IOPS"},
+    "avg_lat": {"$avg": "$Latency"},
+    "avg_lat_avg": {"$avg": "$Latency.Avg"},
+    "run_state": {"$addToSet": "$Run_State"},
+    "avg_ttfb_avg": {"$avg": "$TTFB.Avg"},
+    "avg_ttfb_99p": {"$avg": "$TTFB.Avg"},
+}
+
+
+def get_benchmark_pipeline(data, group_field):
+    """
+    Aggregation pipeline grouping matched documents by (group_field, Operation)
+
+    Args:
+        data: dictionary needed for the query
+        group_field: db key for table rows e.g. Object_Size, Sessions or Build
+
+    Returns:
+        list: aggregation pipeline
+    """
+    group = {"_id": {"key": f"${group_field}", "operation": "$Operation"}}
+    group.update(BENCHMARK_ACCUMULATORS)
+    return [
+        {"$match": get_benchmark_table_schema(data, group_field)},
+        {"$group": group}
+    ]
+
+
+def get_rollup_pipeline(data, group_field):
+    """
+    Aggregation pipeline like get_benchmark_pipeline on the rollup collection,
+    averages are rebuilt from the summed sums and counts of the summaries
+
+    Args:
+        data: dictionary needed for the query
+        group_field: db key for table rows e.g. Object_Size, Sessions or Build
+
+    Returns:
+        list: aggregation pipeline
+    """
+    group = {"_id": {"key": f"${group_field}", "operation": "$Operation"},
+             "failed_runs": {"$sum": "$Failed_Runs"}}
+    for metric in ["Objects", "Throughput", "IOPS", "Latency", "TTFB"]:
+        group[f"{metric}_sum"] = {"$sum": f"${metric}.sum"}
+        group[f"{metric}_count"] = {"$sum": f"${metric}.count"}
+    return [
+        {"$match": get_benchmark_table_schema(data, group_field)},
+        {"$group": group}
+    ]
+
+
+def from_rollup(doc):
+    """convert a get_rollup_pipeline result to a get_benchmark_pipeline result"""
+    def avg(metric):
+        return doc[f"{metric}_sum"] / doc[f"{metric}_count"] if doc[f"{metric}_count"] \
+            else None
+
+    return {
+        "_id": doc["_id"], "total_objs": doc["Objects_sum"],
+        "sum_throughput": doc["Throughput_sum"], "sum_iops": doc["IOPS_sum"],
+        "avg_lat": avg("Latency"), "avg_lat_avg": avg("Latency"),
+        "run_state": ["failed"] if doc["failed_runs"] else ["successful"],
+        "avg_ttfb_avg": avg("TTFB"), "avg_ttfb_99p": avg("TTFB"),
+    }
+
+
+def rollup_enabled():
+    """read rollup flag of PerfDB in configs.yml"""
+    return bool(makeconfig(config_path)["PerfDB"].get("rollup", False))
+
+
+def _round_column(series):
+    """round off all values of a column, missing values become NA"""
+    return series.map(round_off)
+
+
+def _sort_rows(frame, group_field):
+    """label rows and order them like the dropdown sort functions do"""
+    to_label, sort_labels = ROW_KEYS[group_field]
+    frame.index = [to_label(key) for key in frame.index]
+    frame = frame[~frame.index.duplicated()]
+    return frame.loc[sort_labels(list(frame.index))]
+
+
+def _to_table(frame, label, headings):
+    """convert frame with headings columns to table frame shown by dash"""
+    frame = frame[headings]
+    frame.insert(0, label, frame.index)
+    frame = frame.reset_index(drop=True)
+    frame.index += 1
+    return frame
+
+
+def build_benchmark_frame(docs, bench, group_field, label):
+    """
+    Build statistics table from grouped aggregation results in one step
+
+    Args:
+        docs: results of get_benchmark_pipeline
+        bench: benchmark name, S3bench, Hsbench or other
+        group_field: db key used for table rows
+        label: heading of the row label column
+
+    Returns:
+        dataframe: Pandas dataframe with one row per group_field value
+        run_states: list of run state per row
+    """
+    headings = statistics_column_headings if bench == 'S3bench' else multiple_buckets_headings
+    if not docs:
+        return pd.DataFrame(columns=[label] + headings), []
+
+    raw = pd.DataFrame(docs)
+    raw["key"] = raw["_id"].map(lambda _id: _id.get("key"))
+    raw["operation"] = raw["_id"].map(lambda _id: _id.get("operation"))
+    raw = raw[raw["key"].notna()]
+    failed = raw["run_state"].map(lambda states: 'failed' in states).groupby(raw["key"]).any()
+    values = raw.drop(columns=["_id", "run_state"]).set_index(["key", "operation"])
+    values = values.apply(pd.to_numeric, errors="coerce").unstack("operation")
+    values = values.reindex(columns=pd.MultiIndex.from_product(
+        [list(BENCHMARK_ACCUMULATORS), OPERATIONS]))
+
+    latency, scale = ("avg_lat_avg", 1000) if bench == 'S3bench' else ("avg_lat", 1)
+    table = pd.DataFrame(index=values.index)
+    samples = values[("total_objs", "Write")].fillna(values[("total_objs", "Read")])
+    table["Samples"] = samples.astype(object).where(samples.notna(), "NA")
+    for operation in OPERATIONS:
+        table[f"{operation} Throughput (MBps)"] = values[("sum_throughput", operation)]
+        table[f"{operation} IOPS"] = values[("sum_iops", operation)]
+        table[f"{operation} Latency (ms)"] = values[(latency, operation)] * scale
+    if bench == 'S3bench':
+        table["Read TTFB Avg (ms)"] = values[("avg_ttfb_avg", "Read")] * 1000
+        table["Read TTFB 99% (ms)"] = values[("avg_ttfb_99p", "Read")] * 1000
+    metrics = [heading for heading in headings if heading != "Samples"]
+    table[metrics] = table[metrics].apply(_round_column)
+
+    table = table[~(table[headings] == "NA").all(axis=1)]
+    table["failed"] = failed.reindex(table.index).fillna(False)
+    table = _sort_rows(table, group_field)
+    run_states = list(np.where(table["failed"], "failed", "successful"))
+    return _to_table(table, label, headings), run_states
+
+
+def get_benchmark_table(data, group_field, label):
+    """
+    Query statistics of all group_field values with a single aggregation
+
+    Args:
+        data: dictionary needed for the query
+        group_field: db key for table rows e.g. Object_Size, Sessions or Build
+        label: heading of the row label column
+
+    Returns:
+        dataframe: Pandas dataframe with queried data
+        run_states: list of run state per row
+    """
+    uri, db_name, db_collection = get_db_details(data['release'])
+    if rollup_enabled():
+        docs = aggregate_documents(get_rollup_pipeline(data, group_field), uri, db_name,
+                                   db_collection + ROLLUP_SUFFIX)
+        docs = [from_rollup(doc) for doc in docs]
+    else:
+        docs = aggregate_documents(get_benchmark_pipeline(data, group_field), uri, db_name,
+                                   db_collection)
+    return build_benchmark_frame(docs, data['name'], group_field, label)
+
+
+def get_degraded_pipeline(data):
+    """
+    Aggregation pipeline with first Read result per (Object_Size, Cluster_State)
+
+    Args:
+        data: dictionary needed for the query
+
+    Returns:
+        list: aggregation pipeline
+    """
+    group = {"_id": {"key": "$Object_Size", "state": "$Cluster_State"}}
+    group.update({stat: {"$first": f"${stat}"} for stat in DEGRADED_STATS})
+    return [
+        {"$match": get_degraded_table_schema(data, CLUSTER_STATES)},
+        {"$group": group}
+    ]
+
+
+def _stat_value(value):
+    """numeric value of a stat, average of stats stored with Avg/Min/Max"""
+    if isinstance(value, dict):
+        value = value.get("Avg")
+    return pd.to_numeric(value, errors="coerce")
+
+
+def build_degraded_frames(docs, bench):
+    """
+    Build one table per stat with normal, degraded and recovered read columns
+
+    Args:
+        docs: results of get_degraded_pipeline
+        bench: benchmark name, S3bench, Hsbench or other
+
+    Returns:
+        dataframes: list of Pandas dataframes, one per stat
+    """
+    stats = DEGRADED_STATS if bench == 'S3bench' else DEGRADED_STATS[:3]
+    label = 'Object Sizes'
+    if not docs:
+        return [pd.DataFrame(columns=[label] + degraded_read_headings) for _ in stats]
+
+    raw = pd.DataFrame(docs)
+    raw["key"] = raw["_id"].map(lambda _id: _id.get("key"))
+    raw["state"] = raw["_id"].map(lambda _id: _id.get("state"))
+    raw = raw[raw["key"].notna()]
+    dataframes = []
+    for stat in stats:
+        scale = 1000 if bench == 'S3bench' and stat in ["Latency", "TTFB"] else 1
+        column = raw[stat] if stat in raw else pd.Series(np.nan, index=raw.index)
+        values = pd.DataFrame({"key": raw["key"], "state": raw["state"],
+                               "value": column.map(_stat_value) * scale})
+        table = values.pivot(index="key", columns="state", values="value")
+        table = table.reindex(columns=CLUSTER_STATES)
+        table.columns = degraded_read_headings
+        table = table.apply(_round_column)
+        table = table[~(table == "NA").all(axis=1)]
+        dataframes.append(_to_table(_sort_rows(table, 'Object_Size'), label,
+                                    degraded_read_headings))
+    return dataframes
+
+
+def get_degraded_tables(data):
+    """
+    Query degraded read statistics of all object sizes with a single aggregation
+
+    Args:
+        data: dictionary needed for the query
+
+    Returns:
+        dataframes: list of Pandas dataframes, one per stat
+    """
+    uri, db_name, db_collection = get_db_details(data['release'])
+    docs = aggregate_documents(get_degraded_pipeline(data), uri, db_name, db_collection)
+    return build_degraded_frames(docs, data['name'])
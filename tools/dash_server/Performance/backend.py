@@ -26,10 +26,10 @@ import dash_html_components as html
 import plotly.graph_objs as go
 
 from Performance.schemas import *
-from Performance.global_functions import get_distinct_keys, sort_object_sizes_list, \
-    sort_builds_list, get_db_details, keys_exists, round_off, check_empty_list, \
-    sort_sessions
-from Performance.mongodb_api import find_documents, count_documents, get_aggregate
+from Performance.global_functions import get_db_details, keys_exists, round_off, \
+    check_empty_list
+from Performance.mongodb_api import find_documents, count_documents
+from Performance.aggregate_queries import get_benchmark_table, get_degraded_tables
 from Performance.styles import style_dashtable_header, style_table_cell
 
 
@@ -86,38 +86,7 @@ def get_data_for_stats(data):
     Returns:
         dataframe: Pandas dataframe with queried data
     """
-    data_needed_for_query = data.copy()
-    query = get_statistics_schema(data_needed_for_query)
-    objects = get_distinct_keys(
-        data_needed_for_query['release'], 'Object_Size', query)
-    objects = sort_object_sizes_list(objects)
-
-    if data_needed_for_query['name'] == 'S3bench':
-        # stats_headings = statistics_column_headings.copy()
-        results = {
-            'Object Sizes': statistics_column_headings
-        }
-    else:
-        # mult_headings = multiple_buckets_headings.copy()
-        results = {
-            'Object Sizes': multiple_buckets_headings
-        }
-
-    run_state_list = []
-    for obj in objects:
-        data_needed_for_query['objsize'] = obj
-        temp_data, run_state = get_benchmark_data(data_needed_for_query)
-        if not check_empty_list(temp_data):
-            run_state_list.append(run_state)
-            results[obj] = temp_data
-
-    df = pd.DataFrame(results)
-    df = df.T
-    df.reset_index(inplace=True)
-    df.columns = df.iloc[0]
-    df = df[1:]
-
-    return df, run_state_list
+    return get_benchmark_table(data.copy(), 'Object_Size', 'Object Sizes')
 
 
 def get_data_for_degraded_stats(data):
@@ -128,100 +97,7 @@ def get_data_for_degraded_stats(data):
     Returns:
         dataframe: list of Pandas dataframe with queried data
     """
-    data_needed_for_query = data.copy()
-    query = get_statistics_schema(data_needed_for_query)
-    objects = get_distinct_keys(
-        data_needed_for_query['release'], 'Object_Size', query)
-    objects = sort_object_sizes_list(objects)
-    results = {
-        'Throughput':
-            {
-                'Object Sizes': statistics_column_headings
-            },
-        'IOPS':
-            {
-                'Object Sizes': statistics_column_headings
-            },
-        'Latency':
-            {
-                'Object Sizes': statistics_column_headings
-            },
-        'TTFB':
-            {
-                'Object Sizes': statistics_column_headings
-            }
-    }
-    if data_needed_for_query['name'] != 'S3bench':
-        del results['TTFB']
-
-    for obj in objects:
-        data_needed_for_query['objsize'] = obj
-
-        if keys_exists(data_needed_for_query, 'degraded_cluster'):
-            temp_data = get_degraded_cluster_data(data_needed_for_query)
-            if not check_empty_list(temp_data):
-                for stat in temp_data:
-                    results[stat][obj] = temp_data
-
-    dataframes = []
-    for stat in results:
-        dataframe = pd.DataFrame(results[stat])
-        dataframe = dataframe.T
-        dataframe.reset_index(inplace=True)
-        dataframe.columns = dataframe.iloc[0]
-        dataframe = dataframe[1:]
-        dataframes.append(dataframe)
-
-    return dataframes
-
-
-def get_degraded_cluster_data(data_needed_for_query):
-    """
-    function to organise and get data required for degraded cluster view
-
-    Args:
-        data: dictionary needed for the query
-
-    Returns:
-        results: dictionary with data for this particular instance
-    """
-    temp_data = {}
-    data_needed_for_query['operation'] = 'Read'
-    cluster_states = ['normal-read', 'degraded-read', 'recovered-read']
-
-    if data_needed_for_query["name"] == 'S3bench':
-        stats = ["Throughput", "IOPS", "Latency", "TTFB"]
-    else:
-        stats = ["Throughput", "IOPS", "Latency"]
-
-    for stat in stats:
-        temp_data[stat] = []
-
-    uri, db_name, db_collection = get_db_details(
-        data_needed_for_query['release'])
-
-    for state in cluster_states:
-        data_needed_for_query['cluster_state'] = state
-        query = get_degraded_schema(data_needed_for_query)
-        count = count_documents(query=query, uri=uri, db_name=db_name,
-                                collection=db_collection)
-        db_data = find_documents(query=query, uri=uri, db_name=db_name,
-                                 collection=db_collection)
-
-        for stat in stats:
-            if data_needed_for_query["name"] == 'S3bench' and stat in ["Latency", "TTFB"]:
-                temp_data[stat].append(get_average_data(
-                    count, db_data, stat, "Avg", 1000))
-            elif data_needed_for_query["name"] == 'S3bench':
-                temp_data[stat].append(get_data(count, db_data, stat, 1))
-            else:
-                try:
-                    temp_data[stat].append(get_data(count, db_data, stat, 1))
-                except TypeError:
-                    temp_data[stat].append(get_average_data(
-                        count, db_data, stat, "Avg", 1))
-
-    return temp_data
+    return get_degraded_tables(data.copy())
 
 
 def get_data_for_graphs(data, xfilter, xfilter_tag):
@@ -239,141 +115,14 @@ def get_data_for_graphs(data, xfilter, xfilter_tag):
     data_needed_for_query = data.copy()
 
     if data_needed_for_query['sessions'] == 'all' or data_needed_for_query['all_sessions_plot']:
-        query = get_multi_concurrency_schema(data, xfilter, xfilter_tag)
-        sessions = get_distinct_keys(
-            data_needed_for_query['release'], 'Sessions', query)
-        sessions = sort_sessions(sessions)
-
-        if data_needed_for_query['name'] == 'S3bench':
-            results = {
-                'Concurrency': statistics_column_headings
-            }
-        else:
-            results = {
-                'Concurrency': multiple_buckets_headings
-            }
-
-        for session in sessions:
-            data_needed_for_query['sessions'] = session
-            temp_data, _ = get_benchmark_data(data_needed_for_query)
-            if not check_empty_list(temp_data):
-                results[session] = temp_data
-
+        dataframe, _ = get_benchmark_table(data_needed_for_query, 'Sessions', 'Concurrency')
     elif xfilter == 'Build':
-        query = get_graphs_schema(data_needed_for_query, xfilter, xfilter_tag)
-        objects = get_distinct_keys(
-            data_needed_for_query['release'], 'Object_Size', query)
-        objects = sort_object_sizes_list(objects)
-
-        if data_needed_for_query['name'] == 'S3bench':
-            results = {
-                'Object Sizes': statistics_column_headings
-            }
-        else:
-            results = {
-                'Object Sizes': multiple_buckets_headings
-            }
-
-        for obj in objects:
-            data_needed_for_query['objsize'] = obj
-            temp_data, _ = get_benchmark_data(data_needed_for_query)
-            if not check_empty_list(temp_data):
-                results[obj] = temp_data
+        dataframe, _ = get_benchmark_table(data_needed_for_query, 'Object_Size', 'Object Sizes')
     else:
-        query = get_graphs_schema(data_needed_for_query, xfilter, xfilter_tag)
-        builds = get_distinct_keys(
-            data_needed_for_query['release'], 'Build', query)
-        builds = sort_builds_list(builds)
-
-        if data_needed_for_query['name'] == 'S3bench':
-            results = {
-                'Builds': statistics_column_headings
-            }
-        else:
-            results = {
-                'Builds': multiple_buckets_headings
-            }
-        for build in builds:
-            data_needed_for_query['build'] = build
-            temp_data, _ = get_benchmark_data(data_needed_for_query)
-            if not check_empty_list(temp_data):
-                results[build] = temp_data
-
-    dataframe = pd.DataFrame(results)
-    dataframe = dataframe.T
-    dataframe.reset_index(inplace=True)
-    dataframe.columns = dataframe.iloc[0]
-    dataframe = dataframe[1:]
+        dataframe, _ = get_benchmark_table(data_needed_for_query, 'Build', 'Builds')
     return dataframe
 
 
-def get_benchmark_data(data_needed_for_query):  # pylint: disable=too-many-branches
-    """
-    Granularized function to query data from database for perf metrics
-
-    Args:
-        data: dictionary needed for the query
-
-    Returns:
-        results: dictionary to with appended data for this particular instance
-    """
-    temp_data = []
-    run_state = "successful"
-    added_objects = "NA"
-    skipttfb = True
-    operations = ["Read", "Write"]
-
-
-    uri, db_name, db_collection = get_db_details(
-        data_needed_for_query['release'])
-
-    for operation in operations:
-        data_needed_for_query['operation'] = operation
-
-        query = get_complete_schema(data_needed_for_query)
-        group_query = {
-            "_id": "null",
-            "total_objs": { "$sum": "$Objects"},
-            "sum_throughput": {"$sum": "$Throughput"},
-            "sum_iops": {"$sum": "$IOPS"},
-            "avg_lat": {"$avg": "$Latency"},
-            "avg_lat_avg": {"$avg": "$Latency.Avg"},
-            "run_state": { "$addToSet": "$Run_State"},
-            "avg_ttfb_avg": {"$avg": "$TTFB.Avg"},
-            "avg_ttfb_99p": {"$avg": "$TTFB.Avg"},
-            }
-
-        cursor = get_aggregate(query=query, group_query=group_query, uri=uri, db_name=db_name,
-                        collection=db_collection)
-        if not cursor:
-            cursor = {
-            "_id": "null", "total_objs": "NA", "sum_throughput": "NA", "sum_iops": "NA",
-            "avg_lat": "NA", "avg_lat_avg": "NA", "run_state": "NA", "avg_ttfb_avg": "NA",
-            "avg_ttfb_99p": "NA"}
-
-        if cursor['total_objs'] != "NA":
-            added_objects = cursor['total_objs']
-        if 'failed' in cursor['run_state']:
-            run_state = 'failed'
-
-        temp_data.append(round_off(cursor['sum_throughput']))
-        temp_data.append(round_off(cursor['sum_iops']))
-        if data_needed_for_query["name"] == 'Hsbench':
-            temp_data.append(round_off(cursor['avg_lat']))
-        elif data_needed_for_query["name"] == 'S3bench':
-            temp_data.append(round_off(cursor['avg_lat_avg']*1000))
-            if skipttfb:
-                temp_data.append(round_off(cursor['avg_ttfb_avg']*1000))
-                temp_data.append(round_off(cursor['avg_ttfb_99p']*1000))
-        else:
-            temp_data.append(round_off(cursor['avg_lat']))
-
-        skipttfb = False
-
-    temp_data.insert(0, added_objects)
-    return temp_data, run_state
-
-
 def get_dash_table_from_dataframe(dataframe, bench, column_id, states=None):
     """
     functional to get dash table to show stats from dataframe
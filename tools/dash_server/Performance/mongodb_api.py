@@ -17,12 +17,19 @@
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 #
 # -*- coding: utf-8 -*-
+import os
 import sys
 
-from pymongo import MongoClient
 from pymongo.errors import PyMongoError
 from pymongo.errors import ServerSelectionTimeoutError, OperationFailure
 
+# The tools run from their own directory, commons is imported from the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+# pylint: disable=wrong-import-position
+from commons.utils import db_utils  # noqa: E402
+
 
 def pymongo_exception(func):
     """Decorator for pymongo exceptions"""
@@ -69,11 +76,8 @@ def count_documents(query: dict,
     Returns:
         On success returns number of documents
     """
-    with MongoClient(uri) as client:
-        pymongo_db = client[db_name]
-        tests = pymongo_db[collection]
-        result = tests.count_documents(query)
-        return result
+    return db_utils.cached_query("count", uri, db_name, collection, (query,),
+                                 lambda tests: tests.count_documents(query))
 
 
 @pymongo_exception
@@ -92,13 +96,10 @@ def find_documents(query: dict,
         collection: Collection name in database
 
     Returns:
-        On success returns documents
+        On success returns list of documents
     """
-    with MongoClient(uri) as client:
-        pymongo_db = client[db_name]
-        tests = pymongo_db[collection]
-        result = tests.find(query)
-        return result
+    return db_utils.cached_query("find", uri, db_name, collection, (query,),
+                                 lambda tests: list(tests.find(query)))
 
 
 @pymongo_exception
@@ -121,11 +122,8 @@ def find_distinct_values(key: str,
     Returns:
         On success returns array of fields
     """
-    with MongoClient(uri) as client:
-        pymongo_db = client[db_name]
-        tests = pymongo_db[collection]
-        result = tests.distinct(key, query)
-        return result
+    return db_utils.cached_query("distinct", uri, db_name, collection, (key, query),
+                                 lambda tests: tests.distinct(key, query))
 
 
 # collection.find(query).sort([("_id", pymongo.DESCENDING)]).limit(1)
@@ -144,14 +142,31 @@ def get_aggregate(query: dict, group_query: dict, uri: str, db_name: str, collec
     Returns:
         On success returns number of documents
     """
-    with MongoClient(uri) as client:
-        pymongo_db = client[db_name]
-        tests = pymongo_db[collection]
-        result = tests.aggregate([
-            {"$match": query},
-            {"$group": group_query}
-        ])
-        try:
-            return list(result)[0]
-        except IndexError:
-            return {}
+    pipeline = [
+        {"$match": query},
+        {"$group": group_query}
+    ]
+    result = db_utils.cached_query("aggregate", uri, db_name, collection, (pipeline,),
+                                   lambda tests: list(tests.aggregate(pipeline)))
+    try:
+        return result[0]
+    except IndexError:
+        return {}
+
+
+@pymongo_exception
+def aggregate_documents(pipeline: list, uri: str, db_name: str, collection: str) -> list:
+    """
+    Run an aggregation pipeline on MongoDB database
+
+    Args:
+        pipeline: List of aggregation stages
+        uri: URI of MongoDB database
+        db_name: Database name
+        collection: Collection name in database
+
+    Returns:
+        On success returns list of result documents
+    """
+    return db_utils.cached_query("aggregate", uri, db_name, collection, (pipeline,),
+                                 lambda tests: list(tests.aggregate(pipeline)))
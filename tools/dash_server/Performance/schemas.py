@@ -141,6 +141,51 @@ def get_degraded_schema(data):
     return entry
 
 
+def get_benchmark_table_schema(data, group_field):
+    """
+    function for getting performance schema of a whole statistics table,
+    Read and Write results of all values of group_field are matched at once
+
+    Args:
+        data: data needed for query
+        group_field: db key on which table rows are grouped
+
+    Returns:
+        dict: data dict with db key mapped with given data
+    """
+    entry = get_common_schema(data)
+    entry['Build'] = data.get('build')
+    entry['Object_Size'] = data.get('objsize')
+    entry['Operation'] = {"$in": ["Read", "Write"]}
+    entry['Name'] = data['name']
+    entry['Cluster_State'] = {"$exists": False}
+    entry['Additional_op'] = {"$exists": False}
+    del entry[group_field]
+
+    return entry
+
+
+def get_degraded_table_schema(data, cluster_states):
+    """
+    function for getting degraded cluster read schema of all object sizes
+    and cluster states
+
+    Args:
+        data: data needed for query
+        cluster_states: list of cluster states to be matched
+
+    Returns:
+        dict: data dict with db key mapped with given data
+    """
+    entry = get_common_schema(data)
+    entry['Build'] = data['build']
+    entry['Operation'] = 'Read'
+    entry['Name'] = data['name']
+    entry['Cluster_State'] = {"$in": cluster_states}
+
+    return entry
+
+
 def get_copyobject_schema(data):
     """
     function for getting complete performance schema
@@ -171,6 +216,8 @@ multiple_buckets_headings = [
     'Samples', 'Read Throughput (MBps)', 'Read IOPS', 'Read Latency (ms)',
     'Write Throughput (MBps)', 'Write IOPS', 'Write Latency (ms)']
 
+degraded_read_headings = ['Normal Read', 'Degraded Read', 'Recovered Read']
+
 bucketops_headings = [
     'Create Buckets (BINIT)', 'Put Objects (PUT)', 'Listing Objects (LIST)', 'Get Objects (GET)',
     'Delete Objects (DEL)', 'Clear Buckets (BCLR)', 'Delete Buckets (BDEL)']
@@ -25,6 +25,7 @@ from copy import deepcopy
 import common
 import jira_api
 import mongodb_api
+import perf_rollup
 
 OPERATIONS = ["write", "read"]
 STATS = ["Throughput", "Latency", "IOPS"]
@@ -78,7 +79,6 @@ def get_component_issue_summary(test_plans: list, username: str, password: str):
     return data
 
 
-# pylint: disable-msg=too-many-locals
 def get_single_bucket_perf_stats(build, branch, uri, db_name, db_collection):
     """Get single bucket performance data for engineering report"""
     row_2 = deepcopy(OBJECTS_SIZES)
@@ -86,6 +86,9 @@ def get_single_bucket_perf_stats(build, branch, uri, db_name, db_collection):
     data = [["Single Bucket Performance Statistics (Average) using S3Bench"], row_2]
     operations = ["Write", "Read"]
     stats = ["Throughput", "Latency", "IOPS", "TTFB"]
+    summaries = perf_rollup.first_summaries({'Branch': branch, 'Build': build},
+                                            ['Object_Size', 'Operation'], uri, db_name,
+                                            db_collection)
     for operation in operations:
         for stat in stats:
             if stat in ["Latency", "TTFB"]:
@@ -95,31 +98,27 @@ def get_single_bucket_perf_stats(build, branch, uri, db_name, db_collection):
             else:
                 temp_data = [f"{operation} {stat}"]
             for obj_size in OBJECTS_SIZES:
-                query = {'Branch': branch, 'Build': build, 'Operation': operation,
-                         'Object_Size': obj_size}
-                count = mongodb_api.count_documents(query=query, uri=uri, db_name=db_name,
-                                                    collection=db_collection)
-                db_data = mongodb_api.find_documents(query=query, uri=uri, db_name=db_name,
-                                                     collection=db_collection)
-                if stat in ["Latency", "TTFB"]:
-                    if count > 0 and common.keys_exists(db_data[0], stat, "Avg"):
-                        temp_data.append(common.round_off(db_data[0][stat]["Avg"] * 1000))
-                    else:
-                        temp_data.append("-")
+                summary = summaries.get((obj_size, operation), {})
+                value = perf_rollup.average(summary, stat)
+                if value is None:
+                    temp_data.append("-")
+                elif stat in ["Latency", "TTFB"]:
+                    temp_data.append(common.round_off(value * 1000))
+                elif "Count_of_Servers" in summary:
+                    temp_data.append(common.round_off(value / summary["Count_of_Servers"]))
                 else:
-                    if count > 0 and common.keys_exists(db_data[0], stat) \
-                            and "Count_of_Servers" in db_data[0]:
-                        temp_data.append(
-                            common.round_off(db_data[0][stat] / db_data[0]["Count_of_Servers"]))
-                    else:
-                        temp_data.append("-")
+                    temp_data.append("-")
             data.extend([temp_data])
     return data
 
 
 def get_tool_data(build, db_data, tool):
-    """Get data for given tool."""
-    temp_data = []
+    """Get data rows for given tool."""
+    rows = []
+    summaries = perf_rollup.first_summaries(
+        {'Build': build, 'Name': tool, 'Branch': db_data['branch']},
+        ['Operation', 'Object_Size', 'Buckets', 'Sessions'], db_data['uri'],
+        db_data['db_name'], db_data['db_collection'])
     for configs in CONFIG:
         row_num = 0
         for operation in OPERATIONS:
@@ -134,25 +133,18 @@ def get_tool_data(build, db_data, tool):
                     head = f"{configs[1]} Sessions"
                 temp_data = [head, f"{operation.capitalize()} {stat}"]
                 for obj_size in OBJECTS_SIZES:
-                    query = {'Build': build, 'Name': tool, 'Operation': operation,
-                             'Object_Size': obj_size, 'Buckets': configs[0],
-                             'Sessions': configs[1], "Branch": db_data['branch']}
-                    count = mongodb_api.count_documents(query=query, uri=db_data['uri'],
-                                                        db_name=db_data['db_name'],
-                                                        collection=db_data['db_collection'])
-                    db_data = mongodb_api.find_documents(query=query, uri=db_data['uri'],
-                                                         db_name=db_data['db_name'],
-                                                         collection=db_data['db_collection'])
-
-                    if count > 0 and stat == "Throughput" and common.keys_exists(db_data[0],
-                                                                                 stat):
-                        temp_data.append(
-                            common.round_off(db_data[0][stat] / db_data[0]["Count_of_Servers"]))
-                    elif count > 0 and common.keys_exists(db_data[0], stat):
-                        temp_data.append(common.round_off(db_data[0][stat]))
+                    summary = summaries.get(
+                        (operation.capitalize(), obj_size, configs[0], configs[1]), {})
+                    value = perf_rollup.average(summary, stat)
+                    servers = summary.get("Count_of_Servers", 0)
+                    if value is not None and stat == "Throughput" and servers:
+                        temp_data.append(common.round_off(value / servers))
+                    elif value is not None and stat != "Throughput":
+                        temp_data.append(common.round_off(value))
                     else:
                         temp_data.append("-")
-    return temp_data
+                rows.append(temp_data)
+    return rows
 
 
 def get_bench_data(build, uri, db_name, db_collection, branch):
@@ -160,7 +152,7 @@ def get_bench_data(build, uri, db_name, db_collection, branch):
     data = []
     db_data = {'uri': uri, 'db_name': db_name, 'db_collection': db_collection, 'branch': branch}
     for tool in ["Hsbench", "Cosbench"]:
-        data.append(get_tool_data(build, db_data, tool))
+        data.extend(get_tool_data(build, db_data, tool))
     return data
 
 
@@ -255,6 +247,7 @@ def main():
     builds = [x["buildNo"] if x != 'NA' else 'NA' for x in tps_info]
 
     branch = tps_info[0]["branch"]
+    perf_rollup.refresh_or_read_raw(uri, db_name, db_collection)
 
     data = []
     data.extend(jira_api.get_main_table_data(tps_info[0], "Engg"))
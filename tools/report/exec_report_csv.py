@@ -26,7 +26,7 @@ from jira import JIRA
 
 import common
 import jira_api
-import mongodb_api
+import perf_rollup
 
 
 def get_feature_breakdown_summary_table_data(test_plan: str, username: str, password: str):
@@ -101,6 +101,9 @@ def get_single_bucket_perf_data(build, uri, db_name, db_collection):
     operations = ["Write", "Read"]
     stats = ["Throughput", "Latency"]
     objects_sizes = ["4Kb", "256Mb"]
+    summaries = perf_rollup.first_summaries({'Build': build, 'Name': 'S3bench'},
+                                            ['Object_Size', 'Operation'], uri, db_name,
+                                            db_collection)
     for operation in operations:
         for stat in stats:
             if stat == "Latency":
@@ -108,24 +111,14 @@ def get_single_bucket_perf_data(build, uri, db_name, db_collection):
             else:
                 temp_data = [f"{operation} {stat} (ms)"]
             for objects_size in objects_sizes:
-                query = {'Build': build, 'Name': 'S3bench', 'Object_Size': objects_size,
-                         'Operation': operation}
-                count = mongodb_api.count_documents(query=query, uri=uri, db_name=db_name,
-                                                    collection=db_collection)
-                db_data = mongodb_api.find_documents(query=query, uri=uri, db_name=db_name,
-                                                     collection=db_collection)
-                if stat == "Latency":
-                    if count > 0 and common.keys_exists(db_data[0], stat, "Avg"):
-                        temp_data.append(common.round_off(db_data[0][stat]["Avg"] * 1000))
-                    else:
-                        temp_data.append("-")
-                elif stat == "Throughput":
-                    if count > 0 and common.keys_exists(db_data[0], stat):
-                        temp_data.append(common.round_off(db_data[0][stat]))
-                    else:
-                        temp_data.append("-")
-                else:
+                value = perf_rollup.average(summaries.get((objects_size, operation), {}),
+                                            stat)
+                if value is None:
                     temp_data.append("-")
+                elif stat == "Latency":
+                    temp_data.append(common.round_off(value * 1000))
+                else:
+                    temp_data.append(common.round_off(value))
             data.extend([temp_data])
     return data
 
@@ -139,6 +132,7 @@ def main():
     tps_info = [jira_api.get_details_from_test_plan(test_plan, username, password) if
                 test_plan else "NA" for test_plan in test_plans]
     builds = [x["buildNo"] if x != 'NA' else 'NA' for x in tps_info]
+    perf_rollup.refresh_or_read_raw(uri, db_name, db_collection)
 
     data = []
     data.extend(jira_api.get_main_table_data(tps_info[0], "Exec"))
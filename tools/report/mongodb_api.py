@@ -17,12 +17,19 @@
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 #
 # -*- coding: utf-8 -*-
+import os
 import sys
 
-from pymongo import MongoClient
 from pymongo.errors import PyMongoError
 from pymongo.errors import ServerSelectionTimeoutError, OperationFailure
 
+# The tools run from their own directory, commons is imported from the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+# pylint: disable=wrong-import-position
+from commons.utils import db_utils  # noqa: E402
+
 
 def pymongo_exception(func):
     """Decorator for pymongo exceptions"""
@@ -68,11 +75,8 @@ def count_documents(query: dict,
     Returns:
         On success returns number of documents
     """
-    with MongoClient(uri) as client:
-        pymongo_db = client[db_name]
-        tests = pymongo_db[collection]
-        result = tests.count_documents(query)
-        return result
+    return db_utils.cached_query("count", uri, db_name, collection, (query,),
+                                 lambda tests: tests.count_documents(query))
 
 
 @pymongo_exception
@@ -91,10 +95,7 @@ def find_documents(query: dict,
         collection: Collection name in database
 
     Returns:
-        On success returns documents
+        On success returns list of documents
     """
-    with MongoClient(uri) as client:
-        pymongo_db = client[db_name]
-        tests = pymongo_db[collection]
-        result = tests.find(query)
-        return result
+    return db_utils.cached_query("find", uri, db_name, collection, (query,),
+                                 lambda tests: list(tests.find(query)))
@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+"""Pre-aggregated performance summaries read by reports and the dashboard."""
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+# Every raw benchmark document of a results collection (one collection per
+# release) is folded into one summary document per KEY_FIELDS value in
+# "<collection>_rollup". A summary keeps sum and count of every metric, so
+# averages and sums are read without scanning the raw runs.
+#
+# Usage:
+#   python3 perf_rollup.py backfill   rebuild all summaries from raw documents
+#   python3 perf_rollup.py refresh    fold documents inserted after the watermark
+#   python3 perf_rollup.py status     print watermark of the collection
+#
+# refresh is incremental: documents with an ObjectId above the watermark of the
+# collection are read, every summary they touch is recomputed from all of its
+# raw documents and the watermark moves to the last folded document. Summaries
+# are replaced, not incremented, so an interrupted or repeated refresh is safe.
+# Documents younger than LAG seconds are left for the next refresh because
+# ObjectIds are generated by the inserting clients. Updates or deletes of raw
+# documents need a backfill. A backfill builds the summaries in a scratch
+# collection and renames it over the rollup, readers never see it empty.
+#
+# Reports call refresh_or_read_raw: with read only credentials the rollup is
+# not written and summaries are computed from the raw documents instead.
+import argparse
+import datetime
+import json
+import threading
+from typing import Dict
+from typing import Iterable
+from typing import List
+
+from bson import ObjectId
+from pymongo.errors import PyMongoError
+
+import common
+import mongodb_api
+from mongodb_api import db_utils
+
+KEY_FIELDS = ["Branch", "Build", "Name", "Object_Size", "Operation", "Buckets", "Sessions",
+              "OS", "Count_of_Servers", "Count_of_Clients", "Percentage_full", "Iteration",
+              "Custom", "Cluster_State", "Additional_op"]
+METRICS = ["Objects", "Throughput", "IOPS", "Latency", "TTFB"]
+ROLLUP_SUFFIX = "_rollup"
+STATE_COLLECTION = "rollup_state"
+BATCH_SIZE = 5000
+#: Seconds raw documents must be old before refresh folds them.
+LAG = 60
+SCRATCH_SUFFIX = "_rebuild"
+
+# raw collections whose rollup could not be refreshed, their summaries are
+# computed from raw documents
+_READ_RAW = set()
+_READ_RAW_LOCK = threading.Lock()
+
+
+def rollup_collection(collection: str) -> str:
+    """Name of the summary collection of a raw results collection."""
+    return collection + ROLLUP_SUFFIX
+
+
+def group_key(doc: dict) -> tuple:
+    """KEY_FIELDS values of a raw document, missing fields are None."""
+    return tuple(doc.get(field) for field in KEY_FIELDS)
+
+
+def key_filter(key: tuple) -> dict:
+    """Query matching raw documents of a key, None matches missing fields."""
+    return dict(zip(KEY_FIELDS, key))
+
+
+def metric_value(doc: dict, metric: str):
+    """Numeric value of a metric, Avg of metrics stored with Avg/Min/Max."""
+    value = doc.get(metric)
+    if isinstance(value, dict):
+        value = value.get("Avg")
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    return None
+
+
+def summarize(docs: Iterable[dict]) -> Dict[tuple, dict]:
+    """
+    Fold raw documents into summaries.
+
+    Returns: {key: {"_id": .., <key fields>, "Runs": 2, "Failed_Runs": 0,
+                    "Throughput": {"sum": 210.5, "count": 2}, ..}}
+    """
+    summaries = {}
+    for doc in docs:
+        key = group_key(doc)
+        summary = summaries.get(key)
+        if summary is None:
+            summary = {"_id": json.dumps(key, default=str)}
+            summary.update({field: value for field, value in zip(KEY_FIELDS, key)
+                            if value is not None})
+            summary.update({"Runs": 0, "Failed_Runs": 0, "First_Run": doc["_id"],
+                            "Last_Run": doc["_id"]})
+            summary.update({metric: {"sum": 0, "count": 0} for metric in METRICS})
+            summaries[key] = summary
+        summary["Runs"] += 1
+        if doc.get("Run_State") == "failed":
+            summary["Failed_Runs"] += 1
+        summary["First_Run"] = min(summary["First_Run"], doc["_id"])
+        summary["Last_Run"] = max(summary["Last_Run"], doc["_id"])
+        for metric in METRICS:
+            value = metric_value(doc, metric)
+            if value is not None:
+                summary[metric]["sum"] += value
+                summary[metric]["count"] += 1
+    return summaries
+
+
+def average(summary: dict, metric: str):
+    """Average of a metric over the runs of a summary, None without values."""
+    values = summary.get(metric) or {}
+    if not values.get("count"):
+        return None
+    return values["sum"] / values["count"]
+
+
+def _raw_docs(raw, query: dict, batch_size: int):
+    """Raw documents of query in _id order with the fields summaries need."""
+    projection = {field: 1 for field in KEY_FIELDS + METRICS + ["Run_State"]}
+    return raw.find(query, projection).sort("_id", 1).batch_size(batch_size)
+
+
+def _write(rollup, summaries: Dict[tuple, dict], replace: bool = True) -> None:
+    """Replace summaries in the rollup collection, insert them into an empty one."""
+    now = datetime.datetime.utcnow()
+    docs = list(summaries.values())
+    for summary in docs:
+        summary["Updated"] = now
+    if not replace:
+        for start in range(0, len(docs), BATCH_SIZE):
+            rollup.insert_many(docs[start:start + BATCH_SIZE], ordered=False)
+        return
+    for summary in docs:
+        rollup.replace_one({"_id": summary["_id"]}, summary, upsert=True)
+
+
+def _set_watermark(database, collection: str, watermark: ObjectId, folded: int) -> None:
+    """Record the last folded raw document of collection."""
+    database[STATE_COLLECTION].update_one(
+        {"_id": collection},
+        {"$set": {"watermark": watermark, "updated": datetime.datetime.utcnow()},
+         "$inc": {"folded": folded}}, upsert=True)
+
+
+def _get_watermark(uri: str, db_name: str, collection: str) -> dict:
+    """State of the rollup of collection, None before the first backfill."""
+    database = db_utils.get_client(uri)[db_name]
+    return database[STATE_COLLECTION].find_one({"_id": collection})
+
+
+def _backfill(uri: str, db_name: str, collection: str, batch_size: int = BATCH_SIZE) -> int:
+    """Rebuild all summaries of collection, see backfill."""
+    database = db_utils.get_client(uri)[db_name]
+    raw = database[collection]
+    last = raw.find_one({}, {"_id": 1}, sort=[("_id", -1)])
+    if last is None:
+        return 0
+    summaries = summarize(_raw_docs(raw, {"_id": {"$lte": last["_id"]}}, batch_size))
+    # build aside and swap in, the rollup is never seen empty or half written
+    scratch = database[rollup_collection(collection) + SCRATCH_SUFFIX]
+    scratch.drop()
+    scratch.create_index([("Build", 1), ("Name", 1), ("Object_Size", 1), ("Operation", 1)])
+    _write(scratch, summaries, replace=False)
+    scratch.rename(rollup_collection(collection), dropTarget=True)
+    folded = sum(summary["Runs"] for summary in summaries.values())
+    database[STATE_COLLECTION].replace_one(
+        {"_id": collection},
+        {"_id": collection, "watermark": last["_id"], "folded": folded,
+         "updated": datetime.datetime.utcnow()}, upsert=True)
+    db_utils.QUERY_CACHE.invalidate(db_name, rollup_collection(collection))
+    return folded
+
+
+def _refresh(uri: str, db_name: str, collection: str, batch_size: int = BATCH_SIZE,
+             lag: float = LAG) -> int:
+    """Fold raw documents inserted after the watermark, see refresh."""
+    state = _get_watermark(uri, db_name, collection)
+    if state is None:
+        return _backfill(uri, db_name, collection, batch_size)
+    database = db_utils.get_client(uri)[db_name]
+    raw, rollup = database[collection], database[rollup_collection(collection)]
+    # ObjectId timestamps have second resolution, include the whole cutoff second
+    cutoff = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(seconds=lag)
+    upper = ObjectId.from_datetime(cutoff.replace(microsecond=0) + datetime.timedelta(seconds=1))
+    watermark, folded = state["watermark"], 0
+    while True:
+        new_docs = list(raw.find({"_id": {"$gt": watermark, "$lt": upper}},
+                                 {field: 1 for field in KEY_FIELDS}
+                                 ).sort("_id", 1).limit(batch_size))
+        if not new_docs:
+            break
+        keys = {group_key(doc) for doc in new_docs}
+        watermark = new_docs[-1]["_id"]
+        # Recompute touched summaries up to the new watermark only, later
+        # documents are folded by the next batch.
+        summaries = dict()
+        key_list = list(keys)
+        for start in range(0, len(key_list), 100):
+            query = {"$or": [key_filter(key) for key in key_list[start:start + 100]],
+                     "_id": {"$lte": watermark}}
+            summaries.update(summarize(_raw_docs(raw, query, batch_size)))
+        _write(rollup, summaries)
+        _set_watermark(database, collection, watermark, len(new_docs))
+        folded += len(new_docs)
+    if folded:
+        db_utils.QUERY_CACHE.invalidate(db_name, rollup_collection(collection))
+    return folded
+
+
+@mongodb_api.pymongo_exception
+def get_watermark(uri: str, db_name: str, collection: str) -> dict:
+    """State of the rollup of collection, None before the first backfill."""
+    return _get_watermark(uri, db_name, collection)
+
+
+@mongodb_api.pymongo_exception
+def backfill(uri: str, db_name: str, collection: str, batch_size: int = BATCH_SIZE) -> int:
+    """
+    Rebuild all summaries of collection from its raw documents.
+    Returns number of raw documents folded.
+    """
+    return _backfill(uri, db_name, collection, batch_size)
+
+
+@mongodb_api.pymongo_exception
+def refresh(uri: str, db_name: str, collection: str, batch_size: int = BATCH_SIZE,
+            lag: float = LAG) -> int:
+    """
+    Fold raw documents inserted after the watermark, backfills on first use.
+    Returns number of new raw documents folded.
+    """
+    return _refresh(uri, db_name, collection, batch_size, lag)
+
+
+def refresh_or_read_raw(uri: str, db_name: str, collection: str) -> bool:
+    """
+    Refresh the rollup of collection for a report. If it cannot be written, e.g.
+    with read only credentials, summaries of collection are computed from its raw
+    documents instead of failing the report.
+    Returns True if the rollup is used.
+    """
+    try:
+        folded = _refresh(uri, db_name, collection)
+    except PyMongoError as error:
+        print(f"Rollup of {collection} not refreshed, reading raw documents: {error}")
+        with _READ_RAW_LOCK:
+            _READ_RAW.add((uri, db_name, collection))
+        return False
+    with _READ_RAW_LOCK:
+        _READ_RAW.discard((uri, db_name, collection))
+    print(f"Rollup of {collection} refreshed with {folded} new documents")
+    return True
+
+
+@mongodb_api.pymongo_exception
+def find_summaries(query: dict, uri: str, db_name: str, collection: str) -> List[dict]:
+    """Summaries of raw collection matching query, oldest first run first."""
+    if (uri, db_name, collection) in _READ_RAW:
+        return db_utils.cached_query(
+            "summaries", uri, db_name, collection, (query,),
+            lambda raw: sorted(summarize(_raw_docs(raw, query, BATCH_SIZE)).values(),
+                               key=lambda summary: summary["First_Run"]))
+    name = rollup_collection(collection)
+    return db_utils.cached_query(
+        "find_sorted", uri, db_name, name, (query,),
+        lambda summaries: list(summaries.find(query).sort("First_Run", 1)))
+
+
+def first_summaries(query: dict, fields: List[str], uri: str, db_name: str,
+                    collection: str) -> Dict[tuple, dict]:
+    """
+    Map values of fields to the first summary matching query, like the first
+    raw document a count/find per value used to return.
+    """
+    result = {}
+    for summary in find_summaries(query, uri, db_name, collection):
+        result.setdefault(tuple(summary.get(field) for field in fields), summary)
+    return result
+
+
+def main():
+    """Backfill, refresh or show the rollup of the configured collection."""
+    parser = argparse.ArgumentParser(description="Maintain performance rollup collection")
+    parser.add_argument("command", choices=["backfill", "refresh", "status"])
+    parser.add_argument("--collection", help="raw results collection, default from config.ini")
+    parser.add_argument("--lag", type=float, default=LAG,
+                        help="seconds raw documents must be old before refresh folds them")
+    args = parser.parse_args()
+    uri, db_name, db_collection = common.get_perf_db_details()
+    collection = args.collection or db_collection
+    if args.command == "backfill":
+        print(f"Folded {backfill(uri, db_name, collection)} documents of {collection}")
+    elif args.command == "refresh":
+        print(f"Folded {refresh(uri, db_name, collection, lag=args.lag)} new documents of "
+              f"{collection}")
+    print(f"Watermark: {get_watermark(uri, db_name, collection)}")
+
+
+if __name__ == '__main__':
+    main()
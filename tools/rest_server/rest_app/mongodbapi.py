@@ -17,12 +17,22 @@
 # For any questions about this software or licensing,
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
+import os
+import sys
 from http import HTTPStatus
 
-from pymongo import MongoClient
 from pymongo.errors import PyMongoError
 from pymongo.errors import ServerSelectionTimeoutError, OperationFailure
 
+# The tools run from their own directory, commons is imported from the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+# pylint: disable=wrong-import-position
+from commons.utils import db_utils  # noqa: E402
+
+from . import read_config  # noqa: E402
+
 
 def pymongo_exception(func):
     """Decorator for pymongo exceptions"""
@@ -49,6 +59,14 @@ def pymongo_exception(func):
     return new_func
 
 
+#: Writes through this module invalidate the collection, the short TTL bounds
+#: staleness for writes done by other server processes.
+db_utils.QUERY_CACHE.ttl = 10
+# Setup locks and VM reservations of core/locking_server are never cached
+db_utils.UNCACHED_COLLECTIONS.update((read_config.system_collection,
+                                      read_config.vm_pool_collection))
+
+
 @pymongo_exception
 def count_documents(query: dict,
                     uri: str,
@@ -68,11 +86,8 @@ def count_documents(query: dict,
         On failure returns http status code and message
         On success returns number of documents
     """
-    with MongoClient(uri) as client:
-        pymongo_db = client[db_name]
-        tests = pymongo_db[collection]
-        result = tests.count_documents(query)
-        return True, result
+    return True, db_utils.cached_query("count", uri, db_name, collection, (query,),
+                                       lambda tests: tests.count_documents(query))
 
 
 @pymongo_exception
@@ -96,11 +111,8 @@ def find_documents(query: dict,
         On failure returns http status code and message
         On success returns documents
     """
-    with MongoClient(uri) as client:
-        pymongo_db = client[db_name]
-        tests = pymongo_db[collection]
-        result = tests.find(query, projection)
-        return True, result
+    return True, db_utils.cached_query("find", uri, db_name, collection, (query, projection),
+                                       lambda tests: list(tests.find(query, projection)))
 
 
 @pymongo_exception
@@ -122,11 +134,33 @@ def add_document(data: dict,
         On failure returns http status code and message
         On success returns created document ID
     """
-    with MongoClient(uri) as client:
-        pymongo_db = client[db_name]
-        tests = pymongo_db[collection]
-        result = tests.insert_one(data)
-        return True, result
+    result = db_utils.get_client(uri)[db_name][collection].insert_one(data)
+    db_utils.QUERY_CACHE.invalidate(db_name, collection)
+    return True, result
+
+
+@pymongo_exception
+def add_documents(data: list,
+                  uri: str,
+                  db_name: str,
+                  collection: str
+                  ) -> (bool, str):
+    """
+    Add documents in MongoDB database with one request
+
+    Args:
+        data: Documents to be created in MongoDB
+        uri: URI of MongoDB database
+        db_name: Database name
+        collection: Collection name in database
+
+    Returns:
+        On failure returns http status code and message
+        On success returns created document IDs
+    """
+    result = db_utils.get_client(uri)[db_name][collection].insert_many(data)
+    db_utils.QUERY_CACHE.invalidate(db_name, collection)
+    return True, result
 
 
 @pymongo_exception
@@ -150,11 +184,9 @@ def update_documents(query: dict,
         On failure returns http status code and message
         On success returns created document ID
     """
-    with MongoClient(uri) as client:
-        pymongo_db = client[db_name]
-        tests = pymongo_db[collection]
-        result = tests.update_many(query, data)
-        return True, result
+    result = db_utils.get_client(uri)[db_name][collection].update_many(query, data)
+    db_utils.QUERY_CACHE.invalidate(db_name, collection)
+    return True, result
 
 
 # pylint: disable=too-many-arguments
@@ -181,11 +213,10 @@ def update_document(query: dict,
         On failure returns http status code and message
         On success returns created document ID
     """
-    with MongoClient(uri) as client:
-        database = client[db_name]
-        tests = database[collection]
-        result = tests.find_one_and_update(query, data, upsert=upsert)
-        return True, result
+    result = db_utils.get_client(uri)[db_name][collection].find_one_and_update(query, data,
+                                                                               upsert=upsert)
+    db_utils.QUERY_CACHE.invalidate(db_name, collection)
+    return True, result
 
 
 @pymongo_exception
@@ -209,11 +240,8 @@ def distinct_fields(field: str,
         On failure returns http status code and message
         On success returns number of documents
     """
-    with MongoClient(uri) as client:
-        pymongo_db = client[db_name]
-        tests = pymongo_db[collection]
-        result = tests.distinct(field, query)
-        return True, result
+    return True, db_utils.cached_query("distinct", uri, db_name, collection, (field, query),
+                                       lambda tests: tests.distinct(field, query))
 
 
 @pymongo_exception
@@ -235,8 +263,9 @@ def aggregate(data: list,
         On failure returns http status code and message
         On success returns created document ID
     """
-    with MongoClient(uri) as client:
-        pymongo_db = client[db_name]
-        tests = pymongo_db[collection]
-        result = tests.aggregate(data)
+    if any("$out" in stage or "$merge" in stage for stage in data):
+        result = list(db_utils.get_client(uri)[db_name][collection].aggregate(data))
+        db_utils.QUERY_CACHE.invalidate(db_name)
         return True, result
+    return True, db_utils.cached_query("aggregate", uri, db_name, collection, (data,),
+                                       lambda tests: list(tests.aggregate(data)))
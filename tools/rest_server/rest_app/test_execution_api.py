@@ -90,6 +90,29 @@ class Search(Resource):
         return flask.Response(status=query_results[1][0], response=query_results[1][1])
 
 
+def validate_entry(json_data: dict):
+    """Validate and normalize a test execution entry, returns error response or None."""
+    response = validations.check_db_keys(json_data)
+    if not response[0]:
+        return flask.Response(status=HTTPStatus.BAD_REQUEST,
+                              response=f"Unknown fields given or mandatory fields missing  "
+                                       f"{response[1]}")
+
+    # Validate formats of mandatory fields
+    validate_result = validations.validate_mandatory_db_fields(json_data)
+    if not validate_result[0]:
+        return flask.Response(status=validate_result[1][0],
+                              response=validate_result[1][1])
+    json_data["testStartTime"] = validate_result[1]
+
+    # Validate formats of extra fields
+    valid_result = validations.validate_extra_db_fields(json_data)
+    if not valid_result[0]:
+        return flask.Response(status=valid_result[1][0],
+                              response=valid_result[1][1])
+    return None
+
+
 # pylint-disable-message=too-few-public-methods
 @api.route("/create", doc={"description": "Add test execution entry in MongoDB"})
 @api.response(200, "Success")
@@ -111,25 +134,9 @@ class Create(Resource):
         if not validations.check_user_pass(json_data):
             return flask.Response(status=HTTPStatus.BAD_REQUEST,
                                   response="db_username/db_password missing in request body")
-
-        response = validations.check_db_keys(json_data)
-        if not response[0]:
-            return flask.Response(status=HTTPStatus.BAD_REQUEST,
-                                  response=f"Unknown fields given or mandatory fields missing  "
-                                           f"{response[1]}")
-
-        # Validate formats of mandatory fields
-        validate_result = validations.validate_mandatory_db_fields(json_data)
-        if not validate_result[0]:
-            return flask.Response(status=validate_result[1][0],
-                                  response=validate_result[1][1])
-        json_data["testStartTime"] = validate_result[1]
-
-        # Validate formats of extra fields
-        valid_result = validations.validate_extra_db_fields(json_data)
-        if not valid_result[0]:
-            return flask.Response(status=valid_result[1][0],
-                                  response=valid_result[1][1])
+        error = validate_entry(json_data)
+        if error:
+            return error
 
         # Build MongoDB URI using username and password
         uri = read_config.MONGODB_URI.format(quote_plus(json_data["db_username"]),
@@ -161,6 +168,67 @@ class Create(Resource):
         return flask.Response(status=update_result[1][0], response=update_result[1][1])
 
 
+# pylint-disable-message=too-few-public-methods
+@api.route("/create_many", doc={"description": "Add test execution entries in MongoDB"})
+@api.response(200, "Success")
+@api.response(400, "Bad Request: Missing parameters. Do not retry.")
+@api.response(401, "Unauthorized: Wrong db_username/db_password.")
+@api.response(403, "Forbidden: User does not have permission for operation.")
+@api.response(503, "Service Unavailable: Unable to connect to mongoDB.")
+class CreateMany(Resource):
+    """Create many endpoint, body is {"entries": [..], "db_username": .., "db_password": ..}"""
+
+    # pylint-disable-message=too-many-return-statements
+    @staticmethod
+    def post():
+        """Create test execution entries, nothing is created if one entry is invalid."""
+        json_data = flask.request.get_json()
+        if not json_data or not json_data.get("entries"):
+            return flask.Response(status=HTTPStatus.BAD_REQUEST,
+                                  response="Body is empty or has no entries")
+        if not validations.check_user_pass(json_data):
+            return flask.Response(status=HTTPStatus.BAD_REQUEST,
+                                  response="db_username/db_password missing in request body")
+        entries = json_data["entries"]
+        for index, entry in enumerate(entries):
+            entry.pop("db_username", None)
+            entry.pop("db_password", None)
+            error = validate_entry(entry)
+            if error:
+                # clients create the entries one by one on 4xx, name the bad one
+                error.set_data(f"Entry {index}: ".encode() + error.get_data())
+                return error
+
+        uri = read_config.MONGODB_URI.format(quote_plus(json_data["db_username"]),
+                                             quote_plus(json_data["db_password"]),
+                                             read_config.db_hostname)
+
+        # Earlier entries of the same tests are no longer latest
+        filter_fields = {"$or": [{each: entry[each] for each in
+                                  ["testPlanID", "testExecutionID", "testID"]}
+                                 for entry in entries], "latest": True}
+        update_field = {"$set": {"latest": False}}
+        update_result = mongodbapi.update_documents(filter_fields, update_field,
+                                                    uri, read_config.db_name,
+                                                    read_config.results_collection)
+        if not update_result[0]:
+            return flask.Response(status=update_result[1][0], response=update_result[1][1])
+        # A test reported twice in one request keeps only its last entry latest
+        last = {}
+        for index, entry in enumerate(entries):
+            last[(entry["testPlanID"], entry["testExecutionID"], entry["testID"])] = index
+        latest = set(last.values())
+        for index, entry in enumerate(entries):
+            if index not in latest:
+                entry["latest"] = False
+        add_result = mongodbapi.add_documents(entries, uri, read_config.db_name,
+                                              read_config.results_collection)
+        if add_result[0]:
+            return flask.Response(status=HTTPStatus.OK,
+                                  response=f"{len(add_result[1].inserted_ids)} entries created")
+        return flask.Response(status=add_result[1][0], response=add_result[1][1])
+
+
 # pylint-disable-message=too-few-public-methods
 @api.route("/update", doc={"description": "Update test execution entries in MongoDB"})
 @api.response(200, "Success")
@@ -0,0 +1,86 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""UnitTest module for SSH connection pool and Host.run_many."""
+"""UnitTest module for ClusterExecutor."""
+
+import time
+
+import pytest
+
+from commons.helpers.cluster_executor import ClusterExecutor
+
+
+class FakeNode:
+    """Node stub sleeping for delay seconds in execute_cmd."""
+
+    def __init__(self, hostname, delay=0.0):
+        self.hostname = hostname
+        self.delay = delay
+
+    def execute_cmd(self, cmd, **kwargs):
+        time.sleep(self.delay)
+        if cmd == 'fail':
+            raise IOError(['failed'])
+        return f'{self.hostname}: {cmd}'
+
+
+def test_run_cmd_concurrently():
+    """Nodes run in parallel and results keep node order."""
+    nodes = [FakeNode(f'node{idx}', 0.2) for idx in range(8)]
+    start = time.time()
+    result = ClusterExecutor(nodes).run_cmd('hostname')
+    assert time.time() - start < 1
+    assert result.ok
+    assert list(result.outputs().values()) == [f'node{idx}: hostname' for idx in range(8)]
+
+
+def test_bounded_concurrency():
+    """max_workers limits the number of concurrent calls."""
+    nodes = [FakeNode(f'node{idx}', 0.1) for idx in range(4)]
+    start = time.time()
+    assert ClusterExecutor(nodes, max_workers=2).run_cmd('date').ok
+    assert time.time() - start >= 0.2
+
+
+def test_partial_failure_and_timeout():
+    """A failed or slow node is reported without failing the others."""
+    nodes = [FakeNode('ok'), FakeNode('slow', 2)]
+    result = ClusterExecutor(nodes).run_cmd('uptime', timeout=0.3)
+    assert not result.ok and list(result.failed) == ['slow']
+    assert result['slow'].timed_out and result['ok'].output == 'ok: uptime'
+    assert result.slowest()[0][0] == 'slow'
+    with pytest.raises(TimeoutError):
+        result.raise_on_failure()
+    result = ClusterExecutor([FakeNode('n1')]).run(lambda node: node.execute_cmd('fail'))
+    assert isinstance(result['n1'].error, IOError)
+    with pytest.raises(RuntimeError):
+        result.raise_on_failure()
+
+
+def test_key_of_node_dicts(caplog):
+    """Node dicts are keyed and logged by the given key, never by their content."""
+    nodes = [{'hostname': 'n1', 'password': 'secret'}, {'hostname': 'n2', 'password': 'secret'}]
+
+    def check(node):
+        if node['hostname'] == 'n2':
+            raise IOError('down')
+        return True
+
+    result = ClusterExecutor(nodes, key=lambda node: node['hostname']).run(check)
+    assert list(result) == ['n1', 'n2'] and list(result.failed) == ['n2']
+    assert 'secret' not in caplog.text and 'n2' in caplog.text
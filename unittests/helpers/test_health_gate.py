@@ -0,0 +1,77 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""UnitTest module for the cluster health gate."""
+
+import time
+
+import pytest
+
+from commons.helpers.health_gate import HealthGate
+from commons.helpers.health_gate import is_destructive
+
+
+class Probe:
+    """Counting probe, raises AssertionError while unhealthy."""
+
+    def __init__(self):
+        self.calls = 0
+        self.healthy = True
+
+    def __call__(self):
+        self.calls += 1
+        assert self.healthy, 'node1 offline'
+
+
+def test_verdict_reused_until_ttl_or_invalidation():
+    """A healthy verdict is reused within ttl, invalidation forces a probe."""
+    probe = Probe()
+    gate = HealthGate(probe, ttl=60)
+    for _ in range(5):
+        gate.check()
+    assert probe.calls == 1 and gate.stats['hits'] == 4
+    gate.invalidate()
+    gate.check()
+    assert probe.calls == 2
+    gate.checked -= 61
+    gate.check()
+    assert probe.calls == 3
+
+
+def test_failure_never_cached():
+    """Degradation found by the poller is confirmed by check and raised."""
+    probe = Probe()
+    gate = HealthGate(probe, ttl=60)
+    gate.start_poller(0.01)
+    probe.healthy = False
+    deadline = time.monotonic() + 5
+    while gate.stats['failures'] == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    gate.stop_poller()
+    with pytest.raises(AssertionError):
+        gate.check()
+    probe.healthy = True
+    gate.check()
+    assert gate.checked is not None
+
+
+def test_destructive_marks():
+    """Marker words, not substrings, select destructive tests."""
+    assert is_destructive(['tags', 'ha'])
+    assert is_destructive(['s3_data_durability'])
+    assert is_destructive(['prov_sanity'])
+    assert not is_destructive(['dataprovider', 'parallel', 'lc'])
@@ -0,0 +1,173 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""UnitTest module for SSH connection pool and Host.run_many."""
+
+import io
+import time
+
+import pytest
+
+from commons.helpers import host
+from commons.helpers.ssh_pool import SSHConnectionPool
+
+
+class FakeTransport:
+    """Transport stub."""
+
+    def __init__(self):
+        self.active = True
+
+    def is_active(self):
+        return self.active
+
+    def send_ignore(self):
+        if not self.active:
+            raise EOFError()
+
+    def set_keepalive(self, interval):
+        self.keepalive = interval
+
+
+class FakeChannel:
+    """Channel stub returning exit status."""
+
+    def __init__(self, status):
+        self.status = status
+
+    def exit_status_ready(self):
+        return True
+
+    def recv_exit_status(self):
+        return self.status
+
+
+class FakeStream(io.BytesIO):
+    """stdout/stderr stub, read() gives bytes and readlines() str like paramiko."""
+
+    def __init__(self, data, status):
+        super().__init__(data)
+        self.channel = FakeChannel(status)
+
+    def readlines(self, hint=-1):
+        return [line.decode() for line in super().readlines(hint)]
+
+
+class FakeClient:
+    """paramiko.SSHClient stub running commands as echo."""
+
+    def __init__(self, hostname):
+        self.hostname = hostname
+        self.transport = FakeTransport()
+        self.closed = False
+
+    def get_transport(self):
+        return self.transport
+
+    def exec_command(self, cmd, timeout=None):
+        if not self.transport.active:
+            raise EOFError()
+        status = 1 if cmd == 'false' else 0
+        out = '{} {}'.format(self.hostname, cmd).encode()
+        return io.BytesIO(), FakeStream(out, status), FakeStream(b'failed\n', status)
+
+    def close(self):
+        self.closed = True
+        self.transport.active = False
+
+
+@pytest.fixture(name="pool")
+def fake_pool(monkeypatch):
+    """Pool opening FakeClients, installed as the process wide pool."""
+    pool = SSHConnectionPool(max_connections=2, max_channels=2, idle_timeout=60)
+    monkeypatch.setattr(SSHConnectionPool, '_open',
+                        staticmethod(lambda hostname, *args, **kwargs: FakeClient(hostname)))
+    monkeypatch.setattr(host, 'SSH_POOL', pool)
+    return pool
+
+
+def test_reuse_and_channels(pool):
+    """Connections are shared by max_channels borrowers and reused."""
+    conns = [pool.acquire('node1', 'root', 'pwd', timeout=1) for _ in range(4)]
+    assert len({id(conn) for conn in conns}) == 2
+    with pytest.raises(TimeoutError):
+        pool.acquire('node1', 'root', 'pwd', timeout=0.1)
+    for conn in conns:
+        pool.release(conn)
+    assert pool.acquire('node1', 'root', 'pwd', timeout=1) is conns[0]
+    assert pool.stats['created'] == 2
+
+
+def test_health_check_and_idle_eviction(pool):
+    """Dead connections are replaced on borrow, idle ones are closed."""
+    conn = pool.acquire('node1', 'root', 'pwd')
+    pool.release(conn)
+    conn.client.transport.active = False
+    new_conn = pool.acquire('node1', 'root', 'pwd')
+    assert new_conn is not conn and pool.stats['discarded'] == 1
+    pool.release(new_conn)
+    new_conn.last_used = time.monotonic() - 120
+    pool.acquire('node2', 'root', 'pwd')
+    assert new_conn.client.closed and pool.stats['evicted'] == 1
+
+
+def test_execute_cmd_pooled(pool):
+    """execute_cmd reuses one connection and retries once on a stale one."""
+    node = host.Host('node1', 'root', 'pwd')
+    assert node.execute_cmd('hostname') == b'node1 hostname'
+    assert node.execute_cmd('uptime') == b'node1 uptime'
+    assert node.host_obj is None and pool.stats['created'] == 1
+    conn = pool.acquire('node1', 'root', 'pwd')
+    pool.release(conn)
+    node.disconnect()
+    assert not conn.client.closed
+
+    def stale(*args, **kwargs):
+        raise EOFError()
+
+    conn.client.exec_command = stale  # passes health check but connection is dead
+    assert node.execute_cmd('uptime') == b'node1 uptime'
+    assert pool.stats['created'] == 2
+    with pytest.raises(IOError):
+        node.execute_cmd('false')
+
+
+def test_execute_cmd_stale_retry_raises(pool):
+    """The last error is raised when the retry also gets a stale connection."""
+    node = host.Host('node1', 'root', 'pwd')
+    conns = [pool.acquire('node1', 'root', 'pwd') for _ in range(3)]
+    for conn in conns:
+        pool.release(conn)
+
+    def stale(*args, **kwargs):
+        raise EOFError()
+
+    for conn in conns:
+        conn.client.exec_command = stale
+    with pytest.raises(EOFError):
+        node.execute_cmd('uptime')
+
+
+def test_run_many(pool):
+    """Commands fan out to all hosts and failures are reported per host."""
+    nodes = [host.Host('node{}'.format(idx), 'root', 'pwd') for idx in range(3)]
+    results = host.Host.run_many(nodes, 'date')
+    assert [res.output for res in results] == [b'node0 date', b'node1 date', b'node2 date']
+    assert all(res.status for res in results)
+    results = host.Host.run_many([(nodes[0], 'true'), (nodes[1], 'false')])
+    assert [res.status for res in results] == [True, False]
+    assert results[1].error == str(['failed'])
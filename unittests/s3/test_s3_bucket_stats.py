@@ -0,0 +1,97 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""UnitTest for bucket statistics with an in memory ListObjectsV2."""
+
+import threading
+
+from libs.s3.s3_bucket_stats import bucket_stats
+from libs.s3.s3_bucket_stats import verify_capacity
+
+
+class FakeS3:
+    """ListObjectsV2 over a dict of key: size, in S3 key order."""
+
+    def __init__(self, objects):
+        self.keys = sorted(objects)
+        self.objects = objects
+        self.calls = 0
+        self.threads = set()
+
+    def list_objects_v2(self, Bucket, Prefix="", MaxKeys=1000, StartAfter="",
+                        ContinuationToken=None):
+        self.calls += 1
+        self.threads.add(threading.current_thread().name)
+        after = ContinuationToken or StartAfter
+        keys = [key for key in self.keys if key.startswith(Prefix) and key > after]
+        page = keys[:MaxKeys]
+        response = {"Contents": [{"Key": key, "Size": self.objects[key]} for key in page],
+                    "IsTruncated": len(keys) > MaxKeys}
+        if response["IsTruncated"]:
+            response["NextContinuationToken"] = page[-1]
+        return response
+
+
+def make_objects():
+    """Keys starting with all kinds of characters, sizes 0 .. 2 GiB."""
+    objects = {}
+    for idx in range(3000):
+        first = "-_.0aZz~"[idx % 8]
+        objects[f"{first}{idx:05d}"] = idx * 1000
+    objects["big/blob"] = 2 * 1024 ** 3
+    objects["0"] = 1
+    return objects
+
+
+def test_partitioned_listing_counts_every_key_once():
+    """Concurrent key range listers give the same totals as the objects."""
+    objects = make_objects()
+    s3_client = FakeS3(objects)
+    stats = bucket_stats(s3_client, "bkt", partitions=8, page_size=100)
+    assert stats.partitions == 8 and len(s3_client.threads) > 1
+    assert stats.objects == len(objects) and stats.bytes == sum(objects.values())
+    assert sum(stats.histogram) == stats.objects
+    assert sum(stats.histogram_bytes) == stats.bytes
+    assert stats.largest == 2 * 1024 ** 3 and stats.histogram_dict()[">1073741824"] == 1
+    assert stats.histogram_dict()["<=0"] == 1
+
+
+def test_prefix_and_small_bucket():
+    """Prefix limits the keys, a one page bucket is listed with one call."""
+    objects = make_objects()
+    stats = bucket_stats(FakeS3(objects), "bkt", prefix="z", partitions=4, page_size=100)
+    expected = {key: size for key, size in objects.items() if key.startswith("z")}
+    assert stats.objects == len(expected) and stats.bytes == sum(expected.values())
+    s3_client = FakeS3({"a": 1, "b": 2})
+    stats = bucket_stats(s3_client, "bkt")
+    assert (stats.objects, stats.bytes, s3_client.calls) == (2, 3, 1)
+
+
+def test_verify_capacity():
+    """Bucket bytes above the CSM used capacity fail the cross check."""
+
+    class Capacity:
+        """CSM capacity reporting 1 MB used."""
+
+        @staticmethod
+        def parse_capacity_usage():
+            return 100, 99, 1, 1.0, "MB"
+
+    stats = bucket_stats(FakeS3({"a": 1024 ** 2}), "bkt")
+    assert verify_capacity([stats], Capacity())[0]
+    stats.bytes += 1
+    assert not verify_capacity([stats], Capacity())[0]
@@ -0,0 +1,127 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""UnitTest for bulk bucket teardown with an in memory S3 client."""
+
+import threading
+
+from botocore.exceptions import ClientError
+
+from libs.s3.s3_bulk_delete import BulkDeleter
+
+
+class Paginator:
+    """Pages of a fake list call, one page per PageSize keys."""
+
+    def __init__(self, func):
+        self.func = func
+
+    def paginate(self, PaginationConfig=None, **kwargs):
+        size = (PaginationConfig or {}).get("PageSize", 1000)
+        token = ""
+        while True:
+            page, token = self.func(size, token, **kwargs)
+            yield page
+            if token is None:
+                return
+
+
+class FakeS3:
+    """Buckets of keys, versioned buckets hold (key, version) pairs."""
+
+    def __init__(self):
+        self.buckets = dict()
+        self.uploads = dict()
+        self.versioned = set()
+        self.batches = []
+        self.lock = threading.Lock()
+        self.fail_keys = set()
+
+    def get_bucket_versioning(self, Bucket):
+        return {"Status": "Enabled"} if Bucket in self.versioned else {}
+
+    def get_paginator(self, name):
+        return Paginator(getattr(self, "_" + name))
+
+    def _page(self, bucket, size, token):
+        keys = sorted(key for key in self.buckets[bucket] if str(key) > token)[:size]
+        return keys, (str(keys[-1]) if len(keys) == size else None)
+
+    def _list_objects_v2(self, size, token, Bucket, Prefix):
+        keys, token = self._page(Bucket, size, token)
+        return {"Contents": [{"Key": key} for key in keys]}, token
+
+    def _list_object_versions(self, size, token, Bucket, Prefix):
+        keys, token = self._page(Bucket, size, token)
+        return {"Versions": [{"Key": key, "VersionId": ver} for key, ver in keys]}, token
+
+    def _list_multipart_uploads(self, size, token, Bucket, Prefix):
+        return {"Uploads": [{"Key": "mp", "UploadId": uid}
+                            for uid in self.uploads.get(Bucket, [])]}, None
+
+    def delete_objects(self, Bucket, Delete):
+        assert len(Delete["Objects"]) <= 1000
+        errors = []
+        with self.lock:
+            self.batches.append(len(Delete["Objects"]))
+            for obj in Delete["Objects"]:
+                key = (obj["Key"], obj["VersionId"]) if "VersionId" in obj else obj["Key"]
+                if obj["Key"] in self.fail_keys:
+                    errors.append({"Key": obj["Key"], "Code": "AccessDenied"})
+                else:
+                    self.buckets[Bucket].discard(key)
+        return {"Errors": errors} if errors else {}
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.uploads[Bucket].remove(UploadId)
+        if UploadId == "gone":  # completed by its test meanwhile
+            raise ClientError({"Error": {"Code": "NoSuchUpload"}}, "AbortMultipartUpload")
+
+    def delete_bucket(self, Bucket):
+        assert not self.buckets[Bucket] and not self.uploads.get(Bucket)
+        del self.buckets[Bucket]
+
+
+def test_bulk_delete_buckets():
+    """Buckets are emptied in 1000 key batches, uploads aborted, buckets deleted."""
+    s3_client = FakeS3()
+    s3_client.buckets["big"] = {f"obj-{idx:05d}" for idx in range(2500)}
+    s3_client.buckets["versioned"] = {(f"obj-{idx}", ver) for idx in range(10) for ver in "ab"}
+    s3_client.versioned.add("versioned")
+    s3_client.buckets["empty"] = set()
+    s3_client.uploads["empty"] = ["u1", "u2", "gone"]
+    with BulkDeleter(s3_client, workers=4, buckets=2) as deleter:
+        results = deleter.delete_buckets(["big", "versioned", "empty"])
+    assert list(results) == ["big", "versioned", "empty"]
+    assert all(res.deleted for res in results.values()) and not s3_client.buckets
+    assert results["big"].objects == 2500 and results["versioned"].objects == 20
+    assert results["empty"].uploads_aborted == 2
+    assert sorted(s3_client.batches) == [20, 500, 1000, 1000]
+    assert results["big"].objects_per_sec > 0
+
+
+def test_failed_keys_keep_bucket():
+    """Keys DeleteObjects reports as errors fail the bucket, others go on."""
+    s3_client = FakeS3()
+    s3_client.buckets["locked"] = {"a", "b", "c"}
+    s3_client.buckets["ok"] = {"d"}
+    s3_client.fail_keys.add("b")
+    with BulkDeleter(s3_client, workers=2) as deleter:
+        results = deleter.delete_buckets(["locked", "ok"])
+    assert not results["locked"].deleted and results["locked"].errors[0]["Key"] == "b"
+    assert results["locked"].objects == 2 and results["ok"].deleted
+    assert s3_client.buckets == {"locked": {"b"}}
@@ -0,0 +1,115 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""UnitTest module for LRU/TTL caches."""
+
+import threading
+
+import pytest
+
+from core.cache import InMemoryDB
+from core.cache import LRUCache
+
+
+def test_lru_eviction_and_stats():
+    """Least recently used entry is evicted, not the oldest stored one."""
+    cache = LRUCache(2)
+    cache.store('a', 1)
+    cache.store('b', 2)
+    assert cache.lookup('a') == 1
+    cache.store('c', 3)
+    assert 'b' not in cache and cache.lookup('a') == 1 and cache.lookup('c') == 3
+    with pytest.raises(KeyError):
+        cache.lookup('b')
+    cache.delete('a')
+    cache.delete('missing')
+    stats = cache.stats()
+    assert stats['size'] == 1 and stats['evictions'] == 1
+    assert stats['hits'] == 3 and stats['misses'] >= 1
+
+
+def test_ttl_expiry(monkeypatch):
+    """Entries expire ttl seconds after they were stored."""
+    now = [100.0]
+    monkeypatch.setattr('core.cache.time.monotonic', lambda: now[0])
+    cache = LRUCache(10, ttl=5)
+    cache.store('a', 1)
+    cache.store('b', 2, ttl=60)
+    now[0] += 10
+    assert cache.get('a') is None and cache.get('b') == 2
+    assert cache.stats()['expirations'] == 1
+
+
+def test_random_pop_is_consistent():
+    """Random pops remove every key once and keep the index array consistent."""
+    db = InMemoryDB(1000)
+    for idx in range(100):
+        db.store(f'bucket/obj{idx}', idx)
+    db.delete('bucket/obj5')
+    popped = set()
+    while True:
+        key, value = db.pop_one()
+        if key is False:
+            break
+        assert key == f'bucket/obj{value}'
+        popped.add(key)
+    assert len(popped) == 99 and 'bucket/obj5' not in popped
+    assert not db.keys and not db.index and len(db) == 0
+
+
+def test_eviction_updates_index():
+    """Evicted keys leave the random sampling index too."""
+    db = InMemoryDB(3)
+    for idx in range(5):
+        db.store(idx, idx)
+    assert sorted(db.keys) == [2, 3, 4]
+    assert all(db.keys[pos] == key for key, pos in db.index.items())
+
+
+def test_save_and_load(tmp_path):
+    """Entries survive a save/load round trip in LRU order."""
+    cache = InMemoryDB(10, ttl=3600)
+    for idx in range(3):
+        cache.store(idx, str(idx))
+    cache.lookup(0)
+    path = str(tmp_path / 'cache.pkl')
+    assert cache.save(path) == 3
+    restored = InMemoryDB(10)
+    assert restored.load(path) == 3
+    assert restored.to_dict() == {1: '1', 2: '2', 0: '0'}
+    assert list(restored.to_dict()) == [1, 2, 0]
+    assert restored.sample()[0] in (0, 1, 2)
+    assert LRUCache(10).load(str(tmp_path / 'missing.pkl')) == 0
+
+
+def test_thread_safety():
+    """Concurrent stores and pops never corrupt the index."""
+    db = InMemoryDB(500)
+
+    def worker(offset):
+        for idx in range(2000):
+            db.store(offset + idx, idx)
+            if idx % 3 == 0:
+                db.pop_one()
+
+    threads = [threading.Thread(target=worker, args=(n * 10000,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(db) == len(db.keys) == len(db.index) <= 500
+    assert all(db.keys[pos] == key for key, pos in db.index.items())
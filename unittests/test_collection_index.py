@@ -0,0 +1,94 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""UnitTest module for the persistent collection index."""
+
+import os
+
+from core.collection_index import CollectionIndex
+
+
+def make_tree(root):
+    """Test tree with an ignored and a norecurse directory."""
+    for relpath in ('tests/s3/test_bucket.py', 'tests/s3/helper.py', 'tests/csm/test_user.py',
+                    'unittests/test_unit.py', 'tests/tmp_data/test_data.py'):
+        path = root / relpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f'# {relpath}\n')
+    (root / 'pytest.ini').write_text('[pytest]\naddopts = -v --ignore=unittests\n'
+                                     'norecursedirs = .idea tmp*\n')
+
+
+def entry(nodeid, test_id, *marks):
+    """Index entry as written by conftest."""
+    return dict(nodeid=nodeid, test_id=test_id, marks=list(marks), parallel='parallel' in marks)
+
+
+def test_stale_files_and_selection(tmp_path):
+    """Only new or changed files are stale, test ids map to their files."""
+    make_tree(tmp_path)
+    index = CollectionIndex(str(tmp_path / 'log' / 'index.json'), str(tmp_path)).load()
+    files = index.default_test_files()
+    assert files == [os.path.join('tests', 'csm', 'test_user.py'),
+                     os.path.join('tests', 's3', 'test_bucket.py')]
+    assert index.stale(files) == set(files)
+    bucket, user = files[1], files[0]
+    index.update({bucket: [entry(f'{bucket}::test_put', 'TEST-1', 'parallel', 's3_ops')],
+                  user: [entry(f'{user}::test_login', 'TEST-2', 'csm')]})
+    index.save()
+    index = CollectionIndex(index.path, str(tmp_path)).load()
+    assert not index.stale(files)
+    assert index.files_for(['TEST-1']) == {bucket}
+    assert [item['test_id'] for item in index.entries(files)] == ['TEST-2', 'TEST-1']
+    (tmp_path / bucket).write_text('# changed\n')
+    assert index.stale(files) == {bucket}
+    os.utime(tmp_path / user, ns=(1, 1))
+    assert index.stale(files) == {bucket}, 'touched file with same content is current'
+
+
+def test_nodeid_args_and_config_change(tmp_path):
+    """Nodeid args are not indexed, a conftest change drops the whole index."""
+    make_tree(tmp_path)
+    index = CollectionIndex(str(tmp_path / 'index.json'), str(tmp_path))
+    assert index.test_files(['tests/s3/test_bucket.py::test_put']) is None
+    files = index.default_test_files()
+    index.update({path: [] for path in files})
+    index.save()
+    assert CollectionIndex(index.path, str(tmp_path)).load().files
+    (tmp_path / 'tests' / 'conftest.py').write_text('import pytest\n')
+    assert not CollectionIndex(index.path, str(tmp_path)).load().files
+    (tmp_path / 'index.json').write_text('{broken')
+    assert not CollectionIndex(index.path, str(tmp_path)).load().files
+
+
+def test_helper_and_data_change(tmp_path):
+    """Helper modules and config data feed parametrization, they drop the index too."""
+    make_tree(tmp_path)
+    (tmp_path / 'config').mkdir()
+    (tmp_path / 'config' / 'params.yaml').write_text('count: 1\n')
+    index = CollectionIndex(str(tmp_path / 'log' / 'index.json'), str(tmp_path))
+    index.update({path: [] for path in index.default_test_files()})
+    index.save()
+    (tmp_path / 'log' / 'te_meta.json').write_text('{}')
+    assert CollectionIndex(index.path, str(tmp_path)).load().files, 'log dir is not hashed'
+    (tmp_path / 'config' / 'params.yaml').write_text('count: 2\n')
+    assert not CollectionIndex(index.path, str(tmp_path)).load().files
+    index = CollectionIndex(index.path, str(tmp_path))
+    index.update({path: [] for path in index.default_test_files()})
+    index.save()
+    (tmp_path / 'tests' / 's3' / 'helper.py').write_text('VALUES = [1, 2]\n')
+    assert not CollectionIndex(index.path, str(tmp_path)).load().files
@@ -0,0 +1,91 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Test lazy and cached configuration loading."""
+import datetime
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from commons import configmanager
+from commons import pswdmanager
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(name="cfg_file")
+def encrypted_config(tmp_path, monkeypatch):
+    """yaml config with an encrypted password and an empty disk cache."""
+    monkeypatch.setenv("KEY", "unit-test-key")
+    monkeypatch.setattr(configmanager, "CONFIG_CACHE_DIR", str(tmp_path / "cache"))
+    configmanager.clear_cache()
+    path = tmp_path / "test_config.yaml"
+    path.write_text("node:\n  username: root\n  password: {}\nport: 22\n".format(
+        pswdmanager.encrypt("secret")))
+    yield str(path)
+    configmanager.clear_cache()
+
+
+def test_parse_once_and_disk_cache(cfg_file, monkeypatch):
+    """A file is parsed once, the disk cache holds encrypted data only."""
+    data = configmanager.get_config_wrapper(fpath=cfg_file)
+    assert data == {"node": {"username": "root", "password": "secret"}, "port": 22}
+    data["node"]["password"] = "changed"
+    cache_files = os.listdir(configmanager.CONFIG_CACHE_DIR)
+    assert len(cache_files) == 1
+    with open(os.path.join(configmanager.CONFIG_CACHE_DIR, cache_files[0]), "rb") as fin:
+        cached = fin.read()
+    assert b"secret" not in cached
+    assert json.loads(cached)["port"] == 22
+
+    def no_parse(*args, **kwargs):
+        raise AssertionError("yaml parsed again")
+
+    monkeypatch.setattr(configmanager.yaml, "load", no_parse)
+    assert configmanager.get_config_yaml(cfg_file)["node"]["password"] == "secret"
+    configmanager.clear_cache()
+    assert configmanager.get_config_yaml(cfg_file)["port"] == 22
+
+
+def test_changed_file_reloaded(cfg_file):
+    """Edits of a config file are picked up."""
+    assert configmanager.get_config_yaml(cfg_file)["port"] == 22
+    with open(cfg_file, "a") as fout:
+        fout.write("extra: 1\n")
+    assert configmanager.get_config_yaml(cfg_file)["extra"] == 1
+
+
+def test_non_json_data_not_cached(tmp_path, monkeypatch):
+    """Data changed by a JSON round trip, e.g. int keys or dates, is never cached."""
+    monkeypatch.setattr(configmanager, "CONFIG_CACHE_DIR", str(tmp_path / "cache"))
+    configmanager.clear_cache()
+    path = tmp_path / "dates.yaml"
+    path.write_text("1: one\nday: 2022-01-02\n")
+    data = configmanager._load_yaml(str(path))  # pylint: disable=protected-access
+    assert data[1] == "one" and data["day"] == datetime.date(2022, 1, 2)
+    assert not os.path.exists(configmanager.CONFIG_CACHE_DIR)
+    configmanager.clear_cache()
+
+
+def test_config_import_is_lazy():
+    """Importing config loads nothing until a config name is accessed."""
+    code = "import config; assert 'CMN_CFG' not in vars(config); assert 'CMN_CFG' in dir(config)"
+    env = dict(os.environ, TARGET="")
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, check=True)
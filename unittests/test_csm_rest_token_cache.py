@@ -0,0 +1,129 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Test CSM REST login token cache and pooled sessions."""
+import pytest
+import requests
+
+from commons.exceptions import CTException
+from libs.csm.rest import csm_rest_core_lib
+from libs.csm.rest.csm_rest_core_lib import TokenCache
+from libs.csm.rest.csm_rest_test_lib import RestTestLib
+
+CONFIG = {"mgmt_vip": "csm.local", "port": 8081, "secure": False,
+          "rest_login_endpoint": "/api/v2/login", "rest_logout_endpoint": "/api/v2/logout",
+          "Login_headers": {"Content-Type": "application/json"},
+          "csm_admin_user": {"username": "admin", "password": "Seagate@1"},
+          "csm_user_monitor": {"username": "monitor", "password": "Seagate@1"}}
+
+
+class FakeCsm:
+    """Session stand in issuing a token per login and rejecting expired tokens."""
+
+    def __init__(self):
+        self.logins = 0
+        self.valid = set()
+
+    def respond(self, status, headers=None):
+        """Build a requests.Response."""
+        response = requests.Response()
+        response.status_code = status
+        response.headers.update(headers or {})
+        response.request = requests.Request("GET", "http://csm.local").prepare()
+        return response
+
+    def post(self, url, headers=None, data=None, **kwargs):
+        """Login and logout."""
+        if url.endswith("/login"):
+            if "wrong" in data:
+                return self.respond(401)
+            self.logins += 1
+            token = "Bearer token{}".format(self.logins)
+            self.valid.add(token)
+            return self.respond(200, {"Authorization": token})
+        self.valid.discard(headers["Authorization"])
+        return self.respond(200)
+
+    def get(self, url, headers=None, **kwargs):
+        """Authorized resource."""
+        return self.respond(200 if headers.get("Authorization") in self.valid else 401)
+
+    patch = delete = put = get
+
+
+class Users(RestTestLib):
+    """RestTestLib with one authenticated call."""
+
+    @RestTestLib.authenticate_and_login
+    def list_users(self):
+        """GET with the login header."""
+        return self.restapi.rest_call("get", "/api/v2/csm/users", headers=self.headers)
+
+
+@pytest.fixture(name="csm")
+def fake_csm(monkeypatch):
+    """Fresh token cache and config and a fake CSM behind the pooled session."""
+    csm = FakeCsm()
+    monkeypatch.setattr("libs.csm.rest.csm_rest_test_lib.CSM_REST_CFG", dict(CONFIG))
+    monkeypatch.setattr(csm_rest_core_lib, "get_session", lambda *args: csm)
+    monkeypatch.setattr(csm_rest_core_lib, "TOKEN_CACHE", TokenCache())
+    monkeypatch.setattr("libs.csm.rest.csm_rest_test_lib.TOKEN_CACHE",
+                        csm_rest_core_lib.TOKEN_CACHE)
+    return csm
+
+
+def test_token_reused_per_identity(csm):
+    """One login per user for many calls and objects."""
+    users, other = Users(), Users()
+    for _ in range(5):
+        assert users.list_users().status_code == 200
+        assert other.list_users(login_as="csm_user_monitor").status_code == 200
+    assert csm.logins == 2
+    users.invalidate_token("csm_admin_user")
+    assert users.list_users().status_code == 200 and csm.logins == 3
+
+
+def test_refresh_on_401_and_logout(csm):
+    """Rejected cached tokens are replaced once, logout drops the token."""
+    users = Users()
+    users.list_users()
+    csm.valid.clear()
+    assert users.list_users().status_code == 200 and csm.logins == 2
+    users.restapi.rest_call("post", CONFIG["rest_logout_endpoint"], headers=users.headers)
+    assert users.list_users().status_code == 200 and csm.logins == 3
+
+
+def test_negative_auth_not_cached(csm):
+    """Failed and unauthorized logins raise and are never cached."""
+    users = Users()
+    users.update_csm_config_for_user("bad_user", "admin", "wrong")
+    with pytest.raises(CTException):
+        users.list_users(login_as="bad_user")
+    with pytest.raises(CTException):
+        users.list_users(authorized=False)
+    assert csm.logins == 1
+    assert users.list_users().status_code == 200 and csm.logins == 2
+
+
+def test_token_expiry():
+    """ttl and JWT exp bound the reuse of a token."""
+    cache = TokenCache(ttl=0.05)
+    cache.put(("key",), "Bearer abc")
+    assert cache.get(("key",)) == "Bearer abc"
+    jwt = "Bearer e30.eyJleHAiOiAxMDB9.sig"  # exp in 1970
+    cache.put(("jwt",), jwt)
+    assert cache.get(("jwt",)) is None
@@ -0,0 +1,92 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Test MongoDB client registry and query cache."""
+import time
+
+import pytest
+
+from commons.utils import db_utils
+
+mongomock = pytest.importorskip("mongomock")
+
+URI = "mongodb://localhost:27017"
+
+
+@pytest.fixture(name="coll")
+def mock_collection(monkeypatch):
+    """Registry backed by mongomock with a small collection."""
+    monkeypatch.setattr(db_utils, "MongoClient", mongomock.MongoClient)
+    monkeypatch.setattr(db_utils, "QUERY_CACHE", db_utils.QueryCache(ttl=60, max_entries=4))
+    db_utils.close_clients()
+    coll = db_utils.get_client(URI)["perf"]["results"]
+    coll.insert_many([{"build": str(idx % 3), "ops": idx} for idx in range(30)])
+    yield coll
+    db_utils.close_clients()
+
+
+def find(query):
+    """Cached find on the test collection."""
+    return db_utils.cached_query("find", URI, "perf", "results", (query,),
+                                 lambda tests: list(tests.find(query, {"_id": 0})))
+
+
+def test_registry_reuses_client(coll):
+    """A single client per URI."""
+    assert db_utils.get_client(URI) is db_utils.get_client(URI)
+    assert db_utils.get_client(URI)["perf"]["results"].count_documents({}) == coll.count_documents({})
+
+
+def test_cache_hit_normalized_and_copied(coll):
+    """Field order does not matter and cached documents can not be modified by callers."""
+    first = find({"build": "1", "ops": {"$gt": 10}})
+    first[0]["ops"] = -1
+    coll.delete_many({})
+    second = find({"ops": {"$gt": 10}, "build": "1"})
+    assert db_utils.QUERY_CACHE.hits == 1
+    assert len(second) == 6 and second[0]["ops"] != -1
+
+
+def test_invalidate_ttl_and_lru(coll):
+    """Writes invalidate, entries expire after ttl and LRU bounds the size."""
+    assert len(find({"build": "0"})) == 10
+    coll.delete_many({"build": "0"})
+    assert len(find({"build": "0"})) == 10
+    db_utils.QUERY_CACHE.invalidate("perf", "results")
+    assert find({"build": "0"}) == []
+    for ops in range(6):
+        find({"ops": ops})
+    assert len(db_utils.QUERY_CACHE.entries) == 4
+    db_utils.QUERY_CACHE.ttl = 0.05
+    db_utils.QUERY_CACHE.put(("k",), 1)
+    time.sleep(0.1)
+    assert db_utils.QUERY_CACHE.get(("k",)) == (False, None)
+
+
+def test_lock_collections_not_cached(coll):
+    """Setup locks and VM reservations are always read from the DB."""
+    systems = db_utils.get_client(URI)["perf"][db_utils.SYS_INFO_COLLECTION]
+    systems.insert_one({"setupname": "s1", "in_use": False})
+
+    def in_use():
+        return db_utils.cached_query("find", URI, "perf", db_utils.SYS_INFO_COLLECTION, ({},),
+                                     lambda sys_coll: sys_coll.find_one({}, {"_id": 0}))["in_use"]
+
+    assert not in_use()
+    systems.update_one({}, {"$set": {"in_use": True}})
+    assert in_use()
+    assert not db_utils.QUERY_CACHE.entries
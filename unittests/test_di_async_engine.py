@@ -0,0 +1,105 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Test asyncio DI engine client against an in-process HTTP server."""
+import asyncio
+import hashlib
+
+import pytest
+
+from libs.di.async_engine import AsyncS3Client
+from libs.di.async_engine import ConnectionPool
+from libs.di.async_engine import S3RequestError
+
+
+class FakeS3:
+    """Keep-alive HTTP server storing PUT bodies by path."""
+
+    def __init__(self):
+        self.objects = dict()
+        self.connections = 0
+
+    async def handle(self, reader, writer):
+        """Serve requests of one connection."""
+        self.connections += 1
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            method, path, _ = line.decode().split()
+            headers = dict()
+            while True:
+                hline = await reader.readline()
+                if hline == b'\r\n':
+                    break
+                name, value = hline.decode().split(':', 1)
+                headers[name.strip().lower()] = value.strip()
+            assert headers['authorization'].startswith('AWS4-HMAC-SHA256')
+            body = await reader.readexactly(int(headers.get('content-length', 0)))
+            if method == 'PUT':
+                self.objects[path] = body
+                etag = hashlib.md5(body).hexdigest().encode()
+                writer.write(b'HTTP/1.1 200 OK\r\nETag: "%s"\r\nContent-Length: 0\r\n\r\n' % etag)
+            elif path in self.objects:
+                data = self.objects[path]
+                writer.write(b'HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n' % len(data) + data)
+            else:
+                writer.write(b'HTTP/1.1 404 Not Found\r\nContent-Length: 9\r\n\r\nNoSuchKey')
+            await writer.drain()
+        writer.close()
+
+
+class TestAsyncS3Client:
+    """Test AsyncS3Client and ConnectionPool."""
+
+    def test_put_get_with_pool(self):
+        """Concurrent PUT/GET reuse a bounded number of connections."""
+        fake = FakeS3()
+
+        async def scenario():
+            server = await asyncio.start_server(fake.handle, '127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            pool = ConnectionPool('http://127.0.0.1:{}'.format(port), max_connections=4)
+            client = AsyncS3Client(pool, 'access', 'secret')
+            data = [bytes([idx]) * 70000 for idx in range(20)]
+            etags = await asyncio.gather(*[
+                client.put_object('bkt', 'obj {}'.format(idx), buf, hashlib.md5(buf).hexdigest())
+                for idx, buf in enumerate(data)])
+            sums = await asyncio.gather(*[
+                client.get_object_checksum('bkt', 'obj {}'.format(idx)) for idx in range(20)])
+            with pytest.raises(S3RequestError):
+                await client.get_object_checksum('bkt', 'missing')
+            pool.close()
+            server.close()
+            return etags, sums, pool.opened
+
+        etags, sums, opened = asyncio.run(scenario())
+        assert etags == [hashlib.md5(bytes([idx]) * 70000).hexdigest() for idx in range(20)]
+        assert sums == [(etag, 70000) for etag in etags]
+        assert opened <= 4 and fake.connections == opened
+
+    def test_status_line_without_reason(self):
+        """Reason phrase of the status line is optional."""
+        async def read(data):
+            reader = asyncio.StreamReader()
+            reader.feed_data(data)
+            reader.feed_eof()
+            return await AsyncS3Client._read_head(reader)  # pylint: disable=protected-access
+
+        assert asyncio.run(read(b'HTTP/1.1 200\r\nContent-Length: 0\r\n\r\n')) == \
+            (200, '', {'content-length': '0'})
+        assert asyncio.run(read(b'HTTP/1.1 404 Not Found\r\n\r\n')) == (404, 'Not Found', {})
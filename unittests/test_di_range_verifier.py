@@ -0,0 +1,57 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Test DI seed based range verification."""
+import io
+
+from libs.di.data_generator import DataGenerator
+from libs.di.range_verifier import SeedVerifier
+
+
+class TestSeedVerifier:
+    """Test SeedVerifier class."""
+
+    size = 300000
+
+    def setup_method(self):
+        """Function will be invoked prior to each test case."""
+        self.verifier = SeedVerifier(chunk_size=65536)
+        self.data = DataGenerator(c_ratio=2).stream(self.size, seed=42).read()
+
+    def test_match(self):
+        """Full and ranged data regenerated from seed match uploaded data."""
+        assert self.verifier.compare_stream(io.BytesIO(self.data), 42, 0, self.size, 2) == -1
+        body = io.BytesIO(self.data[1000:71000])
+        assert self.verifier.compare_stream(body, 42, 1000, 70000, 2) == -1
+
+    def test_first_mismatch_offset(self):
+        """First corrupted byte and truncation are reported by offset."""
+        corrupt = bytearray(self.data)
+        corrupt[200001] ^= 0xFF
+        corrupt[250000] ^= 0xFF
+        body = io.BytesIO(bytes(corrupt))
+        assert self.verifier.compare_stream(body, 42, 0, self.size, 2) == 200001
+        body = io.BytesIO(self.data[:123456])
+        assert self.verifier.compare_stream(body, 42, 0, self.size, 2) == 123456
+        assert self.verifier.compare_stream(io.BytesIO(self.data), 43, 0, self.size, 2) != -1
+
+    def test_sample_ranges(self):
+        """Sampled ranges cover both ends of the object."""
+        ranges = SeedVerifier.sample_ranges(self.size, 5, 4096)
+        assert ranges[0] == (0, 4096) and ranges[-1] == (self.size - 4096, 4096)
+        assert len(ranges) == 5
+        assert SeedVerifier.sample_ranges(100, 5, 4096) == [(0, 100)]
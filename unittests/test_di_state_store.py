@@ -0,0 +1,71 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Test DI append-only object state store."""
+import os
+import shutil
+import tempfile
+import logging
+
+from libs.di.state_store import ObjectStateStore
+
+
+class TestObjectStateStore:
+    """Test ObjectStateStore class."""
+
+    def setup_method(self):
+        """Function will be invoked prior to each test case."""
+        self.log = logging.getLogger(__name__)
+        self.home = tempfile.mkdtemp(prefix='di-state-')
+
+    def teardown_method(self):
+        """Function will be invoked after each test case."""
+        shutil.rmtree(self.home, ignore_errors=True)
+
+    @staticmethod
+    def file_dict(name, checksum, seed=1):
+        """Return file dict in the uploader format."""
+        return dict(name=name, checksum=checksum, seed=seed, size=1024, mtime=1)
+
+    def test_add_and_query(self):
+        """Entries are visible through the DataManager query API."""
+        store = ObjectStateStore(home=self.home, flush_every=2)
+        store.add_file_to_bucket('user1', 'bkt1', self.file_dict('a.txt', 'abcd'))
+        store.add_file_to_bucket('user1', 'bkt1', self.file_dict('a.txt', 'efgh', 2))
+        store.add_file_to_bucket('user1', 'bkt2', self.file_dict('b.txt', 'ijkl'))
+        buckets = store.get_all_buckets_data_for_user('user1')
+        assert sorted(bkt['name'] for bkt in buckets) == ['bkt1', 'bkt2']
+        container = [bkt for bkt in buckets if bkt['name'] == 'bkt1'][0]
+        fdict = store.get_file_within_bucket('a.txt', container, 'bkt1')
+        assert fdict['checksum'] == 'efgh' and fdict['seed'] == 2
+        assert store.get_all_buckets_data_for_user('user2') is None
+
+    def test_replay_and_compaction(self):
+        """A new store replays the log and compaction keeps live entries only."""
+        store = ObjectStateStore(home=self.home, flush_every=1, compact_threshold=3)
+        for seed in range(5):
+            store.add_file_to_bucket('user1', 'bkt1', self.file_dict('a.txt', str(seed), seed))
+        store.add_file_to_bucket('user1', 'bkt1', self.file_dict('b.txt', 'b'))
+        store.flush()
+        with open(os.path.join(self.home, 'user1_user_metadata.log')) as fp:
+            assert len(fp.readlines()) <= 4
+        reader = ObjectStateStore(home=self.home)
+        assert reader.get_object('user1', 'bkt1', 'a.txt')['checksum'] == '4'
+        assert reader.get_object('user1', 'bkt1', 'b.txt')['checksum'] == 'b'
+        store.add_file_to_bucket('user1', 'bkt1', self.file_dict('c.txt', 'c'))
+        store.flush()
+        assert reader.get_object('user1', 'bkt1', 'c.txt')['checksum'] == 'c'
@@ -0,0 +1,91 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""UnitTest module for background log shipping."""
+
+import gzip
+import os
+
+from commons import log_shipper
+from commons.log_shipper import LogShipper
+
+
+def new_shipper(tmp_path, monkeypatch, mounted=True, **kwargs):
+    """Shipper with the share mounted on a temporary directory."""
+    mounts = []
+
+    def mount(host_dir, mnt_dir):
+        mounts.append(mnt_dir)
+        return (True, mnt_dir) if mounted else (False, 'mount failed')
+
+    monkeypatch.setattr(log_shipper.system_utils, 'mount_nfs_dir', mount)
+    shipper = LogShipper('nfs:/share', str(tmp_path / 'mnt'), str(tmp_path / 'local'),
+                         retry_delay=0.01, **kwargs)
+    shipper.start()
+    return shipper, mounts
+
+
+def write_log(path, size):
+    """Create a log file of size bytes."""
+    path.write_bytes(b'x' * size)
+    return str(path)
+
+
+def test_ship_compress_and_callback(tmp_path, monkeypatch):
+    """Logs are uploaded with one mount, large ones gzipped, callback gets real path."""
+    shipper, mounts = new_shipper(tmp_path, monkeypatch, compress_min=1024)
+    done = []
+    small = write_log(tmp_path / 'test.log', 10)
+    large = write_log(tmp_path / 'large.log', 4096)
+    upload = shipper.ship(small, 'build/TEST-1', on_done=done.append)
+    shipper.ship(large, 'build/TEST-1', remove=True)
+    assert shipper.close(timeout=5)
+    assert mounts == [str(tmp_path / 'mnt')]
+    assert upload.wait(1) == 'nfs:/share/build/TEST-1/test.log'
+    assert done == [upload]
+    assert (tmp_path / 'mnt/build/TEST-1/test.log').read_bytes() == b'x' * 10
+    with gzip.open(tmp_path / 'mnt/build/TEST-1/large.log.gz') as gz_file:
+        assert gz_file.read() == b'x' * 4096
+    assert os.path.exists(small) and not os.path.exists(large)
+    assert shipper.stats()['compressed'] == 1 and shipper.stats()['uploaded'] == 2
+
+
+def test_fallback_to_local(tmp_path, monkeypatch):
+    """Logs are copied to the local directory when the share is not mounted."""
+    shipper, _ = new_shipper(tmp_path, monkeypatch, mounted=False)
+    upload = shipper.ship(write_log(tmp_path / 'test.log', 10), 'build/TEST-2')
+    assert shipper.close(timeout=5)
+    assert upload.path == str(tmp_path / 'local/build/TEST-2/test.log')
+    assert os.path.exists(upload.path) and shipper.stats()['fallback'] == 1
+
+
+def test_retry_failed_copy(tmp_path, monkeypatch):
+    """A failing copy is retried before the log falls back to local directory."""
+    shipper, _ = new_shipper(tmp_path, monkeypatch, retries=2)
+    calls = []
+    copy_into = shipper._copy_into
+
+    def flaky(local_path, dest_dir):
+        calls.append(dest_dir)
+        if len(calls) == 1:
+            raise OSError('stale file handle')
+        return copy_into(local_path, dest_dir)
+
+    monkeypatch.setattr(shipper, '_copy_into', flaky)
+    upload = shipper.ship(write_log(tmp_path / 'test.log', 10), 'build/TEST-3')
+    assert shipper.close(timeout=5)
+    assert upload.uploaded and len(calls) == 2 and shipper.stats()['retried'] == 1
@@ -0,0 +1,112 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Test single pipeline statistics tables of the performance dashboard."""
+import os
+import sys
+
+import pytest
+
+mongomock = pytest.importorskip("mongomock")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "tools", "dash_server"))
+
+# pylint: disable=wrong-import-position
+from Performance import aggregate_queries  # noqa: E402
+from commons.utils import db_utils  # noqa: E402
+
+URI = "mongodb://localhost:27017"
+QUERY = {'release': 1, 'OS': 'centos', 'branch': 'main', 'nodes': 3, 'clients': 1, 'pfull': 0,
+         'itrns': 1, 'custom': 'none', 'buckets': 1, 'sessions': 100, 'build': '531',
+         'name': 'S3bench'}
+
+
+def result(size, operation, build='531', sessions=100, **kwargs):
+    """Perf DB document of one benchmark run."""
+    doc = {'OS': 'centos', 'Branch': 'main', 'Count_of_Servers': 3, 'Count_of_Clients': 1,
+           'Percentage_full': 0, 'Iteration': 1, 'Custom': 'none', 'Buckets': 1,
+           'Sessions': sessions, 'Build': build, 'Object_Size': size, 'Operation': operation,
+           'Name': 'S3bench', 'Objects': 10, 'Throughput': 100.0, 'IOPS': 50.0,
+           'Latency': {'Avg': 0.02}, 'TTFB': {'Avg': 0.01}, 'Run_State': 'successful'}
+    doc.update(kwargs)
+    return doc
+
+
+@pytest.fixture(name="coll")
+def perf_collection(monkeypatch):
+    """mongomock perf collection used by get_db_details."""
+    monkeypatch.setattr(db_utils, "MongoClient", mongomock.MongoClient)
+    monkeypatch.setattr(db_utils, "QUERY_CACHE", db_utils.QueryCache())
+    monkeypatch.setattr(aggregate_queries, "rollup_enabled", lambda: False)
+    monkeypatch.setattr(aggregate_queries, "get_db_details",
+                        lambda release: (URI, "perf", "results"))
+    db_utils.close_clients()
+    yield db_utils.get_client(URI)["perf"]["results"]
+    db_utils.close_clients()
+
+
+def test_statistics_table(coll):
+    """Rows are sorted object sizes, failed runs and missing operations are reported."""
+    coll.insert_many([
+        result('16MB', 'Write', Objects=20), result('16MB', 'Read'),
+        result('4KB', 'Write', Throughput=5.0), result('4KB', 'Write', Throughput=7.0),
+        result('4KB', 'Read', Run_State='failed'),
+        result('1GB', 'Write'),
+        result('1MB', 'Read', Cluster_State='degraded-read'),
+        result('8KB', 'Write', build='400'),
+    ])
+    frame, states = aggregate_queries.get_benchmark_table(dict(QUERY), 'Object_Size',
+                                                          'Object Sizes')
+    assert list(frame['Object Sizes']) == ['4KB', '16MB', '1GB']
+    assert list(frame.index) == [1, 2, 3]
+    assert states == ['failed', 'successful', 'successful']
+    row = frame.iloc[0]
+    assert row['Samples'] == 20 and row['Write Throughput (MBps)'] == 12
+    assert row['Read Latency (ms)'] == 20 and row['Read TTFB Avg (ms)'] == 10
+    assert frame.iloc[1]['Samples'] == 20
+    assert frame.iloc[2]['Read IOPS'] == "NA" and frame.iloc[2]['Write IOPS'] == 50
+
+
+def test_graphs_tables(coll):
+    """Grouping on sessions and builds gives one row per distinct value."""
+    coll.insert_many([result('4KB', 'Read', sessions=sessions, build=build)
+                      for sessions in (400, 50, 100) for build in ('531', '90')])
+    query = dict(QUERY, objsize='4KB')
+    frame, _ = aggregate_queries.get_benchmark_table(query, 'Sessions', 'Concurrency')
+    assert list(frame['Concurrency']) == [50, 100, 400]
+    frame, _ = aggregate_queries.get_benchmark_table(query, 'Build', 'Builds')
+    assert list(frame['Builds']) == ['90', '531']
+    assert list(frame.columns)[0] == 'Builds'
+
+
+def test_degraded_tables(coll):
+    """One table per stat with a column per cluster state."""
+    coll.insert_many([
+        result('4KB', 'Read', Cluster_State='normal-read', Throughput=30.0),
+        result('4KB', 'Read', Cluster_State='degraded-read', Throughput=10.0),
+        result('1MB', 'Read', Cluster_State='recovered-read', IOPS=5.0),
+        result('1MB', 'Read'),
+    ])
+    frames = aggregate_queries.get_degraded_tables(dict(QUERY))
+    assert len(frames) == 4
+    throughput, iops, latency, _ = frames
+    assert list(throughput.columns) == ['Object Sizes', 'Normal Read', 'Degraded Read',
+                                        'Recovered Read']
+    assert list(throughput.iloc[0]) == ['4KB', 30, 10, 'NA']
+    assert list(iops.iloc[1]) == ['1MB', 'NA', 'NA', 5]
+    assert latency.iloc[0]['Normal Read'] == 20
+    assert len(aggregate_queries.get_degraded_tables(dict(QUERY, name='Hsbench'))) == 3
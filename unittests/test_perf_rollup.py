@@ -0,0 +1,149 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Test performance rollup materialization and its readers."""
+import os
+import sys
+
+import pytest
+
+mongomock = pytest.importorskip("mongomock")
+TOOLS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tools")
+sys.path.insert(0, os.path.join(TOOLS, "dash_server"))
+sys.path.insert(0, os.path.join(TOOLS, "report"))  # before dash_server/common.py
+
+# pylint: disable=wrong-import-position
+import engg_report_csv  # noqa: E402
+import perf_rollup  # noqa: E402
+from Performance import aggregate_queries  # noqa: E402
+from commons.utils import db_utils  # noqa: E402
+
+URI = "mongodb://localhost:27017"
+
+
+def result(size, operation, throughput=100.0, build='531', **kwargs):
+    """Raw S3bench document."""
+    doc = {'OS': 'centos', 'Branch': 'main', 'Count_of_Servers': 2, 'Count_of_Clients': 1,
+           'Percentage_full': 0, 'Iteration': 1, 'Custom': 'none', 'Buckets': 1,
+           'Sessions': 100, 'Build': build, 'Object_Size': size, 'Operation': operation,
+           'Name': 'S3bench', 'Objects': 10, 'Throughput': throughput, 'IOPS': 50.0,
+           'Latency': {'Avg': 0.02}, 'TTFB': {'Avg': 0.01}, 'Run_State': 'successful'}
+    doc.update(kwargs)
+    return doc
+
+
+@pytest.fixture(name="raw")
+def raw_collection(monkeypatch):
+    """Shared mongomock client for report and dashboard modules."""
+    client = mongomock.MongoClient()
+    monkeypatch.setattr(db_utils, "get_client", lambda uri: client)
+    monkeypatch.setattr(db_utils, "QUERY_CACHE", db_utils.QueryCache())
+    monkeypatch.setattr(aggregate_queries, "get_db_details",
+                        lambda release: (URI, "perf", "results"))
+    return client["perf"]["results"]
+
+
+def summaries(raw):
+    """Summaries keyed by (Object_Size, Operation)."""
+    rollup = raw.database[perf_rollup.rollup_collection("results")]
+    return {(doc["Object_Size"], doc["Operation"]): doc for doc in rollup.find()}
+
+
+def test_backfill_and_refresh(raw):
+    """Refresh folds only new documents and rewrites the summaries they touch."""
+    raw.insert_many([result('4Kb', 'Write', 100.0), result('4Kb', 'Write', 200.0),
+                     result('4Kb', 'Read', Run_State='failed'),
+                     result('1Mb', 'Read', Cluster_State='degraded-read')])
+    assert perf_rollup.refresh(URI, "perf", "results", lag=0) == 4
+    rollups = summaries(raw)
+    assert len(rollups) == 3
+    assert rollups[('4Kb', 'Write')]['Runs'] == 2
+    assert perf_rollup.average(rollups[('4Kb', 'Write')], 'Throughput') == 150
+    assert rollups[('4Kb', 'Read')]['Failed_Runs'] == 1
+    assert 'Cluster_State' not in rollups[('4Kb', 'Write')]
+
+    raw.insert_many([result('4Kb', 'Write', 300.0), result('16Mb', 'Read')])
+    assert perf_rollup.refresh(URI, "perf", "results", lag=0) == 2
+    assert perf_rollup.refresh(URI, "perf", "results", lag=0) == 0
+    rollups = summaries(raw)
+    assert perf_rollup.average(rollups[('4Kb', 'Write')], 'Throughput') == 200
+    assert rollups[('16Mb', 'Read')]['Runs'] == 1
+    state = perf_rollup.get_watermark(URI, "perf", "results")
+    assert state['folded'] == 6 and state['watermark'] == raw.find_one(sort=[('_id', -1)])['_id']
+
+    raw.delete_many({'Object_Size': '16Mb'})
+    assert perf_rollup.backfill(URI, "perf", "results") == 5
+    assert ('16Mb', 'Read') not in summaries(raw)
+
+
+def test_refresh_batches_and_lag(raw):
+    """Documents younger than lag wait, batches give the same summaries."""
+    raw.insert_many([result('4Kb', 'Write', idx) for idx in range(7)])
+    perf_rollup.backfill(URI, "perf", "results")
+    raw.insert_many([result('4Kb', 'Write', idx) for idx in range(7, 12)])
+    assert perf_rollup.refresh(URI, "perf", "results", lag=3600) == 0
+    assert perf_rollup.refresh(URI, "perf", "results", batch_size=2, lag=0) == 5
+    assert summaries(raw)[('4Kb', 'Write')]['Throughput'] == {'sum': 66, 'count': 12}
+
+
+def test_readers(raw, monkeypatch):
+    """Report rows and dashboard table read the rollup."""
+    raw.insert_many([result('4Kb', 'Write', 100.0), result('4Kb', 'Write', 300.0),
+                     result('4Kb', 'Read'), result('256Mb', 'Read', build='400')])
+    perf_rollup.backfill(URI, "perf", "results")
+    data = engg_report_csv.get_single_bucket_perf_stats('531', 'main', URI, "perf", "results")
+    assert data[2][:3] == ['Write Throughput (MBps)', 100, '-']
+    assert data[3][1] == 20 and data[6][1] == 50 and data[6][-1] == "-"
+
+    query = {'release': 1, 'OS': 'centos', 'branch': 'main', 'nodes': 2, 'clients': 1,
+             'pfull': 0, 'itrns': 1, 'custom': 'none', 'buckets': 1, 'sessions': 100,
+             'build': '531', 'name': 'S3bench'}
+    monkeypatch.setattr(aggregate_queries, "rollup_enabled", lambda: False)
+    from_raw = aggregate_queries.get_benchmark_table(query, 'Object_Size', 'Object Sizes')
+    monkeypatch.setattr(aggregate_queries, "rollup_enabled", lambda: True)
+    from_rollup = aggregate_queries.get_benchmark_table(query, 'Object_Size', 'Object Sizes')
+    assert from_raw[0].equals(from_rollup[0]) and from_raw[1] == from_rollup[1]
+    assert list(from_rollup[0]['Write Throughput (MBps)']) == [400]
+
+
+def test_read_only_fallback_and_rebuild(raw, monkeypatch):
+    """Reports read raw documents when the rollup cannot be written, backfill swaps."""
+    raw.insert_many([result('4Kb', 'Write', 100.0), result('4Kb', 'Write', 300.0),
+                     result('4Kb', 'Read', Count_of_Servers=None)])
+    assert perf_rollup.refresh_or_read_raw(URI, "perf", "results")
+    from_rollup = perf_rollup.first_summaries({'Build': '531'}, ['Object_Size', 'Operation'],
+                                              URI, "perf", "results")
+
+    def read_only(*args):
+        raise perf_rollup.PyMongoError("not authorized on perf to execute command")
+
+    monkeypatch.setattr(perf_rollup, "_refresh", read_only)
+    assert not perf_rollup.refresh_or_read_raw(URI, "perf", "results")
+    raw.database.drop_collection(perf_rollup.rollup_collection("results"))
+    from_raw = perf_rollup.first_summaries({'Build': '531'}, ['Object_Size', 'Operation'],
+                                           URI, "perf", "results")
+    assert {key: perf_rollup.average(doc, 'Throughput') for key, doc in from_raw.items()} == \
+        {key: perf_rollup.average(doc, 'Throughput') for key, doc in from_rollup.items()}
+    db_data = dict(branch='main', uri=URI, db_name="perf", db_collection="results")
+    rows = engg_report_csv.get_tool_data('531', db_data, 'S3bench')
+    read_throughput = [row for row in rows if row[1] == 'Read Throughput'][0]
+    assert read_throughput[2] == '-', 'no servers count, no per server throughput'
+
+    assert perf_rollup.backfill(URI, "perf", "results") == 3
+    names = raw.database.list_collection_names()
+    assert perf_rollup.rollup_collection("results") in names
+    assert not [name for name in names if name.endswith(perf_rollup.SCRATCH_SUFFIX)]
@@ -0,0 +1,142 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""UnitTest module for background reporting service."""
+
+import os
+from http import HTTPStatus
+
+from commons.reporting_service import ReportingService
+
+
+class FakeReportClient:
+    """Records bulk create requests."""
+
+    def __init__(self, status=HTTPStatus.OK):
+        self.status = status
+        self.requests = []
+
+    def create_db_entries(self, entries, db_user=None, db_pass=None):
+        self.requests.append((list(entries), db_user, db_pass))
+        return self.status
+
+    def create_db_entry(self, **data_kwargs):
+        self.requests.append(([data_kwargs], data_kwargs['db_username'],
+                              data_kwargs['db_password']))
+        if data_kwargs['test_id'] == 'TEST-BAD':
+            return HTTPStatus.BAD_REQUEST
+        return HTTPStatus.OK
+
+
+class FakeResponse:
+    """requests.Response stub."""
+
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class FakeJiraTask:
+    """Records Xray imports and comments."""
+
+    def __init__(self):
+        self.imports = []
+        self.comments = []
+
+    def update_test_jira_statuses(self, test_exe_id, statuses):
+        self.imports.append((test_exe_id, list(statuses)))
+        return FakeResponse(HTTPStatus.OK)
+
+    def update_execution_details(self, test_run_id, test_id, comment):
+        self.comments.append((test_run_id, test_id, comment))
+        return True
+
+
+def new_service(tmp_path, client, jira=None, **kwargs):
+    """Started service with short intervals."""
+    kwargs.setdefault('flush_interval', 0.05)
+    service = ReportingService(client, jira, 'user', 'secret', spill_dir=str(tmp_path),
+                               retries=2, retry_delay=0.01, **kwargs)
+    service.start()
+    return service
+
+
+def test_batched_and_coalesced(tmp_path):
+    """DB entries are sent in bulk, Jira statuses once per test with start kept."""
+    client, jira = FakeReportClient(), FakeJiraTask()
+    service = new_service(tmp_path, client, jira, batch_size=3, flush_interval=10)
+    for idx in range(4):
+        service.create_db_entry(test_id=f'TEST-{idx}', db_username='user', db_password='pwd')
+    service.update_jira_status('TEST-100', 'TEST-1', 'Executing')
+    service.update_jira_status('TEST-100', 'TEST-1', 'PASS')
+    service.update_execution_details('42', 'TEST-1', 'Log file path: /logs')
+    assert service.close(timeout=5)
+    assert [len(entries) for entries, _, _ in client.requests] == [3, 1]
+    assert {(user, pwd) for _, user, pwd in client.requests} == {('user', 'secret')}
+    assert 'db_password' not in client.requests[0][0][0]
+    assert len(jira.imports) == 1
+    te_tkt, statuses = jira.imports[0]
+    assert te_tkt == 'TEST-100' and len(statuses) == 1
+    assert statuses[0]['status'] == 'PASS' and 'start' in statuses[0]
+    assert jira.comments == [('42', 'TEST-1', 'Log file path: /logs')]
+    assert service.stats()['sent'] == 7
+
+
+def test_spill_and_replay(tmp_path):
+    """Updates failing all retries are spilled and replayed by the next service."""
+    down = FakeReportClient(status=HTTPStatus.SERVICE_UNAVAILABLE)
+    service = new_service(tmp_path, down)
+    service.create_db_entry(test_id='TEST-1', db_username='user', db_password='pwd')
+    assert service.flush(timeout=5)
+    assert len(down.requests) == 2
+    assert service.close(timeout=5)
+    assert service.stats()['spilled'] == 1
+    spilled = [name for name in os.listdir(tmp_path) if name.endswith('.jsonl')]
+    assert len(spilled) == 1
+    with open(os.path.join(tmp_path, spilled[0])) as spill:
+        assert 'pwd' not in spill.read()
+
+    client = FakeReportClient()
+    service = new_service(tmp_path, client)
+    service.create_db_entry(test_id='TEST-2')
+    assert service.close(timeout=5)
+    sent = [entry['test_id'] for entries, _, _ in client.requests for entry in entries]
+    assert sorted(sent) == ['TEST-1', 'TEST-2']
+    assert service.stats()['replayed'] == 1
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(('.jsonl', '.replay'))]
+
+
+def test_not_started_spills(tmp_path):
+    """Updates are never lost when the worker is not running."""
+    service = ReportingService(FakeReportClient(), spill_dir=str(tmp_path))
+    assert not service.create_db_entry(test_id='TEST-1')
+    assert service.stats()['spilled'] == 1
+
+
+def test_rejected_entry_dropped(tmp_path):
+    """A 4xx bulk create is not retried, only the entry rejected on its own is dropped."""
+    client = FakeReportClient(status=HTTPStatus.BAD_REQUEST)
+    service = new_service(tmp_path, client, flush_interval=10)
+    for test_id in ('TEST-1', 'TEST-BAD', 'TEST-2'):
+        service.create_db_entry(test_id=test_id)
+    assert service.close(timeout=5)
+    assert len(client.requests) == 4
+    assert [entries[0]['test_id'] for entries, _, _ in client.requests[1:]] == \
+        ['TEST-1', 'TEST-BAD', 'TEST-2']
+    assert {(user, pwd) for _, user, pwd in client.requests} == {('user', 'secret')}
+    stats = service.stats()
+    assert (stats['sent'], stats['dropped'], stats['spilled'], stats['retried']) == (2, 1, 0, 0)
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.jsonl')]
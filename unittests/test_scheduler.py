@@ -0,0 +1,71 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""UnitTest module for duration aware test scheduling."""
+
+import itertools
+
+from core.scheduler import DurationHistory
+from core.scheduler import lpt_pack
+from core.scheduler import makespan
+from core.scheduler import prior
+
+
+def test_lpt_pack_close_to_optimal():
+    """LPT bins stay within 4/3 of the best split found by brute force."""
+    durations = {f'TEST-{idx}': secs for idx, secs in enumerate([7, 7, 6, 6, 5, 4, 4, 3, 2])}
+    bins = lpt_pack(durations, 3)
+    assert sorted(itertools.chain(*bins)) == sorted(durations)
+    lpt_span = max(sum(durations[test] for test in tests) for tests in bins)
+    best = min(max(sum(durations[test] for test, slot in zip(durations, assign) if slot == b)
+                   for b in range(3))
+               for assign in itertools.product(range(3), repeat=len(durations)))
+    assert lpt_span <= best * 4 / 3
+    assert lpt_pack({'TEST-1': 1}, 4) == [['TEST-1']]
+    assert makespan({'a': 10, 'b': 1, 'c': 1}, 2) == 10
+
+
+def test_history_estimate_and_priors(tmp_path):
+    """Median of kept runs, marker priors for unknown tests."""
+    history = DurationHistory(str(tmp_path / 'durations.json'), samples=3)
+    for secs in (100, 10, 20, 30):
+        history.record('TEST-1', secs)
+    history.record('TEST-2', 0)
+    history.record(None, 5)
+    history.save()
+    history = DurationHistory(history.path).load()
+    assert history.durations == {'TEST-1': [10, 20, 30]}
+    assert history.estimate('TEST-1') == 20
+    assert history.estimate('TEST-9', ['tags', 'ha']) == prior(['ha']) > prior(['s3_ops'])
+    assert prior(['three_node_deployment']) == prior(['prov_sanity'])
+
+
+def test_refresh_from_report_db(monkeypatch, tmp_path):
+    """Report DB durations fill only tests without local history."""
+    asked = []
+
+    def get_test_durations(_, test_ids):
+        asked.extend(test_ids)
+        return {'TEST-2': 3600.0}
+
+    monkeypatch.setattr('commons.report_client.ReportClient.get_test_durations',
+                        get_test_durations)
+    history = DurationHistory(str(tmp_path / 'durations.json'))
+    history.record('TEST-1', 60)
+    assert history.refresh(['TEST-1', 'TEST-2', 'TEST-3']) == 1
+    assert sorted(asked) == ['TEST-2', 'TEST-3']
+    assert history.estimate('TEST-2') == 3600.0
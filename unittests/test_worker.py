@@ -0,0 +1,109 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""Test bounded batched worker pool."""
+import queue
+import threading
+
+import pytest
+
+from commons.worker import Workers
+
+
+def square(num):
+    """Square of num."""
+    return num * num
+
+
+def fail(num):
+    """Always raise."""
+    raise ValueError(num)
+
+
+class TestWorkers:
+    """Test Workers pool."""
+
+    def setup_method(self):
+        """Start a small pool."""
+        self.workers = Workers()
+        self.workers.start_workers(nworkers=4, max_pending=2)
+
+    def teardown_method(self):
+        """Stop pool."""
+        self.workers.end_workers(timeout=10)
+
+    def test_submit_and_map(self):
+        """Results are returned in submission order."""
+        assert self.workers.submit(square, 7).get(5) == 49
+        assert list(self.workers.map(square, range(1000), batch_size=16)) == \
+            [num * num for num in range(1000)]
+        assert self.workers.drain(5)
+        stats = self.workers.stats()
+        assert stats['done'] == 1001 and stats['failed'] == 0
+        assert sum(stats['latency_ms'].values()) == 1001
+
+    def test_exception_captured(self):
+        """A failing task does not kill the worker thread."""
+        assert self.workers.submit_many(fail, range(10), batch_size=3) == 10
+        assert self.workers.drain(5)
+        with pytest.raises(ValueError):
+            next(self.workers.map(fail, range(3)))
+        assert self.workers.submit(square, 3).get(5) == 9
+        assert self.workers.drain(5)
+        assert self.workers.stats()['failed'] == 13
+
+    def test_map_streams_bounded(self):
+        """map yields first results before consuming all items and bounds tasks in flight."""
+        consumed = [0]
+
+        def items():
+            for num in range(10000):
+                consumed[0] += 1
+                yield num
+
+        results = self.workers.map(square, items(), batch_size=4)
+        assert next(results) == 0
+        # max_pending batches queued, max_pending in flight and one being built
+        assert consumed[0] <= 5 * 4
+        assert sum(results) == sum(num * num for num in range(10000))
+
+    def test_backpressure(self):
+        """Submitter blocks while max_pending batches are queued."""
+        event = threading.Event()
+        self.workers.submit_many(lambda _: event.wait(10), range(4), batch_size=1)
+        self.workers.submit_many(square, range(4), batch_size=2)
+        submitter = threading.Thread(target=self.workers.submit, args=(square, 2))
+        submitter.start()
+        submitter.join(0.2)
+        assert submitter.is_alive()
+        event.set()
+        submitter.join(5)
+        assert not submitter.is_alive()
+
+    def test_legacy_wenque_and_timeout(self):
+        """Queue based work items still run, end_workers drops work on timeout."""
+        work_q = queue.Queue()
+        work_q.func = square
+        work_q.put(5)
+        assert self.workers.wenque(work_q).get(5) == 25
+        event = threading.Event()
+        self.workers.submit_many(lambda _: event.wait(10), range(4), batch_size=1)
+        self.workers.submit(square, 1)
+        assert not self.workers.end_workers(timeout=0.2)
+        event.set()
+        with pytest.raises(RuntimeError):
+            self.workers.submit(square, 1)
@@ -0,0 +1,90 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""UnitTest module for in process file checksums."""
+
+import base64
+import hashlib
+import os
+
+import pytest
+
+from commons.utils import checksum_utils
+
+
+@pytest.fixture(name="data_file")
+def fixture_data_file(tmp_path):
+    """File of 3.5 blocks of 64 KB random data."""
+    path = tmp_path / "data"
+    path.write_bytes(os.urandom(7 * 32 * 1024))
+    return str(path)
+
+
+def test_single_pass_digests(data_file):
+    """All digests of one read match hashlib over the whole content."""
+    data = open(data_file, "rb").read()
+    digests = checksum_utils.file_digests(
+        data_file, ("md5", "SHA-1", "sha256", "SHA-512"), block_size=64 * 1024)
+    assert digests == {"md5": hashlib.md5(data).hexdigest(),
+                       "SHA-1": hashlib.sha1(data).hexdigest(),
+                       "sha256": hashlib.sha256(data).hexdigest(),
+                       "SHA-512": hashlib.sha512(data).hexdigest()}
+    assert checksum_utils.to_base64(digests["md5"]) == \
+        base64.b64encode(hashlib.md5(data).digest()).decode()
+    with pytest.raises(ValueError):
+        checksum_utils.new("md4x")
+
+
+def test_crc32c():
+    """Castagnoli check value, also when fed in pieces."""
+    crc = checksum_utils.Crc32c()
+    crc.update(b"1234")
+    crc.update(memoryview(b"56789"))
+    assert crc.hexdigest() == "e3069283"
+    assert checksum_utils.new("CRC32C").hexdigest() == "00000000"
+
+
+def test_etag(data_file):
+    """Multipart ETag matches md5 of part digests, parts crossing read blocks."""
+    data = open(data_file, "rb").read()
+    part_size = 100 * 1024
+    parts = [data[idx:idx + part_size] for idx in range(0, len(data), part_size)]
+    expected = hashlib.md5(b"".join(hashlib.md5(part).digest() for part in parts)).hexdigest()
+    assert checksum_utils.file_checksum(data_file, "etag", part_size) == \
+        f"{expected}-{len(parts)}"
+    single = hashlib.md5(hashlib.md5(data).digest()).hexdigest()
+    assert checksum_utils.file_checksum(data_file, "etag") == f"{single}-1"
+    exact = checksum_utils.EtagHash(part_size=4)
+    exact.update(b"abcdefgh")
+    assert exact.hexdigest().endswith("-2")
+    empty = hashlib.md5(hashlib.md5(b"").digest()).hexdigest()
+    assert checksum_utils.EtagHash(part_size=4).hexdigest() == f"{empty}-1"
+
+
+def test_files_digests(tmp_path):
+    """Concurrent hashing keeps the file order and matches hashlib."""
+    paths = []
+    for idx in range(6):
+        path = tmp_path / f"file{idx}"
+        path.write_bytes(os.urandom(1024 * (idx + 1)))
+        paths.append(str(path))
+    results = checksum_utils.files_digests(paths, ("md5", "crc32c"), workers=3)
+    assert list(results) == paths
+    for path in paths:
+        assert results[path]["md5"] == hashlib.md5(open(path, "rb").read()).hexdigest()
+    with pytest.raises(OSError):
+        checksum_utils.files_digests(paths + [str(tmp_path / "missing")])
@@ -20,7 +20,9 @@
 
 import os
 import time
+import pickle
 import logging
+import multiprocessing
 from random import shuffle
 from hashlib import md5
 
@@ -32,6 +34,11 @@ from commons.utils import assert_utils
 from commons.params import TEST_DATA_FOLDER
 
 
+def parts_length(parts):
+    """Bytes of the parts of a parts dict, run in a worker process."""
+    return sum(len(part[0]) for part in parts.values())
+
+
 class TestS3Utils:
     """Test S3 utility library class."""
 
@@ -114,3 +121,66 @@ class TestS3Utils:
         resp = s3_utils.get_unaligned_parts(self.fpath, total_parts=total_parts, random=True)
         self.log.info(resp.keys())
         self.log.info("ENDED: get aligned parts.")
+
+    def test_mmap_parts(self, tmp_path):
+        """Parts are zero copy slices of the file with lazily computed checksums."""
+        fpath = str(tmp_path / "mpu")
+        data = os.urandom(3 * 1048576 + 12345)
+        with open(fpath, "wb") as fout:
+            fout.write(data)
+        parts = s3_utils.get_aligned_parts(fpath, total_parts=2, chunk_size=1048576)
+        assert_utils.assert_equal(b"".join(part[0] for part in parts.values()), data)
+        assert_utils.assert_true(all(isinstance(part[0], memoryview) for part in parts.values()))
+        s3_utils.calc_parts_md5(parts.values())
+        _, content_md5 = parts[1]
+        assert_utils.assert_equal(content_md5, s3_utils.calc_contentmd5(bytes(parts[1][0])))
+        expected = '"%s-%s"' % (md5(b"".join(md5(part[0]).digest() for part in
+                                            [parts[key] for key in sorted(parts)])).hexdigest(),
+                                len(parts))
+        assert_utils.assert_equal(s3_utils.get_multipart_etag(parts), expected)
+        unaligned = s3_utils.get_unaligned_parts(fpath, total_parts=1, chunk_size=1048576,
+                                                 random=True)
+        assert_utils.assert_equal(
+            b"".join(unaligned[key][0] for key in sorted(unaligned)), data)
+        reader = s3_utils.PartReader(parts[2][0])
+        assert_utils.assert_equal(reader.read(10), data[len(parts[1][0]):][:10])
+        reader.seek(0)
+        assert_utils.assert_equal(reader.read(), bytes(parts[2][0]))
+
+    def test_precalculated_parts(self, tmp_path):
+        """Part sizes past end of file give empty parts as reads did before."""
+        fpath = str(tmp_path / "mpu")
+        with open(fpath, "wb") as fout:
+            fout.write(b"x" * 2500)
+        parts = s3_utils.get_precalculated_parts(
+            fpath, [{"part_size": 1, "count": 2}, {"part_size": 2, "count": 1}], chunk_size=1000)
+        assert_utils.assert_equal(sum(len(part[0]) for part in parts.values()), 2500)
+        assert_utils.assert_equal(len(parts), 3)
+
+    def test_pickle_parts(self, tmp_path):
+        """Parts dicts can be passed to multiprocessing workers, the file is mapped there."""
+        fpath = str(tmp_path / "mpu")
+        data = os.urandom(2500)
+        with open(fpath, "wb") as fout:
+            fout.write(data)
+        parts = s3_utils.get_precalculated_parts(
+            fpath, [{"part_size": 1, "count": 2}, {"part_size": 2, "count": 1}], chunk_size=1000)
+        parts[1].digest()
+        loaded = pickle.loads(pickle.dumps(dict(list(parts.items())[:2])))
+        assert_utils.assert_equal(list(loaded), [1, 2])
+        for key, part in loaded.items():
+            assert_utils.assert_true(isinstance(part[0], memoryview))
+            assert_utils.assert_equal(bytes(part[0]), bytes(parts[key][0]))
+            assert_utils.assert_equal(part[1], parts[key][1])
+        with multiprocessing.Pool(1) as pool:
+            lengths = pool.map(parts_length, [dict([item]) for item in parts.items()])
+        assert_utils.assert_equal(lengths, [len(part[0]) for part in parts.values()])
+
+    def test_poll_condition(self):
+        """poll returns the response meeting a callable condition and rejects other ones."""
+        responses = iter([(True, 1), (True, 2), (True, 3)])
+        resp = s3_utils.poll(lambda: next(responses), condition=lambda res: res[1] == 2,
+                             timeout=5, step=0.1)
+        assert_utils.assert_equal(resp, (True, 2))
+        with pytest.raises(TypeError):
+            s3_utils.poll(lambda: (True, 1), condition="{}[0]", timeout=5)
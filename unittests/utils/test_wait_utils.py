@@ -0,0 +1,73 @@
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+"""UnitTest module for condition waits with backoff."""
+
+import itertools
+
+import pytest
+
+from commons.utils import wait_utils
+
+FAST = wait_utils.Backoff(initial=0.01, factor=2, maximum=0.04, jitter=0.5)
+
+
+def test_backoff_delays():
+    """Delays grow by factor up to maximum and stay within jitter."""
+    delays = list(itertools.islice(wait_utils.Backoff(1, 2, 8, 0).delays(), 6))
+    assert delays == [1, 2, 4, 8, 8, 8]
+    jittered = itertools.islice(wait_utils.Backoff(1, 2, 8, 0.25).delays(), 6)
+    for delay, base in zip(jittered, [1, 2, 4, 8, 8, 8]):
+        assert abs(delay - base) <= base * 0.25
+
+
+def test_wait_for_returns_early():
+    """The wait ends at the first true value, errors count as not yet true."""
+    calls = iter([ValueError("not yet"), 0, "ready"])
+
+    def predicate():
+        value = next(calls)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    result = wait_utils.wait_for(predicate, timeout=5, name="early", backoff=FAST)
+    assert result and result.value == "ready"
+    assert result.attempts == 3 and result.error is None
+    assert result.elapsed < 1
+    assert wait_utils.wait_timings()[-1]["name"] == "early"
+
+
+def test_wait_for_deadline():
+    """A false predicate is retried until the deadline and not far past it."""
+    result = wait_utils.wait_for(lambda: False, timeout=0.2, backoff=FAST)
+    assert not result
+    assert result.attempts > 3
+    assert 0.2 <= result.elapsed < 0.5
+    with pytest.raises(TimeoutError):
+        wait_utils.wait_for(lambda: 1 / 0, timeout=0.05, backoff=FAST, raise_on_timeout=True)
+
+
+def test_wait_until_response():
+    """wait_until returns the target response which met the condition."""
+    responses = iter([(False, "down"), (False, "down"), (True, "up")])
+    result = wait_utils.wait_until(lambda name: next(responses), "cluster",
+                                   condition=lambda resp: resp[0], timeout=5, backoff=FAST)
+    assert result.value == (True, "up")
+    pause = wait_utils.pause(0.01, "fixed")
+    assert pause and pause.elapsed >= 0.01
+    assert wait_utils.wait_timings()[-1]["name"] == "fixed"